@@ -1,3 +1,4 @@
 from .client import DdmClient
+from .async_client import AsyncDdmClient
 
-__all__ = ["DdmClient"]
+__all__ = ["DdmClient", "AsyncDdmClient"]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from ..transport.async_http import AsyncHttpTransport
 from ..transport.http import HttpTransport
 
 
@@ -86,3 +87,28 @@ class AuthAPI:
             auth=not bool(headers),
         )
         return UserInfo.from_json(data)
+
+
+class AsyncAuthAPI:
+    def __init__(self, auth_http: AsyncHttpTransport):
+        self._http = auth_http
+
+    async def login(self, username: str, password: str) -> LoginResponse:
+        payload = {"username": username, "password": password}
+        data = await self._http.request(
+            "POST",
+            "/extreme_auth/api/v1/person/login",
+            json=payload,
+            auth=False,
+        )
+        return LoginResponse.from_json(data)
+
+    async def userinfo(self, access_token: Optional[str] = None) -> UserInfo:
+        headers = {"Authorization": f"Bearer {access_token}"} if access_token else None
+        data = await self._http.request(
+            "GET",
+            "/extreme_auth/api/v1/person/userinfo",
+            headers=headers,
+            auth=not bool(headers),
+        )
+        return UserInfo.from_json(data)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence
 
+from ..transport.async_http import AsyncHttpTransport
 from ..transport.http import HttpTransport
+from ..transport.pagination import aiter_items, iter_items
 from ..transport.serializers import build_params
 
 from ..models.catalog import PagedFiles, FileOption, TreeResponse
+from ..models.file import FileItem
 
 
 _CSV_KEYS = {
@@ -13,6 +16,60 @@ _CSV_KEYS = {
 }
 
 
+def _list_params(
+    *,
+    filename: Optional[Sequence[str]],
+    use_case: Optional[Sequence[str]],
+    project_id: Optional[Sequence[str]],
+    created_from: Optional[str],
+    created_to: Optional[str],
+    user_id: Optional[Sequence[str]],
+    file_type: Optional[Sequence[str]],
+    parent_files: Optional[Sequence[str]],
+    size_from: Optional[int],
+    size_to: Optional[int],
+    sort: str,
+    page: int,
+    perPage: int,
+) -> Dict[str, Any]:
+    # shared by list/my_catalog (sync + async)
+    return build_params(
+        {
+            "filename": list(filename) if filename else None,
+            "use_case": list(use_case) if use_case else None,
+            "project_id": list(project_id) if project_id else None,
+            "created_from": created_from,
+            "created_to": created_to,
+            "user_id": list(user_id) if user_id else None,
+            "file_type": list(file_type) if file_type else None,
+            "parent_files": list(parent_files) if parent_files else None,
+            "size_from": size_from,
+            "size_to": size_to,
+            "sort": sort,
+            "page": page,
+            "perPage": perPage,
+        },
+        csv_keys=_CSV_KEYS,
+    )
+
+
+def _options_params(project_id: Optional[str], filename: Optional[str], user_id: Optional[str]) -> Dict[str, Any]:
+    params: Dict[str, Any] = {}
+    if project_id:
+        params["project_id"] = project_id
+    if filename:
+        params["filename"] = filename
+    if user_id:
+        params["user_id"] = user_id
+    return params
+
+
+def _tree_params(**kw: Any) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"page": kw.pop("page"), "perPage": kw.pop("perPage")}
+    params.update({k: v for k, v in kw.items() if v is not None})
+    return params
+
+
 class CatalogAPI:
     def __init__(self, http: HttpTransport):
         self._http = http
@@ -34,23 +91,11 @@ class CatalogAPI:
         page: int = 1,
         perPage: int = 10,
     ) -> PagedFiles:
-        params = build_params(
-            {
-                "filename": list(filename) if filename else None,
-                "use_case": list(use_case) if use_case else None,
-                "project_id": list(project_id) if project_id else None,
-                "created_from": created_from,
-                "created_to": created_to,
-                "user_id": list(user_id) if user_id else None,
-                "file_type": list(file_type) if file_type else None,
-                "parent_files": list(parent_files) if parent_files else None,
-                "size_from": size_from,
-                "size_to": size_to,
-                "sort": sort,
-                "page": page,
-                "perPage": perPage,
-            },
-            csv_keys=_CSV_KEYS,
+        params = _list_params(
+            filename=filename, use_case=use_case, project_id=project_id,
+            created_from=created_from, created_to=created_to, user_id=user_id,
+            file_type=file_type, parent_files=parent_files, size_from=size_from,
+            size_to=size_to, sort=sort, page=page, perPage=perPage,
         )
         data = self._http.request("GET", "/ddm/catalog/list", params=params)
         return PagedFiles.model_validate(data)
@@ -72,27 +117,46 @@ class CatalogAPI:
         page: int = 1,
         perPage: int = 10,
     ) -> PagedFiles:
-        params = build_params(
-            {
-                "filename": list(filename) if filename else None,
-                "use_case": list(use_case) if use_case else None,
-                "project_id": list(project_id) if project_id else None,
-                "created_from": created_from,
-                "created_to": created_to,
-                "user_id": list(user_id) if user_id else None,
-                "file_type": list(file_type) if file_type else None,
-                "parent_files": list(parent_files) if parent_files else None,
-                "size_from": size_from,
-                "size_to": size_to,
-                "sort": sort,
-                "page": page,
-                "perPage": perPage,
-            },
-            csv_keys=_CSV_KEYS,
+        params = _list_params(
+            filename=filename, use_case=use_case, project_id=project_id,
+            created_from=created_from, created_to=created_to, user_id=user_id,
+            file_type=file_type, parent_files=parent_files, size_from=size_from,
+            size_to=size_to, sort=sort, page=page, perPage=perPage,
         )
         data = self._http.request("GET", "/ddm/catalog/my-catalog", params=params)
         return PagedFiles.model_validate(data)
 
+    def iter_list(
+        self,
+        *,
+        perPage: int = 100,
+        max_in_flight: int = 4,
+        **filters: Any,
+    ) -> Iterator[FileItem]:
+        """
+        Every FileItem matching the list() filters (any list() keyword except page),
+        with the next pages prefetched in the background (see transport.pagination).
+        """
+        return iter_items(
+            lambda page: self.list(page=page, perPage=perPage, **filters),
+            per_page=perPage,
+            max_in_flight=max_in_flight,
+        )
+
+    def iter_my_catalog(
+        self,
+        *,
+        perPage: int = 100,
+        max_in_flight: int = 4,
+        **filters: Any,
+    ) -> Iterator[FileItem]:
+        """Like iter_list(), over my_catalog()."""
+        return iter_items(
+            lambda page: self.my_catalog(page=page, perPage=perPage, **filters),
+            per_page=perPage,
+            max_in_flight=max_in_flight,
+        )
+
     def options(
         self,
         *,
@@ -100,14 +164,7 @@ class CatalogAPI:
         filename: Optional[str] = None,
         user_id: Optional[str] = None,
     ) -> list[FileOption]:
-        params: Dict[str, Any] = {}
-        if project_id:
-            params["project_id"] = project_id
-        if filename:
-            params["filename"] = filename
-        if user_id:
-            params["user_id"] = user_id
-
+        params = _options_params(project_id, filename, user_id)
         data = self._http.request("GET", "/ddm/catalog/options", params=params)
         return [FileOption.model_validate(x) for x in data]
 
@@ -123,26 +180,130 @@ class CatalogAPI:
         perPage: int = 20,
         filter: Optional[str] = None,
     ) -> TreeResponse:
-        params: Dict[str, Any] = {
-            "page": page,
-            "perPage": perPage,
-        }
-        if parent is not None:
-            params["parent"] = parent
-        if name is not None:
-            params["name"] = name
-        if size is not None:
-            params["size"] = size
-        if type is not None:
-            params["type"] = type
-        if sort is not None:
-            params["sort"] = sort
-        if filter is not None:
-            params["filter"] = filter
-
+        params = _tree_params(
+            parent=parent, name=name, size=size, type=type, sort=sort, page=page, perPage=perPage, filter=filter
+        )
         data = self._http.request("GET", "/ddm/catalog/tree", params=params)
         return TreeResponse.model_validate(data)
 
     def advanced(self, filters: Dict[str, Any]) -> Any:
         # Returns a JSON array of file-like dicts 
         return self._http.request("POST", "/ddm/catalog/advanced", json=filters)
+
+
+class AsyncCatalogAPI:
+    """asyncio version of CatalogAPI (same arguments and models)."""
+
+    def __init__(self, http: AsyncHttpTransport):
+        self._http = http
+
+    async def list(
+        self,
+        *,
+        filename: Optional[Sequence[str]] = None,
+        use_case: Optional[Sequence[str]] = None,
+        project_id: Optional[Sequence[str]] = None,
+        created_from: Optional[str] = None,  # ISO string
+        created_to: Optional[str] = None,
+        user_id: Optional[Sequence[str]] = None,
+        file_type: Optional[Sequence[str]] = None,
+        parent_files: Optional[Sequence[str]] = None,
+        size_from: Optional[int] = None,
+        size_to: Optional[int] = None,
+        sort: str = "id,asc",
+        page: int = 1,
+        perPage: int = 10,
+    ) -> PagedFiles:
+        params = _list_params(
+            filename=filename, use_case=use_case, project_id=project_id,
+            created_from=created_from, created_to=created_to, user_id=user_id,
+            file_type=file_type, parent_files=parent_files, size_from=size_from,
+            size_to=size_to, sort=sort, page=page, perPage=perPage,
+        )
+        data = await self._http.request("GET", "/ddm/catalog/list", params=params)
+        return PagedFiles.model_validate(data)
+
+    async def my_catalog(
+        self,
+        *,
+        filename: Optional[Sequence[str]] = None,
+        use_case: Optional[Sequence[str]] = None,
+        project_id: Optional[Sequence[str]] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        user_id: Optional[Sequence[str]] = None,
+        file_type: Optional[Sequence[str]] = None,
+        parent_files: Optional[Sequence[str]] = None,
+        size_from: Optional[int] = None,
+        size_to: Optional[int] = None,
+        sort: str = "id,asc",
+        page: int = 1,
+        perPage: int = 10,
+    ) -> PagedFiles:
+        params = _list_params(
+            filename=filename, use_case=use_case, project_id=project_id,
+            created_from=created_from, created_to=created_to, user_id=user_id,
+            file_type=file_type, parent_files=parent_files, size_from=size_from,
+            size_to=size_to, sort=sort, page=page, perPage=perPage,
+        )
+        data = await self._http.request("GET", "/ddm/catalog/my-catalog", params=params)
+        return PagedFiles.model_validate(data)
+
+    def iter_list(
+        self,
+        *,
+        perPage: int = 100,
+        max_in_flight: int = 4,
+        **filters: Any,
+    ) -> AsyncIterator[FileItem]:
+        return aiter_items(
+            lambda page: self.list(page=page, perPage=perPage, **filters),
+            per_page=perPage,
+            max_in_flight=max_in_flight,
+        )
+
+    def iter_my_catalog(
+        self,
+        *,
+        perPage: int = 100,
+        max_in_flight: int = 4,
+        **filters: Any,
+    ) -> AsyncIterator[FileItem]:
+        return aiter_items(
+            lambda page: self.my_catalog(page=page, perPage=perPage, **filters),
+            per_page=perPage,
+            max_in_flight=max_in_flight,
+        )
+
+    async def options(
+        self,
+        *,
+        project_id: Optional[str] = None,
+        filename: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> list[FileOption]:
+        params = _options_params(project_id, filename, user_id)
+        data = await self._http.request("GET", "/ddm/catalog/options", params=params)
+        return [FileOption.model_validate(x) for x in data]
+
+    async def tree(
+        self,
+        *,
+        parent: Optional[str] = None,
+        name: Optional[str] = None,
+        size: Optional[int] = None,
+        type: Optional[str] = None,
+        sort: Optional[str] = None,
+        page: int = 0,
+        perPage: int = 20,
+        filter: Optional[str] = None,
+    ) -> TreeResponse:
+        params = _tree_params(
+            parent=parent, name=name, size=size, type=type, sort=sort, page=page, perPage=perPage, filter=filter
+        )
+        data = await self._http.request("GET", "/ddm/catalog/tree", params=params)
+        return TreeResponse.model_validate(data)
+
+    async def advanced(self, filters: Dict[str, Any]) -> Any:
+        # Returns a JSON array of file-like dicts 
+        return await self._http.request("POST", "/ddm/catalog/advanced", json=filters)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, BinaryIO
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union, BinaryIO
 from pathlib import Path
 
 from ..transport.http import HttpTransport
+from ..transport.pagination import iter_items
 from ..models.expectations import (
     CreateSuiteResponse,
     ExpectationSuiteCreate,
@@ -120,6 +121,23 @@ class ExpectationsAPI:
         resp = self._http.request("GET", "/ddm/expectations/suites", params=params)
         return ExpectationSuiteListResponse.model_validate(resp)
 
+    def iter_suites(
+        self,
+        *,
+        perPage: int = 100,
+        max_in_flight: int = 4,
+        **filters: Any,
+    ) -> Iterator[ExpectationSuiteResponse]:
+        """
+        Every suite matching the list_suites() filters (any keyword except page),
+        with the next pages prefetched in the background (see transport.pagination).
+        """
+        return iter_items(
+            lambda page: self.list_suites(page=page, perPage=perPage, **filters),
+            per_page=perPage,
+            max_in_flight=max_in_flight,
+        )
+
     # ---------- POST /ddm/expectations/suites ----------
     def create_suite(
         self,
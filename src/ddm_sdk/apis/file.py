@@ -1,10 +1,41 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
-from typing import Any, Dict, Optional, Union, BinaryIO
+import os
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Tuple, Union, BinaryIO
 
+from ..storage.base import Storage
 from ..transport.http import HttpTransport
-from ..transport.multipart import read_bytes, guess_filename, iter_chunks
+from ..transport.async_http import AsyncHttpTransport, multipart_body
+from ..transport.chunked import (
+    AsyncChunkedUpload,
+    ChunkReader,
+    ChunkedUpload,
+    ChunkSizeTuner,
+    is_stale_upload_error,
+    manifest_key,
+)
+from ..transport.errors import ApiError
+from ..transport.multipart import MultipartEncoder, guess_filename
+from ..transport.ranges import (
+    MIN_SEGMENT_SIZE,
+    PartState,
+    PositionalWriter,
+    RangeInfo,
+    RangeNotHonored,
+    is_partial,
+    plan_segments,
+    range_headers,
+    sha256_prefix,
+    validator_from,
+)
+from ..storage.cas import sha256_file
 
 from ..models.file import (
     UploadSingleResponse,
@@ -21,11 +52,135 @@ from ..models.file import (
 #   optional query: user_filename, description, use_case (multi)
 #   optional formData: metadata-file
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+TUNING_PREFIX = "uploads/tuning"
+
+
+class ChecksumMismatch(ValueError):
+    def __init__(self, file_id: str, expected: str, actual: str):
+        super().__init__(f"File {file_id} sha256 mismatch: expected {expected}, got {actual}")
+        self.file_id = file_id
+        self.expected = expected
+        self.actual = actual
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    file_id: str
+    path: Optional[str]
+    bytes: int
+    sha256: str
+
+
+def _upload_multipart(
+    *,
+    project_id: str,
+    file: Union[str, bytes, BinaryIO],
+    user_filename: Optional[str],
+    description: Optional[str],
+    use_case: Optional[list[str]],
+    metadata: Optional[Dict[str, Any]],
+    metadata_file: Optional[Union[str, bytes, BinaryIO]],
+    metadata_filename: str,
+    use_mmap: bool,
+) -> MultipartEncoder:
+    up_name = guess_filename(file, fallback="upload.bin")
+
+    enc = MultipartEncoder(use_mmap=use_mmap)
+    enc.add_field("project_id", project_id)
+    if user_filename is not None:
+        enc.add_field("user_filename", user_filename)
+    if description is not None:
+        enc.add_field("description", description)
+    if use_case:
+        for uc in use_case:
+            enc.add_field("use_case", uc)
+
+    enc.add_file("file", file, filename=up_name, content_type="application/octet-stream")
+
+    if metadata_file is not None:
+        enc.add_file("metadata-file", metadata_file, filename=metadata_filename, content_type="application/json")
+    elif metadata is not None:
+        meta_bytes = json.dumps(metadata).encode("utf-8")
+        enc.add_file("metadata-file", meta_bytes, filename=metadata_filename, content_type="application/json")
 
+    return enc
 
-class FileAPI:
-    def __init__(self, http: HttpTransport):
+
+class _ChunkedUploadPlanning:
+    """upload_async bookkeeping shared by FileAPI and AsyncFileAPI (storage, manifest key, tuner)."""
+
+    _http: Any
+    _storage: Optional[Storage]
+    _tuner: Optional[ChunkSizeTuner]
+
+    def chunk_tuner(self) -> ChunkSizeTuner:
+        """
+        Tuner used by upload_async(adaptive=True): one per API object, restored from
+        storage (per base URL) when one is configured.
+        """
+        if self._tuner is None:
+            t = ChunkSizeTuner(timeout=float(self._http.timeout) if self._http.timeout else None)
+            if self._storage is not None:
+                t.load(self._storage.read_json(self._tuner_key()))
+            self._tuner = t
+        return self._tuner
+
+    def _tuner_key(self) -> str:
+        return f"{TUNING_PREFIX}/{hashlib.sha1(self._http.base_url.encode('utf-8')).hexdigest()[:16]}"
+
+    def _save_tuner(self) -> None:
+        if self._storage is not None and self._tuner is not None:
+            self._storage.write_json(self._tuner_key(), self._tuner.to_dict())
+
+    def _plan_chunked(
+        self,
+        *,
+        project_id: str,
+        file: Union[str, bytes, BinaryIO],
+        filename: Optional[str],
+        chunk_size: int,
+        concurrency: int,
+        resume: bool,
+        adaptive: bool,
+        tuner: Optional[ChunkSizeTuner],
+    ) -> Tuple[str, int, Optional[str], Optional[ChunkSizeTuner]]:
+        fname = filename or guess_filename(file, fallback="upload.bin")
+
+        if tuner is None and adaptive:
+            tuner = self.chunk_tuner()
+        if tuner is not None:
+            chunk_size = tuner.size_for(_source_size(file), concurrency)
+
+        key = None
+        if self._storage is not None and isinstance(file, str):
+            key = manifest_key(project_id=project_id, filename=fname, path=file)
+            if not resume:
+                self._storage.delete(key)
+            else:
+                prev = self._storage.read_json(key)
+                if isinstance(prev, dict) and prev.get("chunk_size"):
+                    chunk_size = int(prev["chunk_size"])
+
+        return fname, chunk_size, key, tuner
+
+    @staticmethod
+    def _used_chunk_size(resp: AsyncChunkResponse, chunk_size: int) -> AsyncChunkResponse:
+        resp.chunk_size = chunk_size  # extra field: what the tuner/manifest settled on
+        return resp
+
+    def _after_chunked(self, tuner: Optional[ChunkSizeTuner]) -> None:
+        if tuner is not None:
+            tuner.suggest()
+            if tuner is self._tuner:
+                self._save_tuner()
+
+
+class FileAPI(_ChunkedUploadPlanning):
+    def __init__(self, http: HttpTransport, storage: Optional[Storage] = None):
         self._http = http
+        self._storage = storage  # optional: resume manifests / chunk tuning for upload_async
+        self._tuner: Optional[ChunkSizeTuner] = None
 
     def upload(
         self,
@@ -38,34 +193,28 @@ class FileAPI:
         metadata: Optional[Dict[str, Any]] = None,
         metadata_file: Optional[Union[str, bytes, BinaryIO]] = None,
         metadata_filename: str = "metadata.json",
+        use_mmap: bool = False,
     ):
-        file_bytes = read_bytes(file)
-        up_name = guess_filename(file, fallback="upload.bin")
-
-        files: Dict[str, Any] = {"file": (up_name, file_bytes)}
-
-        if metadata_file is not None:
-            meta_bytes = read_bytes(metadata_file)
-            files["metadata-file"] = (metadata_filename, meta_bytes, "application/json")
-        elif metadata is not None:
-            meta_bytes = json.dumps(metadata).encode("utf-8")
-            files["metadata-file"] = (metadata_filename, meta_bytes, "application/json")
-
-        form: list[tuple[str, str]] = [("project_id", project_id)]
-        if user_filename is not None:
-            form.append(("user_filename", user_filename))
-        if description is not None:
-            form.append(("description", description))
-        if use_case:
-            for uc in use_case:
-                form.append(("use_case", uc))
-
-        data = self._http.request(
-            "POST",
-            "/ddm/file/upload",
-            data=form,
-            files=files,
+        """
+        POST /ddm/file/upload (multipart)
+
+        The body is streamed: the file is read from disk while the request is sent
+        (use_mmap=True maps it instead of using buffered reads).
+        """
+        enc = _upload_multipart(
+            project_id=project_id, file=file, user_filename=user_filename, description=description,
+            use_case=use_case, metadata=metadata, metadata_file=metadata_file,
+            metadata_filename=metadata_filename, use_mmap=use_mmap,
         )
+        try:
+            data = self._http.request(
+                "POST",
+                "/ddm/file/upload",
+                data=enc,
+                headers={"Content-Type": enc.content_type},
+            )
+        finally:
+            enc.close()
         return UploadSingleResponse.model_validate(data)
 
 
@@ -107,36 +256,73 @@ class FileAPI:
         file: Union[str, bytes, BinaryIO],
         filename: Optional[str] = None,
         chunk_size: int = 2 * 1024 * 1024,
+        concurrency: int = 4,
+        resume: bool = True,
+        use_mmap: bool = False,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        adaptive: bool = False,
+        tuner: Optional[ChunkSizeTuner] = None,
     ) -> AsyncChunkResponse:
         """
         Convenience method that splits a file and calls /upload/async repeatedly.
 
-        Returns the final 202 response on completion (contains merge_task_id, metadata_task_id).
-        """
-        raw = read_bytes(file)
-        fname = filename or guess_filename(file, fallback="upload.bin")
+        Chunks are read from disk on demand (pread or mmap), never the whole file.
+        Chunk 0 is sent first to obtain file_id, then up to `concurrency` chunks are
+        in flight, and the last chunk goes out once all others are acknowledged.
 
-        total_chunks = (len(raw) + chunk_size - 1) // chunk_size
-        current_file_id: Optional[str] = None
-        last_resp: Optional[AsyncChunkResponse] = None
+        For path sources with a storage configured, a resume manifest is kept under
+        uploads/async/..., so re-running an interrupted upload only sends the missing
+        chunks (resume=False ignores and overwrites it). A resumed upload keeps the
+        chunk size it was started with.
 
-        for idx, chunk in iter_chunks(raw, chunk_size):
-            resp = self.upload_async_chunk(
+        adaptive=True (or an explicit tuner) ignores chunk_size and uses the size the
+        ChunkSizeTuner learned from earlier uploads; this upload's timings are fed
+        back and the next size is persisted under uploads/tuning/... .
+
+        Returns the final 202 response on completion (contains merge_task_id, metadata_task_id),
+        with chunk_size set to the chunk size actually used.
+        """
+        fname, chunk_size, key, tuner = self._plan_chunked(
+            project_id=project_id, file=file, filename=filename, chunk_size=chunk_size,
+            concurrency=concurrency, resume=resume, adaptive=adaptive, tuner=tuner,
+        )
+
+        def send(idx: int, chunk: bytes, file_id: Optional[str]) -> AsyncChunkResponse:
+            return self.upload_async_chunk(
                 project_id=project_id,
                 file_bytes=chunk,
                 filename=fname,
                 chunk_index=idx,
-                total_chunks=total_chunks,
-                file_id=current_file_id,
+                total_chunks=reader.total_chunks,
+                file_id=file_id,
             )
-            last_resp = resp
 
-            if resp.file_id:
-                current_file_id = resp.file_id
+        with ChunkReader(file, chunk_size, use_mmap=use_mmap) as reader:
+
+            def make() -> ChunkedUpload:
+                return ChunkedUpload(
+                    reader,
+                    send,
+                    project_id=project_id,
+                    filename=fname,
+                    concurrency=concurrency,
+                    storage=self._storage,
+                    manifest_key=key,
+                    on_progress=on_progress,
+                    tuner=tuner,
+                )
 
-        if last_resp is None:
-            raise ValueError("Empty upload; no chunks were sent")
-        return last_resp
+            job = make()
+            try:
+                return self._used_chunk_size(job.run(), chunk_size)
+            except ApiError as e:
+                # server forgot the partial upload we tried to resume -> start over once
+                if not (job.resumed and is_stale_upload_error(e)):
+                    raise
+                self._storage.delete(key)
+                return self._used_chunk_size(make().run(), chunk_size)
+            finally:
+                self._after_chunked(tuner)
 
     # -------- upload from link --------
 
@@ -164,7 +350,494 @@ class FileAPI:
             return bytes(data)
         raise TypeError("Expected bytes from download endpoint")
 
+    def iter_download(self, file_id: str, *, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream the file body in chunks without holding it in memory.
+        """
+        with self._http.stream("GET", f"/ddm/file/{file_id}") as r:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
+
+    def probe(self, file_id: str) -> RangeInfo:
+        """
+        HEAD the file: size, whether byte ranges are served, and the validator used
+        for If-Range. A server that refuses HEAD reports no range support.
+        """
+        try:
+            with self._http.stream("HEAD", f"/ddm/file/{file_id}") as r:
+                return RangeInfo.from_headers(r.headers)
+        except ApiError:
+            return RangeInfo(size=None, accept_ranges=False)
+
+    def download_to(
+        self,
+        file_id: str,
+        dest: Union[str, Path, BinaryIO],
+        *,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        expected_sha256: Optional[str] = None,
+        resume: bool = True,
+        segments: int = 1,
+        min_segment_size: int = MIN_SEGMENT_SIZE,
+    ) -> DownloadResult:
+        """
+        Stream the file into a path or a writable binary file object, hashing on the fly.
+
+        For paths the body is written to "<dest>.part" and renamed into place only once
+        the transfer (and the optional sha256 check against e.g. file_hash) succeeded.
+        With resume=True an interrupted transfer keeps its .part and the next call
+        continues from its size with a Range request. segments > 1 fetches a file of
+        at least 2 * min_segment_size in that many parallel byte ranges, written in
+        place with pwrite. Servers without range support get a plain stream.
+        """
+        h = hashlib.sha256()
+        nbytes = 0
+
+        if not isinstance(dest, (str, Path)):
+            for chunk in self.iter_download(file_id, chunk_size=chunk_size):
+                dest.write(chunk)
+                h.update(chunk)
+                nbytes += len(chunk)
+            digest = h.hexdigest()
+            _check_sha256(file_id, expected_sha256, digest)
+            return DownloadResult(file_id=file_id, path=None, bytes=nbytes, sha256=digest)
+
+        out_path = Path(dest).expanduser().resolve()
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        part = out_path.with_name(out_path.name + ".part")
+        if not resume:
+            PartState.clear(part)
+
+        try:
+            done = None
+            if segments > 1:
+                info = self.probe(file_id)
+                if info.accept_ranges and info.size and len(plan_segments(info.size, segments, min_size=min_segment_size)) > 1:
+                    try:
+                        done = self._download_segments(file_id, part, info, segments, min_segment_size, chunk_size)
+                    except RangeNotHonored:
+                        PartState.clear(part)
+            if done is None:
+                done = self._download_resumable(file_id, part, chunk_size)
+            nbytes, digest = done
+            _check_sha256(file_id, expected_sha256, digest)
+        except ChecksumMismatch:
+            PartState.clear(part)
+            raise
+        except BaseException:
+            if not resume:
+                PartState.clear(part)
+            raise
+
+        os.replace(part, out_path)
+        PartState.clear(part, keep_part=True)
+        return DownloadResult(file_id=file_id, path=str(out_path), bytes=nbytes, sha256=digest)
+
+    def _download_resumable(self, file_id: str, part: Path, chunk_size: int) -> Tuple[int, str]:
+        """
+        One stream into part, continuing after its current size when the server
+        allows. Only a part with a stored validator is resumed: without If-Range a
+        file changed on the server would be spliced onto stale bytes.
+        """
+        state = PartState.load(part)
+        offset = part.stat().st_size if part.exists() and state.validator and not state.segments else 0
+        headers = range_headers(offset, validator=state.validator) if offset else None
+        try:
+            r = self._http.stream("GET", f"/ddm/file/{file_id}", headers=headers)
+        except ApiError as e:
+            if offset and e.status_code == 416:  # nothing left past offset: start over
+                PartState.clear(part)
+                return self._download_resumable(file_id, part, chunk_size)
+            raise
+
+        with r:
+            if offset and not is_partial(r.status_code, r.headers, offset):
+                offset = 0  # whole body (changed on the server, or no range support)
+            if offset:
+                h = sha256_prefix(part, offset)
+            else:
+                h = hashlib.sha256()
+                PartState(part=part, validator=validator_from(r.headers)).save()
+            nbytes = offset
+            with part.open("ab" if offset else "wb") as f:
+                for chunk in r.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        f.write(chunk)
+                        h.update(chunk)
+                        nbytes += len(chunk)
+        return nbytes, h.hexdigest()
+
+    def _download_segments(
+        self,
+        file_id: str,
+        part: Path,
+        info: RangeInfo,
+        segments: int,
+        min_segment_size: int,
+        chunk_size: int,
+    ) -> Tuple[int, str]:
+        """Parallel byte ranges into a preallocated part; finished segments survive a restart."""
+        plan = plan_segments(info.size, segments, min_size=min_segment_size)
+        state = PartState.load(part)
+        if not (
+            state.segments == plan and state.size == info.size and state.validator == info.validator
+            and part.exists() and part.stat().st_size == info.size
+        ):
+            with part.open("wb") as f:
+                f.truncate(info.size)
+            state = PartState(part=part, validator=info.validator, size=info.size, segments=plan)
+            state.save()
+
+        lock = threading.Lock()
+        todo = [i for i in range(len(plan)) if i not in state.done]
+
+        def fetch(i: int, w: PositionalWriter) -> None:
+            start, end = plan[i]
+            headers = range_headers(start, end, validator=info.validator)
+            with self._http.stream("GET", f"/ddm/file/{file_id}", headers=headers) as r:
+                if not is_partial(r.status_code, r.headers, start):
+                    raise RangeNotHonored(f"File {file_id}: bytes {start}-{end} answered with HTTP {r.status_code}")
+                pos = start
+                for chunk in r.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        w.write(pos, chunk)
+                        pos += len(chunk)
+            if pos != end + 1:
+                raise IOError(f"File {file_id}: segment {start}-{end} ended at byte {pos}")
+            with lock:
+                state.done.append(i)
+                state.save()
+
+        if todo:
+            with PositionalWriter(part) as w, ThreadPoolExecutor(
+                max_workers=min(segments, len(todo)), thread_name_prefix="ddm-range"
+            ) as pool:
+                finished, _ = wait([pool.submit(fetch, i, w) for i in todo], return_when=FIRST_EXCEPTION)
+                errors = [f.exception() for f in finished if f.exception() is not None]
+                if errors:
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    raise errors[0]
+
+        return info.size, sha256_file(part)
+
     # -------- delete file --------
 
     def delete(self, file_id: str) -> Dict[str, Any]:
         return self._http.request("DELETE", f"/ddm/file/{file_id}/delete")
+
+
+def _source_size(source: Union[str, bytes, BinaryIO]) -> Optional[int]:
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    if isinstance(source, str):
+        return os.path.getsize(source)
+    return None
+
+
+def _check_sha256(file_id: str, expected: Optional[str], actual: str) -> None:
+    if not expected:
+        return
+    exp = expected.strip().lower()
+    if exp.startswith("0x"):
+        exp = exp[2:]
+    if exp != actual:
+        raise ChecksumMismatch(file_id, expected, actual)
+
+
+class AsyncFileAPI(_ChunkedUploadPlanning):
+    """
+    asyncio version of FileAPI. Disk I/O (multipart blocks, chunk reads, download
+    writes) runs in worker threads so it never blocks the event loop.
+    """
+
+    def __init__(self, http: AsyncHttpTransport, storage: Optional[Storage] = None):
+        self._http = http
+        self._storage = storage
+        self._tuner: Optional[ChunkSizeTuner] = None
+
+    async def upload(
+        self,
+        *,
+        project_id: str,
+        file: Union[str, bytes, BinaryIO],
+        user_filename: Optional[str] = None,
+        description: Optional[str] = None,
+        use_case: Optional[list[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        metadata_file: Optional[Union[str, bytes, BinaryIO]] = None,
+        metadata_filename: str = "metadata.json",
+        use_mmap: bool = False,
+    ) -> UploadSingleResponse:
+        enc = _upload_multipart(
+            project_id=project_id, file=file, user_filename=user_filename, description=description,
+            use_case=use_case, metadata=metadata, metadata_file=metadata_file,
+            metadata_filename=metadata_filename, use_mmap=use_mmap,
+        )
+        body, headers = multipart_body(enc)
+        try:
+            data = await self._http.request("POST", "/ddm/file/upload", data=body, headers=headers)
+        finally:
+            enc.close()
+        return UploadSingleResponse.model_validate(data)
+
+    # -------- async chunk upload --------
+
+    async def upload_async_chunk(
+        self,
+        *,
+        project_id: str,
+        file_bytes: bytes,
+        filename: str,
+        chunk_index: int,
+        total_chunks: int,
+        file_id: Optional[str] = None,
+    ) -> AsyncChunkResponse:
+        enc = MultipartEncoder()
+        enc.add_field("chunk_index", str(chunk_index))
+        enc.add_field("total_chunks", str(total_chunks))
+        enc.add_field("filename", filename)
+        enc.add_field("project_id", project_id)
+        if file_id:
+            enc.add_field("file_id", file_id)
+        enc.add_file("file", file_bytes, filename=filename, content_type="application/octet-stream")
+
+        resp = await self._http.request(
+            "POST",
+            "/ddm/file/upload/async",
+            data=enc.read(),
+            headers={"Content-Type": enc.content_type},
+        )
+        return AsyncChunkResponse.model_validate(resp)
+
+    async def upload_async(
+        self,
+        *,
+        project_id: str,
+        file: Union[str, bytes, BinaryIO],
+        filename: Optional[str] = None,
+        chunk_size: int = 2 * 1024 * 1024,
+        concurrency: int = 4,
+        resume: bool = True,
+        use_mmap: bool = False,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        adaptive: bool = False,
+        tuner: Optional[ChunkSizeTuner] = None,
+    ) -> AsyncChunkResponse:
+        """Same protocol, resume manifest and tuning as FileAPI.upload_async."""
+        fname, chunk_size, key, tuner = self._plan_chunked(
+            project_id=project_id, file=file, filename=filename, chunk_size=chunk_size,
+            concurrency=concurrency, resume=resume, adaptive=adaptive, tuner=tuner,
+        )
+
+        async def send(idx: int, chunk: bytes, file_id: Optional[str]) -> AsyncChunkResponse:
+            return await self.upload_async_chunk(
+                project_id=project_id,
+                file_bytes=chunk,
+                filename=fname,
+                chunk_index=idx,
+                total_chunks=reader.total_chunks,
+                file_id=file_id,
+            )
+
+        with ChunkReader(file, chunk_size, use_mmap=use_mmap) as reader:
+
+            def make() -> AsyncChunkedUpload:
+                return AsyncChunkedUpload(
+                    reader,
+                    send,
+                    project_id=project_id,
+                    filename=fname,
+                    concurrency=concurrency,
+                    storage=self._storage,
+                    manifest_key=key,
+                    on_progress=on_progress,
+                    tuner=tuner,
+                )
+
+            job = make()
+            try:
+                return self._used_chunk_size(await job.run(), chunk_size)
+            except ApiError as e:
+                if not (job.resumed and is_stale_upload_error(e)):
+                    raise
+                await asyncio.to_thread(self._storage.delete, key)
+                return self._used_chunk_size(await make().run(), chunk_size)
+            finally:
+                await asyncio.to_thread(self._after_chunked, tuner)
+
+    # -------- upload from link --------
+
+    async def upload_link(self, body: Union[UploadLinkBody, Dict[str, Any]]) -> TaskChainUploadLinkResponse:
+        payload = body.model_dump() if isinstance(body, UploadLinkBody) else dict(body)
+        data = await self._http.request("POST", "/ddm/file/upload-link", json=payload)
+        return TaskChainUploadLinkResponse.model_validate(data)
+
+    # -------- update file --------
+
+    async def update(self, file_id: str, body: Union[FileUpdateBody, Dict[str, Any]]) -> UpdateFileResponse:
+        payload = body.model_dump(exclude_none=True) if isinstance(body, FileUpdateBody) else dict(body)
+        data = await self._http.request("PATCH", f"/ddm/file/update/{file_id}", json=payload)
+        return UpdateFileResponse.model_validate(data)
+
+    # -------- download file --------
+
+    async def download(self, file_id: str) -> bytes:
+        data = await self._http.request("GET", f"/ddm/file/{file_id}")
+        if isinstance(data, (bytes, bytearray)):
+            return bytes(data)
+        raise TypeError("Expected bytes from download endpoint")
+
+    async def iter_download(self, file_id: str, *, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        async with self._http.stream("GET", f"/ddm/file/{file_id}") as r:
+            async for chunk in r.content.iter_chunked(chunk_size):
+                if chunk:
+                    yield chunk
+
+    async def probe(self, file_id: str) -> RangeInfo:
+        try:
+            async with self._http.stream("HEAD", f"/ddm/file/{file_id}") as r:
+                return RangeInfo.from_headers(r.headers)
+        except ApiError:
+            return RangeInfo(size=None, accept_ranges=False)
+
+    async def download_to(
+        self,
+        file_id: str,
+        dest: Union[str, Path, BinaryIO],
+        *,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        expected_sha256: Optional[str] = None,
+        resume: bool = True,
+        segments: int = 1,
+        min_segment_size: int = MIN_SEGMENT_SIZE,
+    ) -> DownloadResult:
+        """Same contract as FileAPI.download_to (".part" + rename, resume, segments, sha256 check)."""
+        h = hashlib.sha256()
+        nbytes = 0
+
+        if not isinstance(dest, (str, Path)):
+            async for chunk in self.iter_download(file_id, chunk_size=chunk_size):
+                await asyncio.to_thread(dest.write, chunk)
+                h.update(chunk)
+                nbytes += len(chunk)
+            digest = h.hexdigest()
+            _check_sha256(file_id, expected_sha256, digest)
+            return DownloadResult(file_id=file_id, path=None, bytes=nbytes, sha256=digest)
+
+        out_path = Path(dest).expanduser().resolve()
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        part = out_path.with_name(out_path.name + ".part")
+        if not resume:
+            PartState.clear(part)
+
+        try:
+            done = None
+            if segments > 1:
+                info = await self.probe(file_id)
+                if info.accept_ranges and info.size and len(plan_segments(info.size, segments, min_size=min_segment_size)) > 1:
+                    try:
+                        done = await self._download_segments(file_id, part, info, segments, min_segment_size, chunk_size)
+                    except RangeNotHonored:
+                        PartState.clear(part)
+            if done is None:
+                done = await self._download_resumable(file_id, part, chunk_size)
+            nbytes, digest = done
+            _check_sha256(file_id, expected_sha256, digest)
+        except ChecksumMismatch:
+            PartState.clear(part)
+            raise
+        except BaseException:
+            if not resume:
+                PartState.clear(part)
+            raise
+
+        os.replace(part, out_path)
+        PartState.clear(part, keep_part=True)
+        return DownloadResult(file_id=file_id, path=str(out_path), bytes=nbytes, sha256=digest)
+
+    async def _download_resumable(self, file_id: str, part: Path, chunk_size: int) -> Tuple[int, str]:
+        state = PartState.load(part)
+        offset = part.stat().st_size if part.exists() and state.validator and not state.segments else 0
+        headers = range_headers(offset, validator=state.validator) if offset else None
+        try:
+            async with self._http.stream("GET", f"/ddm/file/{file_id}", headers=headers) as r:
+                if offset and not is_partial(r.status, r.headers, offset):
+                    offset = 0
+                if offset:
+                    h = await asyncio.to_thread(sha256_prefix, part, offset)
+                else:
+                    h = hashlib.sha256()
+                    await asyncio.to_thread(PartState(part=part, validator=validator_from(r.headers)).save)
+                nbytes = offset
+                f = await asyncio.to_thread(part.open, "ab" if offset else "wb")
+                try:
+                    async for chunk in r.content.iter_chunked(chunk_size):
+                        await asyncio.to_thread(f.write, chunk)
+                        h.update(chunk)
+                        nbytes += len(chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
+        except ApiError as e:
+            if offset and e.status_code == 416:
+                PartState.clear(part)
+                return await self._download_resumable(file_id, part, chunk_size)
+            raise
+        return nbytes, h.hexdigest()
+
+    async def _download_segments(
+        self,
+        file_id: str,
+        part: Path,
+        info: RangeInfo,
+        segments: int,
+        min_segment_size: int,
+        chunk_size: int,
+    ) -> Tuple[int, str]:
+        plan = plan_segments(info.size, segments, min_size=min_segment_size)
+        state = PartState.load(part)
+        if not (
+            state.segments == plan and state.size == info.size and state.validator == info.validator
+            and part.exists() and part.stat().st_size == info.size
+        ):
+            with part.open("wb") as f:
+                f.truncate(info.size)
+            state = PartState(part=part, validator=info.validator, size=info.size, segments=plan)
+            await asyncio.to_thread(state.save)
+
+        save_lock = asyncio.Lock()  # one state write at a time, in completion order
+
+        async def fetch(i: int, w: PositionalWriter) -> None:
+            start, end = plan[i]
+            headers = range_headers(start, end, validator=info.validator)
+            async with self._http.stream("GET", f"/ddm/file/{file_id}", headers=headers) as r:
+                if not is_partial(r.status, r.headers, start):
+                    raise RangeNotHonored(f"File {file_id}: bytes {start}-{end} answered with HTTP {r.status}")
+                pos = start
+                async for chunk in r.content.iter_chunked(chunk_size):
+                    await asyncio.to_thread(w.write, pos, chunk)
+                    pos += len(chunk)
+            if pos != end + 1:
+                raise IOError(f"File {file_id}: segment {start}-{end} ended at byte {pos}")
+            state.done.append(i)
+            async with save_lock:
+                await asyncio.to_thread(state.save)
+
+        todo = [i for i in range(len(plan)) if i not in state.done]
+        if todo:
+            with PositionalWriter(part) as w:
+                tasks = [asyncio.ensure_future(fetch(i, w)) for i in todo]
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    for t in tasks:
+                        t.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
+
+        return info.size, await asyncio.to_thread(sha256_file, part)
+
+    # -------- delete file --------
+
+    async def delete(self, file_id: str) -> Dict[str, Any]:
+        return await self._http.request("DELETE", f"/ddm/file/{file_id}/delete")
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Sequence, Union
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
+from ..storage.base import Storage
+from ..transport.archive import ZIP_CHUNK_SIZE, ArchiveResult, save_archive
+from ..transport.errors import ApiError, BadRequest, NotFound
 from ..transport.http import HttpTransport
 from ..models.file_metadata import FileIdsRequest, FileMetadataMapResponse
 
+METADATA_BATCH_SIZE = 100
+CACHE_PREFIX = "cache/file_metadata"
+
+
+def _id_specific(e: Exception) -> bool:
+    """Errors a smaller batch could avoid: the server rejected (some of) the ids or the body."""
+    if isinstance(e, (BadRequest, NotFound, TypeError)):
+        return True
+    return isinstance(e, ApiError) and e.status_code == 422
+
 
 class FileMetadataAPI:
-    def __init__(self, http: HttpTransport):
+    def __init__(self, http: HttpTransport, storage: Optional[Storage] = None):
         self._http = http
+        self._storage = storage
 
     # GET /ddm/file_metadata/{file_id}
     def get(self, file_id: str) -> Dict[str, Any]:
@@ -21,32 +39,145 @@ class FileMetadataAPI:
         raise TypeError("Expected JSON object from /ddm/file_metadata/{file_id}")
 
     # POST /ddm/file_metadata/
-    def get_many(self, file_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
-        ids = [str(x) for x in file_ids if str(x).strip()]
+    def get_many(
+        self,
+        file_ids: Sequence[str],
+        *,
+        batch_size: int = METADATA_BATCH_SIZE,
+        max_workers: int = 4,
+        versions: Optional[Mapping[str, Optional[str]]] = None,
+        raise_on_error: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Metadata per file id for the ids the server returned (see
+        get_many_with_errors); ids without metadata are left out. With
+        raise_on_error=True the first per-id error is raised instead, once every
+        batch is done.
+        """
+        found, errors = self.get_many_with_errors(
+            file_ids, batch_size=batch_size, max_workers=max_workers, versions=versions
+        )
+        if errors and raise_on_error:
+            raise next(iter(errors.values()))
+        return found
+
+    def get_many_with_errors(
+        self,
+        file_ids: Sequence[str],
+        *,
+        batch_size: int = METADATA_BATCH_SIZE,
+        max_workers: int = 4,
+        versions: Optional[Mapping[str, Optional[str]]] = None,
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+        """
+        (metadata by id, error by id). Ids are POSTed in batches of `batch_size`,
+        up to `max_workers` batches at a time. A batch rejected for its ids (400,
+        404, 422, malformed body) is split in half until the failing ids are
+        isolated; a single id that still fails is tried with get(). Transport,
+        auth and server errors are recorded for every id of the batch. Ids the
+        response leaves out (or maps to null) get NotFound.
+
+        With storage configured, results are cached per id together with
+        versions[id] (e.g. the catalog "created"/update timestamp) and reused
+        while that version is unchanged. Ids without a version are always fetched.
+        """
+        ids = list(dict.fromkeys(str(x).strip() for x in file_ids if str(x).strip()))
+        found: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, Exception] = {}
         if not ids:
-            return {}
+            return found, errors
 
-        payload = {"file_ids": ids}
+        versions = versions or {}
+        todo = []
+        for fid in ids:
+            hit = self._cached(fid, versions.get(fid))
+            if hit is not None:
+                found[fid] = hit
+            else:
+                todo.append(fid)
 
-        try:
-            data = self._http.request("POST", "/ddm/file_metadata/", json=payload)
+        batches = [todo[i:i + max(1, batch_size)] for i in range(0, len(todo), max(1, batch_size))]
+        if batches:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches))), thread_name_prefix="ddm-meta") as pool:
+                for ok, bad in pool.map(self._fetch_batch, batches):
+                    found.update(ok)
+                    errors.update(bad)
 
-            # expected: { "<id>": {...}, "<id2>": {...} }
-            if isinstance(data, dict) and all(isinstance(v, dict) for v in data.values()):
-                return data  # mapping ok
+        for fid in todo:
+            if fid in found and versions.get(fid):
+                self._store(fid, versions[fid], found[fid])
 
-            # sometimes wrapped: {"metadata": {...}}
-            if isinstance(data, dict) and isinstance(data.get("metadata"), dict):
-                return data["metadata"]
+        # input order
+        return {f: found[f] for f in ids if f in found}, {f: errors[f] for f in ids if f in errors}
 
-        except Exception:
-            pass
+    def _post_many(self, ids: List[str]) -> Dict[str, Any]:
+        data = self._http.request("POST", "/ddm/file_metadata/", json={"file_ids": ids})
+        # expected: {"metadata": {"<id>": {...}}}; older servers return the mapping itself
+        if isinstance(data, dict) and isinstance(data.get("metadata"), dict):
+            return data["metadata"]
+        if isinstance(data, dict):
+            return data
+        raise TypeError("Expected JSON object from /ddm/file_metadata/")
 
-        # fallback
-        out: Dict[str, Dict[str, Any]] = {}
+    def _fetch_batch(self, ids: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+        """
+        One batch, bisected when the server rejects something about the ids.
+        Transport, auth and server errors say nothing about the ids: they are
+        recorded for the whole batch without splitting it.
+        """
+        try:
+            mapping = self._post_many(ids)
+        except Exception as e:
+            if not _id_specific(e):
+                return {}, {fid: e for fid in ids}
+            if len(ids) == 1:
+                try:
+                    return {ids[0]: self.get(ids[0])}, {}
+                except Exception as e2:
+                    return {}, {ids[0]: e2}
+            mid = len(ids) // 2
+            left_ok, left_bad = self._fetch_batch(ids[:mid])
+            right_ok, right_bad = self._fetch_batch(ids[mid:])
+            return {**left_ok, **right_ok}, {**left_bad, **right_bad}
+
+        ok: Dict[str, Dict[str, Any]] = {}
+        bad: Dict[str, Exception] = {}
         for fid in ids:
-            out[fid] = self.get(fid)
-        return out
+            v = mapping.get(fid)
+            if isinstance(v, dict):
+                ok[fid] = v
+            else:
+                bad[fid] = NotFound(404, f"No metadata returned for file {fid}")
+        return ok, bad
+
+    # ---- local cache ----
+
+    def _cache_key(self, file_id: str) -> str:
+        scope = hashlib.sha1(self._http.base_url.encode("utf-8")).hexdigest()[:16]
+        return f"{CACHE_PREFIX}/{scope}/{file_id}"
+
+    def _cached(self, file_id: str, version: Optional[str]) -> Optional[Dict[str, Any]]:
+        if self._storage is None or not version:
+            return None
+        d = self._storage.read_json(self._cache_key(file_id))
+        if isinstance(d, dict) and d.get("version") == version and isinstance(d.get("metadata"), dict):
+            return d["metadata"]
+        return None
+
+    def _store(self, file_id: str, version: str, metadata: Dict[str, Any]) -> None:
+        if self._storage is None:
+            return
+        self._storage.write_json(
+            self._cache_key(file_id),
+            {"version": version, "fetched_at": datetime.now(timezone.utc).isoformat(), "metadata": metadata},
+        )
+
+    def invalidate(self, file_ids: Sequence[str]) -> None:
+        """Drop cached metadata for these ids."""
+        if self._storage is None:
+            return
+        for fid in file_ids:
+            self._storage.delete(self._cache_key(str(fid)))
 
     # GET /ddm/file_metadata/report/{file_id}  (HTML)
     def get_report_html(self, file_id: str) -> str:
@@ -67,14 +198,37 @@ class FileMetadataAPI:
         """
         Returns ZIP bytes containing *_profile_report.html files.
         """
-        if isinstance(file_ids, FileIdsRequest):
-            payload = file_ids.model_dump()
-        elif isinstance(file_ids, dict):
-            payload = file_ids
-        else:
-            payload = {"file_ids": list(file_ids)}
-
+        payload = _file_ids_payload(file_ids)
         resp = self._http.request("POST", "/ddm/file_metadata/reports", json=payload)
         if isinstance(resp, (bytes, bytearray)):
             return bytes(resp)
         raise TypeError("Expected ZIP bytes from /ddm/file_metadata/reports")
+
+    def download_reports_zip_to(
+        self,
+        file_ids: Union[FileIdsRequest, Sequence[str], Dict[str, Any]],
+        dest: Union[str, Path],
+        *,
+        extract: bool = False,
+        workers: int = 4,
+        chunk_size: int = ZIP_CHUNK_SIZE,
+    ) -> ArchiveResult:
+        """
+        Stream the reports ZIP to the path `dest`, or with extract=True into the
+        directory `dest` (see FilesAPI.download_zip_to).
+        """
+        def chunks():
+            with self._http.stream("POST", "/ddm/file_metadata/reports", json=_file_ids_payload(file_ids)) as r:
+                for chunk in r.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        yield chunk
+
+        return save_archive(chunks(), dest, extract=extract, workers=workers)
+
+
+def _file_ids_payload(file_ids: Any) -> Dict[str, Any]:
+    if isinstance(file_ids, FileIdsRequest):
+        return file_ids.model_dump()
+    if isinstance(file_ids, dict):
+        return file_ids
+    return {"file_ids": list(file_ids)}
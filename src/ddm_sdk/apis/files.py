@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence, Union, BinaryIO
+import zipfile
+from pathlib import Path
+from typing import IO, Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union, BinaryIO
 
+from ..transport.archive import ZIP_CHUNK_SIZE, ArchiveResult, asave_archive, iter_spooled_members, save_archive
+from ..transport.async_http import AsyncHttpTransport, multipart_body
 from ..transport.http import HttpTransport
-from ..transport.multipart import read_bytes, guess_filename
+from ..transport.multipart import MultipartEncoder, guess_filename
 import json
 from ..models.files import (
     BulkUploadResponse,
@@ -17,6 +21,72 @@ from ..models.files import (
 )
 
 
+def _upload_multipart(
+    *,
+    project_id: str,
+    files: Sequence[Union[str, bytes, BinaryIO]],
+    user_filenames: Optional[Sequence[str]],
+    descriptions: Optional[Sequence[str]],
+    use_case: Optional[Sequence[Union[str, List[str]]]],
+    metadata_files: Optional[Sequence[Union[str, bytes, BinaryIO]]],
+    metadata_filenames: Optional[Sequence[str]],
+    use_mmap: bool,
+) -> MultipartEncoder:
+    multipart = MultipartEncoder(use_mmap=use_mmap)
+
+    # ✅ project_id as form field
+    multipart.add_field("project_id", project_id)
+
+    # repeat files
+    for idx, f in enumerate(files):
+        fname = guess_filename(f, fallback=f"file_{idx}")
+        multipart.add_file("files", f, filename=fname, content_type="application/octet-stream")
+
+        # per-file user_filenames/descriptions/use_case as form fields (repeat)
+        if user_filenames and idx < len(user_filenames) and user_filenames[idx]:
+            multipart.add_field("user_filenames", str(user_filenames[idx]))
+
+        if descriptions and idx < len(descriptions) and descriptions[idx] is not None:
+            multipart.add_field("descriptions", str(descriptions[idx]))
+
+        if use_case:
+            for uc in use_case:
+                if isinstance(uc, list):
+                    uc_json = json.dumps(uc)
+                else:
+                    s = str(uc).strip()
+                    uc_json = s if s.startswith("[") else json.dumps([s])
+                multipart.add_field("use_case", uc_json)
+
+    #  optional metadata-files
+    if metadata_files:
+        for j, mf in enumerate(metadata_files):
+            mname = (
+                metadata_filenames[j]
+                if (metadata_filenames and j < len(metadata_filenames))
+                else guess_filename(mf, fallback=f"metadata_{j}.json")
+            )
+            multipart.add_file("metadata-files", mf, filename=mname, content_type="application/json")
+
+    return multipart
+
+
+def _file_ids_payload(file_ids: Any, model: Any) -> Dict[str, Any]:
+    if isinstance(file_ids, model):
+        return file_ids.model_dump()
+    if isinstance(file_ids, dict):
+        return file_ids
+    return {"file_ids": list(file_ids)}
+
+
+def _project_payload(project_id: Any) -> Dict[str, Any]:
+    if isinstance(project_id, ProjectDownloadRequest):
+        return project_id.model_dump()
+    if isinstance(project_id, dict):
+        return project_id
+    return {"project_id": project_id}
+
+
 class FilesAPI:
     def __init__(self, http: HttpTransport):
         self._http = http
@@ -31,6 +101,7 @@ class FilesAPI:
         use_case: Optional[Sequence[Union[str, List[str]]]] = None,
         metadata_files: Optional[Sequence[Union[str, bytes, BinaryIO]]] = None,
         metadata_filenames: Optional[Sequence[str]] = None,
+        use_mmap: bool = False,
     ) -> BulkUploadResponse:
         """
         POST /ddm/files/upload (multipart)
@@ -38,53 +109,26 @@ class FilesAPI:
         IMPORTANT: backend expects these as multipart form fields (repeated):
           project_id, user_filenames, descriptions, use_case
         plus repeated files=...
+
+        The body is streamed part by part, so only one block of one file is in
+        memory at a time regardless of how many files are uploaded.
         """
 
-        multipart: List[Any] = []
-
-        # ✅ project_id as form field
-        multipart.append(("project_id", (None, project_id)))
-
-        # repeat files
-        for idx, f in enumerate(files):
-            content = read_bytes(f)
-            fname = guess_filename(f, fallback=f"file_{idx}")
-            multipart.append(("files", (fname, content)))
-
-            # per-file user_filenames/descriptions/use_case as form fields (repeat)
-            if user_filenames and idx < len(user_filenames) and user_filenames[idx]:
-                multipart.append(("user_filenames", (None, str(user_filenames[idx]))))
-
-            if descriptions and idx < len(descriptions) and descriptions[idx] is not None:
-                multipart.append(("descriptions", (None, str(descriptions[idx]))))
-
-            if use_case:
-                for uc in use_case:
-                    if isinstance(uc, list):
-                        uc_json = json.dumps(uc)
-                    else:
-                        s = str(uc).strip()
-                        uc_json = s if s.startswith("[") else json.dumps([s])
-                    multipart.append(("use_case", (None, uc_json)))
-
-        #  optional metadata-files
-        if metadata_files:
-            for j, mf in enumerate(metadata_files):
-                mcontent = read_bytes(mf)
-                mname = (
-                    metadata_filenames[j]
-                    if (metadata_filenames and j < len(metadata_filenames))
-                    else guess_filename(mf, fallback=f"metadata_{j}.json")
-                )
-                multipart.append(("metadata-files", (mname, mcontent, "application/json")))
-
-        data = self._http.request(
-            "POST",
-            "/ddm/files/upload",
-            params=None,
-            data=None,
-            files=multipart,
+        multipart = _upload_multipart(
+            project_id=project_id, files=files, user_filenames=user_filenames, descriptions=descriptions,
+            use_case=use_case, metadata_files=metadata_files, metadata_filenames=metadata_filenames,
+            use_mmap=use_mmap,
         )
+        try:
+            data = self._http.request(
+                "POST",
+                "/ddm/files/upload",
+                params=None,
+                data=multipart,
+                headers={"Content-Type": multipart.content_type},
+            )
+        finally:
+            multipart.close()
         return BulkUploadResponse.model_validate(data)
 
 
@@ -114,13 +158,7 @@ class FilesAPI:
     # /ddm/files/delete (bulk delete)
     # ----------------------------
     def delete(self, file_ids: Union[DeleteFileIds, Sequence[str], Dict[str, Any]]) -> Dict[str, Any]:
-        if isinstance(file_ids, DeleteFileIds):
-            payload = file_ids.model_dump()
-        elif isinstance(file_ids, dict):
-            payload = file_ids
-        else:
-            payload = {"file_ids": list(file_ids)}
-
+        payload = _file_ids_payload(file_ids, DeleteFileIds)
         return self._http.request("DELETE", "/ddm/files/delete", json=payload)
 
     # ----------------------------
@@ -130,13 +168,7 @@ class FilesAPI:
         """
         Returns ZIP bytes. Backend uses send_file(..., mimetype="application/zip").
         """
-        if isinstance(file_ids, DownloadFileIds):
-            payload = file_ids.model_dump()
-        elif isinstance(file_ids, dict):
-            payload = file_ids
-        else:
-            payload = {"file_ids": list(file_ids)}
-
+        payload = _file_ids_payload(file_ids, DownloadFileIds)
         resp = self._http.request("POST", "/ddm/files/download", json=payload)
         if isinstance(resp, (bytes, bytearray)):
             return bytes(resp)
@@ -146,14 +178,167 @@ class FilesAPI:
     # /ddm/files/download/project (zip bytes)
     # ----------------------------
     def download_project_zip(self, project_id: Union[ProjectDownloadRequest, str, Dict[str, Any]]) -> bytes:
-        if isinstance(project_id, ProjectDownloadRequest):
-            payload = project_id.model_dump()
-        elif isinstance(project_id, dict):
-            payload = project_id
-        else:
-            payload = {"project_id": project_id}
-
+        payload = _project_payload(project_id)
         resp = self._http.request("POST", "/ddm/files/download/project", json=payload)
         if isinstance(resp, (bytes, bytearray)):
             return bytes(resp)
         raise TypeError("Expected ZIP bytes from /ddm/files/download/project")
+
+    # ----------------------------
+    # streamed ZIP downloads (never held in memory)
+    # ----------------------------
+    def _iter_zip(self, path: str, payload: Dict[str, Any], chunk_size: int) -> Iterator[bytes]:
+        with self._http.stream("POST", path, json=payload) as r:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
+
+    def download_zip_to(
+        self,
+        file_ids: Union[DownloadFileIds, Sequence[str], Dict[str, Any]],
+        dest: Union[str, Path],
+        *,
+        extract: bool = False,
+        workers: int = 4,
+        chunk_size: int = ZIP_CHUNK_SIZE,
+    ) -> ArchiveResult:
+        """
+        Stream the ZIP to the path `dest`, or with extract=True into the directory
+        `dest` (members extracted by `workers` threads, each CRC-checked).
+        """
+        chunks = self._iter_zip("/ddm/files/download", _file_ids_payload(file_ids, DownloadFileIds), chunk_size)
+        return save_archive(chunks, dest, extract=extract, workers=workers)
+
+    def download_project_zip_to(
+        self,
+        project_id: Union[ProjectDownloadRequest, str, Dict[str, Any]],
+        dest: Union[str, Path],
+        *,
+        extract: bool = False,
+        workers: int = 4,
+        chunk_size: int = ZIP_CHUNK_SIZE,
+    ) -> ArchiveResult:
+        """download_zip_to() for the whole project."""
+        chunks = self._iter_zip("/ddm/files/download/project", _project_payload(project_id), chunk_size)
+        return save_archive(chunks, dest, extract=extract, workers=workers)
+
+    def iter_zip_members(
+        self,
+        file_ids: Union[DownloadFileIds, Sequence[str], Dict[str, Any]],
+        *,
+        spool_dir: Optional[Union[str, Path]] = None,
+        chunk_size: int = ZIP_CHUNK_SIZE,
+    ) -> Iterator[Tuple[zipfile.ZipInfo, IO[bytes]]]:
+        """
+        Yield (ZipInfo, file object) per member. The body is spooled to a temp file
+        in `spool_dir` first (removed when the iterator is closed); each file object
+        is valid until the next item and raises BadZipFile on a CRC mismatch.
+        """
+        chunks = self._iter_zip("/ddm/files/download", _file_ids_payload(file_ids, DownloadFileIds), chunk_size)
+        return iter_spooled_members(chunks, dir=spool_dir)
+
+    def iter_project_zip_members(
+        self,
+        project_id: Union[ProjectDownloadRequest, str, Dict[str, Any]],
+        *,
+        spool_dir: Optional[Union[str, Path]] = None,
+        chunk_size: int = ZIP_CHUNK_SIZE,
+    ) -> Iterator[Tuple[zipfile.ZipInfo, IO[bytes]]]:
+        """iter_zip_members() for the whole project."""
+        chunks = self._iter_zip("/ddm/files/download/project", _project_payload(project_id), chunk_size)
+        return iter_spooled_members(chunks, dir=spool_dir)
+
+
+class AsyncFilesAPI:
+    """asyncio version of FilesAPI (same arguments and models)."""
+
+    def __init__(self, http: AsyncHttpTransport):
+        self._http = http
+
+    async def upload(
+        self,
+        *,
+        project_id: str,
+        files: Sequence[Union[str, bytes, BinaryIO]],
+        user_filenames: Optional[Sequence[str]] = None,
+        descriptions: Optional[Sequence[str]] = None,
+        use_case: Optional[Sequence[Union[str, List[str]]]] = None,
+        metadata_files: Optional[Sequence[Union[str, bytes, BinaryIO]]] = None,
+        metadata_filenames: Optional[Sequence[str]] = None,
+        use_mmap: bool = False,
+    ) -> BulkUploadResponse:
+        multipart = _upload_multipart(
+            project_id=project_id, files=files, user_filenames=user_filenames, descriptions=descriptions,
+            use_case=use_case, metadata_files=metadata_files, metadata_filenames=metadata_filenames,
+            use_mmap=use_mmap,
+        )
+        body, headers = multipart_body(multipart)
+        try:
+            data = await self._http.request("POST", "/ddm/files/upload", data=body, headers=headers)
+        finally:
+            multipart.close()
+        return BulkUploadResponse.model_validate(data)
+
+    async def upload_links(
+        self,
+        body: Union[UploadFileUrlsRequest, Dict[str, Any]],
+    ) -> UploadFileUrlsResponse:
+        payload = body.model_dump() if isinstance(body, UploadFileUrlsRequest) else dict(body)
+        data = await self._http.request("POST", "/ddm/files/upload-links", json=payload)
+        return UploadFileUrlsResponse.model_validate(data)
+
+    async def update(
+        self,
+        body: Union[FilesUpdateRequest, Dict[str, Any]],
+    ) -> FilesUpdateResponse:
+        payload = body.model_dump(exclude_none=True) if isinstance(body, FilesUpdateRequest) else dict(body)
+        data = await self._http.request("PATCH", "/ddm/files/update", json=payload)
+        return FilesUpdateResponse.model_validate(data)
+
+    async def delete(self, file_ids: Union[DeleteFileIds, Sequence[str], Dict[str, Any]]) -> Dict[str, Any]:
+        payload = _file_ids_payload(file_ids, DeleteFileIds)
+        return await self._http.request("DELETE", "/ddm/files/delete", json=payload)
+
+    async def download_zip(self, file_ids: Union[DownloadFileIds, Sequence[str], Dict[str, Any]]) -> bytes:
+        payload = _file_ids_payload(file_ids, DownloadFileIds)
+        resp = await self._http.request("POST", "/ddm/files/download", json=payload)
+        if isinstance(resp, (bytes, bytearray)):
+            return bytes(resp)
+        raise TypeError("Expected ZIP bytes from /ddm/files/download")
+
+    async def download_project_zip(self, project_id: Union[ProjectDownloadRequest, str, Dict[str, Any]]) -> bytes:
+        payload = _project_payload(project_id)
+        resp = await self._http.request("POST", "/ddm/files/download/project", json=payload)
+        if isinstance(resp, (bytes, bytearray)):
+            return bytes(resp)
+        raise TypeError("Expected ZIP bytes from /ddm/files/download/project")
+
+    async def _iter_zip(self, path: str, payload: Dict[str, Any], chunk_size: int) -> AsyncIterator[bytes]:
+        async with self._http.stream("POST", path, json=payload) as r:
+            async for chunk in r.content.iter_chunked(chunk_size):
+                yield chunk
+
+    async def download_zip_to(
+        self,
+        file_ids: Union[DownloadFileIds, Sequence[str], Dict[str, Any]],
+        dest: Union[str, Path],
+        *,
+        extract: bool = False,
+        workers: int = 4,
+        chunk_size: int = ZIP_CHUNK_SIZE,
+    ) -> ArchiveResult:
+        """Same contract as FilesAPI.download_zip_to; disk I/O and extraction run in threads."""
+        chunks = self._iter_zip("/ddm/files/download", _file_ids_payload(file_ids, DownloadFileIds), chunk_size)
+        return await asave_archive(chunks, dest, extract=extract, workers=workers)
+
+    async def download_project_zip_to(
+        self,
+        project_id: Union[ProjectDownloadRequest, str, Dict[str, Any]],
+        dest: Union[str, Path],
+        *,
+        extract: bool = False,
+        workers: int = 4,
+        chunk_size: int = ZIP_CHUNK_SIZE,
+    ) -> ArchiveResult:
+        chunks = self._iter_zip("/ddm/files/download/project", _project_payload(project_id), chunk_size)
+        return await asave_archive(chunks, dest, extract=extract, workers=workers)
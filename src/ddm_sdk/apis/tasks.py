@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import random
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait as wait_futures
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from ..transport.async_http import AsyncHttpTransport
 from ..transport.http import HttpTransport
 from ..models.tasks import TaskResultResponse, TaskStatusResponse
 
@@ -28,6 +33,117 @@ class TaskFailedError(RuntimeError):
         self.error = error
 
 
+StatusCallback = Callable[[str, TaskStatusResponse], None]
+
+
+def _task_ids(task_ids: Iterable[str]) -> List[str]:
+    seen: set[str] = set()
+    out: List[str] = []
+    for t in task_ids:
+        tid = str(t).strip()
+        if tid and tid not in seen:
+            seen.add(tid)
+            out.append(tid)
+    return out
+
+
+class PollSchedule:
+    """
+    Per-task poll times for wait_many/as_completed: a min-heap of (due, task_id).
+
+    Every task is due immediately; each poll that finds it still running pushes the
+    next one `interval` later and grows that task's interval by `factor` (capped at
+    max_interval), with +-jitter so hundreds of tasks started together do not keep
+    hitting the server in the same instant. Long tasks end up polled rarely,
+    short ones are noticed quickly.
+    """
+
+    def __init__(
+        self,
+        task_ids: Iterable[str],
+        *,
+        interval: float = 1.0,
+        max_interval: float = 30.0,
+        factor: float = 1.5,
+        jitter: float = 0.2,
+        now: Optional[float] = None,
+    ):
+        now = time.monotonic() if now is None else now
+        self.max_interval = max(float(max_interval), float(interval))
+        self.factor = max(1.0, float(factor))
+        self.jitter = min(max(0.0, float(jitter)), 1.0)
+        self._interval: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        for tid in task_ids:
+            self._interval[tid] = float(interval)
+            self._heap.append((now, tid))
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def next_due(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> Optional[str]:
+        if self._heap and self._heap[0][0] <= now:
+            return heapq.heappop(self._heap)[1]
+        return None
+
+    def again(self, task_id: str, now: float) -> float:
+        """Reschedule a task that is not ready yet; returns the delay used."""
+        iv = self._interval[task_id]
+        self._interval[task_id] = min(self.max_interval, iv * self.factor)
+        delay = iv * random.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+        heapq.heappush(self._heap, (now + delay, task_id))
+        return delay
+
+
+def _wait_timeout(schedule: PollSchedule, running: int, max_workers: int, now: float, deadline: float) -> float:
+    """How long to block on in-flight polls before the next one is due (or the deadline)."""
+    limit = deadline - now
+    nxt = schedule.next_due()
+    if nxt is not None and running < max_workers:
+        limit = min(limit, nxt - now)
+    return max(0.0, limit)
+
+
+class _WaitManyState:
+    """Bookkeeping shared by the sync/async wait_many."""
+
+    def __init__(self, ids: List[str], print_state: bool):
+        self.statuses: Dict[str, TaskStatusResponse] = {}
+        self.pending = set(ids)
+        self.succeeded: set[str] = set()
+        self.failed: set[str] = set()
+        self.print_state = print_state
+        self._last_states: Dict[str, str] = {}
+
+    def on_status(self, tid: str, st: TaskStatusResponse) -> None:
+        self.statuses[tid] = st
+        if self.print_state and st.state != self._last_states.get(tid):
+            print(f"  ⏳ task {tid} state={st.state}")
+            self._last_states[tid] = st.state
+
+    def done(self, tid: str, st: TaskStatusResponse, raise_on_failure: bool) -> None:
+        self.pending.discard(tid)
+        if st.is_success():
+            self.succeeded.add(tid)
+        else:
+            self.failed.add(tid)
+            if raise_on_failure:
+                raise TaskFailedError(tid, st.error)
+
+    def result(self) -> WaitManyResult:
+        return WaitManyResult(
+            statuses=self.statuses,
+            pending=self.pending,
+            succeeded=self.succeeded,
+            failed=self.failed,
+            timed_out=bool(self.pending),
+        )
+
+
 class TasksAPI:
     def __init__(self, http: HttpTransport):
         self._http = http
@@ -94,6 +210,70 @@ class TasksAPI:
         )
         return st.result if st.is_success() else None
     
+    def as_completed(
+        self,
+        task_ids: Iterable[str],
+        *,
+        timeout_s: float = 300.0,
+        poll_interval_s: float = 1.0,
+        max_interval_s: float = 30.0,
+        max_workers: int = 8,
+        on_status: Optional[StatusCallback] = None,
+    ) -> Iterator[Tuple[str, TaskStatusResponse]]:
+        """
+        Yield (task_id, status) as each task reaches SUCCESS/FAILURE, in completion order:
+
+            for tid, st in client.tasks.as_completed(ids):
+                ...
+
+        Statuses are polled by up to `max_workers` threads, each task on its own
+        PollSchedule (first poll immediately, then poll_interval_s growing to
+        max_interval_s). Every task is polled at least once, then it stops silently at
+        timeout_s; tasks not yielded by then are still pending. on_status(task_id, status) sees every poll result.
+        """
+        ids = _task_ids(task_ids)
+        if not ids:
+            return
+        max_workers = max(1, int(max_workers))
+        schedule = PollSchedule(ids, interval=poll_interval_s, max_interval=max_interval_s)
+        deadline = time.monotonic() + float(timeout_s)
+        unpolled = set(ids)
+        running: Dict[Future, str] = {}
+        pool = ThreadPoolExecutor(max_workers=min(max_workers, len(ids)), thread_name_prefix="ddm-tasks")
+        try:
+            while schedule or running:
+                now = time.monotonic()
+                expired = now >= deadline
+                if expired and not running and not unpolled:
+                    break
+                # every task gets its first poll, even past the deadline (first polls
+                # sort before any rescheduled one)
+                while (not expired or unpolled) and len(running) < max_workers:
+                    tid = schedule.pop_due(now)
+                    if tid is None:
+                        break
+                    unpolled.discard(tid)
+                    running[pool.submit(self.status, tid)] = tid
+
+                if not running:
+                    time.sleep(_wait_timeout(schedule, 0, max_workers, now, deadline))
+                    continue
+
+                # after the deadline only the polls already in flight are collected
+                timeout = None if expired else _wait_timeout(schedule, len(running), max_workers, now, deadline)
+                done, _ = wait_futures(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    tid = running.pop(fut)
+                    st = fut.result()
+                    if on_status is not None:
+                        on_status(tid, st)
+                    if st.is_ready():
+                        yield tid, st
+                    else:
+                        schedule.again(tid, time.monotonic())
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def wait_many(
         self,
         task_ids: Iterable[str],
@@ -102,56 +282,193 @@ class TasksAPI:
         poll_interval_s: float = 1.0,
         raise_on_failure: bool = True,
         print_state: bool = False,
+        max_interval_s: float = 30.0,
+        max_workers: int = 8,
     ) -> WaitManyResult:
-        ids = [str(t).strip() for t in task_ids if str(t).strip()]
-        statuses: Dict[str, TaskStatusResponse] = {}
-        pending = set(ids)
-        succeeded: set[str] = set()
-        failed: set[str] = set()
+        """
+        Wait for all tasks (see as_completed for how they are polled).
+        With raise_on_failure the first FAILURE raises TaskFailedError.
+        """
+        ids = _task_ids(task_ids)
+        state = _WaitManyState(ids, print_state)
+
+        it = self.as_completed(
+            ids,
+            timeout_s=timeout_s,
+            poll_interval_s=poll_interval_s,
+            max_interval_s=max_interval_s,
+            max_workers=max_workers,
+            on_status=state.on_status,
+        )
+        try:
+            for tid, st in it:
+                state.done(tid, st, raise_on_failure)
+        finally:
+            it.close()
+
+        return state.result()
+
+    def value(self, task_id: str) -> Any:
+        """
+        Convenience: returns result.value from /result if ready, else None.
+        """
+        r = self.result(task_id)
+        if not r.ready:
+            return None
+        return r.value
+
+
+class AsyncTasksAPI:
+    """
+    asyncio version of TasksAPI. as_completed/wait_many poll concurrently with the
+    same per-task PollSchedule (also bounded by the transport's max_concurrency).
+    """
+
+    def __init__(self, http: AsyncHttpTransport):
+        self._http = http
+
+    async def result(self, task_id: str) -> TaskResultResponse:
+        resp = await self._http.request("GET", f"/ddm/tasks/result/{task_id}")
+        return TaskResultResponse.model_validate(resp)
+
+    async def status(self, task_id: str) -> TaskStatusResponse:
+        try:
+            resp = await self._http.request("GET", f"/ddm/tasks/status/{task_id}")
+            return TaskStatusResponse.model_validate(resp)
+        except Exception as e:
+            data = getattr(e, "response_json", None)
+            if isinstance(data, dict):
+                return TaskStatusResponse.model_validate(data)
+            raise
 
+    async def wait(
+        self,
+        task_id: str,
+        *,
+        timeout_s: float = 300.0,
+        poll_interval_s: float = 1.0,
+        raise_on_failure: bool = True,
+    ) -> TaskStatusResponse:
         deadline = time.time() + float(timeout_s)
-        last_states: Dict[str, str] = {}
-
-        while pending:
-            for tid in list(pending):
-                st = self.status(tid)
-                statuses[tid] = st
-
-                if print_state:
-                    prev = last_states.get(tid)
-                    if st.state != prev:
-                        print(f"  ⏳ task {tid} state={st.state}")
-                        last_states[tid] = st.state
-
-                if st.is_ready():
-                    pending.remove(tid)
-                    if st.is_success():
-                        succeeded.add(tid)
-                    else:
-                        failed.add(tid)
-                        if raise_on_failure:
-                            raise TaskFailedError(tid, st.error)
 
-            if not pending:
-                break
+        while True:
+            st = await self.status(task_id)
+
+            if st.is_ready():
+                if raise_on_failure and st.is_failure():
+                    raise TaskFailedError(task_id, st.error)
+                return st
+
             if time.time() >= deadline:
-                break
+                return st
 
-            time.sleep(float(poll_interval_s))
+            await asyncio.sleep(float(poll_interval_s))
 
-        return WaitManyResult(
-            statuses=statuses,
-            pending=pending,
-            succeeded=succeeded,
-            failed=failed,
-            timed_out=bool(pending),
+    async def wait_for_result(
+        self,
+        task_id: str,
+        *,
+        timeout_s: float = 300.0,
+        poll_interval_s: float = 1.0,
+        raise_on_failure: bool = True,
+    ):
+        st = await self.wait(
+            task_id,
+            timeout_s=timeout_s,
+            poll_interval_s=poll_interval_s,
+            raise_on_failure=raise_on_failure,
         )
+        return st.result if st.is_success() else None
 
-    def value(self, task_id: str) -> Any:
+    async def as_completed(
+        self,
+        task_ids: Iterable[str],
+        *,
+        timeout_s: float = 300.0,
+        poll_interval_s: float = 1.0,
+        max_interval_s: float = 30.0,
+        max_workers: int = 8,
+        on_status: Optional[StatusCallback] = None,
+    ) -> AsyncIterator[Tuple[str, TaskStatusResponse]]:
         """
-        Convenience: returns result.value from /result if ready, else None.
+        async for tid, st in client.tasks.as_completed(ids): ...
+
+        Same contract as TasksAPI.as_completed.
         """
-        r = self.result(task_id)
+        ids = _task_ids(task_ids)
+        if not ids:
+            return
+        max_workers = max(1, int(max_workers))
+        schedule = PollSchedule(ids, interval=poll_interval_s, max_interval=max_interval_s)
+        deadline = time.monotonic() + float(timeout_s)
+        unpolled = set(ids)
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while schedule or running:
+                now = time.monotonic()
+                expired = now >= deadline
+                if expired and not running and not unpolled:
+                    break
+                # every task gets its first poll, even past the deadline (first polls
+                # sort before any rescheduled one)
+                while (not expired or unpolled) and len(running) < max_workers:
+                    tid = schedule.pop_due(now)
+                    if tid is None:
+                        break
+                    unpolled.discard(tid)
+                    running[asyncio.ensure_future(self.status(tid))] = tid
+
+                if not running:
+                    await asyncio.sleep(_wait_timeout(schedule, 0, max_workers, now, deadline))
+                    continue
+
+                timeout = None if expired else _wait_timeout(schedule, len(running), max_workers, now, deadline)
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for fut in done:
+                    tid = running.pop(fut)
+                    st = fut.result()
+                    if on_status is not None:
+                        on_status(tid, st)
+                    if st.is_ready():
+                        yield tid, st
+                    else:
+                        schedule.again(tid, time.monotonic())
+        finally:
+            for fut in running:
+                fut.cancel()
+
+    async def wait_many(
+        self,
+        task_ids: Iterable[str],
+        *,
+        timeout_s: float = 300.0,
+        poll_interval_s: float = 1.0,
+        raise_on_failure: bool = True,
+        print_state: bool = False,
+        max_interval_s: float = 30.0,
+        max_workers: int = 8,
+    ) -> WaitManyResult:
+        ids = _task_ids(task_ids)
+        state = _WaitManyState(ids, print_state)
+
+        it = self.as_completed(
+            ids,
+            timeout_s=timeout_s,
+            poll_interval_s=poll_interval_s,
+            max_interval_s=max_interval_s,
+            max_workers=max_workers,
+            on_status=state.on_status,
+        )
+        try:
+            async for tid, st in it:
+                state.done(tid, st, raise_on_failure)
+        finally:
+            await it.aclose()
+
+        return state.result()
+
+    async def value(self, task_id: str) -> Any:
+        r = await self.result(task_id)
         if not r.ready:
             return None
         return r.value
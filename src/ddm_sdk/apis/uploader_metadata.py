@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
+from ..transport.errors import ApiError, BadRequest, Conflict
 from ..transport.http import HttpTransport
 from ..models.uploader_metadata import UploaderMetadataJSON, UploaderMetadataResponse
 
 
+def metadata_exists(e: Exception) -> bool:
+    """True if an attach failed because the file already has uploader metadata."""
+    if isinstance(e, Conflict):
+        return True
+    return isinstance(e, BadRequest) and "already" in e.message.lower()
+
+
 class UploaderMetadataAPI:
     def __init__(self, http: HttpTransport):
         self._http = http
@@ -30,6 +38,26 @@ class UploaderMetadataAPI:
         data = self._http.request("PUT", f"/ddm/uploader_metadata/{file_id}", json=payload)
         return UploaderMetadataResponse.model_validate(data)
 
+    # POST, then PUT if the file already has uploader metadata
+    def upsert(
+        self,
+        file_id: str,
+        body: Union[UploaderMetadataJSON, Dict[str, Any]],
+        *,
+        attach: Optional[Callable[[str, Any], Any]] = None,
+    ) -> UploaderMetadataResponse:
+        """
+        attach(), falling back to update() when the server reports existing metadata
+        (409, or a 400 saying it already exists). `attach` replaces the POST, e.g.
+        with one that retries it.
+        """
+        try:
+            return (attach or self.attach)(file_id, body)
+        except ApiError as e:
+            if not metadata_exists(e):
+                raise
+        return self.update(file_id, body)
+
     # GET /ddm/uploader_metadata/{file_id}
     def get(self, file_id: str) -> UploaderMetadataResponse:
         data = self._http.request("GET", f"/ddm/uploader_metadata/{file_id}")
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Sequence, Union
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Union
 
+from ..transport.async_http import AsyncHttpTransport
 from ..transport.http import HttpTransport
+from ..transport.pagination import aiter_items, iter_items
 from ..models.validations import (
     SaveValidationResultResponse,
     ValidateFileAgainstSuitesRequest,
@@ -15,6 +17,39 @@ from ..models.validations import (
 )
 
 
+def _list_results_params(
+    *,
+    dataset_name: Optional[Sequence[str]],
+    dataset_id: Optional[Sequence[str]],
+    user_id: Optional[Sequence[str]],
+    suite_id: Optional[Sequence[str]],
+    run_time_from: Optional[str],
+    run_time_to: Optional[str],
+    sort: str,
+    page: int,
+    perPage: int,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "sort": sort,
+        "page": page,
+        "perPage": perPage,
+    }
+    # Your parser is likely split-based; send CSV.
+    if dataset_name:
+        params["dataset_name"] = ",".join(dataset_name)
+    if dataset_id:
+        params["dataset_id"] = ",".join(dataset_id)
+    if user_id:
+        params["user_id"] = ",".join(user_id)
+    if suite_id:
+        params["suite_id"] = ",".join(suite_id)
+    if run_time_from:
+        params["run_time_from"] = run_time_from
+    if run_time_to:
+        params["run_time_to"] = run_time_to
+    return params
+
+
 class ValidationsAPI:
     def __init__(self, http: HttpTransport):
         self._http = http
@@ -42,28 +77,30 @@ class ValidationsAPI:
         page: int = 1,
         perPage: int = 10,
     ) -> ValidationResultsListResponse:
-        params: Dict[str, Any] = {
-            "sort": sort,
-            "page": page,
-            "perPage": perPage,
-        }
-        # Your parser is likely split-based; send CSV.
-        if dataset_name:
-            params["dataset_name"] = ",".join(dataset_name)
-        if dataset_id:
-            params["dataset_id"] = ",".join(dataset_id)
-        if user_id:
-            params["user_id"] = ",".join(user_id)
-        if suite_id:
-            params["suite_id"] = ",".join(suite_id)
-        if run_time_from:
-            params["run_time_from"] = run_time_from
-        if run_time_to:
-            params["run_time_to"] = run_time_to
-
+        params = _list_results_params(
+            dataset_name=dataset_name, dataset_id=dataset_id, user_id=user_id, suite_id=suite_id,
+            run_time_from=run_time_from, run_time_to=run_time_to, sort=sort, page=page, perPage=perPage,
+        )
         resp = self._http.request("GET", "/ddm/validations/results", params=params)
         return ValidationResultsListResponse.model_validate(resp)
 
+    def iter_results(
+        self,
+        *,
+        perPage: int = 100,
+        max_in_flight: int = 4,
+        **filters: Any,
+    ) -> Iterator[ValidationResultResponse]:
+        """
+        Every result matching the list_results() filters (any keyword except page),
+        with the next pages prefetched in the background (see transport.pagination).
+        """
+        return iter_items(
+            lambda page: self.list_results(page=page, perPage=perPage, **filters),
+            per_page=perPage,
+            max_in_flight=max_in_flight,
+        )
+
     # ---------- GET /ddm/validations/results/{result_id} ----------
     def get_result(self, result_id: str) -> ValidationResultResponse:
         resp = self._http.request("GET", f"/ddm/validations/results/{result_id}")
@@ -86,3 +123,76 @@ class ValidationsAPI:
         payload = body.model_dump(exclude_none=True) if hasattr(body, "model_dump") else dict(body)
         resp = self._http.request("POST", "/ddm/validations/validate/file-against-suites", json=payload)
         return ValidateFileAgainstSuitesResponse.model_validate(resp)
+
+
+class AsyncValidationsAPI:
+    """asyncio version of ValidationsAPI (same arguments and models)."""
+
+    def __init__(self, http: AsyncHttpTransport):
+        self._http = http
+
+    # ---------- POST /ddm/validations/results ----------
+    async def save_result(
+        self,
+        body: Union[ValidationResultCreate, Dict[str, Any]],
+    ) -> SaveValidationResultResponse:
+        payload = body.model_dump(exclude_none=True) if isinstance(body, ValidationResultCreate) else dict(body)
+        resp = await self._http.request("POST", "/ddm/validations/results", json=payload)
+        return SaveValidationResultResponse.model_validate(resp)
+
+    # ---------- GET /ddm/validations/results ----------
+    async def list_results(
+        self,
+        *,
+        dataset_name: Optional[Sequence[str]] = None,
+        dataset_id: Optional[Sequence[str]] = None,
+        user_id: Optional[Sequence[str]] = None,
+        suite_id: Optional[Sequence[str]] = None,
+        run_time_from: Optional[str] = None,  # ISO 8601
+        run_time_to: Optional[str] = None,    # ISO 8601
+        sort: str = "run_time,desc",
+        page: int = 1,
+        perPage: int = 10,
+    ) -> ValidationResultsListResponse:
+        params = _list_results_params(
+            dataset_name=dataset_name, dataset_id=dataset_id, user_id=user_id, suite_id=suite_id,
+            run_time_from=run_time_from, run_time_to=run_time_to, sort=sort, page=page, perPage=perPage,
+        )
+        resp = await self._http.request("GET", "/ddm/validations/results", params=params)
+        return ValidationResultsListResponse.model_validate(resp)
+
+    def iter_results(
+        self,
+        *,
+        perPage: int = 100,
+        max_in_flight: int = 4,
+        **filters: Any,
+    ) -> AsyncIterator[ValidationResultResponse]:
+        return aiter_items(
+            lambda page: self.list_results(page=page, perPage=perPage, **filters),
+            per_page=perPage,
+            max_in_flight=max_in_flight,
+        )
+
+    # ---------- GET /ddm/validations/results/{result_id} ----------
+    async def get_result(self, result_id: str) -> ValidationResultResponse:
+        resp = await self._http.request("GET", f"/ddm/validations/results/{result_id}")
+        return ValidationResultResponse.model_validate(resp)
+
+    # ---------- POST /ddm/validations/validate/files-against-suite ----------
+    async def validate_files_against_suite(
+        self,
+        body: Union[ValidateFilesAgainstSuiteRequest, Dict[str, Any]],
+    ) -> ValidateFilesAgainstSuiteResponse:
+        payload = body.model_dump(exclude_none=True) if hasattr(body, "model_dump") else dict(body)
+        resp = await self._http.request("POST", "/ddm/validations/validate/files-against-suite", json=payload)
+        return ValidateFilesAgainstSuiteResponse.model_validate(resp)
+
+    # ---------- POST /ddm/validations/validate/file-against-suites ----------
+    async def validate_file_against_suites(
+        self,
+        body: Union[ValidateFileAgainstSuitesRequest, Dict[str, Any]],
+    ) -> ValidateFileAgainstSuitesResponse:
+        payload = body.model_dump(exclude_none=True) if hasattr(body, "model_dump") else dict(body)
+        resp = await self._http.request("POST", "/ddm/validations/validate/file-against-suites", json=payload)
+        return ValidateFileAgainstSuitesResponse.model_validate(resp)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .transport.async_http import AsyncHttpTransport
+from .transport.retry import RetryPolicy
+from .config import get_settings
+from .storage.base import Storage
+from .storage.factory import make_storage
+
+from .apis.auth import AsyncAuthAPI, LoginResponse, UserInfo
+from .apis.blockchain import AsyncBlockchainAPI
+from .apis.catalog import AsyncCatalogAPI
+from .apis.file import AsyncFileAPI
+from .apis.files import AsyncFilesAPI
+from .apis.tasks import AsyncTasksAPI
+from .apis.validations import AsyncValidationsAPI
+
+
+@dataclass
+class AsyncDdmClient:
+    """
+    asyncio counterpart of DdmClient (needs the optional aiohttp dependency).
+
+    max_concurrency bounds the requests in flight per transport, so it is safe to
+    asyncio.gather() many calls:
+
+        async with AsyncDdmClient.from_env() as client:
+            pages = await asyncio.gather(*(client.catalog.list(page=p) for p in range(1, 50)))
+    """
+
+    base_url: str
+    auth_url: Optional[str] = None
+    token: Optional[str] = None
+    timeout: int = 30
+    max_concurrency: int = 16
+    retry: Optional[RetryPolicy] = None
+
+    storage: Optional[Storage] = None
+
+    _http: AsyncHttpTransport = field(init=False, repr=False)
+    _auth_http: Optional[AsyncHttpTransport] = field(init=False, default=None, repr=False)
+
+    # exposed APIs
+    auth: Optional[AsyncAuthAPI] = field(init=False, default=None)
+    blockchain: AsyncBlockchainAPI = field(init=False)
+    catalog: AsyncCatalogAPI = field(init=False)
+    file: AsyncFileAPI = field(init=False)
+    files: AsyncFilesAPI = field(init=False)
+    tasks: AsyncTasksAPI = field(init=False)
+    validations: AsyncValidationsAPI = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._http = AsyncHttpTransport(
+            self.base_url,
+            token=self.token,
+            timeout=self.timeout,
+            max_concurrency=self.max_concurrency,
+            retry=self.retry,
+        )
+
+        if self.auth_url:
+            self._auth_http = AsyncHttpTransport(self.auth_url, token=None, timeout=self.timeout, retry=self.retry)
+            self.auth = AsyncAuthAPI(self._auth_http)
+
+        self.blockchain = AsyncBlockchainAPI(self._http)
+        self.catalog = AsyncCatalogAPI(self._http)
+        self.file = AsyncFileAPI(self._http, storage=self.storage)
+        self.files = AsyncFilesAPI(self._http)
+        self.tasks = AsyncTasksAPI(self._http)
+        self.validations = AsyncValidationsAPI(self._http)
+
+    def set_token(self, token: str) -> None:
+        self.token = token
+        self._http.set_token(token)
+
+    def load_token_from_storage(self) -> bool:
+        if self.token or not self.storage:
+            return False
+        d = self.storage.read_json("auth/token") or {}
+        tok = d.get("access_token")
+        if isinstance(tok, str) and tok.strip():
+            self.set_token(tok.strip())
+            return True
+        return False
+
+    async def login(self, username: str, password: str) -> LoginResponse:
+        if not self.auth:
+            raise RuntimeError("Auth is not configured. Provide auth_url or set DDM_AUTH_URL.")
+        resp = await self.auth.login(username, password)
+        self.set_token(resp.access_token)
+        if self.storage:
+            self.storage.write_json("auth/token", {"access_token": resp.access_token, "username": username})
+        return resp
+
+    async def whoami(self) -> UserInfo:
+        if not self.auth:
+            raise RuntimeError("Auth is not configured. Provide auth_url or set DDM_AUTH_URL.")
+        if not self.token:
+            raise RuntimeError("No token set. Call client.login() first or set token.")
+        self._auth_http.set_token(self.token)
+        return await self.auth.userinfo()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+        if self._auth_http is not None:
+            await self._auth_http.aclose()
+
+    async def __aenter__(self) -> "AsyncDdmClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    @classmethod
+    def from_env(cls, *, max_concurrency: int = 16) -> "AsyncDdmClient":
+        s = get_settings()
+
+        storage = make_storage(s.storage_backend, s.storage_dir, encoding=s.storage_encoding, dedupe=s.storage_dedupe)
+
+        c = cls(
+            base_url=s.base_url,
+            auth_url=s.auth_url,
+            token=s.token,
+            timeout=s.timeout,
+            max_concurrency=max_concurrency,
+            retry=RetryPolicy(total=s.max_retries, backoff_factor=s.retry_backoff),
+            storage=storage,
+        )
+        if not c.token:
+            c.load_token_from_storage()
+
+        return c
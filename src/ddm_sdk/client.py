@@ -4,7 +4,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from .transport.cache import HTTP_CACHE_DIR, HttpCache
 from .transport.http import HttpTransport
+from .transport.retry import RetryPolicy
 from .config import get_settings
 from .storage.base import Storage
 from .storage.factory import make_storage
@@ -32,6 +34,14 @@ class DdmClient:
     token: Optional[str] = None
     timeout: int = 30
 
+    # connection pool / retry policy (None -> RetryPolicy() defaults)
+    pool_connections: int = 10
+    pool_maxsize: int = 32
+    retry: Optional[RetryPolicy] = None
+
+    # opt-in cache for rarely-changing GETs (parametrics, ABIs, suites, reports)
+    http_cache: Optional[HttpCache] = None
+
     # NEW: optional storage (won't break existing code)
     storage: Optional[Storage] = None
 
@@ -52,17 +62,25 @@ class DdmClient:
     user: UserAPI = field(init=False)
 
     def __post_init__(self) -> None:
-        self._http = HttpTransport(self.base_url, token=self.token, timeout=self.timeout)
+        self._http = HttpTransport(
+            self.base_url,
+            token=self.token,
+            timeout=self.timeout,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            retry=self.retry,
+            cache=self.http_cache,
+        )
 
         if self.auth_url:
-            self._auth_http = HttpTransport(self.auth_url, token=None, timeout=self.timeout)
+            self._auth_http = HttpTransport(self.auth_url, token=None, timeout=self.timeout, retry=self.retry)
             self.auth = AuthAPI(self._auth_http)
 
         self.blockchain = BlockchainAPI(self._http)
         self.catalog = CatalogAPI(self._http)
-        self.file = FileAPI(self._http)
+        self.file = FileAPI(self._http, storage=self.storage)
         self.files = FilesAPI(self._http)
-        self.file_metadata = FileMetadataAPI(self._http)
+        self.file_metadata = FileMetadataAPI(self._http, storage=self.storage)
         self.uploader_metadata = UploaderMetadataAPI(self._http)
         self.expectations = ExpectationsAPI(self._http)
         self.validations = ValidationsAPI(self._http)
@@ -109,13 +127,25 @@ class DdmClient:
     def from_env(cls) -> "DdmClient":
         s = get_settings()
 
-        storage = make_storage(s.storage_backend, s.storage_dir)
+        storage = make_storage(s.storage_backend, s.storage_dir, encoding=s.storage_encoding, dedupe=s.storage_dedupe)
+
+        http_cache = None
+        if s.http_cache:
+            root = getattr(storage, "root", None)
+            http_cache = HttpCache(
+                directory=Path(root) / HTTP_CACHE_DIR if root is not None else None,
+                max_entries=s.http_cache_size,
+            )
 
         c = cls(
             base_url=s.base_url,
             auth_url=s.auth_url,
             token=s.token,
             timeout=s.timeout,
+            pool_connections=s.pool_connections,
+            pool_maxsize=s.pool_maxsize,
+            retry=RetryPolicy(total=s.max_retries, backoff_factor=s.retry_backoff),
+            http_cache=http_cache,
             storage=storage,
         )
         if not c.token:
@@ -31,9 +31,21 @@ class Settings:
     # 🔐 auth service
     auth_url: Optional[str] = None
 
+    # 🔌 HTTP connection pool / retries
+    pool_connections: int = 10
+    pool_maxsize: int = 32
+    max_retries: int = 3
+    retry_backoff: float = 0.5
+
+    # 🗃️ response cache for rarely-changing GETs (opt-in)
+    http_cache: bool = False
+    http_cache_size: int = 256
+
     # 💾 storage (optional)
-    storage_backend: str = "fs"          # reserved for future
+    storage_backend: str = "fs"          # "fs" | "sqlite"
     storage_dir: Optional[str] = None    # None => disabled or default chosen elsewhere
+    storage_encoding: Optional[str] = None  # fs JSON encoding, e.g. "compact+zstd" or "pretty;tasks/=compact+gzip"
+    storage_dedupe: bool = False         # fs: store blob contents once (content-addressed, hardlinked)
 
     # 🧪 optional test helpers
     test_network: str = "sepolia"
@@ -42,6 +54,20 @@ class Settings:
     test_requester: Optional[str] = None
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
 def get_settings() -> Settings:
     base_url = os.getenv("DDM_BASE_URL", "").strip()
     if not base_url:
@@ -59,6 +85,8 @@ def get_settings() -> Settings:
     # storage config (optional)
     storage_backend = os.getenv("DDM_STORAGE_BACKEND", "fs").strip() or "fs"
     storage_dir = os.getenv("DDM_STORAGE_DIR", "").strip() or None
+    storage_encoding = os.getenv("DDM_STORAGE_ENCODING", "").strip() or None
+    storage_dedupe = os.getenv("DDM_STORAGE_DEDUPE", "").strip().lower() in ("1", "true", "yes", "y", "on")
 
     return Settings(
         base_url=base_url,
@@ -66,8 +94,18 @@ def get_settings() -> Settings:
         timeout=timeout,
         auth_url=auth_url,
 
+        pool_connections=_env_int("DDM_POOL_CONNECTIONS", 10),
+        pool_maxsize=_env_int("DDM_POOL_MAXSIZE", 32),
+        max_retries=_env_int("DDM_MAX_RETRIES", 3),
+        retry_backoff=_env_float("DDM_RETRY_BACKOFF", 0.5),
+
+        http_cache=os.getenv("DDM_HTTP_CACHE", "").strip().lower() in ("1", "true", "yes", "y", "on"),
+        http_cache_size=_env_int("DDM_HTTP_CACHE_SIZE", 256),
+
         storage_backend=storage_backend,
         storage_dir=storage_dir,
+        storage_encoding=storage_encoding,
+        storage_dedupe=storage_dedupe,
 
         test_network=os.getenv("DDM_TEST_NETWORK", "sepolia").strip(),
         test_tx_hash=os.getenv("DDM_TEST_TX_HASH") or None,
@@ -10,12 +10,10 @@ from web3.exceptions import ContractLogicError
 from ddm_sdk.client import DdmClient
 from ddm_sdk.scripts.auth.utils import ensure_authenticated
 
+from ddm_sdk.scripts.blockchain.registry import shared_registry
 from ddm_sdk.scripts.blockchain.utils import (
-    registry_address_from_index,
-    load_abi_from_storage,
     storage_read_json,
     storage_write_pair,
-    rpc_url,
     user_pk,
     _jsonify,
     fail_out,
@@ -48,6 +46,7 @@ def main(argv: list[str] | None = None) -> int:
 
     ap.add_argument("--poll", action="store_true")
     ap.add_argument("--timeout", type=float, default=300.0)
+    ap.add_argument("--confirmations", type=int, default=1, help="Blocks (including its own) before the tx counts as final")
     ap.add_argument("--interval", type=float, default=2.0)
     ap.add_argument("--no-store", action="store_true")
     args = ap.parse_args(argv)
@@ -83,15 +82,16 @@ def main(argv: list[str] | None = None) -> int:
     signature_hex = _require_str(reward, "signature")
 
     # request contract address
+    contracts = shared_registry(client)
     req_addr_raw = (
         (args.request_contract_address.strip() if args.request_contract_address else None)
-        or registry_address_from_index(client, network=network, name=args.request_contract_name)
+        or contracts.address(network, args.request_contract_name)
     )
     req_addr = Web3.to_checksum_address(req_addr_raw)
-    abi = load_abi_from_storage(client, network=network, address=req_addr_raw)
+    contracts.abi(network, req_addr_raw)  # fail early if it was never dumped
 
     # web3
-    w3 = Web3(Web3.HTTPProvider(rpc_url(network)))
+    w3 = contracts.web3(network)
     if not w3.is_connected():
         raise SystemExit(f"Web3 cannot connect to RPC for network={network}")
 
@@ -99,7 +99,7 @@ def main(argv: list[str] | None = None) -> int:
     acct = w3.eth.account.from_key(pk)
     sender = acct.address
 
-    contract = w3.eth.contract(address=req_addr, abi=abi)
+    contract = contracts.contract(network, req_addr_raw)
 
     sig_bytes = normalize_sig(signature_hex)
 
@@ -122,7 +122,7 @@ def main(argv: list[str] | None = None) -> int:
         "prepare_reward_key": prep_key,
     }
 
-    # estimate + send
+    # estimate + send (gas estimate, tx nonce, chain id and fees in one RPC batch)
     try:
         fn = contract.functions.claimRewardForDatasetAndMint(
             int(request_id),
@@ -133,7 +133,11 @@ def main(argv: list[str] | None = None) -> int:
             int(deadline_s),
             sig_bytes,
         )
-        gas_est = fn.estimate_gas({"from": sender})
+        batch = contracts.rpc_batch(network)
+        gas_call = batch.estimate_gas(fn, {"from": sender})
+        tx_fields = batch.tx_fields(sender)
+        batch.execute()
+        gas_est = gas_call.value()
     except ContractLogicError as e:
         out = fail_out("EVM_REVERT", revert_reason(e), details={"stage": "estimate_gas"})
         if client.storage and not args.no_store:
@@ -142,17 +146,12 @@ def main(argv: list[str] | None = None) -> int:
         print(json.dumps(_jsonify(out), indent=2, ensure_ascii=False))
         return 1
 
-    tx = fn.build_transaction(
-        {
-            "from": sender,
-            "nonce": w3.eth.get_transaction_count(sender),
-            "chainId": w3.eth.chain_id,
-            "gas": int(gas_est * 12 // 10),
-        }
-    )
+    tx = fn.build_transaction({"from": sender, **tx_fields.value(), "gas": int(gas_est * 12 // 10)})
     signed = w3.eth.account.sign_transaction(tx, private_key=pk)
     tx_hash = _normalize_0x(w3.eth.send_raw_transaction(signed.raw_transaction).hex())
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=int(args.timeout))
+    receipt = contracts.receipt_watcher(network).wait(
+        tx_hash, confirmations=args.confirmations, timeout=args.timeout
+    )
 
     out: Dict[str, Any] = {
         "ok": True,
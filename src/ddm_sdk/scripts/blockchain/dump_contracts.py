@@ -6,6 +6,7 @@ from typing import Any, Dict, List
 
 from ddm_sdk.client import DdmClient
 from ddm_sdk.scripts.auth.utils import ensure_authenticated
+from ddm_sdk.scripts.blockchain.utils import append_blockchain_log
 
 
 def _normalize_abi(abi: Any) -> Any:
@@ -30,65 +31,57 @@ def main(argv: list[str] | None = None) -> int:
     client = DdmClient.from_env()
     ensure_authenticated(client)
 
-    page = 1
     summaries: List[Dict[str, Any]] = []
 
-    while True:
-        paged = client.blockchain.list_contracts(
-            network=[network],
+    # pages are prefetched while the contracts of the current one are fetched
+    contracts = client.blockchain.iter_contracts(
+        network=[network],
+        withEventsCount=1,
+        includeAbi=0,
+        sort="id,asc",
+        perPage=args.per_page,
+    )
+    for item in contracts:
+        addr = getattr(item, "address", None)
+        if not isinstance(addr, str) or not addr:
+            continue
+
+        c = client.blockchain.get_contract(
+            addr,
+            includeAbi=1 if args.include_abi else 0,
             withEventsCount=1,
-            includeAbi=0,
-            sort="id,asc",
-            page=page,
-            perPage=args.per_page,
         )
-        data = getattr(paged, "data", None) or []
-        if not data:
-            break
-
-        for item in data:
-            addr = getattr(item, "address", None)
-            if not isinstance(addr, str) or not addr:
-                continue
-
-            c = client.blockchain.get_contract(
-                addr,
-                includeAbi=1 if args.include_abi else 0,
-                withEventsCount=1,
-            )
-            abi = _normalize_abi(getattr(c, "abi", None))
-
-            payload: Dict[str, Any] = {
-                "address": getattr(c, "address", addr),
-                "name": getattr(c, "name", None),
-                "network": getattr(c, "network", network),
-                "status": getattr(c, "status", None),
-                "tx_hash": getattr(c, "tx_hash", None),
-                "start_block": getattr(c, "start_block", None),
-                "last_scanned_block": getattr(c, "last_scanned_block", None),
-                "confirmations": getattr(c, "confirmations", None),
-                "events_count": getattr(c, "events_count", None),
-                "abi": abi if args.include_abi else None,
+        abi = _normalize_abi(getattr(c, "abi", None))
+
+        payload: Dict[str, Any] = {
+            "address": getattr(c, "address", addr),
+            "name": getattr(c, "name", None),
+            "network": getattr(c, "network", network),
+            "status": getattr(c, "status", None),
+            "tx_hash": getattr(c, "tx_hash", None),
+            "start_block": getattr(c, "start_block", None),
+            "last_scanned_block": getattr(c, "last_scanned_block", None),
+            "confirmations": getattr(c, "confirmations", None),
+            "events_count": getattr(c, "events_count", None),
+            "abi": abi if args.include_abi else None,
+        }
+
+        # storage: blockchain root (no project)
+        if client.storage and not args.no_store:
+            base = f"blockchain/contracts/{network}/{addr}"
+            client.storage.write_json(base, payload)
+
+            if args.include_abi:
+                client.storage.write_json(f"{base}.abi", abi)
+
+        summaries.append(
+            {
+                "network": network,
+                "address": addr,
+                "name": payload.get("name"),
+                "events_count": payload.get("events_count"),
             }
-
-            # storage: blockchain root (no project)
-            if client.storage and not args.no_store:
-                base = f"blockchain/contracts/{network}/{addr}"
-                client.storage.write_json(base, payload)
-
-                if args.include_abi:
-                    client.storage.write_json(f"{base}.abi", abi)
-
-            summaries.append(
-                {
-                    "network": network,
-                    "address": addr,
-                    "name": payload.get("name"),
-                    "events_count": payload.get("events_count"),
-                }
-            )
-
-        page += 1
+        )
 
     out = {
         "ok": True,
@@ -101,16 +94,12 @@ def main(argv: list[str] | None = None) -> int:
     if client.storage and not args.no_store:
         client.storage.write_json(f"blockchain/contracts/{network}/_index", out)
 
-        existing = client.storage.read_json("blockchain/logs")
-        logs = existing if isinstance(existing, list) else []
-        logs.append(
-            {
-                "action": "dump_contracts",
-                "ok": True,
-                "details": {"network": network, "count": len(summaries)},
-            }
+        append_blockchain_log(
+            client,
+            action="dump_contracts",
+            ok=True,
+            details={"network": network, "count": len(summaries)},
         )
-        client.storage.write_json("blockchain/logs", logs)
 
     print(json.dumps(out, indent=2))
     return 0
@@ -10,6 +10,7 @@ from ddm_sdk.scripts.blockchain.utils import load_json_arg, store_prepare_suite_
 from ddm_sdk.scripts.blockchain.task_runner import run_task_and_store
 from ddm_sdk.scripts.blockchain.extractors import extract_suite_hash
 from ddm_sdk.scripts.expectations.utils import suite_datasets_key, suite_logs_key
+from ddm_sdk.storage.logs import iter_entries
 
 
 def _pick_suite_id(payload: Dict[str, Any]) -> Optional[str]:
@@ -64,19 +65,18 @@ def _dataset_id_from_suite_links_or_log(
         # in case your suite_logs_key signature doesn't accept project_id anymore
         log_key = f"expectations/suites/{suite_id}/log"
 
-    log_obj = client.storage.read_json(log_key)
-    if isinstance(log_obj, list):
-        for entry in reversed(log_obj):
-            if not isinstance(entry, dict):
-                continue
-            details = entry.get("details")
-            if not isinstance(details, dict):
-                continue
-            did = details.get("dataset_id")
-            if isinstance(did, str) and did.strip():
-                return did.strip()
-
-    return None
+    latest: Optional[str] = None
+    for entry in iter_entries(client.storage, log_key):
+        if not isinstance(entry, dict):
+            continue
+        details = entry.get("details")
+        if not isinstance(details, dict):
+            continue
+        did = details.get("dataset_id")
+        if isinstance(did, str) and did.strip():
+            latest = did.strip()
+
+    return latest
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
+
+from ddm_sdk.scripts.blockchain.rpc_batch import RpcBatch, RpcError, _to_int
+
+# ----------------------------
+# One poller for many transaction receipts.
+#
+# Every tick is a single JSON-RPC batch: eth_blockNumber plus either
+# eth_getTransactionReceipt per waiting hash or, when fewer calls, the receipts
+# of the new blocks (eth_getBlockReceipts). A hash watched for the first time
+# is always looked up directly, so transactions mined before watch() are found.
+# With confirmations > 1 the receipt is fetched again once deep enough and only
+# resolves if it is still in the same block (a reorg puts it back to waiting).
+# ----------------------------
+
+
+def _norm_hash(tx_hash: Any) -> str:
+    h = tx_hash.hex() if isinstance(tx_hash, (bytes, bytearray)) else str(tx_hash)
+    h = h.strip().lower()
+    return h if h.startswith("0x") else "0x" + h
+
+
+def _format(raw: Dict[str, Any]) -> AttributeDict:
+    """Receipt as returned by w3.eth.get_transaction_receipt()."""
+    return AttributeDict.recursive(receipt_formatter(raw))
+
+
+@dataclass(eq=False)
+class _Watch:
+    tx_hash: str
+    confirmations: int
+    deadline: float
+    timeout: float
+    future: Future = field(default_factory=Future)
+    checked: bool = False                     # looked up by hash at least once
+    receipt: Optional[Dict[str, Any]] = None  # raw receipt while waiting for depth
+
+
+class ReceiptWatcher:
+    """
+    Wait for many transactions with one background poller.
+
+        watcher = ContractRegistry.for_client(client).receipt_watcher("sepolia")
+        futures = [watcher.watch(h) for h in tx_hashes]     # concurrent.futures.Future
+        receipt = watcher.wait(tx_hash, confirmations=3, timeout=600)
+
+    Futures resolve to the same receipt objects as w3.eth.get_transaction_receipt()
+    and fail with web3's TimeExhausted after `timeout` seconds. The poller thread
+    only runs while something is watched.
+    """
+
+    def __init__(
+        self,
+        batch: RpcBatch,
+        *,
+        poll_interval: float = 2.0,
+        confirmations: int = 1,
+        timeout: float = 300.0,
+        block_receipts: bool = True,
+        max_blocks: int = 32,
+    ):
+        self.batch = batch
+        self.poll_interval = poll_interval
+        self.confirmations = max(1, int(confirmations))
+        self.timeout = timeout
+        self.block_receipts = block_receipts  # switched off if the node lacks eth_getBlockReceipts
+        self.max_blocks = max(1, int(max_blocks))
+        self.head: Optional[int] = None
+        self._scanned: Optional[int] = None  # every block up to here was searched
+        self._watches: List[_Watch] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---- public ----
+
+    def watch(self, tx_hash: Any, *, confirmations: Optional[int] = None, timeout: Optional[float] = None) -> Future:
+        return self.watch_many([tx_hash], confirmations=confirmations, timeout=timeout)[0]
+
+    def watch_many(
+        self,
+        tx_hashes: Iterable[Any],
+        *,
+        confirmations: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Future]:
+        """Futures for every hash (in order); all of them go into the same next poll."""
+        t = self.timeout if timeout is None else float(timeout)
+        depth = max(1, int(confirmations if confirmations is not None else self.confirmations))
+        deadline = time.monotonic() + t
+        new = [_Watch(tx_hash=_norm_hash(h), confirmations=depth, deadline=deadline, timeout=t) for h in tx_hashes]
+        with self._lock:
+            self._watches.extend(new)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ddm-receipts", daemon=True)
+                self._thread.start()
+            else:
+                self._wake.set()
+        return [w.future for w in new]
+
+    def wait(self, tx_hash: Any, *, confirmations: Optional[int] = None, timeout: Optional[float] = None) -> Any:
+        """Like w3.eth.wait_for_transaction_receipt(), plus optional confirmation depth."""
+        return self.watch(tx_hash, confirmations=confirmations, timeout=timeout).result()
+
+    def wait_all(
+        self,
+        tx_hashes: Iterable[Any],
+        *,
+        confirmations: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Future]:
+        """Watch every hash; returns the futures (in order) once all of them are done."""
+        futures = self.watch_many(tx_hashes, confirmations=confirmations, timeout=timeout)
+        for f in futures:
+            f.exception()  # waits; errors stay on the future
+        return futures
+
+    # ---- poller ----
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._watches:
+                    self._thread = None
+                    return
+            try:
+                self._tick()
+            except Exception:
+                pass  # transient RPC/network error: keep polling until the deadlines
+            self._expire()
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _tick(self) -> None:
+        with self._lock:
+            watches = list(self._watches)
+        head = self.head
+        waiting = {w.tx_hash for w in watches if w.receipt is None}
+        known = {w.tx_hash for w in watches if w.receipt is None and w.checked}
+
+        # hashes already looked up are searched in the new blocks when that takes fewer calls
+        blocks: List[int] = []
+        if known and self.block_receipts and self._scanned is not None and head is not None:
+            start = self._scanned + 1
+            n = min(self.max_blocks, max(1, head - start + 2))  # one block past the last head
+            if n < len(known):
+                blocks = list(range(start, start + n))
+        by_hash = (waiting - known) if blocks else waiting
+        # deep enough by the last known head: fetch again to make sure it is still there
+        recheck = {
+            w.tx_hash for w in watches
+            if w.receipt is not None and head is not None
+            and head - _to_int(w.receipt["blockNumber"]) + 1 >= w.confirmations
+        }
+
+        b = self.batch
+        head_call = b.add("eth_blockNumber", decode=_to_int)
+        receipt_calls = {h: b.add("eth_getTransactionReceipt", [h]) for h in sorted(by_hash | recheck)}
+        block_calls = [(n, b.add("eth_getBlockReceipts", [hex(n)])) for n in blocks]
+        b.execute()
+
+        self.head = head = head_call.value()
+        found: Dict[str, Dict[str, Any]] = {}
+        looked_up = set()
+        for h, c in receipt_calls.items():
+            try:
+                r = c.value()
+            except RpcError:
+                continue
+            looked_up.add(h)
+            if r:
+                found[h] = r
+
+        if blocks:
+            scanned = self._scanned
+            for n, c in block_calls:
+                try:
+                    rs = c.value()
+                except RpcError:
+                    self.block_receipts = False  # next tick looks every hash up again
+                    break
+                if rs is None:  # not produced yet
+                    break
+                for r in rs:
+                    h = _norm_hash(r.get("transactionHash"))
+                    if h in waiting:
+                        found[h] = r
+                scanned = n
+            self._scanned = scanned
+        else:
+            # every waiting hash was looked up after reading `head`
+            self._scanned = head
+
+        for w in watches:
+            if w.future.done():
+                continue
+            r = found.get(w.tx_hash)
+            if w.receipt is not None:
+                if w.tx_hash not in looked_up:
+                    continue
+                if not r or r.get("blockHash") != w.receipt.get("blockHash"):
+                    w.receipt, w.checked = None, False  # reorged out: look it up again
+                    continue
+            elif w.tx_hash in by_hash:
+                w.checked = w.tx_hash in looked_up  # a failed lookup is retried by hash
+                if not w.checked:
+                    continue
+            if not r:
+                continue
+            if head - _to_int(r["blockNumber"]) + 1 >= w.confirmations:
+                self._resolve(w, r)
+            else:
+                w.receipt = r
+
+    def _resolve(self, w: _Watch, raw: Dict[str, Any]) -> None:
+        try:
+            w.future.set_result(_format(raw))
+        except Exception as e:
+            w.future.set_exception(e)
+        self._drop(w)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            expired = [w for w in self._watches if now >= w.deadline and not w.future.done()]
+        for w in expired:
+            w.future.set_exception(
+                TimeExhausted(f"Transaction {w.tx_hash} is not in the chain after {w.timeout} seconds")
+            )
+            self._drop(w)
+        with self._lock:
+            self._watches = [w for w in self._watches if not w.future.done()]
+
+    def _drop(self, w: _Watch) -> None:
+        with self._lock:
+            if w in self._watches:
+                self._watches.remove(w)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import argparse
 from http import client
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from web3 import Web3
 from web3.exceptions import ContractLogicError
@@ -14,12 +14,10 @@ from ddm_sdk.scripts.auth.utils import ensure_authenticated
 from ddm_sdk.scripts.blockchain.extractors import extract_suite_hash, extract_report_uri
 from ddm_sdk.scripts.blockchain.utils import _dataset_file_format_from_suite, normalize_sig
 
+from ddm_sdk.scripts.blockchain.registry import shared_registry
 from ddm_sdk.scripts.blockchain.utils import (
-    registry_address_from_index,
-    load_abi_from_storage,
     storage_read_json,
     storage_write_pair,
-    rpc_url,
     user_pk,
     _jsonify,
     fail_out,
@@ -84,6 +82,61 @@ def _register_dataset_inner_hash(
     return Web3.keccak(encoded)
 
 
+def load_registration_inputs(client: DdmClient, *, suite_id: str, catalog_id: str) -> Dict[str, Any]:
+    """
+    suite_hash, report_uri and file_format for registerDataset, from the saved
+    prepare_suite_artifacts / prepare_report responses and the stored suite.
+    Raises SystemExit naming the missing artifact.
+    """
+    # read suite_hash from saved prepare_suite artifacts
+    suite_prepare_key = f"blockchain/expectations/suites/{suite_id}/prepare_suite_artifacts/response"
+    suite_prepare_obj = storage_read_json(client, suite_prepare_key)
+    suite_prepare_val = _unwrap_task_envelope(suite_prepare_obj)
+    suite_hash = extract_suite_hash(suite_prepare_val)
+    if not isinstance(suite_hash, str) or not suite_hash.startswith("0x"):
+        raise SystemExit(f"Missing suite_hash in {suite_prepare_key}")
+
+    # read report_uri (+ file_format if present) from saved prepare_report artifacts
+    report_prepare_key = f"blockchain/expectations/suites/{suite_id}/datasets/{catalog_id}/prepare_report/response"
+    report_prepare_obj = storage_read_json(client, report_prepare_key)
+    report_prepare_val = _unwrap_task_envelope(report_prepare_obj)
+
+    report_uri = extract_report_uri(report_prepare_val)
+    if not isinstance(report_uri, str) or not report_uri.startswith("ipfs://"):
+        raise SystemExit(f"Missing report_uri in {report_prepare_key}")
+
+    return {
+        "suite_hash": suite_hash,
+        "report_uri": report_uri,
+        "file_format": _dataset_file_format_from_suite(client, suite_id=suite_id),
+        "suite_prepare_key": suite_prepare_key,
+        "report_prepare_key": report_prepare_key,
+    }
+
+
+def fingerprint_from_receipt(receipt: Any, registry_addr: str) -> Optional[str]:
+    """Dataset fingerprint (4th topic of the registry's event) from a registerDataset receipt."""
+    try:
+        for lg in receipt.get("logs", []):
+            # must be our registry contract
+            if (lg.get("address") or "").lower() != registry_addr.lower():
+                continue
+
+            topics = lg.get("topics") or []
+            # need at least 4 topics: sig, uploader, suiteHash, fingerprint
+            if len(topics) >= 4:
+                t3 = topics[3]
+                if isinstance(t3, (bytes, bytearray)):
+                    return "0x" + bytes(t3).hex()
+                if isinstance(t3, str):
+                    # already hex string without 0x sometimes
+                    return t3 if t3.startswith("0x") else "0x" + t3
+                return None
+    except Exception:
+        return None
+    return None
+
+
 def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(prog="ddm-register-dataset", description="Register dataset on-chain (DatasetRegistry)")
     ap.add_argument("--network", default="sepolia")
@@ -97,6 +150,7 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--signature", default=None, help="Optional MetaMask signature 0x... (otherwise sign with DDM_USER_PK)")
     ap.add_argument("--poll", action="store_true")
     ap.add_argument("--timeout", type=float, default=300.0)
+    ap.add_argument("--confirmations", type=int, default=1, help="Blocks (including its own) before the tx counts as final")
     ap.add_argument("--interval", type=float, default=2.0)
     ap.add_argument("--no-store", action="store_true")
     args = ap.parse_args(argv)
@@ -112,34 +166,22 @@ def main(argv: list[str] | None = None) -> int:
     dataset_uri = args.dataset_uri.strip()
 
     # registry addr
-    registry_addr_raw = (args.registry_address.strip() if args.registry_address else None) or registry_address_from_index(
-        client, network=network, name=args.registry_name
+    contracts = shared_registry(client)
+    registry_addr_raw = (args.registry_address.strip() if args.registry_address else None) or contracts.address(
+        network, args.registry_name
     )
     registry_addr = Web3.to_checksum_address(registry_addr_raw)
-    abi = load_abi_from_storage(client, network=network, address=registry_addr_raw)
-
-    # read suite_hash from saved prepare_suite artifacts
-    suite_prepare_key = f"blockchain/expectations/suites/{suite_id}/prepare_suite_artifacts/response"
-    suite_prepare_obj = storage_read_json(client, suite_prepare_key)
-    suite_prepare_val = _unwrap_task_envelope(suite_prepare_obj)
-    suite_hash = extract_suite_hash(suite_prepare_val)
-    if not isinstance(suite_hash, str) or not suite_hash.startswith("0x"):
-        raise SystemExit(f"Missing suite_hash in {suite_prepare_key}")
-
-    # read report_uri (+ file_format if present) from saved prepare_report artifacts
-    report_prepare_key = f"blockchain/expectations/suites/{suite_id}/datasets/{catalog_id}/prepare_report/response"
-    report_prepare_obj = storage_read_json(client, report_prepare_key)
-    report_prepare_val = _unwrap_task_envelope(report_prepare_obj)
-
-    report_uri = extract_report_uri(report_prepare_val)
-    if not isinstance(report_uri, str) or not report_uri.startswith("ipfs://"):
-        raise SystemExit(f"Missing report_uri in {report_prepare_key}")
-    
-    file_format = _dataset_file_format_from_suite(client, suite_id=suite_id)
+    contracts.abi(network, registry_addr_raw)  # fail early if it was never dumped
 
+    inputs = load_registration_inputs(client, suite_id=suite_id, catalog_id=catalog_id)
+    suite_hash = inputs["suite_hash"]
+    report_uri = inputs["report_uri"]
+    file_format = inputs["file_format"]
+    suite_prepare_key = inputs["suite_prepare_key"]
+    report_prepare_key = inputs["report_prepare_key"]
 
     # web3 init
-    w3 = Web3(Web3.HTTPProvider(rpc_url(network)))
+    w3 = contracts.web3(network)
     if not w3.is_connected():
         raise SystemExit(f"Web3 cannot connect to RPC for network={network}")
 
@@ -147,10 +189,14 @@ def main(argv: list[str] | None = None) -> int:
     acct = w3.eth.account.from_key(pk)
     sender = acct.address
 
-    contract = w3.eth.contract(address=registry_addr, abi=abi)
+    contract = contracts.contract(network, registry_addr_raw)
 
-    # nonce comes from chain
-    chain_nonce = contract.functions.nonces(sender).call()
+    # nonce comes from chain; tx nonce / chain id / fees ride along in the same RPC batch
+    batch = contracts.rpc_batch(network)
+    nonce_call = batch.call(contract.functions.nonces(sender))
+    tx_fields = batch.tx_fields(sender)
+    batch.execute()
+    chain_nonce = nonce_call.value()
     if not isinstance(chain_nonce, int):
         raise SystemExit("Could not read nonces(sender) from chain")
 
@@ -215,40 +261,15 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     # send tx
-    tx = fn.build_transaction(
-        {
-            "from": sender,
-            "nonce": w3.eth.get_transaction_count(sender),
-            "chainId": w3.eth.chain_id,
-            "gas": int(gas_est * 12 // 10),
-        }
-    )
+    tx = fn.build_transaction({"from": sender, **tx_fields.value(), "gas": int(gas_est * 12 // 10)})
     signed = w3.eth.account.sign_transaction(tx, private_key=pk)
 
     tx_hash = _normalize_0x(w3.eth.send_raw_transaction(signed.raw_transaction).hex())
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=int(args.timeout))
-
-    # fingerprint from event
-    fingerprint = None
-    try:
-        for lg in receipt.get("logs", []):
-            # must be our registry contract
-            if (lg.get("address") or "").lower() != registry_addr.lower():
-                continue
-
-            topics = lg.get("topics") or []
-            # need at least 4 topics: sig, uploader, suiteHash, fingerprint
-            if len(topics) >= 4:
-                t3 = topics[3]
-                if isinstance(t3, (bytes, bytearray)):
-                    fingerprint = "0x" + bytes(t3).hex()
-                elif isinstance(t3, str):
-                    # already hex string without 0x sometimes
-                    fingerprint = t3 if t3.startswith("0x") else "0x" + t3
-                break
-    except Exception:
-        fingerprint = None
+    receipt = contracts.receipt_watcher(network).wait(
+        tx_hash, confirmations=args.confirmations, timeout=args.timeout
+    )
 
+    fingerprint = fingerprint_from_receipt(receipt, registry_addr)
 
     out: Dict[str, Any] = {
         "ok": True,
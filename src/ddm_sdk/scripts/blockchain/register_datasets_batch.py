@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.scripts.auth.utils import ensure_authenticated
+from ddm_sdk.scripts.blockchain.register_dataset import (
+    _normalize_0x,
+    _register_dataset_inner_hash,
+    _to_eth_signed_message_hash,
+    fingerprint_from_receipt,
+    load_registration_inputs,
+)
+from ddm_sdk.scripts.blockchain.registry import shared_registry
+from ddm_sdk.scripts.blockchain.utils import (
+    _jsonify,
+    fail_out,
+    revert_reason,
+    storage_write_pair,
+    user_pk,
+)
+
+# ----------------------------
+# Batch registerDataset.
+#
+# Chain id, the account's tx nonce, the registry's nonces(sender) and the fee
+# parameters are read once, and all gas estimates go out as one JSON-RPC batch.
+# Nonces are then assigned locally (base + k for the k-th transaction), every
+# transaction is signed and sent back-to-back, and one ReceiptWatcher polls for
+# all the receipts.
+#
+# The registry checks the signed nonce against nonces(sender) when the tx is
+# mined, so a transaction that reverts on-chain leaves the contract nonce where
+# it was and the following ones in the same batch revert too. Each item reports
+# its own outcome; re-run the failed ones (a fresh run re-reads the nonces).
+# ----------------------------
+
+_FIELDS = ("suite_id", "catalog_id", "dataset_uri")
+
+
+def _item_from_row(row: Any, where: str) -> Dict[str, str]:
+    if not isinstance(row, dict):
+        raise SystemExit(f"{where}: expected an object with {', '.join(_FIELDS)}")
+    row = {str(k).strip().replace("-", "_"): v for k, v in row.items() if k is not None}
+    if "dataset_uri" not in row and "uri" in row:
+        row["dataset_uri"] = row["uri"]
+    item: Dict[str, str] = {}
+    for f in _FIELDS:
+        v = row.get(f)
+        if not isinstance(v, str) or not v.strip():
+            raise SystemExit(f"{where}: missing {f}")
+        item[f] = v.strip()
+    return item
+
+
+def load_batch_items(path: str | Path) -> List[Dict[str, str]]:
+    """
+    (suite_id, catalog_id, dataset_uri) entries from a JSON list, a JSONL file
+    or a CSV with a header row. BOM-safe.
+    """
+    p = Path(path).expanduser()
+    if not p.is_file():
+        raise SystemExit(f"Batch file not found: {p}")
+    text = p.read_text(encoding="utf-8-sig")
+
+    if p.suffix.lower() == ".csv":
+        rows = list(csv.DictReader(text.splitlines()))
+        return [_item_from_row(r, f"{p.name}:{i + 2}") for i, r in enumerate(rows)]
+
+    if p.suffix.lower() == ".jsonl":
+        items = []
+        for i, line in enumerate(text.splitlines()):
+            if not line.strip():
+                continue
+            try:
+                items.append(_item_from_row(json.loads(line), f"{p.name}:{i + 1}"))
+            except json.JSONDecodeError as e:
+                raise SystemExit(f"{p.name}:{i + 1}: not valid JSON: {e}")
+        return items
+
+    try:
+        obj = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise SystemExit(f"{p.name} is not valid JSON: {e}")
+    if isinstance(obj, dict) and isinstance(obj.get("items"), list):
+        obj = obj["items"]
+    if not isinstance(obj, list):
+        raise SystemExit(f"{p.name} must contain a JSON list of objects")
+    return [_item_from_row(r, f"{p.name}[{i}]") for i, r in enumerate(obj)]
+
+
+def _store_key(item: Dict[str, Any]) -> str:
+    return f"blockchain/expectations/suites/{item['suite_id']}/datasets/{item['catalog_id']}/register_dataset"
+
+
+def _call(contract: Any, item: Dict[str, Any], nonce: int, sig: bytes) -> Any:
+    return contract.functions.registerDataset(
+        item["dataset_uri"],
+        Web3.to_bytes(hexstr=item["suite_hash"]),
+        item["file_format"],
+        item["report_uri"],
+        int(nonce),
+        sig,
+    )
+
+
+def _sign(w3: Web3, item: Dict[str, Any], *, sender: str, nonce: int, pk: str) -> Dict[str, Any]:
+    inner = _register_dataset_inner_hash(
+        uri=item["dataset_uri"],
+        suite_hash=item["suite_hash"],
+        file_format=item["file_format"],
+        report_uri=item["report_uri"],
+        uploader=sender,
+        nonce=nonce,
+    )
+    eth_hash = _to_eth_signed_message_hash(inner)
+    sig = w3.eth.account._sign_hash(eth_hash, private_key=pk).signature
+    return {"inner": inner, "eth_hash": eth_hash, "sig": bytes(sig)}
+
+
+def register_batch(
+    client: DdmClient,
+    items: List[Dict[str, str]],
+    *,
+    network: str,
+    registry_addr_raw: str,
+    pk: str,
+    timeout: float = 300.0,
+    confirmations: int = 1,
+    ingest: bool = True,
+    store: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Register every item; returns one result per item, in input order.
+    A failing item never stops the others, except a send error, after which
+    the remaining items are reported as not sent (their nonces would be gaps).
+    """
+    contracts = shared_registry(client)
+    registry_addr = Web3.to_checksum_address(registry_addr_raw)
+    contract = contracts.contract(network, registry_addr_raw)
+    w3 = contracts.web3(network)
+
+    acct = w3.eth.account.from_key(pk)
+    sender = acct.address
+
+    results: List[Dict[str, Any]] = []
+    pending: List[Dict[str, Any]] = []
+
+    for item in items:
+        res: Dict[str, Any] = {"ok": False, **item}
+        results.append(res)
+        try:
+            inputs = load_registration_inputs(client, suite_id=item["suite_id"], catalog_id=item["catalog_id"])
+        except (SystemExit, RuntimeError, ValueError) as e:
+            res["error"] = fail_out("MISSING_INPUT", str(e), details={"stage": "prepare"})["error"]
+            continue
+        pending.append({**item, **inputs, "res": res})
+
+    if not pending:
+        return results
+
+    # once per batch, in one RPC round-trip
+    batch = contracts.rpc_batch(network)
+    nonce_call = batch.call(contract.functions.nonces(sender))
+    fields_call = batch.tx_fields(sender)
+    batch.execute()
+    contract_nonce = nonce_call.value()
+    if not isinstance(contract_nonce, int):
+        raise SystemExit("Could not read nonces(sender) from chain")
+    fields = fields_call.value()  # tx nonce, chainId, fees
+    tx_nonce = fields.pop("nonce")
+
+    # estimate against current state (signed for the nonce the contract expects now), batched
+    estimates = []
+    for p in pending:
+        try:
+            probe = _sign(w3, p, sender=sender, nonce=contract_nonce, pk=pk)
+        except ValueError as e:
+            p["res"]["error"] = fail_out("BAD_INPUT", str(e), details={"stage": "prepare"})["error"]
+            continue
+        estimates.append((p, batch.estimate_gas(_call(contract, p, contract_nonce, probe["sig"]), {"from": sender})))
+    batch.execute()
+
+    to_send: List[Dict[str, Any]] = []
+    for p, est in estimates:
+        res = p["res"]
+        try:
+            p["gas"] = int(est.value() * 12 // 10)
+        except ContractLogicError as e:
+            res["error"] = fail_out("EVM_REVERT", revert_reason(e), details={"stage": "estimate_gas"})["error"]
+            continue
+        except Exception as e:
+            res["error"] = fail_out("RPC_ERROR", str(e), details={"stage": "estimate_gas"})["error"]
+            continue
+        to_send.append(p)
+
+    # assign nonces locally, sign and send back-to-back
+    sent: List[Dict[str, Any]] = []
+    send_failed = False
+    for k, p in enumerate(to_send):
+        res = p["res"]
+        if send_failed:
+            res["error"] = fail_out("NOT_SENT", "an earlier transaction in the batch could not be sent",
+                                    details={"stage": "send"})["error"]
+            continue
+        n = contract_nonce + k
+        signed_call = _sign(w3, p, sender=sender, nonce=n, pk=pk)
+        p["request_meta"] = {
+            "network": network,
+            "suite_id": p["suite_id"],
+            "catalog_id": p["catalog_id"],
+            "registry_address": registry_addr_raw,
+            "sender": sender,
+            "batch": {"index": k, "size": len(to_send)},
+            "call_args": {
+                "uri": p["dataset_uri"],
+                "suiteHash": p["suite_hash"],
+                "fileFormat": p["file_format"],
+                "reportUri": p["report_uri"],
+                "nonce": n,
+                "signature": "0x" + signed_call["sig"].hex(),
+                "inner_hash_hex": "0x" + signed_call["inner"].hex(),
+                "message_hash_hex": "0x" + signed_call["eth_hash"].hex(),
+            },
+            "suite_prepare_key": p["suite_prepare_key"],
+            "report_prepare_key": p["report_prepare_key"],
+        }
+        try:
+            tx = _call(contract, p, n, signed_call["sig"]).build_transaction(
+                {"from": sender, **fields, "nonce": tx_nonce + k, "gas": p["gas"]}
+            )
+            signed = w3.eth.account.sign_transaction(tx, private_key=pk)
+            p["tx_hash"] = _normalize_0x(w3.eth.send_raw_transaction(signed.raw_transaction).hex())
+        except Exception as e:
+            res["error"] = fail_out("SEND_FAILED", str(e), details={"stage": "send"})["error"]
+            # stop here: a missing tx nonce would hold every later tx in the mempool
+            send_failed = True
+            continue
+        res["tx_hash"] = p["tx_hash"]
+        sent.append(p)
+
+    # one poller for every receipt
+    futures = contracts.receipt_watcher(network).wait_all(
+        [p["tx_hash"] for p in sent], confirmations=confirmations, timeout=timeout
+    )
+    for p, fut in zip(sent, futures):
+        res = p["res"]
+        try:
+            receipt = fut.result()
+        except Exception as e:
+            res["error"] = fail_out("RECEIPT_TIMEOUT", str(e), details={"stage": "receipt"})["error"]
+            continue
+        res["receipt"] = _jsonify(dict(receipt))
+        if int(receipt.get("status", 0)) != 1:
+            res["error"] = fail_out("EVM_REVERT", "transaction reverted", details={"stage": "mined"})["error"]
+            continue
+        res["ok"] = True
+        res["fingerprint"] = fingerprint_from_receipt(receipt, registry_addr)
+
+    for p in pending:
+        res = p["res"]
+        if res["ok"] and ingest:
+            try:
+                ref = client.blockchain.ingest_tx(
+                    {"network": network, "address": registry_addr_raw, "tx_hash": p["tx_hash"]}
+                )
+                res["ingest"] = {"task": ref.model_dump() if hasattr(ref, "model_dump") else _jsonify(ref)}
+            except Exception as e:
+                res["ingest"] = {"error": str(e)}
+        if store and "request_meta" in p:
+            out = {k: v for k, v in res.items() if k not in _FIELDS}
+            out.update({
+                "network": network,
+                "registry_address": registry_addr_raw,
+                "suite_id": p["suite_id"],
+                "catalog_id": p["catalog_id"],
+                "sender": sender,
+                "request_meta": p["request_meta"],
+            })
+            res["saved"] = storage_write_pair(client, _store_key(p), p["request_meta"], out)
+
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="ddm-register-datasets-batch",
+        description="Register many datasets on-chain (DatasetRegistry) with locally assigned nonces",
+    )
+    ap.add_argument("--network", default="sepolia")
+    ap.add_argument("--items", required=True, help="JSON list, .jsonl or .csv of suite_id, catalog_id, dataset_uri")
+    ap.add_argument("--registry-name", default="DatasetRegistry", help="Name in contracts index")
+    ap.add_argument("--registry-address", default=None, help="Optional override DatasetRegistry address")
+    ap.add_argument("--timeout", type=float, default=300.0, help="Receipt timeout per transaction")
+    ap.add_argument("--confirmations", type=int, default=1, help="Blocks (including its own) before a tx counts as final")
+    ap.add_argument("--no-ingest", action="store_true")
+    ap.add_argument("--no-store", action="store_true")
+    args = ap.parse_args(argv)
+
+    items = load_batch_items(args.items)
+
+    client = DdmClient.from_env()
+    ensure_authenticated(client)
+    if not client.storage:
+        raise SystemExit("Storage not configured (DDM_STORAGE_DIR).")
+
+    network = args.network.strip()
+    contracts = shared_registry(client)
+    registry_addr_raw = (args.registry_address.strip() if args.registry_address else None) or contracts.address(
+        network, args.registry_name
+    )
+    contracts.abi(network, registry_addr_raw)  # fail early if it was never dumped
+    if not contracts.web3(network).is_connected():
+        raise SystemExit(f"Web3 cannot connect to RPC for network={network}")
+
+    results = register_batch(
+        client,
+        items,
+        network=network,
+        registry_addr_raw=registry_addr_raw,
+        pk=user_pk(),
+        timeout=args.timeout,
+        confirmations=args.confirmations,
+        ingest=not args.no_ingest,
+        store=not args.no_store,
+    )
+
+    ok = sum(1 for r in results if r["ok"])
+    out = {
+        "ok": ok == len(results),
+        "network": network,
+        "registry_address": registry_addr_raw,
+        "total": len(results),
+        "registered": ok,
+        "failed": len(results) - ok,
+        "items": results,
+    }
+    print(json.dumps(_jsonify(out), indent=2, ensure_ascii=False))
+    return 0 if out["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,12 +9,10 @@ from web3.exceptions import ContractLogicError
 
 from ddm_sdk.client import DdmClient
 from ddm_sdk.scripts.auth.utils import ensure_authenticated
+from ddm_sdk.scripts.blockchain.registry import shared_registry
 from ddm_sdk.scripts.blockchain.utils import (
-    registry_address_from_index,
-    load_abi_from_storage,
     storage_read_json,
     storage_write_pair,
-    rpc_url,
     user_pk,
     _jsonify,
     fail_out,
@@ -94,6 +92,7 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--method", choices=["plain", "sig"], default=None, help="Default: auto")
     ap.add_argument("--poll", action="store_true", help="Poll ingest task")
     ap.add_argument("--timeout", type=float, default=300.0)
+    ap.add_argument("--confirmations", type=int, default=1, help="Blocks (including its own) before the tx counts as final")
     ap.add_argument("--interval", type=float, default=2.0)
     ap.add_argument("--no-store", action="store_true")
     ap.add_argument("--max-fee-gwei", type=float, default=None)
@@ -110,15 +109,16 @@ def main(argv: list[str] | None = None) -> int:
     suite_id = args.suite_id.strip()
 
     # registry address
+    contracts = shared_registry(client)
     if args.registry_address and args.registry_address.strip():
         registry_addr_raw = args.registry_address.strip()
     else:
-        registry_addr_raw = registry_address_from_index(client, network=network, name=args.registry_name)
+        registry_addr_raw = contracts.address(network, args.registry_name)
 
     registry_addr = Web3.to_checksum_address(registry_addr_raw)
 
-    # ABI from storage
-    abi = load_abi_from_storage(client, network=network, address=registry_addr_raw)
+    # ABI from storage (fail early if it was never dumped)
+    contracts.abi(network, registry_addr_raw)
 
     # load artifacts
     prepared = _load_prepared_response(client, suite_id=suite_id)
@@ -155,14 +155,14 @@ def main(argv: list[str] | None = None) -> int:
     method = _pick_method(merged, args.method)
 
     # web3
-    w3 = Web3(Web3.HTTPProvider(rpc_url(network)))
+    w3 = contracts.web3(network)
     if not w3.is_connected():
         raise SystemExit(f"Web3 cannot connect to RPC for network={network}")
 
     acct = w3.eth.account.from_key(user_pk())
     sender = acct.address
 
-    contract = w3.eth.contract(address=registry_addr, abi=abi)
+    contract = contracts.contract(network, registry_addr_raw)
     value_wei = w3.to_wei(args.bounty_eth, "ether")
 
     # build function call
@@ -227,8 +227,15 @@ def main(argv: list[str] | None = None) -> int:
 
     base = f"blockchain/expectations/suites/{suite_id}/register_suite"
 
+    # chain time, gas estimate, tx nonce, chain id and fees in one RPC batch
+    batch = contracts.rpc_batch(network)
+    latest = batch.block("latest")
+    gas_call = batch.estimate_gas(fn, {"from": sender, "value": value_wei})
+    tx_fields = batch.tx_fields(sender, latest=latest)
+    batch.execute()
+
     # deadline sanity (chain time)
-    now = int(w3.eth.get_block("latest")["timestamp"])
+    now = int(latest.value()["timestamp"], 16)
     if int(deadline) <= now:
         out = fail_out(
             "DEADLINE_PAST",
@@ -242,7 +249,7 @@ def main(argv: list[str] | None = None) -> int:
 
     # estimate gas
     try:
-        gas_est = fn.estimate_gas({"from": sender, "value": value_wei})
+        gas_est = gas_call.value()
     except ContractLogicError as e:
         reason = revert_reason(e)
         out = fail_out("EVM_REVERT", reason, details={"stage": "estimate_gas", "method": method})
@@ -255,17 +262,11 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     # build tx
-    tx = fn.build_transaction(
-        {
-            "from": sender,
-            "value": value_wei,
-            "nonce": w3.eth.get_transaction_count(sender),
-            "chainId": w3.eth.chain_id,
-            "gas": int(gas_est * 1.2),
-        }
-    )
+    tx = fn.build_transaction({"from": sender, "value": value_wei, **tx_fields.value(), "gas": int(gas_est * 1.2)})
 
     # optional EIP-1559 knobs
+    if args.max_fee_gwei is not None or args.max_priority_fee_gwei is not None:
+        tx.pop("gasPrice", None)
     if args.max_fee_gwei is not None:
         tx["maxFeePerGas"] = w3.to_wei(args.max_fee_gwei, "gwei")
     if args.max_priority_fee_gwei is not None:
@@ -273,7 +274,9 @@ def main(argv: list[str] | None = None) -> int:
 
     signed = acct.sign_transaction(tx)
     tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction).hex()
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=int(args.timeout))
+    receipt = contracts.receipt_watcher(network).wait(
+        tx_hash, confirmations=args.confirmations, timeout=args.timeout
+    )
 
     out: Dict[str, Any] = {
         "ok": True,
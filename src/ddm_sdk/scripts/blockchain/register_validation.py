@@ -10,18 +10,10 @@ from web3.exceptions import ContractLogicError
 
 from ddm_sdk.client import DdmClient
 from ddm_sdk.scripts.auth.utils import ensure_authenticated
+from ddm_sdk.scripts.blockchain.registry import shared_registry
 from ddm_sdk.scripts.blockchain.utils import _jsonify, fail_out, revert_reason
 
 
-def _rpc_url(network: str) -> str:
-    env1 = f"DDM_RPC_{network.upper()}"
-    env2 = f"{network.upper()}_RPC_URL"
-    v = os.getenv(env1) or os.getenv(env2) or os.getenv("DDM_RPC_URL")
-    if not v:
-        raise SystemExit(f"Missing RPC url. Set {env1} or {env2} or DDM_RPC_URL")
-    return v
-
-
 def _pk() -> str:
     v = os.getenv("DDM_HUMANVAL_PK")
     if not v or not v.strip():
@@ -36,36 +28,6 @@ def _store_latest(client: DdmClient, base: str, req: Dict[str, Any], resp: Dict[
     }
 
 
-def _load_json_storage(client: DdmClient, key: str) -> Any:
-    if not client.storage:
-        raise RuntimeError("Storage not configured (DDM_STORAGE_DIR).")
-    return client.storage.read_json(key)
-
-
-def _load_abi(client: DdmClient, *, network: str, address: str) -> Any:
-    # your dump script uses: blockchain/contracts/<network>/<addr>.abi
-    key = f"blockchain/contracts/{network}/{address}.abi"
-    abi = _load_json_storage(client, key)
-    if abi is None:
-        raise FileNotFoundError(f"ABI not found at storage key: {key}")
-    return abi
-
-
-def _registry_address_from_index(client: DdmClient, *, network: str, name: str) -> str:
-    idx = _load_json_storage(client, f"blockchain/contracts/{network}/_index")
-    if not isinstance(idx, dict):
-        raise FileNotFoundError(f"Contracts index missing at blockchain/contracts/{network}/_index.json")
-
-    contracts = idx.get("contracts")
-    if not isinstance(contracts, list):
-        raise RuntimeError("Contracts index malformed: missing 'contracts' list")
-
-    for c in contracts:
-        if isinstance(c, dict) and c.get("name") == name and isinstance(c.get("address"), str):
-            return c["address"]
-    raise SystemExit(f"Contract {name} not found in saved index for network={network}")
-
-
 def _unwrap_prepared(obj: Dict[str, Any]) -> Dict[str, Any]:
     prepared = None
     if isinstance(obj.get("result"), dict):
@@ -110,6 +72,7 @@ def main(argv: list[str] | None = None) -> int:
 
     ap.add_argument("--poll", action="store_true", help="Poll ingest task")
     ap.add_argument("--timeout", type=float, default=300.0)
+    ap.add_argument("--confirmations", type=int, default=1, help="Blocks (including its own) before the tx counts as final")
     ap.add_argument("--interval", type=float, default=2.0)
     ap.add_argument("--no-store", action="store_true")
 
@@ -127,17 +90,18 @@ def main(argv: list[str] | None = None) -> int:
     fp = args.dataset_fingerprint.strip()
 
     # contract + abi
+    contracts = shared_registry(client)
     if args.registry_address and args.registry_address.strip():
         reg_addr_raw = args.registry_address.strip()
     else:
-        reg_addr_raw = _registry_address_from_index(client, network=network, name=args.registry_name)
+        reg_addr_raw = contracts.address(network, args.registry_name)
 
     reg_addr = Web3.to_checksum_address(reg_addr_raw)
-    abi = _load_abi(client, network=network, address=reg_addr_raw)
+    contracts.abi(network, reg_addr_raw)  # fail early if it was never dumped
 
     # load prepared artifacts
     prep_key = f"blockchain/validations/{fp}/prepare_validation/response"
-    prep_obj = _load_json_storage(client, prep_key)
+    prep_obj = client.storage.read_json(prep_key)
     if not isinstance(prep_obj, dict):
         raise FileNotFoundError(f"Prepared validation response not found at storage key: {prep_key}")
 
@@ -157,14 +121,14 @@ def main(argv: list[str] | None = None) -> int:
         raise SystemExit(f"Missing fields in prepared validation artifacts: {missing}")
 
     # web3
-    w3 = Web3(Web3.HTTPProvider(_rpc_url(network)))
+    w3 = contracts.web3(network)
     if not w3.is_connected():
         raise SystemExit(f"Web3 cannot connect to RPC for network={network}")
 
     acct = w3.eth.account.from_key(_pk())
     sender = acct.address
 
-    contract = w3.eth.contract(address=reg_addr, abi=abi)
+    contract = contracts.contract(network, reg_addr_raw)
 
     fn = contract.functions.submitValidation(
         fp,
@@ -183,9 +147,13 @@ def main(argv: list[str] | None = None) -> int:
         "prepared_key": f"{prep_key}.json",
     }
 
-    # estimate gas (catch all reverts)
+    # estimate gas (catch all reverts); tx nonce, chain id and fees in the same RPC batch
+    batch = contracts.rpc_batch(network)
+    gas_call = batch.estimate_gas(fn, {"from": sender})
+    tx_fields = batch.tx_fields(sender)
+    batch.execute()
     try:
-        gas_est = fn.estimate_gas({"from": sender})
+        gas_est = gas_call.value()
     except ContractLogicError as e:
         reason = revert_reason(e)
         out = fail_out(
@@ -199,15 +167,10 @@ def main(argv: list[str] | None = None) -> int:
         print(json.dumps(_jsonify(out), indent=2, ensure_ascii=False))
         return 1
 
-    tx = fn.build_transaction(
-        {
-            "from": sender,
-            "nonce": w3.eth.get_transaction_count(sender),
-            "chainId": w3.eth.chain_id,
-            "gas": int(gas_est * 1.2),
-        }
-    )
+    tx = fn.build_transaction({"from": sender, **tx_fields.value(), "gas": int(gas_est * 1.2)})
 
+    if args.max_fee_gwei is not None or args.max_priority_fee_gwei is not None:
+        tx.pop("gasPrice", None)
     if args.max_fee_gwei is not None:
         tx["maxFeePerGas"] = w3.to_wei(args.max_fee_gwei, "gwei")
     if args.max_priority_fee_gwei is not None:
@@ -215,7 +178,9 @@ def main(argv: list[str] | None = None) -> int:
 
     signed = acct.sign_transaction(tx)
     tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction).hex()
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=int(args.timeout))
+    receipt = contracts.receipt_watcher(network).wait(
+        tx_hash, confirmations=args.confirmations, timeout=args.timeout
+    )
 
     out: Dict[str, Any] = {
         "ok": True,
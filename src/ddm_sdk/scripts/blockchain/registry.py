@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+
+from ddm_sdk.scripts.blockchain.receipts import ReceiptWatcher
+from ddm_sdk.scripts.blockchain.rpc_batch import RpcBatch
+from ddm_sdk.scripts.blockchain.utils import rpc_url as _rpc_url_from_env
+
+
+def _abi_signature(item: Dict[str, Any]) -> str:
+    def typ(p: Dict[str, Any]) -> str:
+        t = str(p.get("type", ""))
+        if t.startswith("tuple"):
+            return "(" + ",".join(typ(c) for c in p.get("components") or []) + ")" + t[len("tuple"):]
+        return t
+
+    return f"{item.get('name', '')}(" + ",".join(typ(p) for p in item.get("inputs") or []) + ")"
+
+
+class ContractRegistry:
+    """
+    Cache for the blockchain scripts' startup work: the saved
+    contracts index (blockchain/contracts/<network>/_index), parsed ABIs, checksum
+    addresses, function selectors and web3 Contract objects per (network, address),
+    plus one Web3 (and one pooled HTTP session) and one ReceiptWatcher per RPC URL.
+
+        reg = ContractRegistry.for_client(client)
+        contract = reg.contract("sepolia", name="DatasetRegistry")
+        w3 = reg.web3("sepolia")
+
+    Everything is read once and kept (thread-safe), so a long-running process
+    builds each of these once; call invalidate() after dump_contracts refreshed
+    the saved index/ABIs. shared_registry(client) returns one per storage.
+    """
+
+    def __init__(
+        self,
+        storage: Any,
+        *,
+        rpc_url: Optional[Callable[[str], str]] = None,
+        pool_maxsize: int = 16,
+        request_timeout: float = 30.0,
+    ):
+        self.storage = storage
+        self._rpc_url = rpc_url or _rpc_url_from_env
+        self._pool_maxsize = pool_maxsize
+        self._request_timeout = request_timeout
+        self._lock = threading.RLock()
+        self._web3: Dict[str, Web3] = {}
+        self._sessions: Dict[str, requests.Session] = {}
+        self._watchers: Dict[str, ReceiptWatcher] = {}
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._abi: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._contracts: Dict[Tuple[str, str, str], Any] = {}
+        self._selectors: Dict[Tuple[str, str], Dict[str, str]] = {}
+
+    @classmethod
+    def for_client(cls, client: Any, **kwargs: Any) -> "ContractRegistry":
+        if not client.storage:
+            raise RuntimeError("Storage not configured (DDM_STORAGE_DIR).")
+        return cls(client.storage, **kwargs)
+
+    def invalidate(self, network: Optional[str] = None) -> None:
+        """Forget cached index/ABIs/contracts (of one network, or all). Web3 sessions are kept."""
+        with self._lock:
+            if network is None:
+                self._index.clear()
+                self._abi.clear()
+                self._contracts.clear()
+                self._selectors.clear()
+                return
+            self._index.pop(network, None)
+            for d in (self._abi, self._selectors, self._contracts):
+                for k in [k for k in d if k[0] == network]:
+                    del d[k]
+
+    # ---- web3 ----
+
+    def _session(self, url: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(url)
+            if session is None:
+                session = self._sessions[url] = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_maxsize)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+            return session
+
+    def web3(self, network: str) -> Web3:
+        """One Web3 per RPC URL; its HTTP session keeps connections alive between calls."""
+        url = self._rpc_url(network)
+        with self._lock:
+            w3 = self._web3.get(url)
+            if w3 is None:
+                provider = Web3.HTTPProvider(
+                    url, session=self._session(url), request_kwargs={"timeout": self._request_timeout}
+                )
+                w3 = self._web3[url] = Web3(provider)
+            return w3
+
+    def rpc_batch(self, network: str, *, max_batch: int = 100) -> RpcBatch:
+        """A new RpcBatch on the same pooled session as web3(network)."""
+        url = self._rpc_url(network)
+        return RpcBatch(url, session=self._session(url), timeout=self._request_timeout, max_batch=max_batch)
+
+    def receipt_watcher(self, network: str) -> ReceiptWatcher:
+        """The ReceiptWatcher for this network's RPC URL (one poller shared by every caller)."""
+        url = self._rpc_url(network)
+        with self._lock:
+            watcher = self._watchers.get(url)
+            if watcher is None:
+                watcher = self._watchers[url] = ReceiptWatcher(self.rpc_batch(network))
+            return watcher
+
+    # ---- saved index / ABIs ----
+
+    def index(self, network: str) -> Dict[str, Any]:
+        with self._lock:
+            idx = self._index.get(network)
+            if idx is None:
+                key = f"blockchain/contracts/{network}/_index"
+                obj = self.storage.read_json(key)
+                if not isinstance(obj, dict):
+                    raise FileNotFoundError(f"Contract index not found at storage key: {key}")
+                idx = self._index[network] = obj
+            return idx
+
+    def address(self, network: str, name: str) -> str:
+        """Address of a contract by name in the saved index (as stored, not checksummed)."""
+        items = self.index(network).get("contracts")
+        if not isinstance(items, list):
+            raise RuntimeError("Invalid index format: missing 'contracts' list")
+        for it in items:
+            if isinstance(it, dict) and it.get("name") == name:
+                addr = it.get("address")
+                if isinstance(addr, str) and addr.strip():
+                    return addr.strip()
+        raise FileNotFoundError(f"Contract '{name}' not found in blockchain/contracts/{network}/_index")
+
+    def abi(self, network: str, address: str) -> List[Dict[str, Any]]:
+        """
+        ABI saved by dump_contracts under blockchain/contracts/<network>/<address>.abi.
+        The address may be given in any case.
+        """
+        ck = (network, address.lower())
+        with self._lock:
+            abi = self._abi.get(ck)
+            if abi is not None:
+                return abi
+            for a in dict.fromkeys((address, Web3.to_checksum_address(address), address.lower())):
+                found = self.storage.read_json(f"blockchain/contracts/{network}/{a}.abi")
+                if found is not None:
+                    break
+            else:
+                raise FileNotFoundError(f"ABI not found at storage key: blockchain/contracts/{network}/{address}.abi")
+            if isinstance(found, str):
+                found = json.loads(found)
+            self._abi[ck] = found
+            return found
+
+    def selectors(self, network: str, address: str) -> Dict[str, str]:
+        """{"name(type,...)": "0x<4-byte selector>"} for the functions in the ABI."""
+        ck = (network, address.lower())
+        with self._lock:
+            sel = self._selectors.get(ck)
+            if sel is None:
+                sel = {}
+                for item in self.abi(network, address):
+                    if isinstance(item, dict) and item.get("type") == "function":
+                        sig = _abi_signature(item)
+                        sel[sig] = "0x" + bytes(Web3.keccak(text=sig)[:4]).hex()
+                self._selectors[ck] = sel
+            return sel
+
+    def selector(self, network: str, address: str, fn_name: str) -> str:
+        """Selector of a function by name (or full signature); ambiguous overloads need the signature."""
+        sel = self.selectors(network, address)
+        if fn_name in sel:
+            return sel[fn_name]
+        matches = [v for k, v in sel.items() if k.split("(", 1)[0] == fn_name]
+        if len(matches) != 1:
+            raise KeyError(f"{fn_name}: {'not in ABI' if not matches else 'overloaded, pass the signature'}")
+        return matches[0]
+
+    # ---- contracts ----
+
+    def contract(self, network: str, address: Optional[str] = None, *, name: Optional[str] = None) -> Any:
+        """web3 Contract for an address, or for a name from the saved index; built once."""
+        if address is None:
+            if name is None:
+                raise ValueError("address or name is required")
+            address = self.address(network, name)
+        url = self._rpc_url(network)
+        ck = (network, address.lower(), url)
+        with self._lock:
+            c = self._contracts.get(ck)
+            if c is None:
+                c = self.web3(network).eth.contract(
+                    address=Web3.to_checksum_address(address),
+                    abi=self.abi(network, address),
+                )
+                self._contracts[ck] = c
+            return c
+
+
+_shared: Dict[int, ContractRegistry] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_registry(client: Any) -> ContractRegistry:
+    """The ContractRegistry for this client's storage, created on first use."""
+    if not client.storage:
+        raise RuntimeError("Storage not configured (DDM_STORAGE_DIR).")
+    with _shared_lock:
+        reg = _shared.get(id(client.storage))
+        if reg is None or reg.storage is not client.storage:
+            reg = _shared[id(client.storage)] = ContractRegistry(client.storage)
+        return reg
+
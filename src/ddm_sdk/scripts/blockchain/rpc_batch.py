@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import itertools
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from eth_abi import decode as abi_decode
+from eth_utils.abi import get_abi_output_types
+from web3.exceptions import ContractLogicError
+
+# ----------------------------
+# JSON-RPC batching for independent read calls.
+#
+# Calls are queued with add()/call()/estimate_gas()/..., then execute() sends
+# them as one JSON-RPC array (split into chunks of max_batch). Endpoints that
+# reject batches (HTTP error, or a single error object instead of an array)
+# get the same calls one by one, and the batch remembers that for next time.
+# ----------------------------
+
+_ERROR_STRING = "0x08c379a0"  # Error(string)
+
+
+class RpcError(RuntimeError):
+    def __init__(self, code: Any, message: str, data: Any = None):
+        super().__init__(f"RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+def _to_int(v: Any) -> int:
+    return int(v, 16) if isinstance(v, str) else int(v)
+
+
+def _error(err: Dict[str, Any]) -> Exception:
+    msg = str(err.get("message") or "")
+    data = err.get("data")
+    if isinstance(data, dict):  # some nodes nest it
+        data = data.get("data") or data.get("result")
+    if "revert" in msg.lower() or err.get("code") == 3:
+        if isinstance(data, str) and data.startswith(_ERROR_STRING) and msg.strip().lower() == "execution reverted":
+            try:
+                (reason,) = abi_decode(["string"], bytes.fromhex(data[10:]))
+                msg = f"execution reverted: {reason}"
+            except Exception:
+                pass
+        return ContractLogicError(msg, data=data)
+    return RpcError(err.get("code"), msg, data)
+
+
+class RpcCall:
+    """A queued call; value() returns the decoded result (or raises its error) after execute()."""
+
+    _unset = object()
+
+    def __init__(self, method: str, params: List[Any], decode: Optional[Callable[[Any], Any]] = None):
+        self.method = method
+        self.params = params
+        self._decode = decode
+        self._result: Any = self._unset
+        self._error: Optional[Exception] = None
+
+    @property
+    def done(self) -> bool:
+        return self._error is not None or self._result is not self._unset
+
+    def _resolve(self, resp: Dict[str, Any]) -> None:
+        if resp.get("error") is not None:
+            self._error = _error(resp["error"])
+            return
+        try:
+            raw = resp.get("result")
+            self._result = self._decode(raw) if self._decode else raw
+        except Exception as e:
+            self._error = e
+
+    def value(self) -> Any:
+        if self._error is not None:
+            raise self._error
+        if self._result is self._unset:
+            raise RuntimeError(f"{self.method}: batch not executed")
+        return self._result
+
+
+class _Derived(RpcCall):
+    """Value computed from other calls of the same batch."""
+
+    def __init__(self, fn: Callable[[], Any]):
+        super().__init__("derived", [])
+        self._fn = fn
+
+    @property
+    def done(self) -> bool:
+        return True
+
+    def value(self) -> Any:
+        return self._fn()
+
+
+class RpcBatch:
+    """
+    Queue read-only calls and send them in one HTTP round-trip.
+
+        batch = ContractRegistry.for_client(client).rpc_batch("sepolia")
+        nonce = batch.call(contract.functions.nonces(sender))
+        fields = batch.tx_fields(sender)          # nonce, chainId, fees
+        batch.execute()
+        nonce.value(), fields.value()
+
+    value() raises the call's own error (ContractLogicError for reverts,
+    RpcError otherwise), so one failing call does not affect the others.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        session: Optional[requests.Session] = None,
+        timeout: float = 30.0,
+        max_batch: int = 100,
+    ):
+        self.url = url
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.max_batch = max(1, int(max_batch))
+        self.batching = True  # flipped off when the endpoint rejects arrays
+        self._queue: List[RpcCall] = []
+        self._ids = itertools.count(1)
+
+    # ---- queueing ----
+
+    def add(self, method: str, params: Optional[List[Any]] = None, *, decode: Optional[Callable[[Any], Any]] = None) -> RpcCall:
+        c = RpcCall(method, list(params or []), decode)
+        self._queue.append(c)
+        return c
+
+    def chain_id(self) -> RpcCall:
+        return self.add("eth_chainId", decode=_to_int)
+
+    def transaction_count(self, address: str, block: str = "pending") -> RpcCall:
+        return self.add("eth_getTransactionCount", [address, block], decode=_to_int)
+
+    def gas_price(self) -> RpcCall:
+        return self.add("eth_gasPrice", decode=_to_int)
+
+    def max_priority_fee(self) -> RpcCall:
+        return self.add("eth_maxPriorityFeePerGas", decode=_to_int)
+
+    def block(self, block: str = "latest") -> RpcCall:
+        return self.add("eth_getBlockByNumber", [block, False])
+
+    def call(self, fn: Any, tx: Optional[Dict[str, Any]] = None, block: str = "latest") -> RpcCall:
+        """eth_call of a web3 ContractFunction; value() is decoded like fn.call()."""
+        types = get_abi_output_types(fn.abi)
+
+        def decode(raw: Any) -> Any:
+            out = abi_decode(types, bytes.fromhex(str(raw)[2:]))
+            return out[0] if len(out) == 1 else list(out)
+
+        return self.add("eth_call", [self._tx(fn, tx), block], decode=decode)
+
+    def estimate_gas(self, fn: Any, tx: Optional[Dict[str, Any]] = None) -> RpcCall:
+        return self.add("eth_estimateGas", [self._tx(fn, tx)], decode=_to_int)
+
+    def tx_fields(self, sender: str, *, latest: Optional[RpcCall] = None) -> RpcCall:
+        """
+        nonce (pending), chainId and fee fields for a transaction from `sender`:
+        EIP-1559 (maxFee = 2 * baseFee + tip) when the latest block has a base fee,
+        gasPrice otherwise. Pass `latest` to reuse a block() call already queued.
+        """
+        nonce = self.transaction_count(sender, "pending")
+        chain = self.chain_id()
+        latest = latest or self.block("latest")
+        tip = self.max_priority_fee()
+        price = self.gas_price()
+
+        def fields() -> Dict[str, Any]:
+            out: Dict[str, Any] = {"nonce": nonce.value(), "chainId": chain.value()}
+            base = (latest.value() or {}).get("baseFeePerGas")
+            if base is None:
+                out["gasPrice"] = price.value()
+                return out
+            base = _to_int(base)
+            try:
+                t = tip.value()
+            except (RpcError, ContractLogicError):  # node without eth_maxPriorityFeePerGas
+                t = max(price.value() - base, 0)
+            out["maxPriorityFeePerGas"] = t
+            out["maxFeePerGas"] = 2 * base + t
+            return out
+
+        return _Derived(fields)
+
+    @staticmethod
+    def _tx(fn: Any, tx: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"to": fn.address, "data": fn._encode_transaction_data()}
+        for k, v in (tx or {}).items():
+            out[k] = hex(v) if isinstance(v, int) else v
+        return out
+
+    # ---- sending ----
+
+    def execute(self) -> List[RpcCall]:
+        """Send every queued call; returns them in queue order."""
+        calls, self._queue = self._queue, []
+        for i in range(0, len(calls), self.max_batch):
+            chunk = calls[i : i + self.max_batch]
+            if not (self.batching and len(chunk) > 1 and self._send_batch(chunk)):
+                for c in chunk:
+                    c._resolve(self._post(self._payload(c)))
+        return calls
+
+    def _payload(self, c: RpcCall) -> Dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": next(self._ids), "method": c.method, "params": c.params}
+
+    def _post(self, body: Any) -> Any:
+        r = self.session.post(self.url, json=body, timeout=self.timeout)
+        r.raise_for_status()
+        return r.json()
+
+    def _send_batch(self, chunk: List[RpcCall]) -> bool:
+        """
+        False (and batching off for good) only when the endpoint answers the array
+        with a JSON-RPC error object, i.e. it does not take batches. Other HTTP
+        errors (429, 5xx, ...) are raised and leave batching as it was.
+        """
+        payload = [self._payload(c) for c in chunk]
+        r = self.session.post(self.url, json=payload, timeout=self.timeout)
+        try:
+            resp = r.json()
+        except ValueError:
+            resp = None
+        if isinstance(resp, dict) and isinstance(resp.get("error"), dict):
+            self.batching = False
+            return False
+        if not isinstance(resp, list):
+            r.raise_for_status()
+            raise RpcError(-32700, f"unexpected batch response: {r.text[:200]}")
+        by_id = {r.get("id"): r for r in resp if isinstance(r, dict)}
+        for c, p in zip(chunk, payload):
+            r = by_id.get(p["id"])
+            c._resolve(r if r is not None else {"error": {"code": -32603, "message": "missing from batch response"}})
+        return True
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.scripts.auth.utils import ensure_authenticated
+from ddm_sdk.scripts.blockchain.utils import _jsonify
+from ddm_sdk.storage.chain_index import ChainIndex
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="ddm-blockchain-sync-index",
+        description="Sync indexed contract events/txs into the local chain index (SQLite in DDM_STORAGE_DIR)",
+    )
+    ap.add_argument("--network", default="sepolia")
+    ap.add_argument("--address", action="append", default=None, help="Contract address (repeatable). Default: whole network")
+    ap.add_argument("--what", choices=["events", "txs", "both"], default="both")
+    ap.add_argument("--full", action="store_true", help="Ignore the checkpoints and re-list from block 0")
+    ap.add_argument("--overlap", type=int, default=0, help="Also re-list this many blocks before each checkpoint")
+    ap.add_argument("--perPage", type=int, default=200)
+    ap.add_argument("--max-in-flight", type=int, default=4, help="Pages fetched in parallel")
+    ap.add_argument("--name", action="append", default=None, help="After syncing, print stored events with this name")
+    ap.add_argument("--tx-hash", default=None, help="After syncing, print the stored tx and its events")
+    args = ap.parse_args(argv)
+
+    client = DdmClient.from_env()
+    ensure_authenticated(client)
+
+    idx = ChainIndex.for_client(client)
+    if idx is None:
+        raise SystemExit("The chain index needs file storage: set DDM_STORAGE_DIR")
+
+    network = args.network.strip()
+    addresses = [a.strip() for a in args.address or [] if a and a.strip()] or [None]
+    kinds = ["events", "txs"] if args.what == "both" else [args.what]
+
+    with idx:
+        synced = []
+        for kind in kinds:
+            sync = idx.sync_events if kind == "events" else idx.sync_txs
+            for address in addresses:
+                before = idx.checkpoint(kind, network, address)
+                written = sync(
+                    client.blockchain,
+                    network=network,
+                    address=address,
+                    full=args.full,
+                    overlap=args.overlap,
+                    per_page=args.perPage,
+                    max_in_flight=args.max_in_flight,
+                )
+                synced.append({
+                    "kind": kind,
+                    "address": address,
+                    "written": written,
+                    "checkpoint_before": before,
+                    "checkpoint": idx.checkpoint(kind, network, address),
+                })
+
+        out = {
+            "ok": True,
+            "index": str(idx.path),
+            "network": network,
+            "synced": synced,
+            "events": idx.count("events"),
+            "txs": idx.count("txs"),
+        }
+        if args.name:
+            out["matches"] = idx.events(network=network, name=args.name, newest_first=True)
+        if args.tx_hash:
+            h = args.tx_hash.strip()
+            out["tx"] = idx.get_tx(h, network=network)
+            out["tx_events"] = idx.events(network=network, tx_hash=[h])
+
+    print(json.dumps(_jsonify(out), indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,6 +8,7 @@ from hexbytes import HexBytes
 import os
 from ddm_sdk.scripts.expectations.utils import suite_dir_key, suite_datasets_key, suite_logs_key, norm_suite_id
 from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.logs import append_entry, iter_entries
 
 try:
     from web3.datastructures import AttributeDict
@@ -50,24 +51,22 @@ def append_blockchain_log(
     details: Dict[str, Any] | None = None,
 ) -> None:
     """
-    blockchain/logs.json  (append list of dicts)
+    blockchain/logs.jsonl  (append-only)
     """
     if not client.storage:
         return
 
     key = f"{blockchain_root_key()}/logs"
-    existing = client.storage.read_json(key)
-    logs: List[Dict[str, Any]] = existing if isinstance(existing, list) else []
-
-    logs.append(
+    append_entry(
+        client.storage,
+        key,
         {
             "ts": utc_now_iso(),
             "action": action,
             "ok": bool(ok),
             "details": details or {},
-        }
+        },
     )
-    client.storage.write_json(key, logs)
 
 
 def store_blockchain_snapshot(
@@ -227,20 +226,20 @@ def dataset_id_from_suite_links_or_log(client: DdmClient, *, project_id: str, su
             if isinstance(x, str) and x.strip():
                 return x.strip()
 
-    # 2) log.json details.dataset_id (use most recent)
-    log_obj = client.storage.read_json(suite_logs_key(project_id=project_id, suite_id=suite_id))
-    if isinstance(log_obj, list):
-        for entry in reversed(log_obj):
-            if not isinstance(entry, dict):
-                continue
-            details = entry.get("details")
-            if not isinstance(details, dict):
-                continue
-            did = details.get("dataset_id")
-            if isinstance(did, str) and did.strip():
-                return did.strip()
-
-    return None
+    # 2) log details.dataset_id (use most recent)
+    log_key = suite_logs_key(project_id=project_id, suite_id=suite_id)
+    latest: Optional[str] = None
+    for entry in iter_entries(client.storage, log_key):
+        if not isinstance(entry, dict):
+            continue
+        details = entry.get("details")
+        if not isinstance(details, dict):
+            continue
+        did = details.get("dataset_id")
+        if isinstance(did, str) and did.strip():
+            latest = did.strip()
+
+    return latest
 
 def load_contract_index(client: DdmClient, *, network: str) -> Dict[str, Any]:
     """
@@ -338,7 +337,8 @@ def revert_reason(e: Exception) -> str:
     Extraction of revert reason from web3 ContractLogicError.
     Typical string: "execution reverted: <reason>"
     """
-    msg = str(e) or ""
+    # web3 7 keeps the text in .message; str(e) is the (message, data) args tuple
+    msg = getattr(e, "message", None) or str(e) or ""
     # common pattern
     if "execution reverted:" in msg:
         return msg.split("execution reverted:", 1)[1].strip().strip("'").strip('"')
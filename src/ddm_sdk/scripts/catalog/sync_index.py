@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.scripts.auth.utils import ensure_authenticated
+from ddm_sdk.storage.catalog_index import CatalogIndex
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="ddm-catalog-sync-index", description="Sync the local catalog index (SQLite in DDM_STORAGE_DIR)")
+    ap.add_argument("--full", action="store_true", help="Rebuild from scratch instead of syncing from the watermark")
+    ap.add_argument("--perPage", type=int, default=200)
+    ap.add_argument("--max-in-flight", type=int, default=4, help="Catalog pages fetched in parallel")
+    ap.add_argument("--file-id", default=None, help="Print the indexed metadata of one file after syncing")
+    args = ap.parse_args(argv)
+
+    client = DdmClient.from_env()
+    ensure_authenticated(client)
+
+    idx = CatalogIndex.for_client(client)
+    if idx is None:
+        raise SystemExit("The catalog index needs file storage: set DDM_STORAGE_DIR")
+
+    with idx:
+        before = idx.watermark()
+        written = idx.sync(client.catalog, full=args.full, per_page=args.perPage, max_in_flight=args.max_in_flight)
+        out = {
+            "ok": True,
+            "index": str(idx.path),
+            "written": written,
+            "files": len(idx),
+            "watermark_before": before,
+            "watermark": idx.watermark(),
+        }
+        if args.file_id:
+            out["file"] = idx.get(args.file_id.strip())
+
+    print(json.dumps(out, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
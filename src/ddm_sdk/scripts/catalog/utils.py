@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict
 
 from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.logs import append_entry
 
 
 def norm_project(project_id: str) -> str:
@@ -32,27 +33,22 @@ def append_project_log(
 ) -> None:
     """
     Appends a line-delimited JSON log in storage (if enabled).
-    Stored at: projects/<project>/catalog/logs.ndjson
+    Stored at: projects/<project>/catalog/logs.jsonl
     """
     if not client.storage:
         return
 
     key = f"{project_catalog_root(project_id)}/logs"
-    existing = client.storage.read_json(key)
-    if isinstance(existing, list):
-        logs = existing
-    else:
-        logs = []
-
-    logs.append(
+    append_entry(
+        client.storage,
+        key,
         {
             "ts": _utc_now_iso(),
             "action": action,
             "ok": ok,
             "details": details,
-        }
+        },
     )
-    client.storage.write_json(key, logs)
 
 
 def store_result(
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Optional, List, Tuple
 
 from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.logs import append_entry
 
 
 def utc_ts() -> str:
@@ -107,18 +108,16 @@ def append_suite_log(
         return
 
     key = suite_logs_key(project_id=project_id, suite_id=suite_id)
-    existing = client.storage.read_json(key)
-    logs = existing if isinstance(existing, list) else []
-
-    logs.append(
+    append_entry(
+        client.storage,
+        key,
         {
             "ts": datetime.now(timezone.utc).isoformat(),
             "action": action,
             "ok": ok,
             "details": details,
-        }
+        },
     )
-    client.storage.write_json(key, logs)
 
 
 def persist_suite_record(
@@ -458,6 +457,27 @@ def _write_str_list(client: DdmClient, key: str, items: Set[str]) -> None:
     client.storage.write_json(key, sorted(items))
 
 
+def _add_to_str_list(client: DdmClient, key: str, item: str) -> None:
+    """
+    Add `item` to the sorted string list stored at `key`. Uses the storage's
+    update_json (locked read-modify-write) when it has one, so concurrent workers
+    linking the same suite/dataset do not drop each other's entries.
+    """
+    update = getattr(client.storage, "update_json", None)
+    if not callable(update):
+        items = _read_str_set(client, key)
+        items.add(item)
+        _write_str_list(client, key, items)
+        return
+
+    def add(obj: object) -> List[str]:
+        items = {x.strip() for x in obj if isinstance(x, str) and x.strip()} if isinstance(obj, list) else set()
+        items.add(item)
+        return sorted(items)
+
+    update(key, add)
+
+
 def link_suite_dataset(
     *,
     client: DdmClient,
@@ -469,7 +489,7 @@ def link_suite_dataset(
       - add dataset_id to expectations/suites/<suite_id>/datasets.json
       - add suite_id to expectations/datasets/<dataset_id>/suites.json
 
-    Safe to call multiple times (no duplicates).
+    Safe to call multiple times (no duplicates) and from concurrent workers.
     """
     if not client.storage:
         return
@@ -480,13 +500,7 @@ def link_suite_dataset(
         return
 
     # suite -> datasets
-    s_key = suite_datasets_key(suite_id=sid)
-    ds = _read_str_set(client, s_key)
-    ds.add(did)
-    _write_str_list(client, s_key, ds)
+    _add_to_str_list(client, suite_datasets_key(suite_id=sid), did)
 
     # dataset -> suites
-    d_key = dataset_suites_key(dataset_id=did)
-    ss = _read_str_set(client, d_key)
-    ss.add(sid)
-    _write_str_list(client, d_key, ss)
+    _add_to_str_list(client, dataset_suites_key(dataset_id=did), sid)
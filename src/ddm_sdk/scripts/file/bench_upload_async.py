@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.transport.chunked import ChunkSizeTuner
+
+# ----------------------------
+# Replays the /ddm/file/upload/async chunk protocol against a local server that
+# simulates a link (per-connection bandwidth + fixed per-request latency), to compare
+# static chunk sizes with the adaptive ChunkSizeTuner. No DDM backend needed.
+# ----------------------------
+
+
+def _parse_size(s: str) -> int:
+    s = s.strip().upper()
+    for suffix, mul in (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10), ("B", 1)):
+        if s.endswith(suffix):
+            return int(float(s[: -len(suffix)]) * mul)
+    return int(s)
+
+
+class SimulatedLink:
+    """Local chunk endpoint: reads each body at `bandwidth` bytes/s and adds `latency` seconds."""
+
+    def __init__(self, *, bandwidth: int, latency: float, max_request: Optional[int] = None):
+        self.bandwidth = bandwidth
+        self.latency = latency
+        self.max_request = max_request
+        self._lock = threading.Lock()
+        self._ids = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _next_id(self) -> str:
+        with self._lock:
+            self._ids += 1
+            return f"bench-{self._ids}"
+
+    def start(self) -> "SimulatedLink":
+        link = self
+
+        class _H(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                time.sleep(link.latency)
+
+                block = 64 * 1024
+                body = bytearray()
+                t0 = time.perf_counter()
+                while len(body) < length:
+                    body += self.rfile.read(min(block, length - len(body)))
+                    ahead = len(body) / link.bandwidth - (time.perf_counter() - t0)
+                    if ahead > 0:
+                        time.sleep(ahead)
+
+                if link.max_request and length > link.max_request:
+                    return self._reply(413, {"message": "request too large"})
+
+                raw = b"Content-Type: " + self.headers["Content-Type"].encode("latin-1") + b"\r\n\r\n" + bytes(body)
+                msg = BytesParser(policy=HTTP).parsebytes(raw)
+                fields = {
+                    p.get_param("name", header="content-disposition"): p.get_payload(decode=True)
+                    for p in msg.iter_parts()
+                    if p.get_filename() is None
+                }
+                idx = int(fields["chunk_index"])
+                total = int(fields["total_chunks"])
+                file_id = (fields.get("file_id") or b"").decode() or link._next_id()
+
+                if idx == total - 1:
+                    return self._reply(202, {"message": "merging", "file_id": file_id, "merge_task_id": f"m-{file_id}"})
+                return self._reply(200, {"message": "chunk ok", "file_id": file_id})
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _H)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def _run(client: DdmClient, path: str, **kw: Any) -> float:
+    t0 = time.perf_counter()
+    client.file.upload_async(project_id="bench", file=path, resume=False, **kw)
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="ddm-bench-upload-async", description="Benchmark chunk sizes against a simulated link")
+    ap.add_argument("--size", default="32MB", help="Payload size (default 32MB)")
+    ap.add_argument("--bandwidth", default="16MB", help="Per-connection bandwidth per second (default 16MB)")
+    ap.add_argument("--latency", type=float, default=0.15, help="Fixed per-request latency in seconds (default 0.15)")
+    ap.add_argument("--concurrency", type=int, default=4)
+    ap.add_argument("--static", default="512KB,2MB,8MB", help="Comma separated static chunk sizes to compare")
+    ap.add_argument("--rounds", type=int, default=5, help="Adaptive uploads in a row (the tuner learns between them)")
+    ap.add_argument("--timeout", type=float, default=30.0, help="Transport timeout the tuner must stay under")
+    ap.add_argument("--max-chunk-size", default="64MB", help="Per-request limit enforced by the simulated server")
+    args = ap.parse_args(argv)
+
+    size = _parse_size(args.size)
+    max_request = _parse_size(args.max_chunk_size)
+    link = SimulatedLink(bandwidth=_parse_size(args.bandwidth), latency=args.latency, max_request=max_request + 64 * 1024).start()
+
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="ddm-bench-") as tmp:
+        path = str(Path(tmp) / "payload.bin")
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+
+        try:
+            client = DdmClient(base_url=link.url, timeout=int(args.timeout))
+
+            for cs in (s for s in args.static.split(",") if s.strip()):
+                chunk = _parse_size(cs)
+                dt = _run(client, path, chunk_size=chunk, concurrency=args.concurrency)
+                results.append({"mode": "static", "chunk_size": chunk, "seconds": round(dt, 3), "MB/s": round(size / dt / 1e6, 2)})
+
+            tuner = ChunkSizeTuner(timeout=args.timeout, max_size=max_request)
+            for r in range(args.rounds):
+                chunk = tuner.size_for(size, args.concurrency)
+                dt = _run(client, path, concurrency=args.concurrency, tuner=tuner)
+                bw, rtt = tuner.model()
+                results.append({
+                    "mode": f"adaptive#{r + 1}",
+                    "chunk_size": chunk,
+                    "seconds": round(dt, 3),
+                    "MB/s": round(size / dt / 1e6, 2),
+                    "est_stream_MB/s": round(bw / 1e6, 2) if bw else None,
+                    "est_rtt": round(rtt, 3) if rtt is not None else None,
+                    "next_chunk_size": tuner.chunk_size,
+                })
+        finally:
+            link.stop()
+
+    print(json.dumps({"size": size, "latency": args.latency, "bandwidth": args.bandwidth, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,42 +2,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import tempfile
 from pathlib import Path
 from typing import Optional
 
 from ddm_sdk.client import DdmClient
 from ddm_sdk.scripts.auth.utils import ensure_authenticated
-from ddm_sdk.scripts.file.utils import norm_project, require_file_id, append_log, file_dir_key
-
-
-def _pick_filename_from_stored_file_json(stored: object) -> Optional[str]:
-    if not isinstance(stored, dict):
-        return None
-
-    f = stored.get("file") if isinstance(stored.get("file"), dict) else stored
-    if not isinstance(f, dict):
-        return None
-
-    # 1) DDM backend filename includes extension
-    v = f.get("filename")
-    if isinstance(v, str) and v.strip():
-        return v.strip()
-
-    # 2) user-visible names (may not have extension)
-    for k in ("user_filename", "upload_filename"):
-        v = f.get(k)
-        if isinstance(v, str) and v.strip():
-            return v.strip()
-
-    # 3) fallback: infer from path if it contains a filename.ext
-    z = f.get("zenoh_file_path") or f.get("file_path") or f.get("path")
-    if isinstance(z, str) and z.strip():
-        name = Path(z).name
-        if name:
-            return name
-
-    return None
-
+from ddm_sdk.scripts.file.utils import (
+    norm_project, require_file_id, append_log, file_dir_key, pick_filename, pick_file_hash,
+)
+from ddm_sdk.storage.cas import normalize_sha256
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -47,24 +21,28 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--out", default=None, help="Optional output path. If omitted, uses storage tree when enabled.")
     ap.add_argument("--ext", default=None, help="Force extension (e.g. .csv). If omitted, tries filename suffix; else .bin.")
     ap.add_argument("--no-store", action="store_true")
+    ap.add_argument("--segments", type=int, default=1,
+                    help="Parallel byte-range segments for large files (servers without range support get one stream)")
+    ap.add_argument("--no-resume", action="store_true", help="Discard a leftover .part instead of resuming it")
     args = ap.parse_args(argv)
 
     project_id = norm_project(args.project_id)
     file_id = require_file_id(args.file_id)
 
+    transfer = {"segments": args.segments, "resume": not args.no_resume}
+
     client = DdmClient.from_env()
     ensure_authenticated(client)
 
-    blob = client.file.download(file_id)
-
     saved_to: Optional[str] = None
+    nbytes = 0
+    sha256: Optional[str] = None
+    cached = False
 
     # If user explicitly provided --out, write exactly there
     if args.out:
-        out_path = Path(args.out).expanduser().resolve()
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_bytes(blob)
-        saved_to = str(out_path)
+        res = client.file.download_to(file_id, args.out, **transfer)
+        saved_to, nbytes, sha256 = res.path, res.bytes, res.sha256
 
     # Else: prefer storage tree (real file, not blob name) if available
     elif client.storage and hasattr(client.storage, "write_bytes"):
@@ -72,7 +50,8 @@ def main(argv: list[str] | None = None) -> int:
         base_key = file_dir_key(project_id, file_id)
 
         stored_file = client.storage.read_json(f"{base_key}/file")  # file.json (without .json suffix in key)
-        filename = _pick_filename_from_stored_file_json(stored_file) or file_id
+        filename = pick_filename(stored_file) or file_id
+        expected_sha256 = pick_file_hash(stored_file)
 
         # ext precedence: --ext > suffix from filename > .bin
         ext = args.ext
@@ -85,24 +64,44 @@ def main(argv: list[str] | None = None) -> int:
         stem = Path(filename).stem or file_id
 
         #final path: projects/<project>/files/<file_id>/<stem><ext>
-        saved_to = client.storage.write_bytes(f"{base_key}/{stem}", blob, ext=ext)
+        blob_key = f"{base_key}/{stem}"
+
+        # same content already stored locally (content-addressed store): no download
+        linked = None
+        if expected_sha256 and hasattr(client.storage, "link_blob"):
+            linked = client.storage.link_blob(blob_key, expected_sha256, ext=ext)
+
+        if linked:
+            saved_to, nbytes, sha256 = linked, Path(linked).stat().st_size, normalize_sha256(expected_sha256)
+            cached = True
+        elif hasattr(client.storage, "blob_path"):
+            dest = client.storage.blob_path(blob_key, ext=ext)
+            res = client.file.download_to(file_id, dest, expected_sha256=expected_sha256, **transfer)
+            saved_to, nbytes, sha256 = res.path, res.bytes, res.sha256
+            if hasattr(client.storage, "ingest_blob"):
+                client.storage.ingest_blob(blob_key, ext=ext, sha256=sha256)
+        else:
+            # no file to stream into: stream to a temp file and let the storage copy it in
+            with tempfile.TemporaryDirectory(prefix="ddm-download-") as tmp:
+                res = client.file.download_to(file_id, Path(tmp) / f"{stem}{ext}", expected_sha256=expected_sha256, **transfer)
+                saved_to = client.storage.copy_file(blob_key, res.path, ext=ext)
+                nbytes, sha256 = res.bytes, res.sha256
 
         existing = client.storage.read_json(f"{base_key}/file")
         if not isinstance(existing, dict):
             existing = {}
-        existing["last_download"] = {"path": saved_to, "bytes": len(blob)}
+        existing["last_download"] = {"path": saved_to, "bytes": nbytes, "sha256": sha256, "cached": cached}
         client.storage.write_json(f"{base_key}/file", existing)
 
-        append_log(client, project_id, file_id, action="download", ok=True, details={"path": saved_to, "bytes": len(blob)})
+        append_log(client, project_id, file_id, action="download", ok=True, details={"path": saved_to, "bytes": nbytes, "sha256": sha256, "cached": cached})
 
     # Else: storage disabled -> local fallback
     else:
         # fallback: current directory
-        out_path = Path(f"{file_id}.bin").resolve()
-        out_path.write_bytes(blob)
-        saved_to = str(out_path)
+        res = client.file.download_to(file_id, Path(f"{file_id}.bin"), **transfer)
+        saved_to, nbytes, sha256 = res.path, res.bytes, res.sha256
 
-    print(json.dumps({"ok": True, "file_id": file_id, "saved_to": saved_to, "bytes": len(blob)}, indent=2))
+    print(json.dumps({"ok": True, "file_id": file_id, "saved_to": saved_to, "bytes": nbytes, "sha256": sha256, "cached": cached}, indent=2))
     return 0
 
 
@@ -15,6 +15,12 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--project_id", required=True)
     ap.add_argument("--chunk-size", type=int, default=2 * 1024 * 1024, help="Bytes (default 2MB)")
     ap.add_argument("--filename", default=None, help="Override filename sent to server")
+    ap.add_argument("--concurrency", type=int, default=4, help="Chunks in flight after the first one (default 4)")
+    ap.add_argument("--no-resume", action="store_true", help="Ignore a stored resume manifest and start over")
+    ap.add_argument("--mmap", action="store_true", help="Read chunks through mmap instead of pread")
+    ap.add_argument("--adaptive", action="store_true", help="Pick the chunk size from measured throughput (ignores --chunk-size)")
+    ap.add_argument("--min-chunk-size", type=int, default=256 * 1024, help="Adaptive lower bound in bytes (default 256KB)")
+    ap.add_argument("--max-chunk-size", type=int, default=64 * 1024 * 1024, help="Adaptive upper bound in bytes, i.e. the server's per-request limit (default 64MB)")
     ap.add_argument("--no-store", action="store_true")
     args = ap.parse_args(argv)
 
@@ -27,18 +33,31 @@ def main(argv: list[str] | None = None) -> int:
     client = DdmClient.from_env()
     ensure_authenticated(client)
 
+    tuner = None
+    if args.adaptive:
+        tuner = client.file.chunk_tuner()
+        tuner.min_size = args.min_chunk_size
+        tuner.max_size = args.max_chunk_size
+        tuner.chunk_size = min(max(tuner.chunk_size, tuner.min_size), tuner.max_size)
+
     resp = client.file.upload_async(
         project_id=project_id,
         file=str(file_path),
         filename=args.filename,
         chunk_size=args.chunk_size,
+        concurrency=args.concurrency,
+        resume=not args.no_resume,
+        use_mmap=args.mmap,
+        tuner=tuner,
     )
 
     file_id = getattr(resp, "file_id", None)
     if client.storage and not args.no_store and isinstance(file_id, str) and file_id.strip():
         persist_file_record(client=client, project_id=project_id, file_id=file_id, payload=resp)
         append_log(client, project_id, file_id, action="upload_async", ok=True, details={
-            "chunk_size": args.chunk_size,
+            "chunk_size": getattr(resp, "chunk_size", None),  # may come from the resume manifest
+            "adaptive": args.adaptive,
+            "concurrency": args.concurrency,
             "merge_task_id": getattr(resp, "merge_task_id", None),
             "metadata_task_id": getattr(resp, "metadata_task_id", None),
             "path": str(file_path),
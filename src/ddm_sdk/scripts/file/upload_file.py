@@ -74,6 +74,10 @@ def main(argv: list[str] | None = None) -> int:
     if client.storage and not args.no_store:
         persist_file_record(client=client, project_id=project_id, file_id=file_id, payload=resp)
 
+        # seed the content store, so downloading this file later needs no transfer
+        if getattr(client.storage, "dedupe", False):
+            out["sha256"] = client.storage.cas.put_file(file_path)
+
 
         print(json.dumps(out, indent=2, ensure_ascii=False))
         return 0
@@ -3,9 +3,12 @@ from __future__ import annotations
 import re
 from dataclasses import asdict, is_dataclass
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.catalog_index import CatalogIndex
+from ddm_sdk.storage.logs import append_entry
 
 # UUID v4-ish (good enough for CLI validation)
 _UUID_RE = re.compile(
@@ -63,6 +66,47 @@ def file_dir_key(project_id: str, file_id: str) -> str:
     return f"projects/{project_id}/files/{file_id}"
 
 
+def pick_filename(stored: object) -> Optional[str]:
+    """
+    Filename (with extension if known) from a stored file.json or a catalog item.
+    """
+    if not isinstance(stored, dict):
+        return None
+
+    f = stored.get("file") if isinstance(stored.get("file"), dict) else stored
+    if not isinstance(f, dict):
+        return None
+
+    # 1) DDM backend filename includes extension
+    v = f.get("filename")
+    if isinstance(v, str) and v.strip():
+        return v.strip()
+
+    # 2) user-visible names (may not have extension)
+    for k in ("user_filename", "upload_filename"):
+        v = f.get(k)
+        if isinstance(v, str) and v.strip():
+            return v.strip()
+
+    # 3) fallback: infer from path if it contains a filename.ext
+    z = f.get("zenoh_file_path") or f.get("file_path") or f.get("path")
+    if isinstance(z, str) and z.strip():
+        name = Path(z).name
+        if name:
+            return name
+
+    return None
+
+
+def pick_file_hash(stored: object) -> Optional[str]:
+    """file_hash from a stored file.json or a catalog item."""
+    if not isinstance(stored, dict):
+        return None
+    f = stored.get("file") if isinstance(stored.get("file"), dict) else stored
+    v = f.get("file_hash") if isinstance(f, dict) else None
+    return v.strip() if isinstance(v, str) and v.strip() else None
+
+
 def _to_jsonable(payload: Any) -> Any:
     """
     Convert pydantic/dataclass/etc to jsonable dict.
@@ -100,26 +144,19 @@ def append_log(
 ) -> Optional[str]:
     """
     Append a log entry to:
-      projects/<project_id>/files/<file_id>/logs.json
-
-    We read-modify-write because Storage is minimal (no append op).
+      projects/<project_id>/files/<file_id>/logs.jsonl
     """
     if not getattr(client, "storage", None):
         return None
 
     key = f"{file_dir_key(project_id, file_id)}/logs"
-    existing = client.storage.read_json(key)
-    if not isinstance(existing, list):
-        existing = []
-
     entry = {
         "ts": datetime.now(timezone.utc).isoformat(),
         "action": action,
         "ok": bool(ok),
         "details": details or {},
     }
-    existing.append(entry)
-    return client.storage.write_json(key, existing)
+    return append_entry(client.storage, key, entry)
 
 def resolve_file_id(
     *,
@@ -227,9 +264,26 @@ def _fetch_file_meta_from_catalog(
 ) -> Optional[Dict[str, Any]]:
     """
     Best-effort: find file metadata via /ddm/catalog/list.
+    0) Local catalog index when storage is on disk; an index that was synced
+       before (has a watermark) is brought up to date once on a miss. An empty
+       index is not filled here: that is a full catalog mirror (CatalogIndex.sync).
     1) Try with project filter (fast).
-    2) Fallback: page without project filter (slower).
+    2) Fallback: page without project filter (slower, at most max_pages pages).
     """
+    # 0) local index
+    idx = CatalogIndex.for_client(client)
+    if idx is not None:
+        with idx:
+            hit = idx.get(file_id)
+            if hit is None and idx.watermark() is not None:
+                try:
+                    idx.sync(client.catalog, per_page=per_page)
+                    hit = idx.get(file_id)
+                except Exception:
+                    pass
+            if hit is not None:
+                return hit
+
     # 1) project-filtered attempt
     if project_hint:
         try:
@@ -244,22 +298,13 @@ def _fetch_file_meta_from_catalog(
             pass
 
     # 2) broad paging attempt
-    for page in range(1, max_pages + 1):
-        try:
-            resp = client.catalog.list(page=page, perPage=per_page)
-            data = _dump(resp)
-            items = data.get("data") if isinstance(data, dict) else None
-            if not isinstance(items, list):
-                break
-
-            for it in items:
-                if isinstance(it, dict) and it.get("id") == file_id:
-                    return it
-
-            if len(items) < per_page:
-                break
-        except Exception:
-            break
+    try:
+        items = client.catalog.iter_list(perPage=per_page)
+        for it in islice(items, max_pages * per_page):
+            if it.id == file_id:
+                return _dump(it)
+    except Exception:
+        pass
 
     return None
 
@@ -7,6 +7,22 @@ from typing import Optional
 from ddm_sdk.client import DdmClient
 from ddm_sdk.scripts.auth.utils import ensure_authenticated
 from ddm_sdk.scripts.files.utils import norm_project, ts_utc
+from ddm_sdk.storage.catalog_index import CatalogIndex
+
+
+def _versions(client: DdmClient, file_ids: list[str]) -> dict[str, str]:
+    """Catalog created/update time per id from the local index: the metadata cache key."""
+    idx = CatalogIndex.for_client(client)
+    if idx is None:
+        return {}
+    out: dict[str, str] = {}
+    with idx:
+        for fid in file_ids:
+            item = idx.get(fid) or {}
+            v = item.get("updated") or item.get("created")
+            if isinstance(v, str) and v:
+                out[fid] = v
+    return out
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -15,6 +31,9 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--file-id", action="append", required=True, dest="file_ids")
     ap.add_argument("--out", default=None, help="Optional output json path. If omitted, uses storage when enabled.")
     ap.add_argument("--no-store", action="store_true")
+    ap.add_argument("--batch-size", type=int, default=100, help="File ids per bulk request")
+    ap.add_argument("--workers", type=int, default=4, help="Bulk requests in flight")
+    ap.add_argument("--no-cache", action="store_true", help="Fetch every id, bypassing the local metadata cache")
     args = ap.parse_args(argv)
 
     project_id = norm_project(args.project_id)
@@ -25,7 +44,11 @@ def main(argv: list[str] | None = None) -> int:
     client = DdmClient.from_env()
     ensure_authenticated(client)
 
-    m = client.file_metadata.get_many(file_ids)  # dict[file_id] -> dict
+    versions = {} if args.no_cache else _versions(client, file_ids)
+    m, failed = client.file_metadata.get_many_with_errors(
+        file_ids, batch_size=args.batch_size, max_workers=args.workers, versions=versions
+    )
+    errors = {fid: f"{type(e).__name__}: {e}" for fid, e in failed.items()}
 
     saved_to: Optional[str] = None
 
@@ -38,10 +61,13 @@ def main(argv: list[str] | None = None) -> int:
 
     elif client.storage and (not args.no_store):
         key = f"projects/{project_id}/metadata/many/{ts_utc()}"
-        saved_to = client.storage.write_json(key, {"project_id": project_id, "file_ids": file_ids, "metadata": m})
+        saved_to = client.storage.write_json(
+            key, {"project_id": project_id, "file_ids": file_ids, "metadata": m, "errors": errors}
+        )
 
-    print(json.dumps({"ok": True, "project_id": project_id, "file_ids": file_ids, "saved_to": saved_to, "metadata": m}, indent=2, ensure_ascii=False))
-    return 0
+    print(json.dumps({"ok": not errors, "project_id": project_id, "file_ids": file_ids, "saved_to": saved_to,
+                      "metadata": m, "errors": errors}, indent=2, ensure_ascii=False))
+    return 0 if not errors else 1
 
 
 if __name__ == "__main__":
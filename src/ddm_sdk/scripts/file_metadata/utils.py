@@ -4,6 +4,7 @@ from typing import Any, Optional
 from pathlib import Path
 
 from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.logs import append_entry
 from ddm_sdk.scripts.files.utils import norm_project, ts_utc
 
 
@@ -40,16 +41,13 @@ def append_file_log(
         return
 
     key = f"{file_base_key(project_id, file_id)}/logs"
-    existing = client.storage.read_json(key)
-    if not isinstance(existing, list):
-        existing = []
-
-    existing.append(
+    append_entry(
+        client.storage,
+        key,
         {
             "ts": ts_utc(),
             "action": action,
             "ok": ok,
             "details": details or {},
-        }
+        },
     )
-    client.storage.write_json(key, existing)
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.scripts.auth.utils import ensure_authenticated
+from ddm_sdk.scripts.file.utils import append_log, file_dir_key, pick_file_hash, pick_filename
+from ddm_sdk.scripts.files.utils import append_project_log, norm_project
+from ddm_sdk.storage.catalog_index import CatalogIndex
+from ddm_sdk.storage.cas import normalize_sha256, sha256_file
+from ddm_sdk.storage.fs import FileStorage
+
+# ----------------------------
+# Bulk download into projects/<project>/files/<file_id>/<filename>, the layout of
+# scripts/file/download_file.py, either with N parallel per-file streams or
+# through one server-side ZIP.
+#
+# The server builds a ZIP on a single worker and the client receives an extra
+# copy, so parallel streams win for anything but many small files, where the
+# per-request overhead dominates. "auto" decides from the catalog sizes.
+# ----------------------------
+
+ZIP_MIN_FILES = 200
+ZIP_MAX_AVG_BYTES = 256 * 1024
+
+
+@dataclass
+class BulkItem:
+    file_id: str
+    filename: Optional[str] = None
+    size: Optional[int] = None
+    sha256: Optional[str] = None
+    record: Optional[Dict[str, Any]] = None  # catalog item / stored file.json
+
+
+def choose_mode(
+    items: List[BulkItem],
+    *,
+    zip_min_files: int = ZIP_MIN_FILES,
+    zip_max_avg_bytes: int = ZIP_MAX_AVG_BYTES,
+) -> str:
+    """
+    "zip" for at least `zip_min_files` files averaging at most `zip_max_avg_bytes`,
+    else "parallel". An unknown size counts as large.
+    """
+    if len(items) < zip_min_files:
+        return "parallel"
+    sizes = [it.size for it in items]
+    if any(s is None for s in sizes):
+        return "parallel"
+    return "zip" if sum(sizes) / len(sizes) <= zip_max_avg_bytes else "parallel"
+
+
+def _item(file_id: str, record: Optional[Dict[str, Any]]) -> BulkItem:
+    size = record.get("file_size") if isinstance(record, dict) else None
+    return BulkItem(
+        file_id=file_id,
+        filename=pick_filename(record),
+        size=size if isinstance(size, int) else None,
+        sha256=normalize_sha256(pick_file_hash(record)),
+        record=record if isinstance(record, dict) else None,
+    )
+
+
+def resolve_items(
+    client: DdmClient,
+    storage: Any,
+    project_id: str,
+    *,
+    file_ids: Iterable[str] = (),
+    query: Optional[Dict[str, Any]] = None,
+) -> List[BulkItem]:
+    """
+    Explicit ids (described by the local catalog index or a stored file.json, in
+    `storage` or the client's) plus every catalog item matching `query`
+    (CatalogAPI.list filters). Order kept, ids deduped.
+    """
+    items: Dict[str, BulkItem] = {}
+
+    ids = list(dict.fromkeys(file_ids))
+    if ids:
+        idx = CatalogIndex.for_client(client)
+        try:
+            for fid in ids:
+                rec = idx.get(fid) if idx is not None else None
+                for st in (storage, client.storage):
+                    if rec is None and st is not None:
+                        rec = st.read_json(f"{file_dir_key(project_id, fid)}/file")
+                items.setdefault(fid, _item(fid, rec))
+        finally:
+            if idx is not None:
+                idx.close()
+
+    if query is not None:
+        filters = dict(query)
+        filters.setdefault("project_id", [project_id])
+        for it in client.catalog.iter_list(**filters):
+            items.setdefault(it.id, _item(it.id, it.model_dump(mode="json", exclude_none=False)))
+
+    return list(items.values())
+
+
+def _target(storage: Any, project_id: str, item: BulkItem) -> Tuple[str, str, Path]:
+    """(blob key, ext, path), as download_file.py names it."""
+    filename = item.filename or item.file_id
+    ext = Path(filename).suffix or ".bin"
+    key = f"{file_dir_key(project_id, item.file_id)}/{Path(filename).stem or item.file_id}"
+    return key, ext, storage.blob_path(key, ext=ext)
+
+
+def _record(storage: Any, project_id: str, item: BulkItem, result: Dict[str, Any]) -> None:
+    key = f"{file_dir_key(project_id, item.file_id)}/file"
+    rec = storage.read_json(key)
+    if not isinstance(rec, dict):
+        rec = dict(item.record or {})
+    rec["last_download"] = {k: result.get(k) for k in ("path", "bytes", "sha256", "cached")}
+    storage.write_json(key, rec)
+
+
+def _local_copy(storage: Any, key: str, ext: str, path: Path, item: BulkItem) -> Optional[str]:
+    """Path of a local copy with the expected hash (existing file or content store), else None."""
+    if not item.sha256:
+        return None
+    if path.is_file() and (item.size is None or path.stat().st_size == item.size):
+        if sha256_file(path) == item.sha256:
+            return str(path)
+    if hasattr(storage, "link_blob"):
+        return storage.link_blob(key, item.sha256, ext=ext)
+    return None
+
+
+def download_one(client: DdmClient, storage: Any, project_id: str, item: BulkItem) -> Dict[str, Any]:
+    key, ext, path = _target(storage, project_id, item)
+    result: Dict[str, Any] = {"file_id": item.file_id, "ok": True, "cached": False}
+    try:
+        local = _local_copy(storage, key, ext, path, item)
+        if local:
+            result.update(path=local, bytes=Path(local).stat().st_size, sha256=item.sha256, cached=True)
+        else:
+            res = client.file.download_to(item.file_id, path, expected_sha256=item.sha256)
+            result.update(path=res.path, bytes=res.bytes, sha256=res.sha256)
+            if hasattr(storage, "ingest_blob"):
+                storage.ingest_blob(key, ext=ext, sha256=res.sha256)
+        _record(storage, project_id, item, result)
+    except Exception as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}")
+    if storage is client.storage:
+        details = {k: v for k, v in result.items() if k != "file_id"}
+        append_log(client, project_id, item.file_id, action="download", ok=result["ok"], details=details)
+    return result
+
+
+def download_parallel(
+    client: DdmClient, storage: Any, project_id: str, items: List[BulkItem], *, workers: int = 8
+) -> List[Dict[str, Any]]:
+    """One stream per file, `workers` at a time. Results in input order."""
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items))), thread_name_prefix="ddm-bulk") as pool:
+        return list(pool.map(lambda it: download_one(client, storage, project_id, it), items))
+
+
+def _move_member(storage: Any, project_id: str, item: BulkItem, member: Path) -> Dict[str, Any]:
+    """Move an extracted ZIP member into place and check it, like download_one()."""
+    key, ext, path = _target(storage, project_id, item)
+    r: Dict[str, Any] = {"file_id": item.file_id, "ok": True, "cached": False, "path": str(path)}
+    try:
+        os.replace(member, path)
+        digest = sha256_file(path)
+        r.update(bytes=path.stat().st_size, sha256=digest)
+        if item.sha256 and digest != item.sha256:
+            r.update(ok=False, error=f"ChecksumMismatch: expected {item.sha256}, got {digest}")
+            path.unlink(missing_ok=True)
+        else:
+            if hasattr(storage, "ingest_blob"):
+                storage.ingest_blob(key, ext=ext, sha256=digest)
+            _record(storage, project_id, item, r)
+    except Exception as e:
+        r.update(ok=False, error=f"{type(e).__name__}: {e}")
+    return r
+
+
+def download_via_zip(
+    client: DdmClient, storage: Any, project_id: str, items: List[BulkItem], *, workers: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Files already present are skipped, the rest come in one ZIP, extracted next
+    to the tree and moved into place by filename. Files whose name is missing from
+    the ZIP, or ambiguous (several members or several selected files share it),
+    are fetched one by one, and so is everything when the ZIP download fails.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    todo: List[BulkItem] = []
+    for it in items:
+        key, ext, path = _target(storage, project_id, it)
+        local = _local_copy(storage, key, ext, path, it)
+        if local:
+            results[it.file_id] = r = {"file_id": it.file_id, "ok": True, "cached": True, "path": local,
+                                       "bytes": Path(local).stat().st_size, "sha256": it.sha256}
+            _record(storage, project_id, it, r)
+        else:
+            todo.append(it)
+
+    leftovers: List[BulkItem] = []
+    zip_error: Optional[str] = None
+    if todo:
+        # extract inside projects/<project>/files so members move into place with a rename
+        files_dir = _target(storage, project_id, todo[0])[2].parent.parent
+        tmp = Path(tempfile.mkdtemp(dir=files_dir, prefix=".bulk-"))
+        try:
+            try:
+                members = client.files.download_zip_to([it.file_id for it in todo], tmp, extract=True, workers=workers).members
+            except Exception as e:
+                # server error, timeout, bad archive: every file is fetched one by one instead
+                zip_error = f"{type(e).__name__}: {e}"
+                members = ()
+            by_name: Dict[str, List[str]] = {}
+            for m in members:
+                by_name.setdefault(Path(m).name, []).append(m)
+            wanted = Counter(it.filename or "" for it in todo)
+            for it in todo:
+                found = by_name.get(it.filename or "", [])
+                # a name shared by several members or several selected files is ambiguous
+                if len(found) != 1 or wanted[it.filename or ""] != 1:
+                    leftovers.append(it)
+                    continue
+                results[it.file_id] = _move_member(storage, project_id, it, tmp / found[0])
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    for r in download_parallel(client, storage, project_id, leftovers, workers=workers):
+        if zip_error:
+            r["zip_error"] = zip_error
+        results[r["file_id"]] = r
+    return [results[it.file_id] for it in items]
+
+
+def summarize(results: List[Dict[str, Any]], seconds: float) -> Dict[str, Any]:
+    fetched = [r for r in results if r["ok"] and not r["cached"]]
+    nbytes = sum(r.get("bytes") or 0 for r in fetched)
+    return {
+        "files": len(results),
+        "downloaded": len(fetched),
+        "skipped": sum(1 for r in results if r["ok"] and r["cached"]),
+        "failed": sum(1 for r in results if not r["ok"]),
+        "bytes": nbytes,
+        "seconds": round(seconds, 3),
+        "mib_per_s": round(nbytes / (1024 * 1024) / seconds, 2) if seconds > 0 else None,
+    }
+
+
+def _csv_list(v: Optional[str]) -> Optional[List[str]]:
+    if not v:
+        return None
+    return [x.strip() for x in v.split(",") if x.strip()] or None
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="ddm-download-bulk",
+        description="Download many files into projects/<project>/files/<file_id>/ with parallel streams or one ZIP",
+    )
+    ap.add_argument("--project_id", required=True)
+    ap.add_argument("--file-id", action="append", default=[], dest="file_ids", help="Repeatable: --file-id <uuid>")
+    ap.add_argument("--query", action="store_true",
+                    help="Also select every catalog file of the project matching the filters below")
+    ap.add_argument("--filename", default=None, help="Comma-separated filenames (with --query)")
+    ap.add_argument("--use_case", default=None, help="Comma-separated use_case values (with --query)")
+    ap.add_argument("--file_type", default=None, help="Comma-separated file types (with --query)")
+    ap.add_argument("--created_from", default=None, help="ISO datetime (with --query)")
+    ap.add_argument("--created_to", default=None, help="ISO datetime (with --query)")
+    ap.add_argument("--mode", choices=["auto", "parallel", "zip"], default="auto")
+    ap.add_argument("--workers", type=int, default=8, help="Concurrent downloads (and ZIP extraction threads)")
+    ap.add_argument("--zip-min-files", type=int, default=ZIP_MIN_FILES)
+    ap.add_argument("--zip-max-avg-bytes", type=int, default=ZIP_MAX_AVG_BYTES)
+    ap.add_argument("--out", default=None, help="Root of the projects/... tree. If omitted, uses storage.")
+    args = ap.parse_args(argv)
+
+    project_id = norm_project(args.project_id)
+    file_ids = [x.strip() for x in args.file_ids if x and x.strip()]
+    if not file_ids and not args.query:
+        raise SystemExit("Nothing selected: pass --file-id and/or --query")
+
+    client = DdmClient.from_env()
+    ensure_authenticated(client)
+
+    storage = FileStorage(Path(args.out).expanduser().resolve()) if args.out else client.storage
+    if storage is None or not hasattr(storage, "blob_path"):
+        raise SystemExit("Bulk download writes into a storage tree: configure storage (DDM_STORAGE_DIR) or pass --out")
+
+    query = None
+    if args.query:
+        query = {
+            "filename": _csv_list(args.filename),
+            "use_case": _csv_list(args.use_case),
+            "file_type": _csv_list(args.file_type),
+            "created_from": args.created_from,
+            "created_to": args.created_to,
+        }
+    items = resolve_items(client, storage, project_id, file_ids=file_ids, query=query)
+
+    mode = args.mode
+    if mode == "auto":
+        mode = choose_mode(items, zip_min_files=args.zip_min_files, zip_max_avg_bytes=args.zip_max_avg_bytes)
+
+    t0 = time.perf_counter()
+    run = download_via_zip if mode == "zip" else download_parallel
+    results = run(client, storage, project_id, items, workers=args.workers)
+    summary = {"mode": mode, **summarize(results, time.perf_counter() - t0)}
+
+    if storage is client.storage:
+        append_project_log(client, project_id, action="download_bulk", ok=summary["failed"] == 0, details=summary)
+
+    print(json.dumps({"ok": summary["failed"] == 0, "project_id": project_id, **summary, "results": results}, indent=2))
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,7 +4,6 @@ import argparse
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
 
 from ddm_sdk.client import DdmClient
 from ddm_sdk.scripts.auth.utils import ensure_authenticated
@@ -19,8 +18,11 @@ def _ts() -> str:
 def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(prog="ddm-download-project-zip", description="Download ZIP for entire project")
     ap.add_argument("--project_id", required=True)
-    ap.add_argument("--out", default=None, help="Optional output zip path. If omitted, uses storage if enabled.")
+    ap.add_argument("--out", default=None, help="Optional output zip path (directory with --extract). If omitted, uses storage if enabled.")
     ap.add_argument("--no-store", action="store_true")
+    ap.add_argument("--extract", action="store_true",
+                    help="Extract the members (CRC-checked) into a directory instead of keeping the .zip")
+    ap.add_argument("--workers", type=int, default=4, help="Parallel extraction threads (with --extract)")
     args = ap.parse_args(argv)
 
     project_id = norm_project(args.project_id)
@@ -28,54 +30,58 @@ def main(argv: list[str] | None = None) -> int:
     client = DdmClient.from_env()
     ensure_authenticated(client)
 
-    blob = client.files.download_project_zip(project_id)
+    use_store = bool(client.storage) and not args.no_store
+    ts = ts_utc()
+    key = f"projects/{project_id}/zips/project/{ts}"
 
-    saved_to: Optional[str] = None
-
-    # 1) explicit --out wins
+    # 1) explicit --out wins (a directory with --extract)
     if args.out:
-        out_path = Path(args.out).expanduser().resolve()
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_bytes(blob)
-        saved_to = str(out_path)
+        dest = Path(args.out).expanduser().resolve()
 
     # 2) storage path (preferred)
-    elif client.storage and (not args.no_store) and hasattr(client.storage, "write_bytes"):
-        ts = ts_utc()
-        key = f"projects/{project_id}/zips/project/{ts}"
-        saved_to = client.storage.write_bytes(key, blob, ext=".zip")
+    elif use_store and hasattr(client.storage, "blob_path"):
+        dest = client.storage.blob_path(key, ext=".zip")
+        if args.extract:
+            dest = dest.with_suffix("")
+
+    # 3) fallback local
+    else:
+        safe_project = project_id.replace("/", "_")
+        dest = Path(f"project_{safe_project}_{ts}" + ("" if args.extract else ".zip")).resolve()
+
+    res = client.files.download_project_zip_to(project_id, dest, extract=args.extract, workers=args.workers)
+    saved_to = res.path
+    if use_store and not args.out and not args.extract and hasattr(client.storage, "ingest_blob"):
+        client.storage.ingest_blob(key, ext=".zip", sha256=res.sha256)
 
+    summary = {"saved_to": saved_to, "bytes": res.bytes, "sha256": res.sha256}
+    if args.extract:
+        summary["members"] = len(res.members)
+
+    if use_store and not args.out:
         # receipt JSON (same key, but storage will add .json)
         client.storage.write_json(
             key,
             {
                 "kind": "project_zip",
                 "project_id": project_id,
-                "saved_to": saved_to,
-                "bytes": len(blob),
+                "extracted": args.extract,
+                **summary,
                 "created_at": datetime.now(timezone.utc).isoformat(),
             },
         )
 
-    # 3) fallback local
-    else:
-        ts = ts_utc()
-        safe_project = project_id.replace("/", "_")
-        out_path = Path(f"project_{safe_project}_{ts}.zip").resolve()
-        out_path.write_bytes(blob)
-        saved_to = str(out_path)
-
     # log (optional)
-    if client.storage and (not args.no_store):
+    if use_store:
         append_project_log(
             client,
             project_id,
             action="download_project_zip",
             ok=True,
-            details={"saved_to": saved_to, "bytes": len(blob)},
+            details=summary,
         )
 
-    print(json.dumps({"ok": True, "project_id": project_id, "saved_to": saved_to, "bytes": len(blob)}, indent=2))
+    print(json.dumps({"ok": True, "project_id": project_id, **summary}, indent=2))
     return 0
 
 
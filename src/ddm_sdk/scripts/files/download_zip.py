@@ -4,7 +4,6 @@ import argparse
 import hashlib
 import json
 from pathlib import Path
-from typing import Optional
 
 from ddm_sdk.client import DdmClient
 from ddm_sdk.scripts.auth.utils import ensure_authenticated
@@ -25,8 +24,11 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--project_id", required=True)
     ap.add_argument("--file-id", action="append", required=True, dest="file_ids",
                     help="Repeatable: --file-id <uuid>")
-    ap.add_argument("--out", default=None, help="Optional output zip path. If omitted, uses storage when enabled.")
+    ap.add_argument("--out", default=None, help="Optional output zip path (directory with --extract). If omitted, uses storage when enabled.")
     ap.add_argument("--no-store", action="store_true")
+    ap.add_argument("--extract", action="store_true",
+                    help="Extract the members (CRC-checked) into a directory instead of keeping the .zip")
+    ap.add_argument("--workers", type=int, default=4, help="Parallel extraction threads (with --extract)")
     args = ap.parse_args(argv)
 
     project_id = norm_project(args.project_id)
@@ -37,21 +39,34 @@ def main(argv: list[str] | None = None) -> int:
     client = DdmClient.from_env()
     ensure_authenticated(client)
 
-    blob = client.files.download_zip(file_ids)
+    use_store = bool(client.storage) and not args.no_store and hasattr(client.storage, "blob_path")
+    key = _zip_key_for_selection(project_id, file_ids)  # includes timestamp
 
-    saved_to: Optional[str] = None
-
-    # 1) explicit --out 
+    # 1) explicit --out (a directory with --extract)
     if args.out:
-        out_path = Path(args.out).expanduser().resolve()
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_bytes(blob)
-        saved_to = str(out_path)
+        dest = Path(args.out).expanduser().resolve()
+
+    # 2) storage path if enabled and supports streaming to disk
+    elif use_store:
+        dest = client.storage.blob_path(key, ext=".zip")
+        if args.extract:
+            dest = dest.with_suffix("")
+
+    # 3) fallback local path
+    else:
+        h = hashlib.sha1(("|".join(file_ids)).encode("utf-8")).hexdigest()[:12]
+        dest = Path(f"files_{project_id.replace('/', '_')}_{h}_{ts_utc()}" + ("" if args.extract else ".zip")).resolve()
 
-    # 2) storage path if enabled and supports bytes
-    elif client.storage and (not args.no_store) and hasattr(client.storage, "write_bytes"):
-        key = _zip_key_for_selection(project_id, file_ids)  # includes timestamp
-        saved_to = client.storage.write_bytes(key, blob, ext=".zip")
+    res = client.files.download_zip_to(file_ids, dest, extract=args.extract, workers=args.workers)
+    saved_to = res.path
+
+    summary = {"saved_to": saved_to, "file_ids": file_ids, "bytes": res.bytes, "sha256": res.sha256}
+    if args.extract:
+        summary["members"] = len(res.members)
+
+    if use_store and not args.out:
+        if not args.extract and hasattr(client.storage, "ingest_blob"):
+            client.storage.ingest_blob(key, ext=".zip", sha256=res.sha256)
 
         # store a json receipt next to it (same key -> .json)
         client.storage.write_json(
@@ -59,9 +74,8 @@ def main(argv: list[str] | None = None) -> int:
             {
                 "kind": "files_zip",
                 "project_id": project_id,
-                "file_ids": file_ids,
-                "bytes": len(blob),
-                "saved_to": saved_to,
+                "extracted": args.extract,
+                **summary,
                 "created_at": ts_utc(),
             },
         )
@@ -71,17 +85,10 @@ def main(argv: list[str] | None = None) -> int:
             project_id,
             action="download_zip",
             ok=True,
-            details={"saved_to": saved_to, "file_ids": file_ids, "bytes": len(blob)},
+            details=summary,
         )
 
-    # 3) fallback local path
-    else:
-        h = hashlib.sha1(("|".join(file_ids)).encode("utf-8")).hexdigest()[:12]
-        out_path = Path(f"files_{project_id.replace('/', '_')}_{h}_{ts_utc()}.zip").resolve()
-        out_path.write_bytes(blob)
-        saved_to = str(out_path)
-
-    print(json.dumps({"ok": True, "project_id": project_id, "file_ids": file_ids, "saved_to": saved_to, "bytes": len(blob)}, indent=2))
+    print(json.dumps({"ok": True, "project_id": project_id, **summary}, indent=2))
     return 0
 
 
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from typing import Any, Optional
 
 from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.logs import append_entry
 
 
 def norm_project(project_id: str) -> str:
@@ -26,23 +27,17 @@ def append_project_log(client: DdmClient, project_id: str, *, action: str, ok: b
     """
     Project-wide log for bulk operations.
     Writes JSONL to: projects/<project>/files/_logs.jsonl
-    (We implement it as a json list in storage for simplicity if you only have JSON storage.)
     """
     if not client.storage:
         return
 
     key = f"projects/{norm_project(project_id)}/files/_logs"
-    existing = client.storage.read_json(key)
-    if not isinstance(existing, list):
-        existing = []
-
-    existing.append({
+    append_entry(client.storage, key, {
         "ts": datetime.now(timezone.utc).isoformat(),
         "action": action,
         "ok": ok,
         "details": details,
     })
-    client.storage.write_json(key, existing)
 
 
 def append_file_log(client: DdmClient, project_id: str, file_id: str, *, action: str, ok: bool, details: Any) -> None:
@@ -50,17 +45,12 @@ def append_file_log(client: DdmClient, project_id: str, file_id: str, *, action:
         return
 
     key = f"{file_dir_key(project_id, file_id)}/log"
-    existing = client.storage.read_json(key)
-    if not isinstance(existing, list):
-        existing = []
-
-    existing.append({
+    append_entry(client.storage, key, {
         "ts": datetime.now(timezone.utc).isoformat(),
         "action": action,
         "ok": ok,
         "details": details,
     })
-    client.storage.write_json(key, existing)
 
 
 def persist_file_record(*, client: DdmClient, project_id: str, file_id: str, payload: Any) -> None:
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.logs import append_entry
 
 
 def utc_ts() -> str:
@@ -24,24 +25,19 @@ def append_parametrics_log(
     details: Dict[str, Any],
 ) -> None:
     """
-    Writes: parametrics/log.jsonl (or json list, depending on your storage implementation)
-    Here we keep it simple: store as JSON array in parametrics/log
+    Writes: parametrics/log.jsonl (append-only)
     """
     if not client.storage:
         return
 
     key = parametrics_key("log")
-    existing = client.storage.read_json(key)
-
-    if not isinstance(existing, list):
-        existing = []
-
-    existing.append(
+    append_entry(
+        client.storage,
+        key,
         {
             "ts": datetime.now(timezone.utc).isoformat(),
             "action": action,
             "ok": ok,
             "details": details,
-        }
+        },
     )
-    client.storage.write_json(key, existing)
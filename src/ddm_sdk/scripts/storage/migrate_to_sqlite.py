@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from ddm_sdk.storage.sqlite import DB_FILENAME, SqliteStorage, migrate_fs_tree
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="ddm-storage-migrate-to-sqlite",
+        description="Copy an fs storage tree (JSON files + blobs) into a SqliteStorage database",
+    )
+    ap.add_argument("--src", default=os.getenv("DDM_STORAGE_DIR"), help="fs storage dir (default: DDM_STORAGE_DIR)")
+    ap.add_argument("--dst", default=None, help="Directory of the sqlite database (default: same as --src)")
+    ap.add_argument("--batch-size", type=int, default=500, help="Rows per transaction")
+    ap.add_argument("--dry-run", action="store_true", help="Only count what would be copied")
+    args = ap.parse_args(argv)
+
+    if not args.src:
+        raise SystemExit("Provide --src or set DDM_STORAGE_DIR")
+    src = Path(args.src).expanduser().resolve()
+    if not src.is_dir():
+        raise SystemExit(f"Not a directory: {src}")
+    dst_root = Path(args.dst).expanduser().resolve() if args.dst else src
+
+    dst = SqliteStorage(dst_root)
+    try:
+        stats = migrate_fs_tree(src, dst, batch_size=args.batch_size, dry_run=args.dry_run)
+    finally:
+        dst.close()
+
+    print(json.dumps({
+        "ok": True,
+        "src": str(src),
+        "db": str(dst_root / DB_FILENAME),
+        "dry_run": args.dry_run,
+        **stats,
+        "next": "set DDM_STORAGE_BACKEND=sqlite" + ("" if dst_root == src else f" and DDM_STORAGE_DIR={dst_root}"),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
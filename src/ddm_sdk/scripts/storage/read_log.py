@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from ddm_sdk.scripts.common import getenv_str
+from ddm_sdk.storage.factory import make_storage
+from ddm_sdk.storage.logs import iter_entries
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="ddm-storage-read-log", description="Stream the entries of a storage log as JSON lines")
+    ap.add_argument("key", help="Log key, e.g. blockchain/logs or projects/<project>/validations/logs")
+    ap.add_argument("--since", default=None, help="ISO timestamp (inclusive)")
+    ap.add_argument("--until", default=None, help="ISO timestamp (exclusive)")
+    ap.add_argument("--action", default=None, help="Only entries with this action")
+    ap.add_argument("--limit", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    # storage only: no DDM_BASE_URL / login needed
+    storage = make_storage(getenv_str("DDM_STORAGE_BACKEND", "fs"), getenv_str("DDM_STORAGE_DIR"))
+    if storage is None:
+        raise SystemExit("Storage is disabled: set DDM_STORAGE_DIR")
+
+    n = 0
+    for entry in iter_entries(storage, args.key, since=args.since, until=args.until):
+        if args.action and (not isinstance(entry, dict) or entry.get("action") != args.action):
+            continue
+        print(json.dumps(entry, ensure_ascii=False))
+        n += 1
+        if args.limit is not None and n >= args.limit:
+            break
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.models.uploader_metadata import UploaderMetadataJSON
+from ddm_sdk.scripts.auth.utils import ensure_authenticated
+from ddm_sdk.scripts.uploader_metadata.utils import (
+    append_log,
+    norm_project,
+    store_uploader_metadata_json,
+)
+from ddm_sdk.storage.logs import append_entry, iter_entries
+from ddm_sdk.transport.errors import ApiError
+from ddm_sdk.transport.retry import RetryPolicy
+
+# ----------------------------
+# Attach/update uploader metadata for many files from a JSONL or CSV mapping,
+# `workers` requests at a time.
+#
+# Progress goes to an append-only checkpoint log in storage
+# (projects/<project>/uploader_metadata/bulk_checkpoint) holding the file_id and
+# a fingerprint of the metadata sent. A rerun skips rows whose fingerprint is
+# already there, so an interrupted run picks up where it stopped and an edited
+# input only sends the rows that changed.
+# ----------------------------
+
+MODES = ("upsert", "attach", "update")
+META_COLUMNS = ("uploader_metadata", "metadata")
+ID_COLUMNS = ("file_id", "id")
+
+
+@dataclass
+class MetadataRow:
+    file_id: str
+    metadata: Dict[str, Any]
+    line: int = 0
+
+    @property
+    def fingerprint(self) -> str:
+        raw = json.dumps(self.metadata, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _row(rec: Dict[str, Any], line: int) -> MetadataRow:
+    file_id = next((str(rec[c]).strip() for c in ID_COLUMNS if rec.get(c) not in (None, "")), "")
+    if not file_id:
+        raise SystemExit(f"line {line}: missing file_id")
+
+    meta: Any = next((rec[c] for c in META_COLUMNS if c in rec), None)
+    if meta is None:
+        meta = {k: v for k, v in rec.items() if k not in ID_COLUMNS and k is not None}
+    if isinstance(meta, str):
+        try:
+            meta = json.loads(meta) if meta.strip() else {}
+        except ValueError as e:
+            raise SystemExit(f"line {line}: metadata is not valid JSON: {e}")
+    if not isinstance(meta, dict):
+        raise SystemExit(f"line {line}: metadata must be a JSON object")
+    return MetadataRow(file_id=file_id, metadata=meta, line=line)
+
+
+def load_rows(path: str | Path, *, fmt: str = "auto") -> List[MetadataRow]:
+    """
+    Rows of a JSONL or CSV file (by extension when fmt="auto").
+
+    Each JSONL object / CSV row has a file_id (or id) and either a
+    uploader_metadata / metadata object (a JSON string in CSV) or, without one,
+    uses its remaining fields as the metadata. A file_id listed twice keeps its
+    last metadata at its first position.
+    """
+    p = Path(path).expanduser().resolve()
+    if not p.is_file():
+        raise SystemExit(f"Input file not found: {p}")
+    if fmt == "auto":
+        fmt = "csv" if p.suffix.lower() == ".csv" else "jsonl"
+
+    rows: Dict[str, MetadataRow] = {}
+    with p.open("r", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for rec in reader:
+                row = _row(rec, reader.line_num)
+                rows[row.file_id] = row
+        else:
+            for n, raw in enumerate(f, start=1):
+                if not raw.strip():
+                    continue
+                try:
+                    rec = json.loads(raw)
+                except ValueError as e:
+                    raise SystemExit(f"line {n}: not valid JSON: {e}")
+                if not isinstance(rec, dict):
+                    raise SystemExit(f"line {n}: expected a JSON object")
+                row = _row(rec, n)
+                rows[row.file_id] = row
+    return list(rows.values())
+
+
+def checkpoint_key(project_id: str) -> str:
+    return f"projects/{norm_project(project_id)}/uploader_metadata/bulk_checkpoint"
+
+
+def load_checkpoint(storage: Any, project_id: str) -> Dict[str, str]:
+    """file_id -> fingerprint of the metadata last applied (entries after the last reset)."""
+    done: Dict[str, str] = {}
+    for e in iter_entries(storage, checkpoint_key(project_id)):
+        if not isinstance(e, dict):
+            continue
+        if e.get("reset"):
+            done.clear()
+        elif e.get("file_id") and e.get("fp"):
+            done[e["file_id"]] = e["fp"]
+    return done
+
+
+def reset_checkpoint(storage: Any, project_id: str) -> None:
+    append_entry(storage, checkpoint_key(project_id), {"reset": True})
+
+
+def _retryable(e: Exception, retry: RetryPolicy) -> bool:
+    """Transport errors (status 0) and the statuses the transport retries for idempotent methods."""
+    return isinstance(e, ApiError) and (e.status_code == 0 or e.status_code in retry.statuses)
+
+
+def _attach(api: Any, retry: RetryPolicy, result: Dict[str, Any]) -> Callable[[str, Any], Any]:
+    """
+    api.attach with retries. The transport only retries idempotent methods, so the
+    attach (POST) is retried here; update (PUT) and get are left to the transport.
+    """
+
+    def attach(file_id: str, body: Any) -> Any:
+        attempt = 0
+        while True:
+            result["attempts"] = attempt + 1
+            try:
+                return api.attach(file_id, body)
+            except Exception as e:
+                if not (_retryable(e, retry) and attempt < retry.total):
+                    raise
+                time.sleep(retry.backoff(attempt))
+                attempt += 1
+
+    return attach
+
+
+def apply_one(
+    client: DdmClient,
+    project_id: str,
+    row: MetadataRow,
+    *,
+    mode: str = "upsert",
+    retry: RetryPolicy = RetryPolicy(),
+    store: bool = True,
+) -> Dict[str, Any]:
+    """
+    One attach/update/upsert (UploaderMetadataAPI.upsert with the retried attach).
+    A retried attach that was applied the first time comes back as a conflict and
+    ends up as an update.
+    """
+    api = client.uploader_metadata
+    body = UploaderMetadataJSON(uploader_metadata=row.metadata)
+    result: Dict[str, Any] = {"file_id": row.file_id, "ok": True, "attempts": 1}
+
+    try:
+        if mode == "update":
+            api.update(row.file_id, body)
+        elif mode == "attach":
+            _attach(api, retry, result)(row.file_id, body)
+        else:
+            api.upsert(row.file_id, body, attach=_attach(api, retry, result))
+    except Exception as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}", line=row.line)
+
+    if client.storage is not None:
+        if result["ok"]:
+            if store:
+                try:
+                    store_uploader_metadata_json(client, project_id, row.file_id, api.get(row.file_id))
+                except ApiError:
+                    pass  # applied; the local copy is refreshed on the next get
+            append_entry(client.storage, checkpoint_key(project_id), {"file_id": row.file_id, "fp": row.fingerprint})
+        details = {"set": row.metadata} if result["ok"] else {"error": result["error"]}
+        append_log(client, project_id, row.file_id, action=f"uploader_metadata.{mode}", ok=result["ok"], details=details)
+    return result
+
+
+def apply_bulk(
+    client: DdmClient,
+    project_id: str,
+    rows: List[MetadataRow],
+    *,
+    mode: str = "upsert",
+    workers: int = 8,
+    retry: RetryPolicy = RetryPolicy(),
+    store: bool = True,
+    resume: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    apply_one for every row, `workers` at a time. With storage and resume=True,
+    rows already in the checkpoint with the same metadata are skipped
+    ({"skipped": True}). Results in input order.
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    done = load_checkpoint(client.storage, project_id) if (resume and client.storage is not None) else {}
+
+    results: Dict[str, Dict[str, Any]] = {}
+    todo: List[MetadataRow] = []
+    for row in rows:
+        if done.get(row.file_id) == row.fingerprint:
+            results[row.file_id] = {"file_id": row.file_id, "ok": True, "skipped": True}
+        else:
+            todo.append(row)
+
+    if todo:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(todo))), thread_name_prefix="ddm-meta") as pool:
+            for r in pool.map(lambda row: apply_one(client, project_id, row, mode=mode, retry=retry, store=store), todo):
+                results[r["file_id"]] = r
+    return [results[row.file_id] for row in rows]
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="ddm-uploader-meta-bulk",
+        description="Attach/update uploader metadata for many files from a JSONL or CSV mapping",
+    )
+    ap.add_argument("--project_id", required=True)
+    ap.add_argument("--input", required=True, help="JSONL or CSV with file_id + uploader_metadata (or metadata columns)")
+    ap.add_argument("--format", choices=["auto", "jsonl", "csv"], default="auto")
+    ap.add_argument("--mode", choices=list(MODES), default="upsert",
+                    help="upsert = attach, then update if the file already has metadata")
+    ap.add_argument("--workers", type=int, default=8, help="Concurrent requests")
+    ap.add_argument("--retries", type=int, default=3, help="Retries of the attach (POST) on transport errors, 429, 502-504; PUT/GET use the client's retry policy")
+    ap.add_argument("--restart", action="store_true", help="Ignore the checkpoint and send every row")
+    ap.add_argument("--no-store", action="store_true", help="Do not fetch and store uploader_metadata.json per file")
+    args = ap.parse_args(argv)
+
+    project_id = norm_project(args.project_id)
+    rows = load_rows(args.input, fmt=args.format)
+
+    client = DdmClient.from_env()
+    ensure_authenticated(client)
+
+    if args.restart and client.storage is not None:
+        reset_checkpoint(client.storage, project_id)
+
+    t0 = time.perf_counter()
+    results = apply_bulk(
+        client,
+        project_id,
+        rows,
+        mode=args.mode,
+        workers=args.workers,
+        retry=RetryPolicy(total=max(0, args.retries)),
+        store=not args.no_store,
+    )
+    failed = [r for r in results if not r["ok"]]
+    summary = {
+        "mode": args.mode,
+        "files": len(results),
+        "applied": sum(1 for r in results if r["ok"] and not r.get("skipped")),
+        "skipped": sum(1 for r in results if r.get("skipped")),
+        "failed": len(failed),
+        "seconds": round(time.perf_counter() - t0, 3),
+    }
+
+    print(json.dumps({"ok": not failed, "project_id": project_id, **summary, "failures": failed},
+                     indent=2, ensure_ascii=False))
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
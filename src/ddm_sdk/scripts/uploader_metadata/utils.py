@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.logs import append_entry
 
 
 def norm_project(project_id: str) -> str:
@@ -41,10 +42,9 @@ def append_log(
 ) -> None:
     """
     Writes json-lines log entry to:
-      projects/<project>/files/<file_id>/log.jsonl  (stored as bytes)
-    Requires FileStorage.write_bytes (your FS storage has it).
+      projects/<project>/files/<file_id>/log.jsonl
     """
-    if not client.storage or not hasattr(client.storage, "write_bytes"):
+    if not client.storage:
         return
 
     entry = {
@@ -55,20 +55,9 @@ def append_log(
         "file_id": file_id,
         "details": details or {},
     }
-    line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
 
-    # append: read existing then rewrite (fine for small logs)
     base = file_dir_key(project_id, file_id)
-    log_key = f"{base}/log"
-    existing = None
-    try:
-        if hasattr(client.storage, "read_bytes"):
-            existing = client.storage.read_bytes(log_key, ext=".jsonl")  # type: ignore[attr-defined]
-    except Exception:
-        existing = None
-
-    new_bytes = (existing or b"") + line
-    client.storage.write_bytes(log_key, new_bytes, ext=".jsonl")  # type: ignore[attr-defined]
+    append_entry(client.storage, f"{base}/log", entry)
 
 
 def store_uploader_metadata_json(
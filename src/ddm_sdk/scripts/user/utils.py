@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.logs import append_entry
 
 
 def norm_project(project_id: str) -> str:
@@ -51,23 +52,22 @@ def append_user_log(
     details: Any | None = None,
 ) -> None:
     """
-    users/<username>/logs.json  (list of dicts, append)
+    users/<username>/logs.jsonl  (append-only)
     """
     if not client.storage:
         return
 
     key = f"{user_root_key(username)}/logs"
-    existing = client.storage.read_json(key)
-    logs = existing if isinstance(existing, list) else []
-    logs.append(
+    append_entry(
+        client.storage,
+        key,
         {
             "ts": utc_now_iso(),
             "action": action,
             "ok": ok,
             "details": details,
-        }
+        },
     )
-    client.storage.write_json(key, logs)
 
 
 def load_json_arg(*, json_text: Optional[str], json_file: Optional[str]) -> dict[str, Any]:
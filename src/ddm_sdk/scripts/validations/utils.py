@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Optional, List
 
 from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.logs import append_entry
 from ddm_sdk.scripts.file.utils import norm_project
 from datetime import timedelta
 
@@ -24,24 +25,22 @@ def append_validation_log(
     details: Dict[str, Any] | None = None,
 ) -> None:
     """
-    projects/<project>/validations/logs.json  (append list)
+    projects/<project>/validations/logs.jsonl  (append-only)
     """
     if not client.storage:
         return
 
     key = f"{validations_root_key(project_id)}/logs"
-    existing = client.storage.read_json(key)
-    logs: List[Dict[str, Any]] = existing if isinstance(existing, list) else []
-
-    logs.append(
+    append_entry(
+        client.storage,
+        key,
         {
             "ts": utc_now_iso(),
             "action": action,
             "ok": bool(ok),
             "details": details or {},
-        }
+        },
     )
-    client.storage.write_json(key, logs)
 
 
 def store_validation_result_snapshot(
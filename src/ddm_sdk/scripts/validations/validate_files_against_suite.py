@@ -51,10 +51,15 @@ def main(argv: list[str] | None = None) -> int:
 
     statuses: Dict[str, Any] = {}
 
-    if args.poll:
-        for pair in task_pairs:
-            st = client.tasks.wait(pair["task_id"], timeout_s=args.timeout, poll_interval_s=args.interval, raise_on_failure=False)
-            statuses[pair["task_id"]] = st.model_dump(mode="json", exclude_none=False) if hasattr(st, "model_dump") else getattr(st, "__dict__", {"state": getattr(st, "state", None)})
+    if args.poll and task_pairs:
+        wait = client.tasks.wait_many(
+            [pair["task_id"] for pair in task_pairs],
+            timeout_s=args.timeout,
+            poll_interval_s=args.interval,
+            raise_on_failure=False,
+        )
+        for tid, st in wait.statuses.items():
+            statuses[tid] = st.model_dump(mode="json", exclude_none=False)
 
     payload = {
         "ok": True,
@@ -1,3 +1,4 @@
 from .fs import FileStorage
+from .sqlite import SqliteStorage
 
-__all__ = ["FileStorage"]
+__all__ = ["FileStorage", "SqliteStorage"]
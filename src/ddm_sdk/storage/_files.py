@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator
+
+try:  # POSIX
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+TMP_SUFFIX = ".tmp"
+
+# os.replace over a file another process has open fails on Windows; retry briefly
+_REPLACE_ATTEMPTS = 10
+_REPLACE_DELAY_S = 0.05
+
+
+def replace_with_retry(src: str, dst: Path) -> None:
+    for attempt in range(_REPLACE_ATTEMPTS):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == _REPLACE_ATTEMPTS - 1:
+                raise
+            time.sleep(_REPLACE_DELAY_S * (attempt + 1))
+
+
+def atomic_write(path: Path, write: Callable[[BinaryIO], None], *, fsync: bool = False) -> None:
+    """
+    Write `path` through a temp file in the same directory and os.replace() it into
+    place, so readers see either the old or the new content, never a partial file.
+    fsync=True also flushes the data to disk before the rename.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=TMP_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # mkstemp creates 0600; keep the mode a plain write would have had
+        try:
+            os.chmod(tmp, path.stat().st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp, 0o644)
+        replace_with_retry(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_bytes(path: Path, data: bytes, *, fsync: bool = False) -> None:
+    atomic_write(path, lambda f: f.write(data), fsync=fsync)
+
+
+def atomic_copy(src: Path, path: Path, *, fsync: bool = False) -> None:
+    def write(f: BinaryIO) -> None:
+        with src.open("rb") as s:
+            shutil.copyfileobj(s, f, 1024 * 1024)
+
+    atomic_write(path, write, fsync=fsync)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Exclusive advisory lock on `path` (created if missing), held for the block.
+    Excludes other processes and other threads of this process alike (flock locks
+    belong to the open file, and every call opens its own). Not re-entrant.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)  # gives up after ~10s, so loop
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
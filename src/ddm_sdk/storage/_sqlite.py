@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+
+def connect(path: str | Path) -> sqlite3.Connection:
+    """
+    SQLite connection tuned for the local storage files: WAL (readers never block the
+    writer), synchronous=NORMAL, a busy timeout for concurrent scripts, autocommit
+    (callers open transactions explicitly) and usable from worker threads (callers
+    serialize access with their own lock).
+    """
+    p = Path(path).expanduser()
+    p.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(p), timeout=30.0, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
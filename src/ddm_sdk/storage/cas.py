@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from ._files import TMP_SUFFIX, replace_with_retry, atomic_copy, atomic_write_bytes
+
+CAS_DIR = "_cas"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_HEX64 = re.compile(r"^[0-9a-f]{64}$")
+
+
+def normalize_sha256(digest: Optional[str]) -> Optional[str]:
+    """'0xABC..' / 'abc..' -> 64 lowercase hex chars, or None if it is not a sha256."""
+    if not isinstance(digest, str):
+        return None
+    d = digest.strip().lower()
+    if d.startswith("0x"):
+        d = d[2:]
+    return d if _HEX64.match(d) else None
+
+
+def sha256_file(path: Union[str, Path]) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+class BlobStore:
+    """
+    Content-addressed blobs: each unique content is stored once, as
+    <root>/sha256/<ab>/<cd>/<sha256>. Human-readable storage keys point at it through
+    hardlinks (plain copies where the filesystem has none), so N keys with the same
+    bytes cost the disk space of one.
+
+    Stored files must be treated as read-only: a hardlinked key edited in place
+    changes every key sharing it. Storage writes never do that (they replace files).
+    """
+
+    def __init__(self, root: Union[str, Path], *, fsync: bool = False):
+        self.root = Path(root)
+        self.fsync = fsync
+
+    def path(self, digest: str) -> Path:
+        d = normalize_sha256(digest)
+        if d is None:
+            raise ValueError(f"Invalid sha256: {digest!r}")
+        return self.root / "sha256" / d[:2] / d[2:4] / d
+
+    def has(self, digest: Optional[str]) -> bool:
+        d = normalize_sha256(digest)
+        return d is not None and self.path(d).is_file()
+
+    def put_bytes(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        target = self.path(digest)
+        if not target.is_file():
+            atomic_write_bytes(target, data, fsync=self.fsync)
+        return digest
+
+    def put_file(self, src: Union[str, Path], *, digest: Optional[str] = None, link: bool = False) -> str:
+        """
+        Add a local file (hashed unless its sha256 is given). link=True hardlinks it
+        into the store instead of copying, for files that already live in storage.
+        """
+        src = Path(src)
+        digest = normalize_sha256(digest) or sha256_file(src)
+        target = self.path(digest)
+        if target.is_file():
+            return digest
+        if link:
+            try:
+                self._link(src, target)
+                return digest
+            except OSError:
+                pass  # no hardlinks here (other device, FAT, ...): copy
+        atomic_copy(src, target, fsync=self.fsync)
+        return digest
+
+    def link_to(self, digest: str, dest: Union[str, Path]) -> Path:
+        """Materialize a stored blob at `dest` (hardlink, else copy), replacing what is there."""
+        src = self.path(digest)
+        if not src.is_file():
+            raise FileNotFoundError(f"Blob not in store: {digest}")
+        dest = Path(dest)
+        if _same_file(src, dest):
+            return dest
+        try:
+            self._link(src, dest)
+        except OSError:
+            atomic_copy(src, dest, fsync=self.fsync)
+        return dest
+
+    def iter_digests(self) -> Iterator[str]:
+        base = self.root / "sha256"
+        if not base.is_dir():
+            return
+        for p in base.glob("*/*/*"):
+            if normalize_sha256(p.name) is not None:
+                yield p.name
+
+    def prune(self) -> int:
+        """
+        Drop blobs no key links to any more (link count 1). On filesystems without
+        hardlinks every blob is a standalone copy, so this empties the store.
+        """
+        removed = 0
+        for d in list(self.iter_digests()):
+            p = self.path(d)
+            try:
+                if p.stat().st_nlink <= 1:
+                    p.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+    @staticmethod
+    def _link(src: Path, dest: Path) -> None:
+        # link under a temp name, then rename over dest: atomic like every other write
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.{os.urandom(6).hex()}{TMP_SUFFIX}")
+        os.link(src, tmp)
+        try:
+            replace_with_retry(str(tmp), dest)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ._sqlite import connect
+
+INDEX_FILENAME = "catalog_index.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id          TEXT PRIMARY KEY,
+    project_id  TEXT,
+    filename    TEXT,
+    use_case    TEXT,
+    created     TEXT,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_project ON files(project_id);
+CREATE INDEX IF NOT EXISTS files_filename ON files(filename);
+CREATE INDEX IF NOT EXISTS files_created ON files(created);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _dump(item: Any) -> Dict[str, Any]:
+    return item.model_dump(mode="json", exclude_none=False) if hasattr(item, "model_dump") else dict(item)
+
+
+class CatalogIndex:
+    """
+    Local mirror of /ddm/catalog/list in a SQLite file (indexed by id, project_id,
+    filename and created), so a file_id -> metadata lookup is one local read.
+
+    sync() is incremental: it only lists files created at/after the newest `created`
+    already indexed (the watermark) and upserts them. Files deleted on the server
+    stay in the index until a full sync.
+
+        with CatalogIndex.for_client(client) as idx:
+            idx.sync(client.catalog)
+            meta = idx.get(file_id)
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_client(cls, client: Any) -> Optional["CatalogIndex"]:
+        """Index in the client's storage dir (None if storage is disabled or not on disk)."""
+        root = getattr(getattr(client, "storage", None), "root", None)
+        if root is None:
+            return None
+        idx = cls(Path(root) / INDEX_FILENAME)
+        idx.bind(getattr(client, "base_url", "") or "")
+        return idx
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "CatalogIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ---- meta ----
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)", (key, value))
+
+    def bind(self, base_url: str) -> None:
+        """Forget everything if the index was built against another DDM server."""
+        base_url = base_url.rstrip("/")
+        with self._lock:
+            current = self._meta("base_url")
+            if current == base_url:
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if current is not None:
+                    self._conn.execute("DELETE FROM files")
+                    self._conn.execute("DELETE FROM meta")
+                self._set_meta("base_url", base_url)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def watermark(self) -> Optional[str]:
+        with self._lock:
+            return self._meta("watermark")
+
+    # ---- reads ----
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def get(self, file_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM files WHERE id = ?", (file_id,)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def find(
+        self,
+        *,
+        project_id: Optional[str] = None,
+        filename: Optional[str] = None,
+        use_case: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Indexed files matching all given filters, newest first."""
+        where: List[str] = []
+        args: List[Any] = []
+        if project_id is not None:
+            where.append("project_id = ?")
+            args.append(project_id)
+        if filename is not None:
+            where.append("filename = ?")
+            args.append(filename)
+        if use_case is not None:
+            where.append("EXISTS (SELECT 1 FROM json_each(files.use_case) WHERE value = ?)")
+            args.append(use_case)
+        sql = "SELECT data FROM files"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created DESC, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [json.loads(r["data"]) for r in rows]
+
+    # ---- writes ----
+
+    def upsert(self, items: Iterable[Any]) -> int:
+        rows = []
+        newest: Optional[str] = None
+        for it in items:
+            d = _dump(it)
+            fid = d.get("id")
+            if not isinstance(fid, str) or not fid:
+                continue
+            created = d.get("created")
+            if isinstance(created, str) and (newest is None or created > newest):
+                newest = created
+            rows.append((
+                fid,
+                d.get("project_id"),
+                d.get("filename"),
+                json.dumps(d.get("use_case") or []),
+                created,
+                json.dumps(d, ensure_ascii=False),
+            ))
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files(id, project_id, filename, use_case, created, data)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                current = self._meta("watermark")
+                if newest is not None and (current is None or newest > current):
+                    self._set_meta("watermark", newest)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM files")
+            self._set_meta("watermark", None)
+
+    def sync(self, catalog: Any, *, full: bool = False, per_page: int = 200, max_in_flight: int = 4) -> int:
+        """
+        Pull new catalog entries (catalog = client.catalog). Returns the number of rows
+        written. The watermark itself is re-listed (created_from is inclusive), so
+        files sharing the newest timestamp are never skipped.
+        """
+        if full:
+            self.clear()
+        since = self.watermark()
+
+        written = 0
+        batch: List[Any] = []
+        for item in catalog.iter_list(created_from=since, sort="created,asc", perPage=per_page, max_in_flight=max_in_flight):
+            batch.append(item)
+            if len(batch) >= per_page:
+                written += self.upsert(batch)
+                batch = []
+        written += self.upsert(batch)
+        return written
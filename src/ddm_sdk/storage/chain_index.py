@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ._sqlite import connect
+
+INDEX_FILENAME = "chain_index.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    network       TEXT NOT NULL,
+    tx_hash       TEXT NOT NULL,
+    log_index     INTEGER NOT NULL,
+    address       TEXT,
+    name          TEXT,
+    block_number  INTEGER,
+    data          TEXT NOT NULL,
+    PRIMARY KEY (network, tx_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_tx ON events(tx_hash);
+CREATE INDEX IF NOT EXISTS events_name ON events(network, name, block_number);
+CREATE INDEX IF NOT EXISTS events_address ON events(network, address, block_number);
+CREATE INDEX IF NOT EXISTS events_block ON events(block_number);
+CREATE TABLE IF NOT EXISTS txs (
+    network       TEXT NOT NULL,
+    tx_hash       TEXT NOT NULL,
+    address       TEXT,
+    frm           TEXT,
+    block_number  INTEGER,
+    status        INTEGER,
+    data          TEXT NOT NULL,
+    PRIMARY KEY (network, tx_hash)
+);
+CREATE INDEX IF NOT EXISTS txs_tx ON txs(tx_hash);
+CREATE INDEX IF NOT EXISTS txs_address ON txs(network, address, block_number);
+CREATE INDEX IF NOT EXISTS txs_from ON txs(network, frm, block_number);
+CREATE INDEX IF NOT EXISTS txs_block ON txs(block_number);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    kind     TEXT NOT NULL,
+    network  TEXT NOT NULL,
+    address  TEXT NOT NULL,
+    block    INTEGER NOT NULL,
+    PRIMARY KEY (kind, network, address)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_KINDS = ("events", "txs")
+
+
+def _dump(item: Any) -> Dict[str, Any]:
+    if hasattr(item, "model_dump"):
+        return item.model_dump(mode="json", by_alias=True, exclude_none=False)
+    return dict(item)
+
+
+def _lower(v: Any) -> Optional[str]:
+    return v.lower() if isinstance(v, str) and v else None
+
+
+def checkpoint_kind(kind: str, filters: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Checkpoint row kind: "events"/"txs" for a full sync, "<kind>?<hash>" for a
+    sync restricted by list filters (name, search, ...), so that one never moves
+    the other's checkpoint.
+    """
+    used = {k: v for k, v in (filters or {}).items() if v not in (None, "", [], ())}
+    if not used:
+        return kind
+    raw = json.dumps(used, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{kind}?{hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _in(column: str, values: Optional[Sequence[str]], where: List[str], args: List[Any], *, lower: bool = False) -> None:
+    if not values:
+        return
+    vals = [v.lower() for v in values] if lower else list(values)
+    where.append(f"{column} IN ({','.join('?' * len(vals))})")
+    args.extend(vals)
+
+
+class ChainIndex:
+    """
+    Local mirror of the indexed contract events and transactions
+    (/ddm/blockchain/events, /txs and their per-contract variants) in a SQLite
+    file, indexed by tx_hash, name/address and block_number.
+
+    sync_events() / sync_txs() are incremental per (network, address): each keeps
+    a block checkpoint (the highest block_number stored) and only lists from
+    there, in ascending block order, so an interrupted sync resumes where it
+    stopped. The checkpoint block is re-listed (block_from is inclusive) plus
+    `overlap` blocks before it, for entries the backend ingests late. A sync
+    with list filters (name=..., search=...) keeps a separate checkpoint.
+
+        with ChainIndex.for_client(client) as idx:
+            idx.sync_events(client.blockchain, network="sepolia", address=registry)
+            regs = idx.events(network="sepolia", name=["DatasetRegistered"])
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_client(cls, client: Any) -> Optional["ChainIndex"]:
+        """Index in the client's storage dir (None if storage is disabled or not on disk)."""
+        root = getattr(getattr(client, "storage", None), "root", None)
+        if root is None:
+            return None
+        idx = cls(Path(root) / INDEX_FILENAME)
+        idx.bind(getattr(client, "base_url", "") or "")
+        return idx
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ChainIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ---- meta / checkpoints ----
+
+    def bind(self, base_url: str) -> None:
+        """Forget everything if the index was built against another DDM server."""
+        base_url = base_url.rstrip("/")
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'base_url'").fetchone()
+            current = row["value"] if row else None
+            if current == base_url:
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if current is not None:
+                    for table in ("events", "txs", "checkpoints", "meta"):
+                        self._conn.execute(f"DELETE FROM {table}")
+                self._conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES ('base_url', ?)", (base_url,))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def checkpoint(
+        self, kind: str, network: str, address: Optional[str] = None, *, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[int]:
+        """
+        Highest block synced for (network, address); address None = the network-wide
+        sync. A sync with list filters has its own checkpoint (see checkpoint_kind).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT block FROM checkpoints WHERE kind = ? AND network = ? AND address = ?",
+                (checkpoint_kind(kind, filters), network, _lower(address) or ""),
+            ).fetchone()
+        return int(row["block"]) if row else None
+
+    def checkpoints(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, network, address, block FROM checkpoints ORDER BY kind, network, address").fetchall()
+        return [{"kind": r["kind"], "network": r["network"], "address": r["address"] or None, "block": r["block"]} for r in rows]
+
+    def reset(
+        self, kind: str, network: str, address: Optional[str] = None, *, filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Drop the checkpoint (the next sync starts from block 0). Stored rows are kept."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM checkpoints WHERE kind = ? AND network = ? AND address = ?",
+                (checkpoint_kind(kind, filters), network, _lower(address) or ""),
+            )
+
+    # ---- reads ----
+
+    def count(self, kind: str = "events") -> int:
+        if kind not in _KINDS:
+            raise ValueError(f"kind must be one of {_KINDS}")
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {kind}").fetchone()[0]
+
+    def events(
+        self,
+        *,
+        network: Optional[str] = None,
+        address: Optional[Sequence[str]] = None,
+        name: Optional[Sequence[str]] = None,
+        tx_hash: Optional[Sequence[str]] = None,
+        block_from: Optional[int] = None,
+        block_to: Optional[int] = None,
+        newest_first: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Stored events matching all given filters, in block/log order."""
+        where: List[str] = []
+        args: List[Any] = []
+        if network is not None:
+            where.append("network = ?")
+            args.append(network)
+        _in("address", address, where, args, lower=True)
+        _in("name", name, where, args)
+        _in("tx_hash", tx_hash, where, args, lower=True)
+        order = "DESC" if newest_first else "ASC"
+        return self._select("events", where, args, block_from, block_to, f"block_number {order}, log_index {order}", limit)
+
+    def txs(
+        self,
+        *,
+        network: Optional[str] = None,
+        address: Optional[Sequence[str]] = None,
+        frm: Optional[Sequence[str]] = None,
+        tx_hash: Optional[Sequence[str]] = None,
+        status: Optional[int] = None,
+        block_from: Optional[int] = None,
+        block_to: Optional[int] = None,
+        newest_first: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Stored transactions matching all given filters, in block order."""
+        where: List[str] = []
+        args: List[Any] = []
+        if network is not None:
+            where.append("network = ?")
+            args.append(network)
+        _in("address", address, where, args, lower=True)
+        _in("frm", frm, where, args, lower=True)
+        _in("tx_hash", tx_hash, where, args, lower=True)
+        if status is not None:
+            where.append("status = ?")
+            args.append(int(status))
+        order = "DESC" if newest_first else "ASC"
+        return self._select("txs", where, args, block_from, block_to, f"block_number {order}, tx_hash", limit)
+
+    def get_tx(self, tx_hash: str, *, network: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        rows = self.txs(network=network, tx_hash=[tx_hash], limit=1)
+        return rows[0] if rows else None
+
+    def _select(
+        self,
+        table: str,
+        where: List[str],
+        args: List[Any],
+        block_from: Optional[int],
+        block_to: Optional[int],
+        order: str,
+        limit: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        if block_from is not None:
+            where.append("block_number >= ?")
+            args.append(int(block_from))
+        if block_to is not None:
+            where.append("block_number <= ?")
+            args.append(int(block_to))
+        sql = f"SELECT data FROM {table}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [json.loads(r["data"]) for r in rows]
+
+    # ---- writes ----
+
+    def upsert_events(
+        self, items: Iterable[Any], *, checkpoint: Optional[tuple] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        rows = []
+        for it in items:
+            d = _dump(it)
+            if not d.get("tx_hash") or d.get("log_index") is None:
+                continue
+            rows.append((
+                d.get("network") or "",
+                _lower(d["tx_hash"]),
+                int(d["log_index"]),
+                _lower(d.get("address")),
+                d.get("name"),
+                d.get("block_number"),
+                json.dumps(d, ensure_ascii=False),
+            ))
+        self._write(
+            "INSERT OR REPLACE INTO events(network, tx_hash, log_index, address, name, block_number, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+            checkpoint_kind("events", filters),
+            checkpoint,
+        )
+        return len(rows)
+
+    def upsert_txs(
+        self, items: Iterable[Any], *, checkpoint: Optional[tuple] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        rows = []
+        for it in items:
+            d = _dump(it)
+            if not d.get("tx_hash"):
+                continue
+            rows.append((
+                d.get("network") or "",
+                _lower(d["tx_hash"]),
+                _lower(d.get("to") or d.get("contract_address")),
+                _lower(d.get("from")),
+                d.get("block_number"),
+                d.get("status"),
+                json.dumps(d, ensure_ascii=False),
+            ))
+        self._write(
+            "INSERT OR REPLACE INTO txs(network, tx_hash, address, frm, block_number, status, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+            checkpoint_kind("txs", filters),
+            checkpoint,
+        )
+        return len(rows)
+
+    def _write(self, sql: str, rows: List[tuple], kind: str, checkpoint: Optional[tuple]) -> None:
+        # rows and the checkpoint commit together, so a crash never skips blocks
+        if not rows and checkpoint is None:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if rows:
+                    self._conn.executemany(sql, rows)
+                if checkpoint is not None:
+                    network, address, block = checkpoint
+                    self._conn.execute(
+                        "INSERT INTO checkpoints(kind, network, address, block) VALUES (?, ?, ?, ?)"
+                        " ON CONFLICT(kind, network, address) DO UPDATE SET block = MAX(block, excluded.block)",
+                        (kind, network, _lower(address) or "", int(block)),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    # ---- sync ----
+
+    def sync_events(
+        self,
+        blockchain: Any,
+        *,
+        network: str,
+        address: Optional[str] = None,
+        full: bool = False,
+        overlap: int = 0,
+        per_page: int = 200,
+        max_in_flight: int = 4,
+        **filters: Any,
+    ) -> int:
+        """
+        Pull new events (blockchain = client.blockchain) of one contract, or of the
+        whole network when address is None. Returns the number of rows written.
+        """
+        return self._sync("events", blockchain, network, address, full, overlap, per_page, max_in_flight, filters)
+
+    def sync_txs(
+        self,
+        blockchain: Any,
+        *,
+        network: str,
+        address: Optional[str] = None,
+        full: bool = False,
+        overlap: int = 0,
+        per_page: int = 200,
+        max_in_flight: int = 4,
+        **filters: Any,
+    ) -> int:
+        """Like sync_events(), over contract_txs(address) / all_txs()."""
+        return self._sync("txs", blockchain, network, address, full, overlap, per_page, max_in_flight, filters)
+
+    def _sync(
+        self,
+        kind: str,
+        blockchain: Any,
+        network: str,
+        address: Optional[str],
+        full: bool,
+        overlap: int,
+        per_page: int,
+        max_in_flight: int,
+        filters: Dict[str, Any],
+    ) -> int:
+        if full:
+            self.reset(kind, network, address, filters=filters)
+        since = self.checkpoint(kind, network, address, filters=filters)
+        block_from = None if since is None else max(0, since - max(0, int(overlap)))
+
+        params = dict(filters, network=[network], block_from=block_from, sort="block_number,asc",
+                      perPage=per_page, max_in_flight=max_in_flight)
+        if kind == "events":
+            items = blockchain.iter_contract_events(address, **params) if address else blockchain.iter_all_events(**params)
+            upsert = self.upsert_events
+        else:
+            items = blockchain.iter_contract_txs(address, **params) if address else blockchain.iter_all_txs(**params)
+            upsert = self.upsert_txs
+
+        written = 0
+        batch: List[Any] = []
+        newest = since
+        for item in items:
+            batch.append(item)
+            block = getattr(item, "block_number", None)
+            if isinstance(block, int) and (newest is None or block > newest):
+                newest = block
+            if len(batch) >= per_page:
+                written += upsert(batch, checkpoint=(network, address, newest), filters=filters)
+                batch = []
+        if batch:
+            written += upsert(batch, checkpoint=(network, address, newest), filters=filters)
+        return written
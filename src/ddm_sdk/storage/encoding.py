@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import gzip
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# ----------------------------
+# On-disk encoding of JSON documents in FileStorage.
+#
+# "pretty" (indent=2, plain .json) stays the default so trees remain readable;
+# big trees (task results, detailed validation results, ABIs) can switch to compact
+# JSON, orjson if installed and gzip/zstd compression, globally or per key prefix.
+# The file suffix records the encoding (.json / .json.gz / .json.zst), so reads
+# decode whatever is on disk regardless of the current setting.
+# ----------------------------
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None  # type: ignore[assignment]
+
+try:  # Python 3.14+
+    from compression import zstd as _zstd_mod
+
+    def _zstd_compress(data: bytes, level: int) -> bytes:
+        return _zstd_mod.compress(data, level=level)
+
+    def _zstd_decompress(data: bytes) -> bytes:
+        return _zstd_mod.decompress(data)
+
+except ImportError:
+    try:
+        import zstandard as _zstd_mod  # type: ignore[no-redef]
+
+        def _zstd_compress(data: bytes, level: int) -> bytes:
+            return _zstd_mod.ZstdCompressor(level=level).compress(data)
+
+        def _zstd_decompress(data: bytes) -> bytes:
+            # max_output_size: frames written without a content size still decode
+            return _zstd_mod.ZstdDecompressor().decompress(data, max_output_size=1 << 31)
+
+    except ImportError:  # optional
+        _zstd_mod = None
+
+SUFFIXES: Dict[Optional[str], str] = {None: ".json", "gzip": ".json.gz", "zstd": ".json.zst"}
+_DEFAULT_LEVEL = {"gzip": 6, "zstd": 3}
+
+
+def have_zstd() -> bool:
+    return _zstd_mod is not None
+
+
+@dataclass(frozen=True)
+class JsonEncoding:
+    """
+    indent: 2 for pretty, None for compact (no whitespace).
+    serializer: "json", "orjson" (required) or "auto" (orjson when installed).
+    compression: None, "gzip" or "zstd"; level None = codec default.
+    """
+
+    indent: Optional[int] = 2
+    serializer: str = "json"
+    compression: Optional[str] = None
+    level: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.serializer not in ("json", "orjson", "auto"):
+            raise ValueError(f"Unsupported JSON serializer: {self.serializer}")
+        if self.serializer == "orjson" and orjson is None:
+            raise RuntimeError("orjson is not installed (pip install 'ddm-sdk[orjson]')")
+        if self.compression not in SUFFIXES:
+            raise ValueError(f"Unsupported compression: {self.compression}")
+        if self.compression == "zstd" and not have_zstd():
+            raise RuntimeError("zstd needs Python 3.14+ or zstandard (pip install 'ddm-sdk[zstd]')")
+
+    @property
+    def suffix(self) -> str:
+        return SUFFIXES[self.compression]
+
+    def dumps(self, payload: Any) -> bytes:
+        data = None
+        # orjson only knows indent=2 and str keys; anything else goes through json
+        if orjson is not None and self.serializer != "json" and self.indent in (None, 2):
+            try:
+                data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 if self.indent else 0)
+            except TypeError:
+                data = None
+        if data is None:
+            if self.indent is None:
+                text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+            else:
+                text = json.dumps(payload, ensure_ascii=False, indent=self.indent)
+            data = text.encode("utf-8")
+
+        level = self.level if self.level is not None else _DEFAULT_LEVEL.get(self.compression or "")
+        if self.compression == "gzip":
+            return gzip.compress(data, compresslevel=level, mtime=0)
+        if self.compression == "zstd":
+            return _zstd_compress(data, level)
+        return data
+
+
+PRETTY = JsonEncoding()
+COMPACT = JsonEncoding(indent=None, serializer="auto")
+
+
+def loads(data: bytes, suffix: str) -> Any:
+    """Decode a document stored with the given file suffix."""
+    if suffix == ".json.gz":
+        data = gzip.decompress(data)
+    elif suffix == ".json.zst":
+        if not have_zstd():
+            raise RuntimeError("zstd needs Python 3.14+ or zstandard (pip install 'ddm-sdk[zstd]')")
+        data = _zstd_decompress(data)
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN written by json; let json decide
+    return json.loads(data.decode("utf-8"))
+
+
+def parse_encoding(spec: str) -> JsonEncoding:
+    """
+    "pretty", "compact", "orjson", optionally followed by "+gzip"/"+zstd" and a level:
+    e.g. "compact+zstd", "orjson+gzip:9", "pretty".
+    """
+    parts = [p.strip().lower() for p in (spec or "pretty").split("+") if p.strip()]
+    fmt, comp = parts[0], (parts[1] if len(parts) > 1 else None)
+    level = None
+    if comp and ":" in comp:
+        comp, lvl = comp.split(":", 1)
+        level = int(lvl)
+    if comp in ("gz",):
+        comp = "gzip"
+    if comp in ("zst",):
+        comp = "zstd"
+
+    if fmt == "pretty":
+        return JsonEncoding(indent=2, compression=comp, level=level)
+    if fmt == "compact":
+        return JsonEncoding(indent=None, serializer="auto", compression=comp, level=level)
+    if fmt == "orjson":
+        return JsonEncoding(indent=None, serializer="orjson", compression=comp, level=level)
+    raise ValueError(f"Unsupported storage encoding: {spec}")
+
+
+def parse_encoding_rules(spec: Optional[str]) -> Tuple[JsonEncoding, Dict[str, JsonEncoding]]:
+    """
+    DDM_STORAGE_ENCODING value -> (default, {key prefix: encoding}).
+    "compact" or "pretty;tasks/=compact+zstd;projects/=compact+gzip".
+    """
+    default = PRETTY
+    rules: Dict[str, JsonEncoding] = {}
+    for item in (spec or "").split(";"):
+        item = item.strip()
+        if not item:
+            continue
+        if "=" in item:
+            prefix, enc = item.split("=", 1)
+            rules[prefix.strip().replace("\\", "/").lstrip("/")] = parse_encoding(enc)
+        else:
+            default = parse_encoding(item)
+    return default, rules
+
+
+def encoding_for(key: str, default: JsonEncoding, rules: Mapping[str, JsonEncoding]) -> JsonEncoding:
+    """Longest matching key prefix wins."""
+    best: Optional[str] = None
+    for prefix in rules:
+        if key.startswith(prefix) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return rules[best] if best is not None else default
@@ -4,12 +4,23 @@ from pathlib import Path
 from typing import Optional
 
 from .base import Storage
+from .encoding import parse_encoding_rules
 from .fs import FileStorage
+from .sqlite import SqliteStorage
 
 
-def make_storage(backend: str, storage_dir: Optional[str]) -> Optional[Storage]:
+def make_storage(
+    backend: str,
+    storage_dir: Optional[str],
+    *,
+    encoding: Optional[str] = None,
+    dedupe: bool = False,
+) -> Optional[Storage]:
     """
     Returns a Storage implementation or None if disabled.
+    encoding (DDM_STORAGE_ENCODING) sets how the fs backend writes JSON documents and
+    dedupe (DDM_STORAGE_DEDUPE) turns on its content-addressed blob store; the sqlite
+    backend always stores compact JSON and plain blobs.
     """
     if not storage_dir:
         return None
@@ -19,9 +30,12 @@ def make_storage(backend: str, storage_dir: Optional[str]) -> Optional[Storage]:
     root.mkdir(parents=True, exist_ok=True)
 
     if backend in ("fs", "file", "json"):
-        return FileStorage(root)
+        default, rules = parse_encoding_rules(encoding)
+        return FileStorage(root, encoding=default, encodings=rules, dedupe=dedupe)
+
+    if backend in ("sqlite", "sqlite3", "db"):
+        return SqliteStorage(root)
 
     # future:
-    # if backend == "sqlite": return SqliteStorage(...)
     # if backend == "mongo": return MongoStorage(...)
     raise ValueError(f"Unsupported storage backend: {backend}")
@@ -1,14 +1,49 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from ._files import atomic_copy, atomic_write_bytes, file_lock
+from .cas import CAS_DIR, BlobStore, normalize_sha256
+from .encoding import PRETTY, SUFFIXES, JsonEncoding, encoding_for, loads
+from .logs import TimeBound, dumps_entry, in_range, parse_ts
+
+LOCK_DIR = ".locks"
 
 
 @dataclass
 class FileStorage:
+    """
+    One file per key under `root` (<key>.json, <key><ext> blobs, <key>.jsonl logs).
+
+    Writes go through a temp file + os.replace, so a crash never leaves a truncated
+    file behind. locking=True also takes the per-key lock (see lock()) around every
+    write; update_json() always does. fsync=True flushes each write to disk before
+    it becomes visible.
+
+    JSON documents use `encoding` (pretty .json by default), or the encoding of the
+    longest matching key prefix in `encodings`; e.g. compact+zstd for "tasks/"
+    writes tasks/<id>/result.json.zst. read_json decodes any of the variants.
+
+    dedupe=True stores blob contents once in a content-addressed store under
+    <root>/_cas (see BlobStore) and hardlinks the blob keys to it; link_blob() then
+    materializes a key from a known sha256 without downloading it again.
+    """
+
     root: Path
+    locking: bool = False
+    fsync: bool = False
+    encoding: JsonEncoding = PRETTY
+    encodings: Dict[str, JsonEncoding] = field(default_factory=dict)
+    dedupe: bool = False
+
+    @property
+    def cas(self) -> BlobStore:
+        return BlobStore(self.root / CAS_DIR, fsync=self.fsync)
 
     def _norm_key(self, key: str) -> str:
         key = key.replace("\\", "/").strip("/")
@@ -18,11 +53,15 @@ class FileStorage:
             raise ValueError(f"Invalid storage key: {key}")
         return key
 
-    def _path_json(self, key: str) -> Path:
+    def _encoding(self, key: str) -> JsonEncoding:
+        return encoding_for(key, self.encoding, self.encodings) if self.encodings else self.encoding
+
+    def _json_variants(self, key: str) -> List[Tuple[str, Path]]:
+        """(suffix, path) of every file a JSON key may be stored in, the current encoding's first."""
         key = self._norm_key(key)
-        p = self.root / f"{key}.json"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        return p
+        first = self._encoding(key).suffix
+        suffixes = [first] + [s for s in SUFFIXES.values() if s != first]
+        return [(s, self.root / f"{key}{s}") for s in suffixes]
 
     def _path_blob(self, key: str, ext: str) -> Path:
         key = self._norm_key(key)
@@ -31,43 +70,92 @@ class FileStorage:
         p.parent.mkdir(parents=True, exist_ok=True)
         return p
 
-    # ---- JSON ----
+    # ---- locking ----
 
-    def write_json(self, key: str, payload: Any) -> str:
-        p = self._path_json(key)
+    def lock(self, key: str) -> ContextManager[None]:
+        """
+        Exclusive advisory lock for `key` (a file under <root>/.locks), across threads
+        and processes. Only cooperating writers are excluded; not re-entrant.
+        """
+        return file_lock(self.root / LOCK_DIR / f"{self._norm_key(key)}.lock")
 
+    def _write_lock(self, key: str) -> ContextManager[None]:
+        return self.lock(key) if self.locking else nullcontext()
+
+    # ---- JSON ----
+
+    def _dump_json(self, key: str, payload: Any) -> Path:
         if hasattr(payload, "model_dump"):
             payload = payload.model_dump(mode="json", exclude_none=False)
+        (_, p), *others = self._json_variants(key)
+        atomic_write_bytes(p, self._encoding(key).dumps(payload), fsync=self.fsync)
+        # the key was written with another encoding before: drop the stale copy
+        for _, o in others:
+            if o.exists():
+                o.unlink()
+        return p
 
-        p.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    def _load_json(self, key: str, *, strict: bool = False) -> Optional[Any]:
+        """None if missing; a document that does not decode is None too, or ValueError when strict."""
+        for suffix, p in self._json_variants(key):
+            try:
+                data = p.read_bytes()
+            except FileNotFoundError:
+                continue
+            try:
+                return loads(data, suffix)
+            except Exception as e:
+                if strict:
+                    raise ValueError(f"{p}: stored JSON does not decode: {e}") from e
+                return None
+        return None
+
+    def write_json(self, key: str, payload: Any) -> str:
+        with self._write_lock(key):
+            p = self._dump_json(key, payload)
         return str(p)
 
     def read_json(self, key: str) -> Optional[Any]:
-        p = self._path_json(key)
-        if not p.exists():
-            return None
-        try:
-            return json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
-            return None
+        return self._load_json(key)
+
+    def update_json(self, key: str, fn: Callable[[Optional[Any]], Any]) -> Any:
+        """
+        Read-modify-write `key` under its lock: fn gets the current value (None if
+        missing) and returns the new one, which is written atomically unless it is
+        unchanged. Returns the new value. Concurrent updaters (threads or processes)
+        are serialized, so none of their changes is lost. fn must not touch the
+        same key through this storage. A document that does not decode raises
+        ValueError instead of being overwritten as if it were missing.
+        """
+        with self.lock(key):
+            current = self._load_json(key, strict=True)
+            new = fn(current)
+            if new != current:
+                self._dump_json(key, new)
+        return new
 
     def delete(self, key: str) -> None:
         # deletes JSON key only (kept compatible)
-        p = self._path_json(key)
-        if p.exists():
-            p.unlink()
+        with self._write_lock(key):
+            for _, p in self._json_variants(key):
+                if p.exists():
+                    p.unlink()
 
     def write_bytes(self, key: str, data: bytes, *, ext: str = ".bin") -> str:
-        key = key.replace("\\", "/").strip("/")
-        if ".." in key.split("/"):
-            raise ValueError(f"Invalid storage key: {key}")
-
-        ext = ext if ext.startswith(".") else f".{ext}"
-        p = self.root / f"{key}{ext}"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_bytes(data)
+        p = self._path_blob(key, ext)
+        with self._write_lock(key):
+            if self.dedupe:
+                cas = self.cas
+                cas.link_to(cas.put_bytes(data), p)
+            else:
+                atomic_write_bytes(p, data, fsync=self.fsync)
         return str(p)
 
+    def blob_path(self, key: str, *, ext: str = ".bin") -> Path:
+        """
+        Path a blob key maps to (parent dir is created), for callers that stream to disk.
+        """
+        return self._path_blob(key, ext)
 
     def read_bytes(self, key: str, *, ext: str = ".bin") -> Optional[bytes]:
         p = self._path_blob(key, ext)
@@ -86,5 +174,96 @@ class FileStorage:
 
         use_ext = ext if ext is not None else (src.suffix or ".bin")
         p = self._path_blob(key, use_ext)
-        p.write_bytes(src.read_bytes())
+        with self._write_lock(key):
+            if self.dedupe:
+                cas = self.cas
+                cas.link_to(cas.put_file(src), p)
+            else:
+                atomic_copy(src, p, fsync=self.fsync)
+        return str(p)
+
+    # ---- content-addressed blobs (dedupe=True) ----
+
+    def link_blob(self, key: str, sha256: Optional[str], *, ext: str = ".bin") -> Optional[str]:
+        """
+        Point a blob key at already-stored content with this sha256. Returns the path,
+        or None when dedupe is off or the content is not stored locally.
+        """
+        digest = normalize_sha256(sha256)
+        if not self.dedupe or digest is None or not self.cas.has(digest):
+            return None
+        p = self._path_blob(key, ext)
+        with self._write_lock(key):
+            self.cas.link_to(digest, p)
         return str(p)
+
+    def ingest_blob(self, key: str, *, ext: str = ".bin", sha256: Optional[str] = None) -> Optional[str]:
+        """
+        Add a blob file that was written in place (e.g. streamed to blob_path()) to the
+        content store, sharing storage with identical content. sha256, if known, skips
+        re-hashing. Returns the digest, or None when dedupe is off or the file is missing.
+        """
+        p = self._path_blob(key, ext)
+        if not self.dedupe or not p.is_file():
+            return None
+        cas = self.cas
+        with self._write_lock(key):
+            digest = cas.put_file(p, digest=normalize_sha256(sha256), link=True)
+            cas.link_to(digest, p)
+        return digest
+
+    # ---- append-only logs ----
+
+    def append(self, key: str, entry: Any, *, fsync: bool = False) -> str:
+        """
+        Append one JSON line to <key>.jsonl. The file is opened with O_APPEND and the
+        line goes out in a single write, so concurrent writers (threads or
+        processes) never overwrite each other. fsync=True also flushes it to disk.
+        """
+        p = self._path_blob(key, ".jsonl")
+        line = dumps_entry(entry)
+        fd = os.open(p, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            view = memoryview(line)
+            while view:
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        return str(p)
+
+    def iter_log(self, key: str, *, since: TimeBound = None, until: TimeBound = None) -> Iterator[Any]:
+        """
+        Entries of a log in write order, read lazily: first the legacy <key>.json list
+        (if any), then <key>.jsonl line by line. since/until filter on the entry "ts"
+        ([since, until)); a torn last line from a crashed writer is skipped.
+        """
+        key = self._norm_key(key)
+        lo, hi = parse_ts(since), parse_ts(until)
+
+        legacy = self.root / f"{key}.json"
+        if legacy.exists():
+            try:
+                old = json.loads(legacy.read_text(encoding="utf-8"))
+            except Exception:
+                old = None
+            if isinstance(old, list):
+                for e in old:
+                    if in_range(e, lo, hi):
+                        yield e
+
+        p = self.root / f"{key}.jsonl"
+        if not p.exists():
+            return
+        with p.open("rb") as f:
+            for raw in f:
+                raw = raw.strip()
+                if not raw:
+                    continue
+                try:
+                    e = json.loads(raw)
+                except ValueError:
+                    continue
+                if in_range(e, lo, hi):
+                    yield e
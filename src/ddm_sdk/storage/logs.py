@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+# ----------------------------
+# Append-only logs on top of any Storage.
+#
+# Backends with an `append` method store one entry per line/row (FileStorage:
+# <key>.jsonl opened with O_APPEND; SqliteStorage: a row in the logs table), so an
+# append costs O(1) and concurrent writers do not lose entries. Other backends fall
+# back to the old read-modify-write JSON list. Readers also see entries written
+# in the old <key>.json list format.
+# ----------------------------
+
+TimeBound = Union[None, str, datetime]
+
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def parse_ts(value: Any) -> Optional[datetime]:
+    """ISO timestamp (or datetime) -> aware UTC datetime; naive values are taken as UTC."""
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, str) and value.strip():
+        try:
+            dt = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def in_range(entry: Any, since: Optional[datetime], until: Optional[datetime]) -> bool:
+    """since is inclusive, until exclusive; entries without a parsable ts only pass an open range."""
+    if since is None and until is None:
+        return True
+    ts = parse_ts(entry.get("ts")) if isinstance(entry, dict) else None
+    if ts is None:
+        return False
+    if since is not None and ts < since:
+        return False
+    if until is not None and ts >= until:
+        return False
+    return True
+
+
+def filter_entries(entries: Iterable[Any], since: TimeBound = None, until: TimeBound = None) -> Iterator[Any]:
+    lo, hi = parse_ts(since), parse_ts(until)
+    for e in entries:
+        if in_range(e, lo, hi):
+            yield e
+
+
+def append_entry(storage: Any, key: str, entry: Dict[str, Any], *, fsync: bool = False) -> Optional[str]:
+    """
+    Append one log entry under `key` (a "ts" is added if missing). Returns where it
+    was written, or None when storage is disabled.
+    """
+    if storage is None:
+        return None
+    if "ts" not in entry:
+        entry = {"ts": utc_now_iso(), **entry}
+
+    append = getattr(storage, "append", None)
+    if callable(append):
+        return append(key, entry, fsync=fsync)
+
+    existing = storage.read_json(key)
+    logs = existing if isinstance(existing, list) else []
+    logs.append(entry)
+    return storage.write_json(key, logs)
+
+
+def iter_entries(storage: Any, key: str, *, since: TimeBound = None, until: TimeBound = None) -> Iterator[Any]:
+    """Stream the entries of a log in write order, optionally limited to [since, until)."""
+    if storage is None:
+        return iter(())
+
+    reader = getattr(storage, "iter_log", None)
+    if callable(reader):
+        return reader(key, since=since, until=until)
+
+    existing = storage.read_json(key)
+    return filter_entries(existing if isinstance(existing, list) else [], since, until)
+
+
+def dumps_entry(entry: Any) -> bytes:
+    """One JSONL line (compact, newline-terminated) for an entry."""
+    return (json.dumps(entry, ensure_ascii=False, separators=(",", ":"), default=str) + "\n").encode("utf-8")
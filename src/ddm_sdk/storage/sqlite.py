@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ._files import TMP_SUFFIX, atomic_copy, atomic_write_bytes
+from ._sqlite import connect
+from .encoding import SUFFIXES, loads
+from .logs import TimeBound, in_range, parse_ts
+
+DB_FILENAME = "storage.sqlite3"
+# blobs above max_inline_blob (and those streamed to blob_path()) live here as files
+BLOB_DIR = "_blobs"
+MAX_INLINE_BLOB = 64 * 1024 * 1024
+_COPY_CHUNK = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS json_docs (
+    key      TEXT PRIMARY KEY,
+    data     TEXT NOT NULL,
+    updated  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    name     TEXT PRIMARY KEY,
+    data     BLOB NOT NULL,
+    updated  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS logs (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    key      TEXT NOT NULL,
+    ts       TEXT,
+    entry    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS logs_key_ts ON logs(key, ts);
+"""
+
+# files next to the database that a migration must not copy into it
+_OWN_FILES = (DB_FILENAME, "catalog_index.sqlite3")
+# FileStorage bookkeeping: lock files, the blob content store (its blobs are
+# reached through their keys), the HTTP response cache and temp files of
+# interrupted writes
+_SKIP_DIRS = (".locks", "_cas", "http_cache", BLOB_DIR)
+_JSON_SUFFIXES = tuple(SUFFIXES.values())
+
+
+class SqliteStorage:
+    """
+    Storage backed by one SQLite file (WAL) under `root`: JSON documents in one
+    table, blobs in another. Same keys as FileStorage (a blob is addressed by
+    key + ext, like the file name FileStorage would use), so the scripts work
+    unchanged with DDM_STORAGE_BACKEND=sqlite.
+
+    Blobs larger than max_inline_blob, and blobs streamed to blob_path(), are
+    kept as files under <root>/_blobs/<name> instead (SQLite caps a value at
+    1 GB and reads/writes it whole); read_bytes/delete_bytes look there first.
+
+    Returned "paths" are sqlite:<db file>#<name> locators for rows in the
+    database, and filesystem paths for blobs kept as files.
+    """
+
+    def __init__(self, root: str | Path, *, filename: str = DB_FILENAME, max_inline_blob: int = MAX_INLINE_BLOB):
+        self.root = Path(root)
+        self.path = self.root / filename
+        self.max_inline_blob = max_inline_blob
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _norm_key(self, key: str) -> str:
+        key = key.replace("\\", "/").strip("/")
+        if not key:
+            raise ValueError("Invalid storage key: empty")
+        if ".." in key.split("/"):
+            raise ValueError(f"Invalid storage key: {key}")
+        return key
+
+    def _blob_name(self, key: str, ext: str) -> str:
+        ext = ext if ext.startswith(".") else f".{ext}"
+        return f"{self._norm_key(key)}{ext}"
+
+    def _locator(self, name: str) -> str:
+        return f"sqlite:{self.path}#{name}"
+
+    def _blob_file(self, name: str) -> Path:
+        return self.root / BLOB_DIR / name
+
+    # ---- JSON ----
+
+    def write_json(self, key: str, payload: Any) -> str:
+        key = self._norm_key(key)
+        if hasattr(payload, "model_dump"):
+            payload = payload.model_dump(mode="json", exclude_none=False)
+        text = json.dumps(payload, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO json_docs(key, data, updated) VALUES (?, ?, ?)",
+                (key, text, time.time()),
+            )
+        return self._locator(f"{key}.json")
+
+    def read_json(self, key: str) -> Optional[Any]:
+        key = self._norm_key(key)
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM json_docs WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row["data"])
+        except Exception:
+            return None
+
+    def update_json(self, key: str, fn: Callable[[Optional[Any]], Any]) -> Any:
+        """
+        Read-modify-write `key` in one IMMEDIATE transaction, so concurrent updaters
+        (threads or processes) are serialized and none of their changes is lost.
+        Returns the new value. fn must not use this storage. A document that does
+        not decode raises ValueError instead of being overwritten.
+        """
+        key = self._norm_key(key)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT data FROM json_docs WHERE key = ?", (key,)).fetchone()
+                try:
+                    current = json.loads(row["data"]) if row is not None else None
+                except ValueError as e:
+                    raise ValueError(f"{key}: stored JSON does not decode: {e}") from e
+                new = fn(current)
+                if new != current:
+                    payload = new.model_dump(mode="json", exclude_none=False) if hasattr(new, "model_dump") else new
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO json_docs(key, data, updated) VALUES (?, ?, ?)",
+                        (key, json.dumps(payload, ensure_ascii=False), time.time()),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return new
+
+    def delete(self, key: str) -> None:
+        # deletes JSON key only (like FileStorage)
+        key = self._norm_key(key)
+        with self._lock:
+            self._conn.execute("DELETE FROM json_docs WHERE key = ?", (key,))
+
+    # ---- blobs ----
+
+    def write_bytes(self, key: str, data: bytes, *, ext: str = ".bin") -> str:
+        name = self._blob_name(key, ext)
+        if len(data) > self.max_inline_blob:
+            p = self._blob_file(name)
+            atomic_write_bytes(p, data)
+            self._delete_row(name)
+            return str(p)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blobs(name, data, updated) VALUES (?, ?, ?)",
+                (name, bytes(data), time.time()),
+            )
+        self._blob_file(name).unlink(missing_ok=True)
+        return self._locator(name)
+
+    def blob_path(self, key: str, *, ext: str = ".bin") -> Path:
+        """
+        File a blob key maps to under <root>/_blobs (parent dir is created), for
+        callers that stream to disk. The file takes precedence over a row of the
+        same name.
+        """
+        p = self._blob_file(self._blob_name(key, ext))
+        p.parent.mkdir(parents=True, exist_ok=True)
+        return p
+
+    def read_bytes(self, key: str, *, ext: str = ".bin") -> Optional[bytes]:
+        name = self._blob_name(key, ext)
+        p = self._blob_file(name)
+        if p.is_file():
+            return p.read_bytes()
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM blobs WHERE name = ?", (name,)).fetchone()
+        return bytes(row["data"]) if row is not None else None
+
+    def delete_bytes(self, key: str, *, ext: str = ".bin") -> None:
+        name = self._blob_name(key, ext)
+        self._delete_row(name)
+        self._blob_file(name).unlink(missing_ok=True)
+
+    def _delete_row(self, name: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM blobs WHERE name = ?", (name,))
+
+    def copy_file(self, key: str, src_path: str | Path, *, ext: Optional[str] = None) -> str:
+        """
+        Copy a local file into storage.
+        If ext is None, uses source suffix; else uses ext.
+        The file is streamed, never read into memory as a whole.
+        """
+        src = Path(src_path).expanduser().resolve()
+        if not src.exists() or not src.is_file():
+            raise FileNotFoundError(f"Source file not found: {src}")
+
+        use_ext = ext if ext is not None else (src.suffix or ".bin")
+        return self._put_file(self._blob_name(key, use_ext), src)
+
+    def _put_file(self, name: str, src: Path) -> str:
+        size = src.stat().st_size
+        if size > self.max_inline_blob:
+            p = self._blob_file(name)
+            atomic_copy(src, p)
+            self._delete_row(name)
+            return str(p)
+        with self._lock, src.open("rb") as f:
+            if not hasattr(self._conn, "blobopen"):  # Python < 3.11: one read, still bounded by max_inline_blob
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO blobs(name, data, updated) VALUES (?, ?, ?)",
+                    (name, f.read(), time.time()),
+                )
+            else:
+                # reserve the row, then fill it chunk by chunk through incremental blob I/O
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    cur = self._conn.execute(
+                        "INSERT OR REPLACE INTO blobs(name, data, updated) VALUES (?, zeroblob(?), ?)",
+                        (name, size, time.time()),
+                    )
+                    with self._conn.blobopen("blobs", "data", cur.lastrowid) as blob:
+                        for chunk in iter(lambda: f.read(_COPY_CHUNK), b""):
+                            blob.write(chunk)  # ValueError if the file grew meanwhile
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        self._blob_file(name).unlink(missing_ok=True)
+        return self._locator(name)
+
+    # ---- append-only logs ----
+
+    def append(self, key: str, entry: Any, *, fsync: bool = False) -> str:
+        """One row per entry (fsync is implied by the transaction commit in WAL mode)."""
+        key = self._norm_key(key)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO logs(key, ts, entry) VALUES (?, ?, ?)",
+                _log_row(key, entry),
+            )
+        return self._locator(f"{key}.jsonl")
+
+    def iter_log(
+        self,
+        key: str,
+        *,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        batch_size: int = 500,
+    ) -> Iterator[Any]:
+        """
+        Entries in write order, fetched in batches (ts range is an index scan).
+        A legacy JSON list stored under the same key is yielded first.
+        """
+        key = self._norm_key(key)
+        lo, hi = parse_ts(since), parse_ts(until)
+
+        legacy = self.read_json(key)
+        if isinstance(legacy, list):
+            for e in legacy:
+                if in_range(e, lo, hi):
+                    yield e
+
+        where = "key = ? AND id > ?"
+        bounds: List[Any] = []
+        if lo is not None:
+            where += " AND ts >= ?"
+            bounds.append(_ts_text(lo))
+        if hi is not None:
+            where += " AND ts < ?"
+            bounds.append(_ts_text(hi))
+
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT id, entry FROM logs WHERE {where} ORDER BY id LIMIT ?",
+                    (key, last_id, *bounds, int(batch_size)),
+                ).fetchall()
+            if not rows:
+                return
+            for r in rows:
+                yield json.loads(r["entry"])
+            last_id = rows[-1]["id"]
+
+
+def _ts_text(dt: Any) -> str:
+    # fixed width, so text order == time order inside SQLite
+    return dt.isoformat(timespec="microseconds")
+
+
+def _log_row(key: str, entry: Any) -> Tuple[str, Optional[str], str]:
+    ts = parse_ts(entry.get("ts")) if isinstance(entry, dict) else None
+    return key, _ts_text(ts) if ts else None, json.dumps(entry, ensure_ascii=False, default=str)
+
+
+# ----------------------------
+# fs tree -> sqlite migration
+# ----------------------------
+
+def _iter_tree(root: Path) -> Iterator[Tuple[str, Path]]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        top = Path(dirpath) == root
+        if top:
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        dirnames.sort()
+        for fn in sorted(filenames):
+            if top and fn.startswith(_OWN_FILES):  # db + its -wal/-shm files
+                continue
+            if fn.startswith(".") and fn.endswith(TMP_SUFFIX):
+                continue
+            p = Path(dirpath) / fn
+            yield p.relative_to(root).as_posix(), p
+
+
+def migrate_fs_tree(
+    src_root: str | Path,
+    dst: SqliteStorage,
+    *,
+    batch_size: int = 500,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """
+    Copy a FileStorage tree into `dst`: <key>.json files (also .json.gz/.json.zst)
+    become JSON documents (unparsable ones are kept as blobs), <key>.jsonl logs become log rows,
+    everything else becomes a blob under its file name. SQLite files at the top of
+    the tree are skipped and source files are left in place. Blobs above
+    dst.max_inline_blob are copied to dst's blob files.
+    Returns {"json": n, "logs": n, "blobs": n, "bytes": n}.
+    """
+    root = Path(src_root).expanduser().resolve()
+    stats = {"json": 0, "logs": 0, "blobs": 0, "bytes": 0}
+    docs: List[Tuple[str, str, float]] = []
+    blobs: List[Tuple[str, bytes, float]] = []
+    log_rows: List[Tuple[str, Optional[str], str]] = []
+    log_keys: List[Tuple[str]] = []
+
+    def flush() -> None:
+        if not dry_run and (docs or blobs or log_rows or log_keys):
+            with dst._lock:
+                dst._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    dst._conn.executemany("INSERT OR REPLACE INTO json_docs(key, data, updated) VALUES (?, ?, ?)", docs)
+                    dst._conn.executemany("INSERT OR REPLACE INTO blobs(name, data, updated) VALUES (?, ?, ?)", blobs)
+                    # a log is copied as a whole, so re-running the migration does not duplicate rows
+                    dst._conn.executemany("DELETE FROM logs WHERE key = ?", log_keys)
+                    dst._conn.executemany("INSERT INTO logs(key, ts, entry) VALUES (?, ?, ?)", log_rows)
+                    dst._conn.execute("COMMIT")
+                except BaseException:
+                    dst._conn.execute("ROLLBACK")
+                    raise
+        docs.clear()
+        blobs.clear()
+        log_rows.clear()
+        log_keys.clear()
+
+    for rel, p in _iter_tree(root):
+        st = p.stat()
+        if st.st_size > dst.max_inline_blob and not rel.endswith((*_JSON_SUFFIXES, ".jsonl")):
+            if not dry_run:
+                dst._put_file(rel, p)
+            stats["blobs"] += 1
+            stats["bytes"] += st.st_size
+            continue
+
+        data = p.read_bytes()
+        mtime = st.st_mtime
+        stats["bytes"] += len(data)
+
+        text: Optional[str] = None
+        suffix = next((s for s in _JSON_SUFFIXES if rel.endswith(s)), None)
+        if suffix is not None:
+            try:
+                raw = data.removeprefix(b"\xef\xbb\xbf")  # BOM from hand-edited files
+                text = json.dumps(loads(raw, suffix), ensure_ascii=False)
+            except Exception:
+                text = None
+
+        if text is not None:
+            docs.append((rel[: -len(suffix)], text, mtime))
+            stats["json"] += 1
+        elif rel.endswith(".jsonl"):
+            key = rel[: -len(".jsonl")]
+            log_keys.append((key,))
+            for raw in data.splitlines():
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    continue
+                log_rows.append(_log_row(key, entry))
+                stats["logs"] += 1
+        else:
+            blobs.append((rel, data, mtime))
+            stats["blobs"] += 1
+
+        if len(docs) + len(blobs) + len(log_rows) >= batch_size:
+            flush()
+
+    flush()
+    return stats
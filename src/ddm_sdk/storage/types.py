@@ -1,7 +1,14 @@
 # src/ddm_sdk/storage/capabilities.py
 from __future__ import annotations
-from typing import Protocol
+from typing import Any, Callable, Iterator, Optional, Protocol
 
 class BytesStorage(Protocol):
     def write_bytes(self, key: str, data: bytes, *, ext: str = ".bin") -> str: ...
     def read_bytes(self, key: str, *, ext: str = ".bin") -> bytes | None: ...
+
+class LogStorage(Protocol):
+    def append(self, key: str, entry: Any, *, fsync: bool = False) -> str: ...
+    def iter_log(self, key: str, *, since: Any = None, until: Any = None) -> Iterator[Any]: ...
+
+class UpdatableStorage(Protocol):
+    def update_json(self, key: str, fn: Callable[[Optional[Any]], Any]) -> Any: ...
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import IO, AsyncIterable, Iterable, Iterator, List, Tuple, Union
+
+from ..storage._files import atomic_write
+
+# ----------------------------
+# ZIP downloads without holding the archive in memory
+#
+# The response body is spooled to a temp file (the ZIP central directory sits at
+# the end, so members cannot be located before the whole body is there), then
+# either renamed into place or extracted. Extraction runs on a thread pool with
+# one ZipFile handle per worker; zlib releases the GIL, so deflated members
+# inflate in parallel. zipfile verifies each member's CRC-32 when it is read to
+# the end, and every member is written through a temp file + rename, so a bad
+# entry raises BadZipFile and never shows up as a (truncated) file.
+# ----------------------------
+
+ZIP_CHUNK_SIZE = 1024 * 1024
+SPOOL_SUFFIX = ".zip.part"
+
+PathLike = Union[str, Path]
+
+
+class UnsafeArchivePath(ValueError):
+    """A member name that would land outside the extraction directory ("zip slip")."""
+
+    def __init__(self, name: str):
+        super().__init__(f"Refusing to extract archive member outside the target directory: {name!r}")
+        self.name = name
+
+
+@dataclass(frozen=True)
+class ArchiveResult:
+    path: str                     # the .zip, or the directory it was extracted into
+    bytes: int                    # size of the downloaded archive
+    sha256: str                   # of the downloaded archive
+    members: Tuple[str, ...] = ()  # extracted files ("/"-separated, relative to path)
+
+
+def member_path(dest: Path, name: str) -> Path:
+    """
+    Where member `name` goes under `dest`. Absolute names, drive letters and ".."
+    components are rejected instead of being normalized away.
+    """
+    parts = name.replace("\\", "/").split("/")
+    if name.startswith(("/", "\\")) or ":" in parts[0] or ".." in parts:
+        raise UnsafeArchivePath(name)
+    clean = [p for p in parts if p not in ("", ".")]
+    if not clean:
+        raise UnsafeArchivePath(name)
+    return dest.joinpath(*clean)
+
+
+# ---- spooling ----
+
+
+def spool(chunks: Iterable[bytes], *, dir: PathLike | None = None) -> Tuple[Path, int, str]:
+    """
+    Write `chunks` to a new temp file (in `dir`, default the system temp dir).
+    Returns (path, bytes, sha256); the caller owns and removes the file.
+    """
+    h = hashlib.sha256()
+    nbytes = 0
+    fd, tmp = tempfile.mkstemp(dir=dir, prefix=".ddm-", suffix=SPOOL_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                h.update(chunk)
+                nbytes += len(chunk)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return Path(tmp), nbytes, h.hexdigest()
+
+
+async def aspool(chunks: AsyncIterable[bytes], *, dir: PathLike | None = None) -> Tuple[Path, int, str]:
+    """spool() for an async body; file writes run in a worker thread."""
+    h = hashlib.sha256()
+    nbytes = 0
+    fd, tmp = tempfile.mkstemp(dir=dir, prefix=".ddm-", suffix=SPOOL_SUFFIX)
+    try:
+        f = os.fdopen(fd, "wb")
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(f.write, chunk)
+                h.update(chunk)
+                nbytes += len(chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return Path(tmp), nbytes, h.hexdigest()
+
+
+# ---- reading ----
+
+
+def iter_zip_members(source: Union[PathLike, IO[bytes]]) -> Iterator[Tuple[zipfile.ZipInfo, IO[bytes]]]:
+    """
+    Yield (ZipInfo, file object) for every file in the archive, in archive order.
+    Each file object is only valid until the next item; reading it to the end
+    verifies the member's CRC (zipfile.BadZipFile on mismatch).
+    """
+    with zipfile.ZipFile(source) as zf:
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            with zf.open(info) as f:
+                yield info, f
+
+
+def iter_spooled_members(
+    chunks: Iterable[bytes], *, dir: PathLike | None = None
+) -> Iterator[Tuple[zipfile.ZipInfo, IO[bytes]]]:
+    """iter_zip_members() over a streamed body; the spool file is removed when the iterator closes."""
+    path, _, _ = spool(chunks, dir=dir)
+    try:
+        yield from iter_zip_members(path)
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def extract_zip(
+    source: PathLike,
+    dest: PathLike,
+    *,
+    workers: int = 4,
+    chunk_size: int = ZIP_CHUNK_SIZE,
+) -> List[str]:
+    """
+    Extract every member of the ZIP at `source` into `dest` with up to `workers`
+    threads. All names are checked before anything is written. Returns the
+    extracted file names (archive order); the first failing member stops new work
+    and its error is raised once the running ones finished.
+    """
+    dest = Path(dest)
+    with zipfile.ZipFile(source) as zf:
+        infos = zf.infolist()
+
+    todo: List[Tuple[zipfile.ZipInfo, Path]] = []
+    for info in infos:
+        target = member_path(dest, info.filename)
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            todo.append((info, target))
+
+    local = threading.local()
+    handles: List[zipfile.ZipFile] = []
+    handles_lock = threading.Lock()
+
+    def _handle() -> zipfile.ZipFile:
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = zipfile.ZipFile(source)
+            with handles_lock:
+                handles.append(zf)
+        return zf
+
+    def _one(info: zipfile.ZipInfo, target: Path) -> None:
+        with _handle().open(info) as src:
+            atomic_write(target, lambda f: shutil.copyfileobj(src, f, chunk_size))
+
+    # largest first, so one big member does not start last
+    pending = iter(sorted(todo, key=lambda t: t[0].file_size, reverse=True))
+    workers = max(1, min(int(workers), len(todo) or 1))
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ddm-unzip") as pool:
+            inflight = {pool.submit(_one, *t) for t in islice(pending, workers)}
+            while inflight:
+                done, inflight = wait(inflight, return_when=FIRST_EXCEPTION)
+                errors = [f.exception() for f in done if f.exception() is not None]
+                if errors:
+                    wait(inflight)
+                    raise errors[0]
+                inflight |= {pool.submit(_one, *t) for t in islice(pending, len(done))}
+    finally:
+        for zf in handles:
+            zf.close()
+
+    return [info.filename for info, _ in todo]
+
+
+# ---- download helpers used by the *_to API methods ----
+
+
+def _finish(spooled: Path, nbytes: int, digest: str, dest: Path, *, extract: bool, workers: int) -> ArchiveResult:
+    try:
+        if not extract:
+            os.replace(spooled, dest)
+            return ArchiveResult(path=str(dest), bytes=nbytes, sha256=digest)
+        members = extract_zip(spooled, dest, workers=workers)
+    finally:
+        spooled.unlink(missing_ok=True)
+    return ArchiveResult(path=str(dest), bytes=nbytes, sha256=digest, members=tuple(members))
+
+
+def _prepare(dest: PathLike, extract: bool) -> Tuple[Path, Path]:
+    """(resolved dest, spool dir): spool next to the .zip, or inside the extraction dir."""
+    out = Path(dest).expanduser().resolve()
+    spool_dir = out if extract else out.parent
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    return out, spool_dir
+
+
+def save_archive(chunks: Iterable[bytes], dest: PathLike, *, extract: bool = False, workers: int = 4) -> ArchiveResult:
+    """
+    Store a streamed ZIP body at `dest` (a .zip path), or with extract=True extract
+    it into the directory `dest`. Nothing appears at `dest` unless the whole body
+    arrived (and, when extracting, per member once its CRC checked out).
+    """
+    out, spool_dir = _prepare(dest, extract)
+    spooled, nbytes, digest = spool(chunks, dir=spool_dir)
+    return _finish(spooled, nbytes, digest, out, extract=extract, workers=workers)
+
+
+async def asave_archive(
+    chunks: AsyncIterable[bytes], dest: PathLike, *, extract: bool = False, workers: int = 4
+) -> ArchiveResult:
+    """save_archive() for an async body; extraction runs in a worker thread."""
+    out, spool_dir = _prepare(dest, extract)
+    spooled, nbytes, digest = await aspool(chunks, dir=spool_dir)
+    return await asyncio.to_thread(_finish, spooled, nbytes, digest, out, extract=extract, workers=workers)
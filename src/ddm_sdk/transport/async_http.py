@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import asyncio
+import json as _json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .errors import ApiError, make_api_error
+from .multipart import MultipartEncoder
+from .retry import RetryPolicy, replayable
+
+
+def _require_aiohttp():
+    try:
+        import aiohttp
+    except ImportError as e:  # optional dependency
+        raise ImportError(
+            "AsyncHttpTransport needs aiohttp. Install it with: pip install 'ddm-sdk[async]'"
+        ) from e
+    return aiohttp
+
+
+def _query_pairs(params: Optional[Dict[str, Any]]) -> Optional[List[Tuple[str, str]]]:
+    """
+    Encode params the way requests does: None dropped, lists repeated, everything str().
+    (aiohttp itself rejects list values and encodes bools differently.)
+    """
+    if not params:
+        return None
+    out: List[Tuple[str, str]] = []
+    for k, v in params.items():
+        if v is None:
+            continue
+        if isinstance(v, (list, tuple)):
+            out.extend((k, str(x)) for x in v if x is not None)
+        else:
+            out.append((k, str(v)))
+    return out
+
+
+def multipart_body(enc: MultipartEncoder) -> Tuple[AsyncIterator[bytes], Dict[str, str]]:
+    """
+    (data, headers) to send a MultipartEncoder through AsyncHttpTransport: blocks are
+    read in a worker thread (disk I/O stays off the event loop) and Content-Length is
+    set, so the body is not sent chunked.
+    """
+
+    async def blocks() -> AsyncIterator[bytes]:
+        while True:
+            block = await asyncio.to_thread(enc.read, enc.block_size)
+            if not block:
+                break
+            yield block
+
+    return blocks(), {"Content-Type": enc.content_type, "Content-Length": str(len(enc))}
+
+
+class AsyncHttpTransport:
+    """
+    asyncio counterpart of HttpTransport (aiohttp based, imported lazily).
+
+    Same URL/header handling, retry policy and status -> ApiError mapping; at most
+    `max_concurrency` requests are in flight at once (extra calls wait on a
+    semaphore), so callers can gather() hundreds of calls safely.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: Optional[str] = None,
+        timeout: int = 240,
+        *,
+        max_concurrency: int = 16,
+        retry: Optional[RetryPolicy] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.retry = retry if retry is not None else RetryPolicy()
+        self._session = None
+        self._sem: Optional[asyncio.Semaphore] = None
+
+    def set_token(self, token: Optional[str]) -> None:
+        self.token = token
+
+    def _headers(
+        self,
+        extra: Optional[Dict[str, str]] = None,
+        *,
+        auth: bool = True,
+    ) -> Dict[str, str]:
+        h: Dict[str, str] = {"Accept": "application/json"}
+        if auth and self.token:
+            h["Authorization"] = f"Bearer {self.token}"
+        if extra:
+            h.update(extra)
+        return h
+
+    def _normalize_path(self, path: str) -> str:
+        return path if path.startswith("/") else f"/{path}"
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            aiohttp = _require_aiohttp()
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            )
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]],
+        json: Any,
+        headers: Optional[Dict[str, str]],
+        data: Any,
+        auth: bool,
+        timeout: Any = None,
+    ):
+        aiohttp = _require_aiohttp()
+        session = self._get_session()
+        kwargs: Dict[str, Any] = {
+            "params": _query_pairs(params),
+            "headers": self._headers(headers, auth=auth),
+            "data": data,
+        }
+        if json is not None:
+            kwargs["json"] = json
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        retry = self.retry if replayable(data) else RetryPolicy.disabled()
+        attempt = 0
+        while True:
+            try:
+                r = await session.request(method, f"{self.base_url}{path}", **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if retry.can_retry(method, attempt):
+                    await asyncio.sleep(retry.backoff(attempt))
+                    attempt += 1
+                    continue
+                raise ApiError(status_code=0, message=str(e) or type(e).__name__, response_text=None) from e
+
+            if retry.retry_status(method, r.status, attempt):
+                delay = retry.backoff(attempt, r.headers.get("Retry-After"))
+                r.release()
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            return r
+
+    async def _raise_for_status(self, r: Any, method: str, path: str) -> None:
+        body = await r.read()
+        raise make_api_error(
+            r.status,
+            method,
+            path,
+            content_type=r.headers.get("Content-Type", ""),
+            body=body,
+            text=body.decode("utf-8", errors="replace"),
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Any = None,
+        auth: bool = True,
+    ) -> Any:
+        path = self._normalize_path(path)
+        self._get_session()
+
+        async with self._sem:
+            r = await self._send(method, path, params=params, json=json, headers=headers, data=data, auth=auth)
+            async with r:
+                if 200 <= r.status < 300:
+                    body = await r.read()
+                    if not body:
+                        return None
+                    if "application/json" in r.headers.get("Content-Type", ""):
+                        return _json.loads(body)
+                    return body
+
+                await self._raise_for_status(r, method, path)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Any = None,
+        auth: bool = True,
+    ) -> AsyncIterator[Any]:
+        """
+        Like request(), but yields the open aiohttp response (body not read):
+
+            async with http.stream("GET", "/ddm/file/<id>") as r:
+                async for chunk in r.content.iter_chunked(1024 * 1024):
+                    ...
+
+        The transport timeout applies to connecting/reading, not the whole transfer.
+        """
+        path = self._normalize_path(path)
+        self._get_session()
+        aiohttp = _require_aiohttp()
+
+        async with self._sem:
+            r = await self._send(
+                method,
+                path,
+                params=params,
+                json=json,
+                headers=headers,
+                data=data,
+                auth=auth,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout),
+            )
+            async with r:
+                if not 200 <= r.status < 300:
+                    await self._raise_for_status(r, method, path)
+                yield r
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncHttpTransport":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union
+from urllib.parse import urlencode
+
+from ..storage._files import atomic_write_bytes
+
+# ----------------------------
+# Opt-in response cache for GET endpoints that rarely change.
+#
+# Only paths matching a rule are cached. Server headers win: Cache-Control
+# no-store / no-cache / max-age, and ETag / Last-Modified for conditional
+# revalidation (a 304 refreshes the stored copy). Without them the rule's TTL
+# applies. Entries live in a small in-memory LRU and, when `directory` is set,
+# on disk so they survive between script runs.
+# ----------------------------
+
+# directory under the storage root used by DdmClient.from_env()
+HTTP_CACHE_DIR = "http_cache"
+
+# (path regex, TTL seconds used when the server sends no freshness info)
+DEFAULT_RULES: Tuple[Tuple[str, float], ...] = (
+    (r"^/ddm/parametrics/", 24 * 3600),
+    (r"^/ddm/blockchain/contracts/registry$", 3600),
+    (r"^/ddm/blockchain/contracts/[^/]+$", 3600),
+    (r"^/ddm/expectations/suites/[^/]+$", 600),
+    (r"^/ddm/file_metadata/report/[^/]+$", 600),
+)
+
+# request headers that change the response; part of the cache key
+VARY_HEADERS = ("Accept", "X-Fields")
+
+# response headers worth keeping with an entry
+_KEEP_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Expires")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0           # served from cache without a request
+    revalidated: int = 0    # 304 Not Modified: served from cache after a conditional GET
+    misses: int = 0         # fetched in full
+    stores: int = 0         # responses written to the cache
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses, "stores": self.stores}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    expires_at: float               # fresh until then (0 = always revalidate)
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("Content-Type", "")
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a conditional GET."""
+        h: Dict[str, str] = {}
+        if self.headers.get("ETag"):
+            h["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            h["If-Modified-Since"] = self.headers["Last-Modified"]
+        return h
+
+
+def _cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    out: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        k, _, v = part.partition("=")
+        out[k.strip().lower()] = v.strip().strip('"') or None
+    return out
+
+
+def _expires(headers: Mapping[str, str], now: float) -> Optional[float]:
+    raw = headers.get("Expires")
+    if not raw:
+        return None
+    try:
+        return parsedate_to_datetime(raw).timestamp()
+    except (TypeError, ValueError):
+        return now  # invalid Expires means "already expired"
+
+
+class HttpCache:
+    """
+    Response cache used by HttpTransport.request() for GETs matching `rules`
+    (defaults: parametrics, contract registry/ABI, suites, metadata reports).
+
+        cache = HttpCache(directory=storage_root / "http_cache")
+        client = DdmClient(base_url=..., http_cache=cache)
+        ...
+        cache.stats.as_dict()   # {"hits": .., "revalidated": .., "misses": .., "stores": ..}
+
+    Entries are keyed by URL, query and a hash of the bearer token, so users never
+    see each other's responses and the token itself is never written to disk.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: Optional[Union[str, Path]] = None,
+        max_entries: int = 256,
+        rules: Sequence[Tuple[str, float]] = DEFAULT_RULES,
+    ):
+        self.directory = Path(directory) if directory is not None else None
+        self.max_entries = max(1, int(max_entries))
+        self.rules = [(re.compile(p), float(ttl)) for p, ttl in rules]
+        self.stats = CacheStats()
+        self._mem: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ---- policy ----
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """TTL of the first matching rule, or None if the path is not cached at all."""
+        for rx, ttl in self.rules:
+            if rx.search(path):
+                return ttl
+        return None
+
+    def key(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        token: Optional[str],
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        """Entry key: URL, params, caller (token) and the VARY_HEADERS of the request."""
+        items = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+        who = hashlib.sha256(token.encode("utf-8")).hexdigest() if token else "-"
+        lower = {k.lower(): v for k, v in (headers or {}).items() if v is not None}
+        vary = [(h, str(lower[h.lower()])) for h in VARY_HEADERS if h.lower() in lower]
+        raw = f"GET {url}?{urlencode(items)} {who}" + (f" {urlencode(vary)}" if vary else "")
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def build_entry(
+        self,
+        path: str,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        *,
+        now: Optional[float] = None,
+    ) -> Optional[CachedResponse]:
+        """Cache entry for a 200 response, or None when it must not be stored."""
+        ttl = self.ttl_for(path)
+        if ttl is None or status != 200:
+            return None
+        now = now if now is not None else time.time()
+        cc = _cache_control(headers.get("Cache-Control"))
+        if "no-store" in cc:
+            return None
+
+        has_validators = bool(headers.get("ETag") or headers.get("Last-Modified"))
+        max_age = cc.get("max-age")
+        expires = _expires(headers, now)
+        if "no-cache" in cc:
+            expires_at = 0.0
+        elif max_age is not None:
+            try:
+                expires_at = now + max(0.0, float(max_age))
+            except ValueError:
+                expires_at = now
+        elif expires is not None:
+            expires_at = expires
+        else:
+            expires_at = now + ttl
+
+        if expires_at <= now and not has_validators:
+            return None  # would never be usable
+        kept = {h: headers[h] for h in _KEEP_HEADERS if headers.get(h)}
+        return CachedResponse(status=status, headers=kept, body=bytes(body), expires_at=expires_at, stored_at=now)
+
+    def refreshed(self, path: str, entry: CachedResponse, headers: Mapping[str, str]) -> CachedResponse:
+        """Entry after a 304: same body, validators/freshness from the new headers."""
+        merged = dict(entry.headers)
+        merged.update({h: headers[h] for h in _KEEP_HEADERS if h != "Content-Type" and headers.get(h)})
+        fresh = self.build_entry(path, 200, merged, entry.body)
+        return fresh if fresh is not None else replace(entry, expires_at=0.0, stored_at=time.time())
+
+    # ---- storage ----
+
+    def _file(self, key: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                self._mem.move_to_end(key)
+                return entry
+        entry = self._load(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        self._remember(key, entry)
+        self._save(key, entry)
+        with self._lock:
+            self.stats.stores += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+        if self.directory is not None and self.directory.is_dir():
+            for p in self.directory.glob("*/*"):
+                p.unlink(missing_ok=True)
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._mem[key] = entry
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.max_entries:
+                self._mem.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[CachedResponse]:
+        # file = one JSON header line + raw body
+        p = self._file(key)
+        if p is None:
+            return None
+        try:
+            raw = p.read_bytes()
+            head, _, body = raw.partition(b"\n")
+            meta = json.loads(head)
+            return CachedResponse(
+                status=int(meta["status"]),
+                headers=dict(meta["headers"]),
+                body=body,
+                expires_at=float(meta["expires_at"]),
+                stored_at=float(meta["stored_at"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save(self, key: str, entry: CachedResponse) -> None:
+        p = self._file(key)
+        if p is None:
+            return
+        head = json.dumps(
+            {"status": entry.status, "headers": entry.headers, "expires_at": entry.expires_at, "stored_at": entry.stored_at},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        try:
+            atomic_write_bytes(p, head + b"\n" + entry.body)
+        except OSError:
+            pass  # the disk copy is best effort; memory still has the entry
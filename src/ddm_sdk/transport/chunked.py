@@ -0,0 +1,511 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .errors import ApiError
+from .multipart import BytesSource, count_chunks, read_bytes
+
+
+# ----------------------------
+# chunked (resumable) upload engine used by FileAPI.upload_async
+# ----------------------------
+
+MANIFEST_PREFIX = "uploads/async"
+
+# send(chunk_index, chunk_bytes, file_id) -> response with a .file_id attribute
+ChunkSender = Callable[[int, bytes, Optional[str]], Any]
+ProgressFn = Callable[[int, int], None]
+
+
+class ChunkReader:
+    """
+    Random access to fixed-size chunks of a source without loading it whole.
+
+    Paths are read with os.pread (seek+read under a lock where pread is missing,
+    e.g. Windows) or through a read-only mmap; seekable file objects are read under
+    a lock. Non-seekable streams are buffered, since chunks must be re-readable.
+    """
+
+    def __init__(self, source: BytesSource, chunk_size: int, *, use_mmap: bool = False):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be > 0")
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._map: Optional[mmap.mmap] = None
+        self._obj: Any = None
+        self._base = 0
+        self._data: Optional[memoryview] = None
+
+        if isinstance(source, str):
+            self.path: Optional[str] = os.path.abspath(source)
+            self._fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            self.size = os.fstat(self._fd).st_size
+            if use_mmap and self.size > 0:
+                self._map = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+            return
+
+        self.path = None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self._data = memoryview(source)
+            self.size = len(self._data)
+            return
+
+        try:
+            self._base = source.tell()
+            self.size = source.seek(0, os.SEEK_END) - self._base
+            source.seek(self._base)
+            self._obj = source
+        except Exception:
+            self._data = memoryview(read_bytes(source))
+            self.size = len(self._data)
+
+    @property
+    def total_chunks(self) -> int:
+        return count_chunks(self.size, self.chunk_size)
+
+    def read(self, index: int) -> bytes:
+        start = index * self.chunk_size
+        n = max(0, min(self.chunk_size, self.size - start))
+        if n == 0:
+            return b""
+
+        if self._data is not None:
+            return bytes(self._data[start : start + n])
+        if self._map is not None:
+            return self._map[start : start + n]
+        if self._fd is not None:
+            if hasattr(os, "pread"):
+                out = os.pread(self._fd, n, start)
+            else:
+                with self._lock:
+                    os.lseek(self._fd, start, os.SEEK_SET)
+                    out = os.read(self._fd, n)
+        else:
+            with self._lock:
+                self._obj.seek(self._base + start)
+                out = self._obj.read(n)
+
+        if len(out) != n:
+            raise IOError(f"short read for chunk {index}: {len(out)}/{n} bytes (file changed during upload?)")
+        return out
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "ChunkReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+@dataclass
+class UploadManifest:
+    """
+    Resume state stored under uploads/async/<key>.
+
+    acked are the chunk indices the server confirmed, hashes the sha256 of every
+    acknowledged chunk (used to detect that the local file changed in between).
+    """
+
+    project_id: str
+    filename: str
+    path: Optional[str]
+    size: int
+    chunk_size: int
+    total_chunks: int
+    file_id: Optional[str] = None
+    acked: List[int] = field(default_factory=list)
+    hashes: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "UploadManifest":
+        return cls(
+            project_id=str(d["project_id"]),
+            filename=str(d["filename"]),
+            path=d.get("path"),
+            size=int(d["size"]),
+            chunk_size=int(d["chunk_size"]),
+            total_chunks=int(d["total_chunks"]),
+            file_id=d.get("file_id"),
+            acked=sorted(int(i) for i in d.get("acked") or []),
+            hashes={str(k): str(v) for k, v in (d.get("hashes") or {}).items()},
+        )
+
+
+def manifest_key(*, project_id: str, filename: str, path: str) -> str:
+    """
+    Storage key of the resume manifest for a local file; size and mtime are part of
+    the identity so an edited file never resumes onto stale server-side chunks.
+    The chunk size is not: a resumed upload keeps the size it was started with.
+    """
+    st = os.stat(path)
+    ident = f"{project_id}|{os.path.abspath(path)}|{filename}|{st.st_size}|{st.st_mtime_ns}"
+    return f"{MANIFEST_PREFIX}/{hashlib.sha1(ident.encode('utf-8')).hexdigest()}"
+
+
+class ChunkedUpload:
+    """
+    Upload chunks 0..N-1 through `send`:
+
+      1) chunk 0 alone (the server assigns file_id on it),
+      2) the middle chunks with up to `concurrency` requests in flight,
+      3) the last chunk once every other chunk is acknowledged (it triggers the merge).
+
+    With a storage and manifest_key, progress is persisted after every acknowledged
+    chunk, so a later run with the same key only sends what is missing. The manifest
+    is removed once the upload completes.
+    """
+
+    def __init__(
+        self,
+        reader: ChunkReader,
+        send: ChunkSender,
+        *,
+        project_id: str,
+        filename: str,
+        concurrency: int = 1,
+        storage: Any = None,
+        manifest_key: Optional[str] = None,
+        on_progress: Optional[ProgressFn] = None,
+        tuner: Optional["ChunkSizeTuner"] = None,
+        save_interval: float = 1.0,
+    ):
+        self.reader = reader
+        self.tuner = tuner
+        self.save_interval = save_interval
+        self._saved_at = 0.0
+        self.send = send
+        self.concurrency = max(1, int(concurrency))
+        self.storage = storage if manifest_key else None
+        self.manifest_key = manifest_key
+        self.on_progress = on_progress
+        self._lock = threading.Lock()
+        self.resumed = False
+        self.manifest = self._load_manifest() or self._new_manifest(project_id, filename)
+
+    def _new_manifest(self, project_id: str, filename: str) -> UploadManifest:
+        return UploadManifest(
+            project_id=project_id,
+            filename=filename,
+            path=self.reader.path,
+            size=self.reader.size,
+            chunk_size=self.reader.chunk_size,
+            total_chunks=self.reader.total_chunks,
+        )
+
+    def _load_manifest(self) -> Optional[UploadManifest]:
+        if not self.storage:
+            return None
+        d = self.storage.read_json(self.manifest_key)
+        if not isinstance(d, dict):
+            return None
+        try:
+            m = UploadManifest.from_dict(d)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        last = m.total_chunks - 1
+        if (
+            not m.file_id
+            or m.size != self.reader.size
+            or m.chunk_size != self.reader.chunk_size
+            or last in m.acked
+            or not self._hash_ok(m, 0)
+        ):
+            self.storage.delete(self.manifest_key)
+            return None
+
+        self.resumed = True
+        return m
+
+    def _hash_ok(self, m: UploadManifest, index: int) -> bool:
+        want = m.hashes.get(str(index))
+        return want is None or hashlib.sha256(self.reader.read(index)).hexdigest() == want
+
+    def _snapshot(self, force: bool) -> Optional[Dict[str, Any]]:
+        # the manifest grows with the chunk count, so rewrite it at most every
+        # save_interval seconds (and always on file_id / failure); losing the last
+        # interval on a crash only means re-sending those chunks
+        if not self.storage:
+            return None
+        now = time.monotonic()
+        if not (force or now - self._saved_at >= self.save_interval):
+            return None
+        self._saved_at = now
+        return asdict(self.manifest)
+
+    def _save(self, *, force: bool = False) -> None:
+        data = self._snapshot(force)
+        if data is not None:
+            self.storage.write_json(self.manifest_key, data)
+
+    def _ack(self, index: int, chunk: bytes, digest: str, resp: Any, seconds: float) -> bool:
+        """Add an acknowledged chunk to the manifest; True for the chunk that brought file_id."""
+        if self.tuner is not None:
+            self.tuner.observe(len(chunk), seconds)
+        m = self.manifest
+        first = m.file_id is None
+        if first:
+            fid = getattr(resp, "file_id", None)
+            if not fid:
+                raise ValueError(f"Server did not return file_id for chunk {index}")
+            m.file_id = fid
+        m.acked.append(index)
+        m.hashes[str(index)] = digest
+        return first
+
+    def _record(self, index: int, chunk: bytes, resp: Any, seconds: float) -> None:
+        digest = hashlib.sha256(chunk).hexdigest()
+        with self._lock:
+            self._save(force=self._ack(index, chunk, digest, resp, seconds))
+            done = len(self.manifest.acked)
+
+        if self.on_progress:
+            self.on_progress(done, self.manifest.total_chunks)
+
+    def _send_one(self, index: int) -> Any:
+        chunk = self.reader.read(index)
+        t0 = time.perf_counter()
+        resp = self.send(index, chunk, self.manifest.file_id)
+        self._record(index, chunk, resp, time.perf_counter() - t0)
+        return resp
+
+    def _plan(self) -> Tuple[int, List[int]]:
+        total = self.manifest.total_chunks
+        if total == 0:
+            raise ValueError("Empty upload; no chunks were sent")
+        acked = set(self.manifest.acked)
+        return total, [i for i in range(1, total - 1) if i not in acked]
+
+    def _finish(self) -> None:
+        if self.storage:
+            self.storage.delete(self.manifest_key)
+
+    def run(self) -> Any:
+        try:
+            return self._run()
+        except BaseException:
+            self._save(force=True)
+            raise
+
+    def _run(self) -> Any:
+        total, middle = self._plan()
+        last_resp: Any = None
+
+        if 0 not in self.manifest.acked:
+            last_resp = self._send_one(0)
+
+        if middle:
+            # sliding window: at most `concurrency` chunks read/in flight, nothing new
+            # is started once a chunk failed (the manifest keeps what was acknowledged)
+            todo = iter(middle)
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="ddm-chunk") as pool:
+                inflight = {pool.submit(self._send_one, i) for i in islice(todo, self.concurrency)}
+                while inflight:
+                    done, inflight = wait(inflight, return_when=FIRST_EXCEPTION)
+                    errors = [f.exception() for f in done if f.exception() is not None]
+                    if errors:
+                        wait(inflight)
+                        raise errors[0]
+                    inflight |= {pool.submit(self._send_one, i) for i in islice(todo, len(done))}
+
+        if total > 1:
+            last_resp = self._send_one(total - 1)
+
+        self._finish()
+        return last_resp
+
+
+class AsyncChunkedUpload(ChunkedUpload):
+    """
+    asyncio variant of ChunkedUpload: same ordering, manifest and tuner handling,
+    `send` is a coroutine function. Chunk reads, hashing and manifest writes run in
+    worker threads, so storage I/O never blocks the event loop.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._save_lock = asyncio.Lock()  # manifest snapshots reach storage in the order taken
+
+    def _read_hashed(self, index: int) -> Tuple[bytes, str]:
+        chunk = self.reader.read(index)
+        return chunk, hashlib.sha256(chunk).hexdigest()
+
+    async def _save_async(self, *, force: bool = False) -> None:
+        data = self._snapshot(force)
+        if data is not None:
+            async with self._save_lock:
+                await asyncio.to_thread(self.storage.write_json, self.manifest_key, data)
+
+    async def _send_one_async(self, index: int) -> Any:
+        chunk, digest = await asyncio.to_thread(self._read_hashed, index)
+        t0 = time.perf_counter()
+        resp = await self.send(index, chunk, self.manifest.file_id)
+        # no await between updating the manifest and taking the snapshot
+        first = self._ack(index, chunk, digest, resp, time.perf_counter() - t0)
+        await self._save_async(force=first)
+        if self.on_progress:
+            self.on_progress(len(self.manifest.acked), self.manifest.total_chunks)
+        return resp
+
+    async def run(self) -> Any:  # type: ignore[override]
+        try:
+            return await self._run_async()
+        except BaseException:
+            await self._save_async(force=True)
+            raise
+
+    async def _run_async(self) -> Any:
+        total, middle = self._plan()
+        last_resp: Any = None
+
+        if 0 not in self.manifest.acked:
+            last_resp = await self._send_one_async(0)
+
+        todo = iter(middle)
+        inflight = {asyncio.ensure_future(self._send_one_async(i)) for i in islice(todo, self.concurrency)}
+        try:
+            while inflight:
+                done, inflight = await asyncio.wait(inflight, return_when=asyncio.FIRST_EXCEPTION)
+                for t in done:
+                    t.result()
+                inflight |= {asyncio.ensure_future(self._send_one_async(i)) for i in islice(todo, len(done))}
+        finally:
+            for t in inflight:
+                t.cancel()
+            if inflight:
+                await asyncio.wait(inflight)
+
+        if total > 1:
+            last_resp = await self._send_one_async(total - 1)
+
+        await asyncio.to_thread(self._finish)
+        return last_resp
+
+
+@dataclass
+class ChunkSizeTuner:
+    """
+    Picks the chunk size for the next upload from measured per-chunk timings.
+
+    Each acknowledged chunk gives a sample (bytes, seconds). A least-squares fit of
+    seconds = rtt + bytes / throughput over the last `window` samples yields the fixed
+    per-request cost and the per-stream throughput. suggest() then aims for chunks
+    large enough that rtt is at most (1 - efficiency) of a request, capped so that one
+    chunk is sent within `safety` x `timeout` and bounded by [min_size, max_size]
+    (max_size = what the server accepts per request). Steps are limited to x2 / /2
+    per upload to stay stable on noisy links.
+
+    The backend fixes total_chunks with chunk 0, so a size only changes between
+    uploads; the state round-trips through to_dict()/from_dict() for persistence.
+    """
+
+    chunk_size: int = 2 * 1024 * 1024
+    min_size: int = 256 * 1024
+    max_size: int = 64 * 1024 * 1024
+    timeout: Optional[float] = None
+    safety: float = 0.5
+    efficiency: float = 0.9
+    window: int = 32
+    align: int = 64 * 1024
+    samples: List[Tuple[int, float]] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def observe(self, nbytes: int, seconds: float) -> None:
+        if nbytes <= 0 or seconds <= 0:
+            return
+        with self._lock:
+            self.samples.append((int(nbytes), float(seconds)))
+            del self.samples[: -self.window]
+
+    def model(self) -> Tuple[Optional[float], Optional[float]]:
+        """(throughput bytes/s, rtt seconds); rtt is None until samples of different sizes exist."""
+        with self._lock:
+            xs = [float(n) for n, _ in self.samples]
+            ys = [t for _, t in self.samples]
+        if not xs:
+            return None, None
+
+        avg_bw = sum(xs) / sum(ys)
+        mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+        sxx = sum((x - mx) ** 2 for x in xs)
+        if len(xs) < 2 or sxx <= (0.05 * mx) ** 2 * len(xs):
+            return avg_bw, None
+
+        slope = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+        if slope <= 0:
+            return avg_bw, None
+        return 1.0 / slope, max(0.0, my - slope * mx)
+
+    def suggest(self) -> int:
+        """Compute, store and return the chunk size for the next upload."""
+        bw, rtt = self.model()
+        if bw is None:
+            return self.chunk_size
+
+        cur = self.chunk_size
+        if rtt is None:
+            # one size seen so far: probe upwards so the fit gets a second point
+            ideal = cur * 2.0
+        else:
+            ideal = rtt * bw * self.efficiency / (1.0 - self.efficiency)
+        if self.timeout:
+            ideal = min(ideal, self.timeout * self.safety * bw)
+
+        ideal = min(max(ideal, cur / 2.0), cur * 2.0)
+        ideal = min(max(ideal, self.min_size), self.max_size)
+        self.chunk_size = max(self.min_size, int(ideal) // self.align * self.align)
+        return self.chunk_size
+
+    def size_for(self, total_bytes: Optional[int], concurrency: int = 1) -> int:
+        """
+        Chunk size to use for one upload: the tuned size, shrunk for small files so
+        the parallel middle section still has at least `concurrency` chunks.
+        """
+        if not total_bytes or concurrency <= 1:
+            return self.chunk_size
+        cap = -(-total_bytes // (concurrency + 2))
+        cap = -(-cap // self.align) * self.align
+        return max(self.min_size, min(self.chunk_size, cap))
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = [list(s) for s in self.samples]
+        return {"chunk_size": self.chunk_size, "samples": samples}
+
+    def load(self, d: Optional[Dict[str, Any]]) -> "ChunkSizeTuner":
+        """Restore chunk_size/samples saved by to_dict(); bounds stay as configured."""
+        if isinstance(d, dict):
+            try:
+                size = int(d.get("chunk_size") or self.chunk_size)
+                samples = [(int(n), float(t)) for n, t in d.get("samples") or []]
+            except (TypeError, ValueError):
+                return self
+            self.chunk_size = min(max(size, self.min_size), self.max_size)
+            self.samples = samples[-self.window :]
+        return self
+
+
+def is_stale_upload_error(exc: BaseException) -> bool:
+    """
+    Errors that mean the server no longer knows a resumed file_id (expired/cleaned up
+    partial upload); the caller restarts from scratch instead of failing. A 400 is a
+    validation error on the chunk itself and is raised as is.
+    """
+    return isinstance(exc, ApiError) and exc.status_code in (404, 409, 410)
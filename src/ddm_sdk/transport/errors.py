@@ -1,6 +1,7 @@
 from __future__ import annotations
+import json
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Type
 
 
 @dataclass
@@ -34,5 +35,56 @@ class NotFound(ApiError):
     """404"""
 
 
+class Conflict(ApiError):
+    """409"""
+
+
 class ServerError(ApiError):
     """5xx"""
+
+
+# ----------------------------
+# status -> exception mapping shared by the sync and async transports
+# ----------------------------
+
+def exception_for_status(status_code: int) -> Type[ApiError]:
+    if status_code == 400:
+        return BadRequest
+    if status_code == 401:
+        return Unauthorized
+    if status_code == 403:
+        return Forbidden
+    if status_code == 404:
+        return NotFound
+    if status_code == 409:
+        return Conflict
+    if status_code >= 500:
+        return ServerError
+    return ApiError
+
+
+def extract_error_message(content_type: str, body: bytes, text: str) -> str:
+    """Server message from a JSON error body ({"message"|"error"|"detail": ...}), else the raw text."""
+    try:
+        if "application/json" in (content_type or "") and body:
+            payload = json.loads(body)
+            if isinstance(payload, dict):
+                return (
+                    payload.get("message")
+                    or payload.get("error")
+                    or payload.get("detail")
+                    or str(payload)
+                )
+    except Exception:
+        pass
+    return (text or "").strip()
+
+
+def make_api_error(status_code: int, method: str, path: str, *, content_type: str, body: bytes, text: str) -> ApiError:
+    exc = exception_for_status(status_code)
+    server_msg = extract_error_message(content_type, body, text)
+    return exc(
+        status_code=status_code,
+        message=f"{method} {path} failed" + (f": {server_msg}" if server_msg else ""),
+        response_text=text,
+    )
@@ -1,18 +1,59 @@
 from __future__ import annotations
 
+import json as _json
+import time
 from typing import Any, Dict, Optional
 import requests
+from requests.adapters import HTTPAdapter
 
-from .errors import ApiError, BadRequest, Unauthorized, Forbidden, NotFound, ServerError
+from .cache import HttpCache
+from .errors import ApiError, exception_for_status, extract_error_message, make_api_error
+from .retry import RetryPolicy, replayable
+
+# errors where the request may simply be sent again (if the method is idempotent)
+_RETRYABLE_EXC = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+
+def accept_encoding() -> str:
+    """gzip/deflate always; br only when a brotli decoder is installed (urllib3 uses it)."""
+    enc = ["gzip", "deflate"]
+    for mod in ("brotli", "brotlicffi"):
+        try:
+            __import__(mod)
+        except ImportError:
+            continue
+        enc.append("br")
+        break
+    return ", ".join(enc)
 
 
 class HttpTransport:
-    def __init__(self, base_url: str, token: Optional[str] = None, timeout: int = 240):
+    def __init__(
+        self,
+        base_url: str,
+        token: Optional[str] = None,
+        timeout: int = 240,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[HttpCache] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.timeout = timeout
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.cache = cache
         self.session = requests.Session()
 
+        # keep-alive pool sized for thread-pool callers (chunk uploads, parallel
+        # downloads): with the default maxsize=10 extra connections are opened and
+        # thrown away on every burst. Retries are done by us (see RetryPolicy).
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept-Encoding"] = accept_encoding()
+
     def set_token(self, token: Optional[str]) -> None:
         self.token = token
 
@@ -33,33 +74,10 @@ class HttpTransport:
         return path if path.startswith("/") else f"/{path}"
 
     def _pick_exc(self, status_code: int):
-        if status_code == 400:
-            return BadRequest
-        if status_code == 401:
-            return Unauthorized
-        if status_code == 403:
-            return Forbidden
-        if status_code == 404:
-            return NotFound
-        if status_code >= 500:
-            return ServerError
-        return ApiError
+        return exception_for_status(status_code)
 
     def _extract_error_message(self, r: requests.Response) -> str:
-        try:
-            ct = r.headers.get("Content-Type", "")
-            if "application/json" in ct and r.content:
-                payload = r.json()
-                if isinstance(payload, dict):
-                    return (
-                        payload.get("message")
-                        or payload.get("error")
-                        or payload.get("detail")
-                        or str(payload)
-                    )
-        except Exception:
-            pass
-        return (r.text or "").strip()
+        return extract_error_message(r.headers.get("Content-Type", ""), r.content, r.text)
 
     def request(
         self,
@@ -74,35 +92,144 @@ class HttpTransport:
         auth: bool = True,
     ) -> Any:
         path = self._normalize_path(path)
-        url = f"{self.base_url}{path}"
+        if (
+            self.cache is not None
+            and method.upper() == "GET"
+            and json is None and files is None and data is None
+            and self.cache.ttl_for(path) is not None
+        ):
+            return self._cached_get(self.cache, path, params=params, headers=headers, auth=auth)
 
-        try:
-            r = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                headers=self._headers(headers, auth=auth),
-                files=files,
-                data=data,
-                timeout=self.timeout,
-            )
-        except requests.RequestException as e:
-            raise ApiError(status_code=0, message=str(e), response_text=None) from e
+        r = self._send(
+            method,
+            path,
+            params=params,
+            json=json,
+            headers=self._headers(headers, auth=auth),
+            files=files,
+            data=data,
+        )
+
+        if 200 <= r.status_code < 300:
+            return self._decode(r.headers.get("Content-Type", ""), r.content)
+
+        self._raise_for_status(r, method, path)
+
+    @staticmethod
+    def _decode(content_type: str, body: bytes) -> Any:
+        if not body:
+            return None
+        if "application/json" in content_type:
+            return _json.loads(body)
+        return body
+
+    def _cached_get(
+        self,
+        cache: HttpCache,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        auth: bool,
+    ) -> Any:
+        """GET through the cache: fresh entry -> no request; stale -> conditional GET."""
+        key = cache.key(f"{self.base_url}{path}", params, self.token if auth else None, headers)
+        entry = cache.get(key)
+        if entry is not None and entry.is_fresh():
+            cache.record("hits")
+            return self._decode(entry.content_type, entry.body)
+
+        h = dict(headers or {})
+        if entry is not None:
+            h.update(entry.validators())
+        r = self._send("GET", path, params=params, headers=self._headers(h, auth=auth))
+
+        if r.status_code == 304 and entry is not None:
+            entry = cache.refreshed(path, entry, r.headers)
+            cache.put(key, entry)
+            cache.record("revalidated")
+            return self._decode(entry.content_type, entry.body)
 
         if 200 <= r.status_code < 300:
-            if not r.content:
-                return None
-            ct = r.headers.get("Content-Type", "")
-            if "application/json" in ct:
-                return r.json()
-            return r.content
-
-        exc = self._pick_exc(r.status_code)
-        server_msg = self._extract_error_message(r)
-
-        raise exc(
-            status_code=r.status_code,
-            message=f"{method} {path} failed" + (f": {server_msg}" if server_msg else ""),
-            response_text=r.text,
+            cache.record("misses")
+            fresh = cache.build_entry(path, r.status_code, r.headers, r.content)
+            if fresh is not None:
+                cache.put(key, fresh)
+            return self._decode(r.headers.get("Content-Type", ""), r.content)
+
+        self._raise_for_status(r, "GET", path)
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Any = None,
+        auth: bool = True,
+    ) -> requests.Response:
+        """
+        Like request(), but returns the open streaming Response (stream=True)
+        instead of reading the body. Use it as a context manager so the
+        connection goes back to the pool:
+
+            with http.stream("GET", "/ddm/file/<id>") as r:
+                for chunk in r.iter_content(1024 * 1024):
+                    ...
+        """
+        path = self._normalize_path(path)
+        r = self._send(
+            method,
+            path,
+            params=params,
+            json=json,
+            headers=self._headers(headers, auth=auth),
+            data=data,
+            stream=True,
+        )
+
+        if 200 <= r.status_code < 300:
+            return r
+
+        try:
+            self._raise_for_status(r, method, path)
+        finally:
+            r.close()
+
+    def _send(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """
+        session.request() with the retry policy applied; returns the final response
+        (any status) or raises ApiError(status_code=0) for transport errors.
+        """
+        url = f"{self.base_url}{path}"
+        retry = self.retry if replayable(kwargs.get("data"), kwargs.get("files")) else RetryPolicy.disabled()
+        attempt = 0
+        while True:
+            try:
+                r = self.session.request(method=method, url=url, timeout=self.timeout, **kwargs)
+            except requests.RequestException as e:
+                if isinstance(e, _RETRYABLE_EXC) and retry.can_retry(method, attempt):
+                    time.sleep(retry.backoff(attempt))
+                    attempt += 1
+                    continue
+                raise ApiError(status_code=0, message=str(e), response_text=None) from e
+
+            if retry.retry_status(method, r.status_code, attempt):
+                delay = retry.backoff(attempt, r.headers.get("Retry-After"))
+                r.close()
+                time.sleep(delay)
+                attempt += 1
+                continue
+            return r
+
+    def _raise_for_status(self, r: requests.Response, method: str, path: str) -> None:
+        raise make_api_error(
+            r.status_code,
+            method,
+            path,
+            content_type=r.headers.get("Content-Type", ""),
+            body=r.content,
+            text=r.text,
         )
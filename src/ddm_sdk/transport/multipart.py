@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import IO, Iterator, Optional, Tuple, Union
+from typing import IO, Iterator, List, Optional, Tuple, Union
+import mimetypes
+import mmap
 import os
 import math
+import uuid
 
 
 BytesSource = Union[str, bytes, IO[bytes]]
@@ -74,3 +77,180 @@ def iter_file_chunks(fileobj: IO[bytes], chunk_size: int) -> Iterator[Tuple[int,
             break
         yield idx, chunk
         idx += 1
+
+
+# ----------------------------
+# streaming multipart/form-data
+# ----------------------------
+
+STREAM_BLOCK_SIZE = 256 * 1024
+
+
+def _quote(v: str) -> str:
+    # same HTML5-style escaping urllib3 applies to name/filename params
+    out = v.replace("\\", "\\\\").replace('"', "%22")
+    return "".join(f"%{ord(c):02X}" if ord(c) < 0x20 and c != "\x1b" else c for c in out)
+
+
+def _source_len(source: BytesSource) -> Optional[int]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return len(source)
+    if isinstance(source, str):
+        return os.path.getsize(source)
+    try:
+        pos = source.tell()
+        end = source.seek(0, os.SEEK_END)
+        source.seek(pos)
+        return end - pos
+    except Exception:
+        return None
+
+
+class _Part:
+    def __init__(self, header: bytes, source: BytesSource, length: int, use_mmap: bool):
+        self.header = header
+        self.source = source
+        self.length = length
+        self.use_mmap = use_mmap
+        self._fh: Optional[IO[bytes]] = None
+        self._map: Optional[mmap.mmap] = None
+        self._pos = 0
+
+    def read(self, size: int) -> bytes:
+        if self._pos >= self.length:
+            return b""
+        size = min(size, self.length - self._pos)
+        src = self.source
+
+        if isinstance(src, (bytes, bytearray, memoryview)):
+            out = bytes(memoryview(src)[self._pos : self._pos + size])
+        elif isinstance(src, str):
+            if self.use_mmap:
+                if self._map is None:
+                    self._fh = open(src, "rb")
+                    self._map = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+                out = self._map[self._pos : self._pos + size]
+            else:
+                if self._fh is None:
+                    self._fh = open(src, "rb")
+                out = self._fh.read(size)
+        else:
+            out = src.read(size)
+
+        if not out:
+            raise IOError(f"multipart source ended early ({self._pos}/{self.length} bytes)")
+        self._pos += len(out)
+        if self._pos >= self.length:
+            self.close()
+        return out
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+class MultipartEncoder:
+    """
+    multipart/form-data body that is produced while it is being sent.
+
+    File parts are read lazily (path -> opened only when its turn comes, optionally
+    via mmap; file objects are read in blocks), so peak memory is one block no matter
+    how many/large the files are. Content-Length is known upfront, so requests sends
+    it as a regular (non-chunked) body:
+
+        enc = MultipartEncoder()
+        enc.add_field("project_id", "p1")
+        enc.add_file("file", "/data/big.csv")
+        http.request("POST", "/ddm/file/upload", data=enc, headers={"Content-Type": enc.content_type})
+    """
+
+    def __init__(self, *, boundary: Optional[str] = None, use_mmap: bool = False, block_size: int = STREAM_BLOCK_SIZE):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.use_mmap = use_mmap
+        self.block_size = block_size
+        self._parts: List[_Part] = []
+        self._trailer = f"--{self.boundary}--\r\n".encode("ascii")
+        self._idx = 0
+        self._in_header = True
+        self._header_pos = 0
+        self._trailer_pos = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def add_field(self, name: str, value: str) -> None:
+        data = str(value).encode("utf-8")
+        header = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+        ).encode("utf-8")
+        self._parts.append(_Part(header, data + b"\r\n", len(data) + 2, False))
+
+    def add_file(
+        self,
+        name: str,
+        source: BytesSource,
+        *,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> None:
+        fname = filename or guess_filename(source, fallback=name)
+        ctype = content_type or mimetypes.guess_type(fname)[0] or "application/octet-stream"
+
+        length = _source_len(source)
+        if length is None:
+            # non-seekable stream: we cannot know its size, so buffer just this part
+            source = read_bytes(source)
+            length = len(source)
+
+        header = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"; filename="{_quote(fname)}"\r\n'
+            f"Content-Type: {ctype}\r\n\r\n"
+        ).encode("utf-8")
+        self._parts.append(_Part(header, source, length, self.use_mmap and isinstance(source, str) and length > 0))
+        self._parts.append(_Part(b"", b"\r\n", 2, False))
+
+    def __len__(self) -> int:
+        return sum(len(p.header) + p.length for p in self._parts) + len(self._trailer)
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(self.block_size), b""))
+
+        out = bytearray()
+        while len(out) < size and self._idx < len(self._parts):
+            part = self._parts[self._idx]
+            if self._in_header:
+                chunk = part.header[self._header_pos : self._header_pos + size - len(out)]
+                self._header_pos += len(chunk)
+                out += chunk
+                if self._header_pos >= len(part.header):
+                    self._in_header = False
+                continue
+
+            chunk = part.read(size - len(out))
+            out += chunk
+            if not chunk:
+                self._idx += 1
+                self._in_header = True
+                self._header_pos = 0
+
+        if len(out) < size and self._idx >= len(self._parts):
+            chunk = self._trailer[self._trailer_pos : self._trailer_pos + size - len(out)]
+            self._trailer_pos += len(chunk)
+            out += chunk
+
+        return bytes(out)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(self.block_size), b"")
+
+    def close(self) -> None:
+        for p in self._parts:
+            p.close()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Iterator, Optional
+
+# ----------------------------
+# Page iteration for the paged DDM endpoints ({"data": [...], "total", "filtered_total", "page"}).
+# ----------------------------
+
+
+def known_total(page: Any) -> Optional[int]:
+    """
+    filtered_total (or total) of a page response, None when the server did not send
+    one. Model defaults (fields not in model_fields_set) do not count, nor does a
+    total of 0 on a page that has data.
+    """
+    sent = getattr(page, "model_fields_set", None)
+    has_data = bool(getattr(page, "data", None))
+    for attr in ("filtered_total", "total"):
+        if sent is not None and attr not in sent:
+            continue
+        v = getattr(page, attr, None)
+        if isinstance(v, int) and not isinstance(v, bool) and v >= 0 and not (v == 0 and has_data):
+            return v
+    return None
+
+
+def _page_count(first: Any, per_page: int) -> Optional[int]:
+    total = known_total(first)
+    if total is None:
+        return None
+    return max(1, math.ceil(total / max(1, per_page)))
+
+
+def _is_last(page: Any, per_page: int) -> bool:
+    return len(getattr(page, "data", None) or []) < per_page
+
+
+def iter_pages(
+    fetch: Callable[[int], Any],
+    *,
+    per_page: int,
+    start_page: int = 1,
+    max_in_flight: int = 4,
+) -> Iterator[Any]:
+    """
+    Yield the pages of a paged endpoint in order; fetch(page) returns one page model.
+
+    The next page is always requested in the background while the caller works on
+    the current one. When the first page reports filtered_total/total, the number of
+    pages is known and up to `max_in_flight` of the remaining pages are fetched in
+    parallel (still yielded in order). Without a total, pages are fetched one ahead
+    until a short/empty page. Errors are raised when the failing page is reached.
+    """
+    max_in_flight = max(1, int(max_in_flight))
+    first = fetch(start_page)
+    last = _page_count(first, per_page)
+    if last is not None:
+        last += start_page - 1
+
+    window: Deque[Future] = deque()
+    pool = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="ddm-pages")
+    next_page = start_page + 1
+
+    def fill(limit: int) -> None:
+        nonlocal next_page
+        while len(window) < limit and (last is None or next_page <= last):
+            window.append(pool.submit(fetch, next_page))
+            next_page += 1
+
+    try:
+        page = first
+        while True:
+            done = _is_last(page, per_page) if last is None else False
+            if not done:
+                fill(1 if last is None else max_in_flight)
+            yield page
+            if done or not window:
+                return
+            page = window.popleft().result()
+            if not getattr(page, "data", None):
+                return  # the result set shrank while paging
+    finally:
+        for fut in window:
+            fut.cancel()
+        pool.shutdown(wait=False)
+
+
+def iter_items(
+    fetch: Callable[[int], Any],
+    *,
+    per_page: int,
+    start_page: int = 1,
+    max_in_flight: int = 4,
+) -> Iterator[Any]:
+    """Items (page.data) of every page, see iter_pages."""
+    for page in iter_pages(fetch, per_page=per_page, start_page=start_page, max_in_flight=max_in_flight):
+        yield from getattr(page, "data", None) or []
+
+
+async def aiter_pages(
+    fetch: Callable[[int], Awaitable[Any]],
+    *,
+    per_page: int,
+    start_page: int = 1,
+    max_in_flight: int = 4,
+) -> AsyncIterator[Any]:
+    """asyncio version of iter_pages (fetch is a coroutine function)."""
+    max_in_flight = max(1, int(max_in_flight))
+    first = await fetch(start_page)
+    last = _page_count(first, per_page)
+    if last is not None:
+        last += start_page - 1
+
+    window: Deque[asyncio.Task] = deque()
+    next_page = start_page + 1
+
+    def fill(limit: int) -> None:
+        nonlocal next_page
+        while len(window) < limit and (last is None or next_page <= last):
+            window.append(asyncio.ensure_future(fetch(next_page)))
+            next_page += 1
+
+    try:
+        page = first
+        while True:
+            done = _is_last(page, per_page) if last is None else False
+            if not done:
+                fill(1 if last is None else max_in_flight)
+            yield page
+            if done or not window:
+                return
+            page = await window.popleft()
+            if not getattr(page, "data", None):
+                return
+    finally:
+        for t in window:
+            t.cancel()
+
+
+async def aiter_items(
+    fetch: Callable[[int], Awaitable[Any]],
+    *,
+    per_page: int,
+    start_page: int = 1,
+    max_in_flight: int = 4,
+) -> AsyncIterator[Any]:
+    async for page in aiter_pages(fetch, per_page=per_page, start_page=start_page, max_in_flight=max_in_flight):
+        for item in getattr(page, "data", None) or []:
+            yield item
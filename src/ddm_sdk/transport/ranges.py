@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ..storage._files import atomic_write_bytes
+
+# ----------------------------
+# HTTP byte ranges for resumable / segmented downloads (FileAPI.download_to)
+#
+# A transfer writes "<dest>.part" plus a small "<dest>.part.json" state file
+# holding the server's validator (strong ETag or Last-Modified) and, for
+# segmented transfers, the segment plan and which segments are complete.
+# Resumed requests carry If-Range, so a file that changed on the server comes
+# back whole (200) instead of being spliced onto stale bytes.
+# ----------------------------
+
+MIN_SEGMENT_SIZE = 32 * 1024 * 1024
+STATE_SUFFIX = ".json"
+
+_CONTENT_RANGE = re.compile(r"^\s*bytes\s+(?:(\d+)-(\d+)|\*)/(\d+|\*)\s*$", re.IGNORECASE)
+
+
+class RangeNotHonored(Exception):
+    """A range request was answered with something other than the requested 206 slice."""
+
+
+@dataclass(frozen=True)
+class RangeInfo:
+    size: Optional[int]           # Content-Length of the whole file
+    accept_ranges: bool           # Accept-Ranges: bytes
+    validator: Optional[str] = None  # for If-Range
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> "RangeInfo":
+        size: Optional[int] = None
+        cr = parse_content_range(headers.get("Content-Range"))
+        if cr is not None and cr[2] is not None:
+            size = cr[2]
+        elif (headers.get("Content-Length") or "").isdigit():
+            size = int(headers["Content-Length"])
+        accept = "bytes" in (headers.get("Accept-Ranges") or "").lower()
+        return cls(size=size, accept_ranges=accept, validator=validator_from(headers))
+
+
+def validator_from(headers: Mapping[str, str]) -> Optional[str]:
+    """Strong ETag, else Last-Modified (If-Range does not accept weak ETags)."""
+    etag = (headers.get("ETag") or "").strip()
+    if etag and not etag.startswith("W/"):
+        return etag
+    return (headers.get("Last-Modified") or "").strip() or None
+
+
+def parse_content_range(value: Optional[str]) -> Optional[Tuple[Optional[int], Optional[int], Optional[int]]]:
+    """'bytes 0-99/1000' -> (0, 99, 1000); 'bytes */1000' -> (None, None, 1000)."""
+    m = _CONTENT_RANGE.match(value or "")
+    if not m:
+        return None
+    start, end, total = m.groups()
+    return (
+        int(start) if start is not None else None,
+        int(end) if end is not None else None,
+        int(total) if total != "*" else None,
+    )
+
+
+def range_headers(start: int, end: Optional[int] = None, *, validator: Optional[str] = None) -> Dict[str, str]:
+    """Range request headers (end inclusive). Identity encoding keeps offsets in file bytes."""
+    h = {"Range": f"bytes={start}-{'' if end is None else end}", "Accept-Encoding": "identity"}
+    if validator:
+        h["If-Range"] = validator
+    return h
+
+
+def is_partial(status: int, headers: Mapping[str, str], start: int) -> bool:
+    """True if the response is the 206 slice starting at `start`."""
+    if status != 206:
+        return False
+    cr = parse_content_range(headers.get("Content-Range"))
+    return cr is not None and cr[0] == start
+
+
+def plan_segments(size: int, n: int, *, min_size: int = MIN_SEGMENT_SIZE) -> List[Tuple[int, int]]:
+    """Split [0, size) into at most n inclusive (start, end) ranges of at least min_size bytes."""
+    if size <= 0:
+        return []
+    n = max(1, min(int(n), size // max(1, min_size) or 1))
+    step = -(-size // n)
+    return [(s, min(s + step, size) - 1) for s in range(0, size, step)]
+
+
+def sha256_prefix(path: Path, n: int, *, chunk_size: int = 1024 * 1024) -> Any:
+    """sha256 object fed with the first n bytes of path (to continue hashing a resumed .part)."""
+    h = hashlib.sha256()
+    left = n
+    with path.open("rb") as f:
+        while left > 0:
+            chunk = f.read(min(chunk_size, left))
+            if not chunk:
+                raise IOError(f"{path} is shorter than {n} bytes")
+            h.update(chunk)
+            left -= len(chunk)
+    return h
+
+
+@dataclass
+class PartState:
+    """The "<dest>.part.json" next to a partial download."""
+
+    part: Path
+    validator: Optional[str] = None
+    size: Optional[int] = None
+    segments: List[Tuple[int, int]] = field(default_factory=list)
+    done: List[int] = field(default_factory=list)
+
+    @staticmethod
+    def path_for(part: Path) -> Path:
+        return part.with_name(part.name + STATE_SUFFIX)
+
+    @classmethod
+    def load(cls, part: Path) -> "PartState":
+        try:
+            d = json.loads(cls.path_for(part).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(part=part)
+        if not isinstance(d, dict):
+            return cls(part=part)
+        return cls(
+            part=part,
+            validator=d.get("validator"),
+            size=d.get("size"),
+            segments=[(int(a), int(b)) for a, b in d.get("segments") or []],
+            done=[int(i) for i in d.get("done") or []],
+        )
+
+    def save(self) -> None:
+        payload = {"validator": self.validator, "size": self.size, "segments": self.segments, "done": self.done}
+        atomic_write_bytes(self.path_for(self.part), json.dumps(payload).encode("utf-8"))
+
+    @classmethod
+    def clear(cls, part: Path, *, keep_part: bool = False) -> None:
+        cls.path_for(part).unlink(missing_ok=True)
+        if not keep_part:
+            part.unlink(missing_ok=True)
+
+
+class PositionalWriter:
+    """
+    Thread-safe writes at absolute offsets into an existing file: os.pwrite where
+    available, seek+write under a lock elsewhere (e.g. Windows).
+    """
+
+    def __init__(self, path: Path):
+        self._fd = os.open(str(path), os.O_RDWR | getattr(os, "O_BINARY", 0))
+        self._lock = threading.Lock()
+
+    def write(self, offset: int, data: bytes) -> None:
+        view = memoryview(data)
+        if hasattr(os, "pwrite"):
+            while view:
+                n = os.pwrite(self._fd, view, offset)
+                view, offset = view[n:], offset + n
+            return
+        with self._lock:
+            os.lseek(self._fd, offset, os.SEEK_SET)
+            while view:
+                n = os.write(self._fd, view)
+                view = view[n:]
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None  # type: ignore[assignment]
+
+    def __enter__(self) -> "PositionalWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, FrozenSet, Optional
+
+
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header (delta-seconds or HTTP-date) -> seconds to wait, None if absent/invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def replayable(data: Any = None, files: Any = None) -> bool:
+    """False when the body is a stream (file object, MultipartEncoder, generator) that a retry could not resend."""
+    if files:
+        return False
+    return data is None or isinstance(data, (bytes, bytearray, str, dict, list, tuple))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to retry a request (shared by HttpTransport and AsyncHttpTransport).
+
+    Only idempotent methods are retried (a POST that timed out may have been applied),
+    on connection errors/timeouts and on `statuses`. Waits grow exponentially
+    (backoff_factor * 2**attempt, capped at backoff_max) with full jitter; a
+    Retry-After header from the server wins when present (capped at retry_after_max).
+    Once retries are exhausted the last response is mapped to the usual ApiError
+    subclasses, so callers see the same exceptions as without retries.
+    """
+
+    total: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    retry_after_max: float = 120.0
+    jitter: bool = True
+    statuses: FrozenSet[int] = field(default=RETRY_STATUSES)
+    methods: FrozenSet[str] = field(default=IDEMPOTENT_METHODS)
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        return cls(total=0)
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """attempt = number of retries already done."""
+        return attempt < self.total and method.upper() in self.methods
+
+    def retry_status(self, method: str, status_code: int, attempt: int) -> bool:
+        return status_code in self.statuses and self.can_retry(method, attempt)
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        ra = parse_retry_after(retry_after)
+        if ra is not None:
+            return min(ra, self.retry_after_max)
+        delay = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0.0, delay) if self.jitter else delay
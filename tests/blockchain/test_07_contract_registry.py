@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from ddm_sdk.scripts.blockchain.registry import ContractRegistry
+from ddm_sdk.storage.fs import FileStorage
+
+ADDR = "0x5fbdb2315678afecb367f032d93f642f64180aa3"
+ABI = [
+    {"type": "function", "name": "nonces", "inputs": [{"name": "a", "type": "address"}], "outputs": [{"type": "uint256"}]},
+    {"type": "function", "name": "transfer", "inputs": [{"type": "address"}, {"type": "uint256"}], "outputs": [{"type": "bool"}]},
+    {"type": "event", "name": "Registered", "inputs": []},
+]
+
+
+class _CountingStorage(FileStorage):
+    reads = 0
+
+    def read_json(self, key):
+        type(self).reads += 1
+        return super().read_json(key)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    st = _CountingStorage(tmp_path)
+    st.write_json("blockchain/contracts/sepolia/_index", {"contracts": [{"name": "DatasetRegistry", "address": ADDR}]})
+    st.write_json(f"blockchain/contracts/sepolia/{ADDR}.abi", ABI)
+    _CountingStorage.reads = 0
+    return ContractRegistry(st, rpc_url=lambda network: f"http://127.0.0.1:9/{network}")
+
+
+def test_07_contracts_and_abis_are_built_once(registry):
+    c1 = registry.contract("sepolia", name="DatasetRegistry")
+    c2 = registry.contract("sepolia", ADDR.upper().replace("0X", "0x"))
+    reads = _CountingStorage.reads
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.contract("sepolia", ADDR))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert c1 is c2 and all(c is c1 for c in results)
+    assert c1.address == "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+    assert reads == 2 and _CountingStorage.reads == 2  # index + ABI, read once
+    assert registry.web3("sepolia") is c1.w3
+
+
+def test_07_selectors_and_invalidate(registry):
+    sel = registry.selectors("sepolia", ADDR)
+    assert sel == {"nonces(address)": "0x7ecebe00", "transfer(address,uint256)": "0xa9059cbb"}
+    assert registry.selector("sepolia", ADDR, "transfer") == "0xa9059cbb"
+
+    before = registry.contract("sepolia", ADDR)
+    registry.invalidate("sepolia")
+    assert registry.contract("sepolia", ADDR) is not before
+    with pytest.raises(FileNotFoundError):
+        registry.address("sepolia", "Missing")
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from eth_account import Account
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3 import Web3
+
+from ddm_sdk.scripts.blockchain import register_datasets_batch as batch
+from ddm_sdk.scripts.blockchain.receipts import ReceiptWatcher
+from ddm_sdk.scripts.blockchain.rpc_batch import RpcBatch
+from ddm_sdk.storage.fs import FileStorage
+from tests.stub_server import RpcFault, StubServer, json_rpc
+
+PK = "0x" + "11" * 32
+REGISTRY = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+SUITE_HASH = "0x" + "ab" * 32
+
+
+ABI = [
+    {"type": "function", "name": "nonces", "stateMutability": "view",
+     "inputs": [{"name": "a", "type": "address"}], "outputs": [{"type": "uint256"}]},
+    {"type": "function", "name": "registerDataset", "stateMutability": "nonpayable",
+     "inputs": [{"name": "uri", "type": "string"}, {"name": "suiteHash", "type": "bytes32"},
+                {"name": "fileFormat", "type": "string"}, {"name": "reportUri", "type": "string"},
+                {"name": "nonce", "type": "uint256"}, {"name": "sig", "type": "bytes"}],
+     "outputs": []},
+]
+
+
+def _estimate(params):
+    if "bad-uri".encode().hex() in params[0]["data"]:
+        raise RpcFault(3, "execution reverted: already registered", "0x")
+    return hex(100_000)
+
+
+RPC = {
+    "eth_call": lambda params: "0x" + f"{3:064x}",
+    "eth_estimateGas": _estimate,
+    "eth_getTransactionCount": lambda params: hex(40),
+    "eth_chainId": lambda params: hex(11155111),
+    "eth_getBlockByNumber": lambda params: {"number": "0x10", "baseFeePerGas": hex(10)},
+    "eth_maxPriorityFeePerGas": lambda params: hex(2),
+    "eth_gasPrice": lambda params: hex(12),
+}
+
+
+class _Eth:
+    account = Account
+    chain_id = 11155111
+    max_priority_fee = 2
+
+    def __init__(self):
+        self.sent = []
+
+    def get_transaction_count(self, sender, block):
+        assert block == "pending"
+        return 40
+
+    def get_block(self, block):
+        return {"baseFeePerGas": 10}
+
+    def send_raw_transaction(self, raw):
+        self.sent.append(raw)
+        return Web3.keccak(raw)
+
+    def receipt(self, params):
+        hashes = ["0x" + Web3.keccak(r).hex().removeprefix("0x") for r in self.sent]
+        k = hashes.index(params[0])
+        topics = ["0x" + "00" * 32, "0x" + "01" * 32, SUITE_HASH, "0x" + f"{k:064x}"]
+        return {
+            "transactionHash": params[0], "blockHash": "0x" + "bb" * 32, "blockNumber": "0x10",
+            "status": "0x0" if k == 1 else "0x1", "logs": [{"address": REGISTRY, "topics": topics, "data": "0x"}],
+        }
+
+
+def _storage(tmp_path, suites):
+    st = FileStorage(tmp_path)
+    for suite_id, catalog_id in suites:
+        st.write_json(f"expectations/suites/{suite_id}/suite", {"file_types": ["CSV"]})
+        st.write_json(
+            f"blockchain/expectations/suites/{suite_id}/prepare_suite_artifacts/response",
+            {"result": {"result": {"suiteHash": SUITE_HASH}}},
+        )
+        st.write_json(
+            f"blockchain/expectations/suites/{suite_id}/datasets/{catalog_id}/prepare_report/response",
+            {"report_uri": f"ipfs://report-{catalog_id}"},
+        )
+    return st
+
+
+def test_08_load_batch_items(tmp_path):
+    (tmp_path / "a.csv").write_text("﻿suite_id,catalog_id,dataset-uri\ns1,c1,u1\n", encoding="utf-8")
+    (tmp_path / "a.jsonl").write_text('{"suite_id":"s1","catalog_id":"c1","uri":"u1"}\n\n', encoding="utf-8")
+    (tmp_path / "a.json").write_text(json.dumps([{"suite_id": "s1", "catalog_id": "c1", "dataset_uri": "u1"}]))
+    expected = [{"suite_id": "s1", "catalog_id": "c1", "dataset_uri": "u1"}]
+    for name in ("a.csv", "a.jsonl", "a.json"):
+        assert batch.load_batch_items(tmp_path / name) == expected
+
+
+def test_08_nonces_assigned_locally_and_failures_per_item(tmp_path, monkeypatch):
+    eth = _Eth()
+    with StubServer() as stub:
+        stub.route("POST", "/rpc", json_rpc({
+            **RPC,
+            "eth_blockNumber": lambda params: "0x10",
+            "eth_getTransactionReceipt": eth.receipt,
+        }))
+        contract = Web3(Web3.HTTPProvider(stub.url + "/rpc")).eth.contract(address=REGISTRY, abi=ABI)
+        registry = SimpleNamespace(
+            contract=lambda network, addr: contract,
+            web3=lambda network: SimpleNamespace(eth=eth),
+            rpc_batch=lambda network: RpcBatch(stub.url + "/rpc"),
+            receipt_watcher=lambda network: ReceiptWatcher(RpcBatch(stub.url + "/rpc")),
+        )
+        monkeypatch.setattr(batch, "shared_registry", lambda client: registry)
+
+        st = _storage(tmp_path, [("s1", "c1"), ("s1", "c2"), ("s1", "c3"), ("s1", "c4")])
+        client = SimpleNamespace(storage=st, blockchain=SimpleNamespace(ingest_tx=lambda body: {"task_id": "t"}))
+        items = [
+            {"suite_id": "s1", "catalog_id": "c1", "dataset_uri": "uri-1"},
+            {"suite_id": "s1", "catalog_id": "c2", "dataset_uri": "uri-2"},
+            {"suite_id": "s1", "catalog_id": "c3", "dataset_uri": "bad-uri"},
+            {"suite_id": "s1", "catalog_id": "c4", "dataset_uri": "uri-4"},
+            {"suite_id": "s9", "catalog_id": "c9", "dataset_uri": "uri-9"},
+        ]
+        results = batch.register_batch(client, items, network="sepolia", registry_addr_raw=REGISTRY, pk=PK)
+
+    # three round-trips: the per-run reads, every estimate, every receipt
+    shapes = [[c["method"] for c in r.json()] for r in stub.requests]
+    assert shapes[0] == ["eth_call", "eth_getTransactionCount", "eth_chainId", "eth_getBlockByNumber",
+                         "eth_maxPriorityFeePerGas", "eth_gasPrice"]
+    assert shapes[1] == ["eth_estimateGas"] * 4
+    assert shapes[2] == ["eth_blockNumber"] + ["eth_getTransactionReceipt"] * 3 and len(shapes) == 3
+    probes = [contract.decode_function_input(c["params"][0]["data"])[1] for c in stub.requests[1].json()]
+    assert {p["nonce"] for p in probes} == {3}
+
+    txs = [TypedTransaction.from_bytes(HexBytes(raw)).as_dict() for raw in eth.sent]
+    assert [tx["nonce"] for tx in txs] == [40, 41, 42]
+    assert {(tx["maxFeePerGas"], tx["chainId"], tx["gas"]) for tx in txs} == {(22, 11155111, 120_000)}
+
+    assert [r["ok"] for r in results] == [True, False, False, True, False]
+    assert results[1]["error"]["details"]["stage"] == "mined"
+    assert results[2]["error"] == {"code": "EVM_REVERT", "message": "already registered", "details": {"stage": "estimate_gas"}}
+    assert "tx_hash" not in results[2]
+    assert results[4]["error"]["details"]["stage"] == "prepare"
+    assert results[3]["fingerprint"] == "0x" + f"{2:064x}"
+
+    saved = [st.read_json(f"blockchain/expectations/suites/s1/datasets/{c}/register_dataset/request") for c in ("c1", "c2", "c4")]
+    assert [s["call_args"]["nonce"] for s in saved] == [3, 4, 5]
+    resp = st.read_json("blockchain/expectations/suites/s1/datasets/c4/register_dataset/response")
+    assert resp["fingerprint"] == results[3]["fingerprint"] and resp["ingest"]["task"] == {"task_id": "t"}
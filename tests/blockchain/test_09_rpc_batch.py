@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import pytest
+import requests
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+
+from ddm_sdk.scripts.blockchain.rpc_batch import RpcBatch, RpcError
+from tests.stub_server import RpcFault, StubResponse, StubServer, json_rpc
+
+ADDR = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+SENDER = "0x" + "22" * 20
+ABI = [
+    {"type": "function", "name": "nonces", "stateMutability": "view",
+     "inputs": [{"name": "a", "type": "address"}], "outputs": [{"type": "uint256"}]},
+    {"type": "function", "name": "info", "stateMutability": "view",
+     "inputs": [], "outputs": [{"type": "string"}, {"type": "bool"}]},
+]
+# Error(string) "nope"
+REVERT_DATA = "0x08c379a0" + f"{32:064x}" + f"{4:064x}" + b"nope".hex().ljust(64, "0")
+
+
+def _call(params):
+    data = params[0]["data"]
+    if data.startswith("0x7ecebe00"):  # nonces(address)
+        return "0x" + f"{7:064x}"
+    return "0x" + f"{64:064x}" + f"{1:064x}" + f"{2:064x}" + b"ok".hex().ljust(64, "0")
+
+
+def _estimate(params):
+    raise RpcFault(3, "execution reverted", REVERT_DATA)
+
+
+RPC = {
+    "eth_call": _call,
+    "eth_estimateGas": _estimate,
+    "eth_chainId": lambda params: "0xaa36a7",
+    "eth_getTransactionCount": lambda params: "0x5",
+    "eth_getBlockByNumber": lambda params: {"number": "0x1", "timestamp": "0x64"},  # no baseFeePerGas
+    "eth_maxPriorityFeePerGas": lambda params: "0x1",
+    "eth_gasPrice": lambda params: "0x3b9aca00",
+}
+
+
+def _queue(batch, contract):
+    calls = [
+        batch.call(contract.functions.nonces(SENDER)),
+        batch.call(contract.functions.info()),
+        batch.estimate_gas(contract.functions.nonces(SENDER), {"from": SENDER}),
+        batch.add("eth_unknown"),
+        batch.tx_fields(SENDER),
+    ]
+    batch.execute()
+    return calls
+
+
+def _check(calls):
+    nonce, info, est, unknown, fields = calls
+    assert nonce.value() == 7 and info.value() == ["ok", True]
+    with pytest.raises(ContractLogicError) as e:
+        est.value()
+    assert e.value.message == "execution reverted: nope"
+    with pytest.raises(RpcError):
+        unknown.value()
+    assert fields.value() == {"nonce": 5, "chainId": 11155111, "gasPrice": 1_000_000_000}
+
+
+def test_09_one_round_trip_for_independent_reads():
+    with StubServer() as stub:
+        stub.route("POST", "/rpc", json_rpc(RPC))
+        contract = Web3().eth.contract(address=ADDR, abi=ABI)
+        batch = RpcBatch(stub.url + "/rpc")
+        _check(_queue(batch, contract))
+
+        assert len(stub.requests) == 1
+        body = stub.requests[0].json()
+        assert [c["method"] for c in body] == [
+            "eth_call", "eth_call", "eth_estimateGas", "eth_unknown",
+            "eth_getTransactionCount", "eth_chainId", "eth_getBlockByNumber",
+            "eth_maxPriorityFeePerGas", "eth_gasPrice",
+        ]
+        assert len({c["id"] for c in body}) == len(body)
+        assert body[2]["params"][0]["from"] == SENDER and body[4]["params"] == [SENDER, "pending"]
+
+
+def test_09_chunks_and_sequential_fallback():
+    with StubServer() as stub:
+        stub.route("POST", "/chunked", json_rpc(RPC))
+        stub.route("POST", "/single", json_rpc(RPC, batches=False))
+        contract = Web3().eth.contract(address=ADDR, abi=ABI)
+
+        chunked = RpcBatch(stub.url + "/chunked", max_batch=4)
+        _check(_queue(chunked, contract))
+        bodies = [r.json() for r in stub.requests]
+        assert [len(b) for b in bodies[:2]] == [4, 4] and isinstance(bodies[2], dict) and len(bodies) == 3
+
+        stub.requests.clear()
+        single = RpcBatch(stub.url + "/single")
+        _check(_queue(single, contract))
+        assert isinstance(stub.requests[0].json(), list) and not single.batching
+        assert all(isinstance(r.json(), dict) for r in stub.requests[1:]) and len(stub.requests) == 10
+
+        # remembered: the next execute goes straight to single calls
+        stub.requests.clear()
+        single.chain_id()
+        single.execute()
+        assert len(stub.requests) == 1 and isinstance(stub.requests[0].json(), dict)
+
+
+def test_09_http_error_keeps_batching():
+    fail = {"n": 1}
+    rpc = json_rpc(RPC)
+
+    def flaky(req):
+        if fail["n"]:
+            fail["n"] -= 1
+            return StubResponse.json({"message": "rate limited"}, status=429)
+        return rpc(req)
+
+    with StubServer() as stub:
+        stub.route("POST", "/rpc", flaky)
+        batch = RpcBatch(stub.url + "/rpc")
+        batch.chain_id(), batch.gas_price()
+        with pytest.raises(requests.HTTPError):
+            batch.execute()
+        assert batch.batching
+
+        calls = [batch.chain_id(), batch.gas_price()]
+        batch.execute()
+        assert [c.value() for c in calls] == [11155111, 1_000_000_000]
+        assert isinstance(stub.requests[-1].json(), list) and len(stub.requests) == 2
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from web3.exceptions import TimeExhausted
+
+from ddm_sdk.scripts.blockchain.receipts import ReceiptWatcher
+from ddm_sdk.scripts.blockchain.rpc_batch import RpcBatch
+from tests.stub_server import StubServer, json_rpc
+
+HASHES = ["0x" + f"{i:064x}" for i in range(1, 6)]
+
+
+class _Chain:
+    """Head moves one block per eth_blockNumber; `mine` maps a call number to {hash: block}."""
+
+    def __init__(self, head, mine):
+        self.head, self.mine, self.calls, self.blocks = head, mine, 0, {}
+        self.lock = threading.Lock()
+
+    def _receipt(self, h, n):
+        return {"transactionHash": h, "blockHash": "0x" + f"{n:064x}", "blockNumber": hex(n), "status": "0x1", "logs": []}
+
+    def block_number(self, params):
+        with self.lock:
+            self.calls += 1
+            for h, n in self.mine.get(self.calls, {}).items():
+                self.blocks[h] = n
+            if self.calls > 1:
+                self.head += 1
+            return hex(self.head)
+
+    def receipt(self, params):
+        n = self.blocks.get(params[0])
+        return self._receipt(params[0], n) if n is not None and n <= self.head else None
+
+    def block_receipts(self, params):
+        n = int(params[0], 16)
+        if n > self.head:
+            return None
+        return [self._receipt(h, b) for h, b in self.blocks.items() if b == n]
+
+    def methods(self, block_receipts=True):
+        m = {"eth_blockNumber": self.block_number, "eth_getTransactionReceipt": self.receipt}
+        if block_receipts:
+            m["eth_getBlockReceipts"] = self.block_receipts
+        return m
+
+
+def _shapes(stub):
+    bodies = [r.json() for r in stub.requests]
+    return [[c["method"] for c in (b if isinstance(b, list) else [b])] for b in bodies]
+
+
+def test_10_many_hashes_one_poller_then_block_receipts():
+    chain = _Chain(100, {2: {h: 101 for h in HASHES}})
+    with StubServer() as stub:
+        stub.route("POST", "/rpc", json_rpc(chain.methods()))
+        watcher = ReceiptWatcher(RpcBatch(stub.url + "/rpc"), poll_interval=0.05)
+        futures = watcher.wait_all(HASHES, timeout=10)
+
+    receipts = [f.result() for f in futures]
+    assert [r.transactionHash.to_0x_hex() for r in receipts] == HASHES
+    assert {r.blockNumber for r in receipts} == {101} and receipts[0].status == 1
+    # first tick looks every hash up; afterwards one block's receipts cover all five
+    shapes = _shapes(stub)
+    assert shapes[0] == ["eth_blockNumber"] + ["eth_getTransactionReceipt"] * 5
+    assert shapes[1] == ["eth_blockNumber", "eth_getBlockReceipts"] and len(shapes) == 2
+    assert watcher._watches == []
+
+
+def test_10_confirmations_and_no_block_receipts():
+    chain = _Chain(100, {1: {HASHES[0]: 101, HASHES[1]: 101}})
+    with StubServer() as stub:
+        stub.route("POST", "/rpc", json_rpc(chain.methods(block_receipts=False)))
+        watcher = ReceiptWatcher(RpcBatch(stub.url + "/rpc"), poll_interval=0.02, confirmations=3)
+        a, b = watcher.wait_all(HASHES[:2], timeout=10)
+        assert a.result().blockNumber == 101 and watcher.head >= 103
+
+        with pytest.raises(TimeExhausted):
+            watcher.wait(HASHES[4], timeout=0.1)
+    # tried once, then every hash is looked up directly
+    assert sum(s.count("eth_getBlockReceipts") for s in _shapes(stub)) == 1 and not watcher.block_receipts
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.chain_index import INDEX_FILENAME, ChainIndex
+from ddm_sdk.storage.fs import FileStorage
+from tests.stub_server import StubResponse, StubServer
+
+REGISTRY = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+
+
+def _event(i: int) -> dict:
+    return {
+        "network": "sepolia",
+        "address": REGISTRY,
+        "name": "DatasetRegistered" if i % 3 else "SuiteRegistered",
+        "tx_hash": f"0x{i:064X}",
+        "block_number": 100 + i // 2,  # two events per block
+        "log_index": i % 2,
+        "args": {"i": i},
+    }
+
+
+def _tx(i: int) -> dict:
+    return {"network": "sepolia", "tx_hash": f"0x{i:064x}", "block_number": 100 + i, "from": "0xAB", "to": REGISTRY, "status": i % 2}
+
+
+class _Paged:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __call__(self, req):
+        q = {k: v[0] for k, v in req.query.items()}
+        rows = [r for r in self.rows if "block_from" not in q or r["block_number"] >= int(q["block_from"])]
+        rows.sort(key=lambda r: (r["block_number"], r.get("log_index", 0)))
+        page, per = int(q["page"]), int(q["perPage"])
+        return StubResponse.json({
+            "data": rows[(page - 1) * per: page * per],
+            "total": len(self.rows), "filtered_total": len(rows), "page": page, "perPage": per,
+        })
+
+
+def test_11_incremental_event_sync_from_checkpoint(tmp_path):
+    events = _Paged([_event(i) for i in range(120)])
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/blockchain/contracts/{REGISTRY}/events", events)
+        client = DdmClient(base_url=stub.url, storage=FileStorage(tmp_path))
+
+        with ChainIndex.for_client(client) as idx:
+            assert idx.sync_events(client.blockchain, network="sepolia", address=REGISTRY, per_page=50) == 120
+            assert idx.checkpoint("events", "sepolia", REGISTRY.lower()) == 159
+
+            events.rows += [_event(i) for i in range(120, 124)]
+            n_before = len(stub.requests)
+            # the checkpoint block (2 events) is re-listed, plus the 4 new ones
+            assert idx.sync_events(client.blockchain, network="sepolia", address=REGISTRY, per_page=50) == 6
+            q = stub.requests[n_before].query
+            assert q["block_from"] == ["159"] and q["sort"] == ["block_number,asc"] and q["network"] == ["sepolia"]
+            assert idx.checkpoint("events", "sepolia", REGISTRY) == 161
+
+            assert idx.count("events") == 124
+            hits = idx.events(network="sepolia", name=["SuiteRegistered"], block_from=150)
+            assert [e["args"]["i"] for e in hits] == [102, 105, 108, 111, 114, 117, 120, 123]
+            assert idx.events(tx_hash=[_event(7)["tx_hash"].lower()])[0]["log_index"] == 1
+            assert idx.events(address=[REGISTRY.lower()], newest_first=True, limit=1)[0]["args"]["i"] == 123
+
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+
+def test_11_tx_sync_keeps_from_alias_and_binds_server(tmp_path):
+    txs = _Paged([_tx(i) for i in range(5)])
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/blockchain/txs", txs)
+        client = DdmClient(base_url=stub.url, storage=FileStorage(tmp_path))
+        with ChainIndex.for_client(client) as idx:
+            assert idx.sync_txs(client.blockchain, network="sepolia") == 5
+            assert idx.checkpoints() == [{"kind": "txs", "network": "sepolia", "address": None, "block": 104}]
+            assert [t["tx_hash"] for t in idx.txs(frm=["0xab"], status=1)] == [_tx(1)["tx_hash"], _tx(3)["tx_hash"]]
+            assert idx.get_tx(_tx(2)["tx_hash"].upper().replace("0X", "0x"))["from"] == "0xAB"
+
+        other = DdmClient(base_url=stub.url + "/other", storage=FileStorage(tmp_path))
+        with ChainIndex.for_client(other) as idx:
+            assert idx.count("txs") == 0 and idx.checkpoints() == []
+
+
+def test_11_filtered_sync_keeps_its_own_checkpoint(tmp_path):
+    events = _Paged([_event(i) for i in range(10)])
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/blockchain/contracts/{REGISTRY}/events", events)
+        client = DdmClient(base_url=stub.url, storage=FileStorage(tmp_path))
+
+        with ChainIndex.for_client(client) as idx:
+            idx.sync_events(client.blockchain, network="sepolia", address=REGISTRY, name=["SuiteRegistered"])
+            assert idx.checkpoint("events", "sepolia", REGISTRY, filters={"name": ["SuiteRegistered"]}) == 104
+            assert idx.checkpoint("events", "sepolia", REGISTRY) is None
+
+            idx.sync_events(client.blockchain, network="sepolia", address=REGISTRY)
+            assert "block_from" not in stub.requests[-1].query
+            assert idx.checkpoint("events", "sepolia", REGISTRY) == 104
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from ddm_sdk.async_client import AsyncDdmClient
+from ddm_sdk.transport.errors import NotFound, ServerError
+from tests.stub_server import StubResponse, StubServer
+
+
+def _page(req):
+    page = int(req.query["page"][0])
+    item = {"id": f"f{page}", "filename": f"f{page}.csv", "path": "p", "user_id": "u"}
+    return StubResponse.json({"data": [item], "total": 30, "page": page, "perPage": 1, "filtered_total": 30})
+
+
+def test_06_async_catalog_gather_is_bounded():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_page(req):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return _page(req)
+
+    async def run(url):
+        async with AsyncDdmClient(base_url=url, token="t0k", max_concurrency=4) as client:
+            return await asyncio.gather(
+                *(client.catalog.list(project_id=["a", "b"], page=p, perPage=1) for p in range(1, 21))
+            )
+
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/list", slow_page)
+        pages = asyncio.run(run(stub.url))
+        req = stub.requests[0]
+
+    assert [p.data[0].id for p in pages] == [f"f{i}" for i in range(1, 21)]
+    assert 1 < peak <= 4
+    assert req.query["project_id"] == ["a,b"]  # csv keys encoded like the sync client
+    assert req.headers["Authorization"] == "Bearer t0k"
+
+
+def test_06_async_errors_use_shared_mapping():
+    async def run(url):
+        async with AsyncDdmClient(base_url=url) as client:
+            with pytest.raises(NotFound) as e:
+                await client.catalog.tree(parent="x")
+            assert "GET /ddm/catalog/tree failed: nope" in str(e.value)
+
+            with pytest.raises(ServerError):
+                await client.tasks.status("t1")
+
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/tree", lambda req: StubResponse.json({"message": "nope"}, status=404))
+        stub.route("GET", "/ddm/tasks/status/t1", lambda req: StubResponse.json({"error": "down"}, status=503))
+        asyncio.run(run(stub.url))
+
+
+def test_06_async_tasks_wait_many():
+    polls: dict[str, int] = {}
+
+    def status(req):
+        tid = req.path.rsplit("/", 1)[-1]
+        polls[tid] = polls.get(tid, 0) + 1
+        done = polls[tid] >= (2 if tid == "a" else 1)
+        return StubResponse.json({"state": "SUCCESS" if done else "PENDING", "result": tid})
+
+    async def run(url):
+        async with AsyncDdmClient(base_url=url) as client:
+            return await client.tasks.wait_many(["a", "b"], poll_interval_s=0.01)
+
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/tasks/status/a", status)
+        stub.route("GET", "/ddm/tasks/status/b", status)
+        res = asyncio.run(run(stub.url))
+
+    assert res.succeeded == {"a", "b"} and not res.timed_out
+    assert polls == {"a": 2, "b": 1}
+
+    async def run_expired(url):
+        async with AsyncDdmClient(base_url=url) as client:
+            return await client.tasks.wait_many(["a", "b"], timeout_s=0, max_workers=1, raise_on_failure=False)
+
+    polls.clear()
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/tasks/status/a", status)
+        stub.route("GET", "/ddm/tasks/status/b", status)
+        res = asyncio.run(run_expired(stub.url))
+
+    # timeout_s=0 still polls each task once
+    assert res.succeeded == {"b"} and res.pending == {"a"} and polls == {"a": 1, "b": 1}
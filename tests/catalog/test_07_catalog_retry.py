@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.transport.errors import ServerError
+from ddm_sdk.transport.retry import RetryPolicy, parse_retry_after
+from tests.stub_server import StubResponse, StubServer
+
+FAST = RetryPolicy(total=3, backoff_factor=0.01, jitter=False)
+
+
+def _page(req):
+    return StubResponse.json({"data": [], "total": 0, "page": 1, "perPage": 10, "filtered_total": 0})
+
+
+def _flaky(fails: int, status: int = 503, headers=None):
+    calls = {"n": 0}
+
+    def handler(req):
+        calls["n"] += 1
+        if calls["n"] <= fails:
+            return StubResponse.json({"message": "busy"}, status=status, headers=headers)
+        return _page(req)
+
+    return handler
+
+
+def test_07_get_is_retried_on_503():
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/list", _flaky(2))
+        client = DdmClient(base_url=stub.url, retry=FAST)
+        page = client.catalog.list()
+        n = len(stub.requests)
+
+    assert page.total == 0
+    assert n == 3
+
+
+def test_07_retry_after_is_honored():
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/list", _flaky(1, status=429, headers={"Retry-After": "0.3"}))
+        client = DdmClient(base_url=stub.url, retry=FAST)
+        t0 = time.perf_counter()
+        client.catalog.list()
+        dt = time.perf_counter() - t0
+
+    assert dt >= 0.3
+
+
+def test_07_exhausted_retries_keep_api_error_mapping():
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/list", _flaky(10, status=502))
+        client = DdmClient(base_url=stub.url, retry=FAST)
+        with pytest.raises(ServerError) as e:
+            client.catalog.list()
+        n = len(stub.requests)
+
+    assert e.value.status_code == 502
+    assert n == 4  # first try + 3 retries
+
+
+def test_07_post_is_not_retried():
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/catalog/advanced", _flaky(1))
+        client = DdmClient(base_url=stub.url, retry=FAST)
+        with pytest.raises(ServerError):
+            client._http.request("POST", "/ddm/catalog/advanced", json={})
+        n = len(stub.requests)
+
+    assert n == 1
+
+
+def test_07_pool_and_compression_settings():
+    client = DdmClient(base_url="http://127.0.0.1:1", pool_connections=4, pool_maxsize=64)
+    adapter = client._http.session.get_adapter("https://example.org")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 64
+    assert "gzip" in client._http.session.headers["Accept-Encoding"]
+
+
+def test_07_parse_retry_after():
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # date in the past
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.transport.errors import ServerError
+from ddm_sdk.transport.pagination import iter_pages
+from tests.stub_server import StubResponse, StubServer
+
+TOTAL = 95
+
+
+class _Catalog:
+    def __init__(self, delay: float = 0.0, fail_page: int | None = None):
+        self.delay = delay
+        self.fail_page = fail_page
+        self.active = 0
+        self.peak = 0
+        self.pages = []
+        self._lock = threading.Lock()
+
+    def __call__(self, req):
+        page = int(req.query["page"][0])
+        per = int(req.query["perPage"][0])
+        with self._lock:
+            self.pages.append(page)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if page == self.fail_page:
+            return StubResponse.json({"message": "boom"}, status=500)
+        ids = range((page - 1) * per, min(page * per, TOTAL))
+        data = [{"id": f"f{i}", "filename": f"f{i}.csv", "path": "p", "user_id": "u"} for i in ids]
+        return StubResponse.json({"data": data, "total": 500, "page": page, "perPage": per, "filtered_total": TOTAL})
+
+
+def test_08_iter_list_fetches_remaining_pages_in_parallel():
+    cat = _Catalog(delay=0.05)
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/list", cat)
+        client = DdmClient(base_url=stub.url)
+        ids = [it.id for it in client.catalog.iter_list(project_id=["p1"], perPage=10, max_in_flight=3)]
+        req = stub.requests[0]
+
+    assert ids == [f"f{i}" for i in range(TOTAL)]
+    assert sorted(cat.pages) == list(range(1, 11))  # filtered_total -> exactly 10 pages, no probing
+    assert 1 < cat.peak <= 3
+    assert req.query["project_id"] == ["p1"]
+
+
+def test_08_iter_list_raises_at_failing_page():
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/list", _Catalog(fail_page=3))
+        client = DdmClient(base_url=stub.url)
+        seen = []
+        with pytest.raises(ServerError):
+            for it in client.catalog.iter_list(perPage=10):
+                seen.append(it.id)
+
+    assert seen == [f"f{i}" for i in range(20)]
+
+
+def test_08_iter_pages_without_total_stops_on_short_page():
+    calls = []
+
+    def fetch(page):
+        calls.append(page)
+        n = 10 if page < 4 else 3
+        return SimpleNamespace(data=list(range(n)), page=page)
+
+    pages = list(iter_pages(fetch, per_page=10, max_in_flight=4))
+
+    assert [p.page for p in pages] == [1, 2, 3, 4]
+    assert calls == [1, 2, 3, 4]
+
+
+def test_08_defaulted_total_is_not_trusted():
+    from ddm_sdk.models.expectations import ExpectationSuiteListResponse
+
+    def fetch(page):
+        n = 2 if page < 3 else 1
+        return ExpectationSuiteListResponse.model_validate({"data": [{"id": f"s{page}{i}", "suite_name": "s"} for i in range(n)], "page": page})
+
+    pages = list(iter_pages(fetch, per_page=2))
+    assert [len(p.data) for p in pages] == [2, 2, 1]
+
+
+def test_08_iter_contract_events_uses_address_path():
+    def events(req):
+        page = int(req.query["page"][0])
+        ev = {
+            "id": page, "network": "sepolia", "address": "0xabc", "name": "E",
+            "tx_hash": "0x1", "block_number": page, "log_index": 0, "args": {},
+        }
+        return StubResponse.json({"data": [ev], "total": 2, "filtered_total": 2, "page": page, "perPage": 1})
+
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/blockchain/contracts/0xabc/events", events)
+        client = DdmClient(base_url=stub.url)
+        out = list(client.blockchain.iter_contract_events("0xabc", perPage=1, network=["sepolia"]))
+        q = stub.requests[0].query
+
+    assert len(out) == 2
+    assert q["network"] == ["sepolia"]
+
+
+def test_08_async_iter_list():
+    pytest.importorskip("aiohttp")
+    from ddm_sdk.async_client import AsyncDdmClient
+
+    async def run(url):
+        async with AsyncDdmClient(base_url=url) as client:
+            return [it.id async for it in client.catalog.iter_list(perPage=10, max_in_flight=4)]
+
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/list", _Catalog())
+        ids = asyncio.run(run(stub.url))
+
+    assert ids == [f"f{i}" for i in range(TOTAL)]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.scripts.file.utils import _fetch_file_meta_from_catalog
+from ddm_sdk.storage.catalog_index import INDEX_FILENAME, CatalogIndex
+from ddm_sdk.storage.fs import FileStorage
+from tests.stub_server import StubResponse, StubServer
+
+
+def _file(i: int, project: str = "p1") -> dict:
+    return {
+        "id": f"f{i:04d}",
+        "filename": f"data{i}.csv",
+        "path": "x",
+        "user_id": "u",
+        "project_id": project,
+        "use_case": ["crop"] if i % 2 else ["energy"],
+        "created": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}",
+    }
+
+
+class _Catalog:
+    def __init__(self, files):
+        self.files = files
+
+    def __call__(self, req):
+        q = {k: v[0] for k, v in req.query.items()}
+        rows = [f for f in self.files if not q.get("created_from") or f["created"] >= q["created_from"]]
+        rows.sort(key=lambda f: f["created"])
+        page, per = int(q["page"]), int(q["perPage"])
+        data = rows[(page - 1) * per: page * per]
+        return StubResponse.json({"data": data, "total": len(self.files), "page": page, "perPage": per, "filtered_total": len(rows)})
+
+
+def test_09_incremental_sync_uses_created_watermark(tmp_path):
+    cat = _Catalog([_file(i) for i in range(250)])
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/list", cat)
+        client = DdmClient(base_url=stub.url, storage=FileStorage(tmp_path))
+
+        with CatalogIndex.for_client(client) as idx:
+            assert idx.sync(client.catalog, per_page=100) == 250
+            assert idx.watermark() == _file(249)["created"]
+
+            cat.files.append(_file(250, project="p2"))
+            n_before = len(stub.requests)
+            assert idx.sync(client.catalog, per_page=100) == 2  # watermark row + the new one
+            since = stub.requests[n_before].query["created_from"]
+
+            assert since == [_file(249)["created"]]
+            assert len(idx) == 251
+            assert idx.get("f0250")["project_id"] == "p2"
+            assert [f["id"] for f in idx.find(project_id="p2")] == ["f0250"]
+            assert len(idx.find(project_id="p1", use_case="crop")) == 125
+
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+
+def test_09_file_meta_lookup_hits_index_first(tmp_path):
+    cat = _Catalog([_file(i) for i in range(2500)])
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/list", cat)
+        client = DdmClient(base_url=stub.url, storage=FileStorage(tmp_path))
+
+        # empty index: no full mirror, just the bounded scan
+        assert _fetch_file_meta_from_catalog(client, file_id="f0007")["id"] == "f0007"
+        with CatalogIndex.for_client(client) as idx:
+            assert len(idx) == 0
+            idx.sync(client.catalog, per_page=500)
+
+        # past the old 10 x 200 scan limit, from the index
+        n = len(stub.requests)
+        assert _fetch_file_meta_from_catalog(client, file_id="f2400")["filename"] == "data2400.csv"
+        assert len(stub.requests) == n
+
+        # a newer file: one incremental sync
+        cat.files.append(_file(2500, project="p2"))
+        assert _fetch_file_meta_from_catalog(client, file_id="f2500")["project_id"] == "p2"
+        assert stub.requests[n].query["created_from"] == [_file(2499)["created"]]
+
+        # not in the (synced) index: still tries the project-filtered list
+        n = len(stub.requests)
+        assert _fetch_file_meta_from_catalog(client, file_id="nope", project_hint="p9") is None
+        assert stub.requests[n + 1].query["project_id"] == ["p9"]
+
+
+def test_09_index_is_reset_for_another_server(tmp_path):
+    with CatalogIndex(tmp_path / INDEX_FILENAME) as idx:
+        idx.bind("http://a")
+        idx.upsert([_file(1)])
+        idx.bind("http://a/")
+        assert len(idx) == 1
+        idx.bind("http://b")
+        assert len(idx) == 0 and idx.watermark() is None
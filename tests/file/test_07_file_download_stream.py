@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import hashlib
+import io
+
+import pytest
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.apis.file import ChecksumMismatch
+from ddm_sdk.transport.errors import NotFound
+from tests.stub_server import StubResponse, StubServer
+
+FILE_ID = "2813033a-daff-458c-98f3-37330490d84d"
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+@pytest.fixture()
+def stub():
+    with StubServer() as s:
+        s.route("GET", f"/ddm/file/{FILE_ID}", lambda req: StubResponse.bytes(PAYLOAD))
+        yield s
+
+
+def test_07_download_to_path_streams_and_hashes(stub, tmp_path):
+    client = DdmClient(base_url=stub.url)
+    expected = hashlib.sha256(PAYLOAD).hexdigest()
+
+    res = client.file.download_to(FILE_ID, tmp_path / "out" / "data.bin", chunk_size=64 * 1024, expected_sha256=expected)
+
+    assert res.bytes == len(PAYLOAD)
+    assert res.sha256 == expected
+    assert (tmp_path / "out" / "data.bin").read_bytes() == PAYLOAD
+    assert not (tmp_path / "out" / "data.bin.part").exists()
+
+
+def test_07_download_to_fileobj_and_iter(stub):
+    client = DdmClient(base_url=stub.url)
+
+    buf = io.BytesIO()
+    res = client.file.download_to(FILE_ID, buf)
+    assert res.path is None
+    assert buf.getvalue() == PAYLOAD
+
+    chunks = list(client.file.iter_download(FILE_ID, chunk_size=100_000))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == PAYLOAD
+
+
+def test_07_download_hash_mismatch_leaves_no_file(stub, tmp_path):
+    client = DdmClient(base_url=stub.url)
+
+    with pytest.raises(ChecksumMismatch):
+        client.file.download_to(FILE_ID, tmp_path / "data.bin", expected_sha256="0" * 64)
+
+    assert not (tmp_path / "data.bin").exists()
+    assert not (tmp_path / "data.bin.part").exists()
+
+
+def test_07_download_stream_maps_errors(stub, tmp_path):
+    client = DdmClient(base_url=stub.url)
+
+    with pytest.raises(NotFound):
+        client.file.download_to("missing", tmp_path / "x.bin")
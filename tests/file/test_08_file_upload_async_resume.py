@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.fs import FileStorage
+from ddm_sdk.transport.chunked import is_stale_upload_error
+from ddm_sdk.transport.errors import BadRequest, Conflict, NotFound, ServerError
+from tests.stub_server import StubResponse, StubServer
+
+CHUNK = 64 * 1024
+PAYLOAD = bytes(range(256)) * 1024 + b"tail"  # 256 KiB + 4 bytes -> 5 chunks
+
+
+class ChunkBackend:
+    """Mimics /ddm/file/upload/async: file_id on chunk 0, merge once the last chunk arrives."""
+
+    def __init__(self, fail_once_on: int | None = None):
+        self.chunks: dict[int, bytes] = {}
+        self.order: list[int] = []
+        self.fail_once_on = fail_once_on
+        self.lock = threading.Lock()
+
+    def __call__(self, req):
+        form = req.form()
+        fields = {n: v.decode() for n, fn, v in form if fn is None}
+        data = next(v for n, fn, v in form if n == "file")
+        idx, total = int(fields["chunk_index"]), int(fields["total_chunks"])
+
+        with self.lock:
+            if idx == self.fail_once_on:
+                self.fail_once_on = None
+                return StubResponse.json({"message": "boom"}, status=500)
+            if idx > 0:
+                assert fields.get("file_id") == "fid-1"
+            self.chunks[idx] = data
+            self.order.append(idx)
+
+        if idx == total - 1:
+            assert len(self.chunks) == total, "last chunk must be sent after all others"
+            return StubResponse.json({"message": "merging", "file_id": "fid-1", "merge_task_id": "m-1"}, status=202)
+        return StubResponse.json({"message": "chunk ok", "file_id": "fid-1"})
+
+    def assembled(self) -> bytes:
+        return b"".join(self.chunks[i] for i in sorted(self.chunks))
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_08_upload_async_parallel(tmp_path, use_mmap):
+    src = tmp_path / "big.bin"
+    src.write_bytes(PAYLOAD)
+    backend = ChunkBackend()
+
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/file/upload/async", backend)
+        client = DdmClient(base_url=stub.url, storage=FileStorage(tmp_path / "store"))
+        resp = client.file.upload_async(
+            project_id="p", file=str(src), chunk_size=CHUNK, concurrency=3, use_mmap=use_mmap
+        )
+
+    assert resp.merge_task_id == "m-1"
+    assert backend.order[0] == 0 and backend.order[-1] == 4
+    assert backend.assembled() == PAYLOAD
+    assert not list((tmp_path / "store").rglob("uploads/async/*.json")), "manifest removed on success"
+
+
+def test_08_upload_async_resumes_after_failure(tmp_path):
+    src = tmp_path / "big.bin"
+    src.write_bytes(PAYLOAD)
+    storage = FileStorage(tmp_path / "store")
+    backend = ChunkBackend(fail_once_on=2)
+
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/file/upload/async", backend)
+        client = DdmClient(base_url=stub.url, storage=storage)
+
+        with pytest.raises(ServerError):
+            client.file.upload_async(project_id="p", file=str(src), chunk_size=CHUNK, concurrency=1)
+
+        manifests = list((tmp_path / "store").rglob("uploads/async/*.json"))
+        assert len(manifests) == 1
+        sent_before = list(backend.order)
+        assert sent_before == [0, 1]
+
+        # the resumed upload keeps the manifest's chunk size and reports it
+        resp = client.file.upload_async(project_id="p", file=str(src), chunk_size=2 * CHUNK, concurrency=2)
+
+    assert resp.merge_task_id == "m-1" and resp.chunk_size == CHUNK
+    assert sorted(backend.order[len(sent_before):]) == [2, 3, 4], "acknowledged chunks are not re-sent"
+    assert backend.assembled() == PAYLOAD
+    assert not list((tmp_path / "store").rglob("uploads/async/*.json"))
+
+
+def test_08_upload_async_bytes_without_storage():
+    backend = ChunkBackend()
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/file/upload/async", backend)
+        client = DdmClient(base_url=stub.url)
+        resp = client.file.upload_async(project_id="p", file=PAYLOAD, filename="x.bin", chunk_size=CHUNK)
+
+    assert resp.file_id == "fid-1"
+    assert backend.assembled() == PAYLOAD
+
+
+def test_08_only_unknown_upload_errors_restart():
+    assert is_stale_upload_error(NotFound(404, "unknown file_id"))
+    assert is_stale_upload_error(Conflict(409, "upload expired"))
+    assert not is_stale_upload_error(BadRequest(400, "chunk too large"))
+    assert not is_stale_upload_error(ServerError(500, "boom"))
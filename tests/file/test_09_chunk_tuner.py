@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import pytest
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.fs import FileStorage
+from ddm_sdk.transport.chunked import ChunkSizeTuner
+from tests.stub_server import StubResponse, StubServer
+
+MB = 1024 * 1024
+
+
+def _simulate(tuner: ChunkSizeTuner, *, rtt: float, bw: float, uploads: int) -> list[int]:
+    sizes = []
+    for _ in range(uploads):
+        n = tuner.chunk_size
+        sizes.append(n)
+        for _ in range(4):
+            tuner.observe(n, rtt + n / bw)
+        tuner.suggest()
+    return sizes
+
+
+def test_09_tuner_converges_to_latency_bound():
+    t = ChunkSizeTuner(chunk_size=2 * MB, max_size=256 * MB)
+    sizes = _simulate(t, rtt=0.2, bw=10e6, uploads=8)
+
+    bw, rtt = t.model()
+    assert bw == pytest.approx(10e6, rel=0.01)
+    assert rtt == pytest.approx(0.2, rel=0.01)
+    # rtt <= 10% of a request -> 9 * rtt * bw = 18 MB
+    assert t.chunk_size == pytest.approx(18e6, rel=0.01)
+    assert all(b <= a * 2 for a, b in zip(sizes, sizes[1:])), "grows at most x2 per upload"
+
+
+def test_09_tuner_respects_timeout_and_bounds():
+    t = ChunkSizeTuner(chunk_size=2 * MB, timeout=2.0, safety=0.5, max_size=256 * MB)
+    _simulate(t, rtt=1.0, bw=5e6, uploads=10)
+    assert t.chunk_size <= 2.0 * 0.5 * 5e6  # a chunk must go through within half the timeout
+
+    t = ChunkSizeTuner(chunk_size=2 * MB, max_size=4 * MB)
+    _simulate(t, rtt=1.0, bw=50e6, uploads=5)
+    assert t.chunk_size == 4 * MB
+
+    assert t.size_for(12 * MB, concurrency=4) == 2 * MB  # small file keeps the pool busy
+
+
+def test_09_upload_async_adaptive_persists_tuning(tmp_path):
+    src = tmp_path / "f.bin"
+    src.write_bytes(b"x" * (3 * MB))
+    storage = FileStorage(tmp_path / "store")
+    seen: list[int] = []
+
+    def handler(req):
+        form = req.form()
+        fields = {n: v.decode() for n, fn, v in form if fn is None}
+        if fields["chunk_index"] == "0":
+            seen.append(len(next(v for n, fn, v in form if n == "file")))
+        return StubResponse.json({"message": "ok", "file_id": "fid"})
+
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/file/upload/async", handler)
+
+        c1 = DdmClient(base_url=stub.url, storage=storage)
+        c1.file.chunk_tuner().chunk_size = 512 * 1024
+        c1.file.upload_async(project_id="p", file=str(src), adaptive=True, concurrency=1)
+
+        saved = list((tmp_path / "store" / "uploads" / "tuning").glob("*.json"))
+        assert len(saved) == 1
+
+        # a fresh client picks up the learned size (probe step doubles it)
+        c2 = DdmClient(base_url=stub.url, storage=storage)
+        assert c2.file.chunk_tuner().chunk_size == 1024 * 1024
+        c2.file.upload_async(project_id="p", file=str(src), adaptive=True, concurrency=1)
+
+    assert seen == [512 * 1024, 1024 * 1024]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from ddm_sdk.async_client import AsyncDdmClient
+from ddm_sdk.storage.fs import FileStorage
+from tests.stub_server import StubResponse, StubServer
+
+PAYLOAD = bytes(range(256)) * 2048 + b"end"  # 512 KiB + 3 bytes
+
+
+def test_10_async_upload_async_and_download(tmp_path):
+    src = tmp_path / "in.bin"
+    src.write_bytes(PAYLOAD)
+    chunks: dict[int, bytes] = {}
+
+    def chunk_handler(req):
+        form = req.form()
+        fields = {n: v.decode() for n, fn, v in form if fn is None}
+        idx, total = int(fields["chunk_index"]), int(fields["total_chunks"])
+        chunks[idx] = next(v for n, fn, v in form if n == "file")
+        if idx == total - 1:
+            assert len(chunks) == total
+            return StubResponse.json({"message": "merging", "file_id": "fid", "merge_task_id": "m"}, status=202)
+        return StubResponse.json({"message": "ok", "file_id": "fid"})
+
+    async def run(url):
+        async with AsyncDdmClient(base_url=url, storage=FileStorage(tmp_path / "store")) as client:
+            up = await client.file.upload_async(project_id="p", file=str(src), chunk_size=100_000, concurrency=3)
+            dl = await client.file.download_to("fid", tmp_path / "out.bin", chunk_size=65536)
+            single = await client.file.upload(project_id="p", file=str(src), use_case=["x"])
+            return up, dl, single
+
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/file/upload/async", chunk_handler)
+        stub.route("GET", "/ddm/file/fid", lambda req: StubResponse.bytes(PAYLOAD))
+        stub.route(
+            "POST",
+            "/ddm/file/upload",
+            lambda req: StubResponse.json({"message": "ok", "file": {"id": "s1", "filename": "in.bin", "path": "p"}}),
+        )
+        up, dl, single = asyncio.run(run(stub.url))
+        upload_req = stub.requests[-1]
+
+    assert up.merge_task_id == "m"
+    assert b"".join(chunks[i] for i in sorted(chunks)) == PAYLOAD
+    assert dl.sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+    assert (tmp_path / "out.bin").read_bytes() == PAYLOAD
+
+    assert single.file.id == "s1"
+    assert int(upload_req.headers["Content-Length"]) == len(upload_req.body)
+    assert [p[0] for p in upload_req.form()] == ["project_id", "use_case", "file"]
+
+
+class _ThreadCheckingStorage(FileStorage):
+    """Records whether each storage write ran on the main (event loop) thread."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.writes: list[tuple[str, bool]] = []
+
+    def write_json(self, key, payload):
+        self.writes.append((key, threading.current_thread() is threading.main_thread()))
+        return super().write_json(key, payload)
+
+    def delete(self, key):
+        self.writes.append((key, threading.current_thread() is threading.main_thread()))
+        return super().delete(key)
+
+
+def test_10_async_upload_writes_manifest_off_the_loop(tmp_path):
+    src = tmp_path / "in.bin"
+    src.write_bytes(PAYLOAD)
+    store = _ThreadCheckingStorage(tmp_path / "store")
+    fail = {"once": 3}
+
+    def chunk_handler(req):
+        fields = {n: v.decode() for n, fn, v in req.form() if fn is None}
+        idx, total = int(fields["chunk_index"]), int(fields["total_chunks"])
+        if fail.get("once") == idx:
+            del fail["once"]
+            return StubResponse.json({"message": "boom"}, status=500)
+        if idx == total - 1:
+            return StubResponse.json({"message": "merging", "file_id": "fid", "merge_task_id": "m"}, status=202)
+        return StubResponse.json({"message": "ok", "file_id": "fid"})
+
+    async def run(url):
+        async with AsyncDdmClient(base_url=url, storage=store) as client:
+            with pytest.raises(Exception):
+                await client.file.upload_async(project_id="p", file=str(src), chunk_size=100_000, concurrency=1)
+            # resumes with the manifest's chunk size; the tuner state is saved afterwards
+            return await client.file.upload_async(project_id="p", file=str(src), concurrency=2, adaptive=True)
+
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/file/upload/async", chunk_handler)
+        up = asyncio.run(run(stub.url))
+
+    assert up.merge_task_id == "m" and up.chunk_size == 100_000
+    keys = {k.split("/")[1] for k, _ in store.writes}
+    assert {"async", "tuning"} <= keys  # manifest saves/delete and the tuner state
+    assert not [k for k, on_loop in store.writes if on_loop]
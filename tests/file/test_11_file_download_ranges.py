@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+
+import pytest
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.transport.ranges import PartState, plan_segments
+from tests.stub_server import StubResponse, StubServer
+
+FILE_ID = "2813033a-daff-458c-98f3-37330490d84d"
+PAYLOAD = bytes(range(256)) * 4096 + b"tail"  # 1 MiB + 4
+SHA = hashlib.sha256(PAYLOAD).hexdigest()
+ETAG = '"v1"'
+
+
+class _Ranged:
+    """GET/HEAD of PAYLOAD with single byte ranges, ETag and If-Range; ranges=False ignores Range."""
+
+    def __init__(self, data=PAYLOAD, *, ranges=True, etag=ETAG):
+        self.data, self.ranges, self.etag = data, ranges, etag
+
+    def __call__(self, req):
+        h = {"ETag": self.etag}
+        if self.ranges:
+            h["Accept-Ranges"] = "bytes"
+        m = re.match(r"bytes=(\d+)-(\d*)$", req.headers.get("Range", ""))
+        if_range = req.headers.get("If-Range")
+        if not (self.ranges and m and req.method == "GET" and if_range in (None, self.etag)):
+            return StubResponse.bytes(self.data, headers=h)
+        start = int(m.group(1))
+        end = int(m.group(2)) if m.group(2) else len(self.data) - 1
+        if start >= len(self.data):
+            return StubResponse.bytes(b"", status=416, headers={"Content-Range": f"bytes */{len(self.data)}"})
+        h["Content-Range"] = f"bytes {start}-{end}/{len(self.data)}"
+        return StubResponse.bytes(self.data[start:end + 1], status=206, headers=h)
+
+
+def _ranges(stub):
+    return [r.headers.get("Range") for r in stub.requests if r.method == "GET"]
+
+
+def _partial(tmp_path, n, validator=ETAG):
+    out = tmp_path / "data.bin"
+    part = tmp_path / "data.bin.part"
+    part.write_bytes(PAYLOAD[:n])
+    PartState(part=part, validator=validator).save()
+    return out, part
+
+
+def test_11_plan_segments():
+    assert plan_segments(10, 3, min_size=1) == [(0, 3), (4, 7), (8, 9)]
+    assert plan_segments(10, 4, min_size=4) == [(0, 4), (5, 9)]
+    assert plan_segments(10, 4, min_size=100) == [(0, 9)]
+
+
+def test_11_resume_from_part_and_restart_when_changed(tmp_path):
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/file/{FILE_ID}", _Ranged())
+        client = DdmClient(base_url=stub.url)
+
+        out, part = _partial(tmp_path, 900_000)
+        res = client.file.download_to(FILE_ID, out, chunk_size=64 * 1024, expected_sha256=SHA)
+        assert res.sha256 == SHA and res.bytes == len(PAYLOAD) and out.read_bytes() == PAYLOAD
+        assert _ranges(stub) == ["bytes=900000-"]
+        assert stub.requests[0].headers["If-Range"] == ETAG
+        assert not part.exists() and not PartState.path_for(part).exists()
+
+        # the file changed since the .part was written: If-Range fails, full body replaces it
+        stub.requests.clear()
+        out, part = _partial(tmp_path, 900_000, validator='"v0"')
+        part.write_bytes(b"\xff" * 900_000)
+        assert client.file.download_to(FILE_ID, out, expected_sha256=SHA).sha256 == SHA
+        assert len(stub.requests) == 1
+
+        # already complete: 416, then one plain request
+        stub.requests.clear()
+        out, part = _partial(tmp_path, len(PAYLOAD))
+        assert client.file.download_to(FILE_ID, out).sha256 == SHA
+        assert _ranges(stub) == [f"bytes={len(PAYLOAD)}-", None]
+
+
+def test_11_part_without_validator_is_not_resumed(tmp_path):
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/file/{FILE_ID}", _Ranged())
+        client = DdmClient(base_url=stub.url)
+        out, part = _partial(tmp_path, 900_000, validator=None)
+        part.write_bytes(b"\xff" * 900_000)  # stale bytes a Range request would keep
+        res = client.file.download_to(FILE_ID, out)
+    assert res.sha256 == SHA and out.read_bytes() == PAYLOAD
+    assert _ranges(stub) == [None]
+
+
+def test_11_failed_transfer_keeps_part_for_resume(tmp_path):
+    out = tmp_path / "data.bin"
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/file/{FILE_ID}", lambda req: StubResponse.json({"message": "boom"}, status=400))
+        client = DdmClient(base_url=stub.url)
+        _partial(tmp_path, 1000)
+        with pytest.raises(Exception):
+            client.file.download_to(FILE_ID, out)
+        assert (tmp_path / "data.bin.part").stat().st_size == 1000
+        with pytest.raises(Exception):
+            client.file.download_to(FILE_ID, out, resume=False)
+        assert not (tmp_path / "data.bin.part").exists()
+
+
+def test_11_segments_in_parallel_and_resume_missing_ones(tmp_path):
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/file/{FILE_ID}", _Ranged())
+        stub.route("HEAD", f"/ddm/file/{FILE_ID}", _Ranged())
+        client = DdmClient(base_url=stub.url)
+
+        res = client.file.download_to(FILE_ID, tmp_path / "a.bin", segments=4, min_segment_size=100_000, expected_sha256=SHA)
+        assert res.sha256 == SHA and (tmp_path / "a.bin").read_bytes() == PAYLOAD
+        plan = plan_segments(len(PAYLOAD), 4, min_size=100_000)
+        assert sorted(_ranges(stub)) == sorted(f"bytes={a}-{b}" for a, b in plan)
+
+        # segments 0 and 2 survived an interrupted run: only 1 and 3 are fetched again
+        stub.requests.clear()
+        part = tmp_path / "b.bin.part"
+        part.write_bytes(PAYLOAD[:plan[1][0]] + b"\0" * (plan[2][0] - plan[1][0])
+                         + PAYLOAD[plan[2][0]:plan[3][0]] + b"\0" * (len(PAYLOAD) - plan[3][0]))
+        PartState(part=part, validator=ETAG, size=len(PAYLOAD), segments=plan, done=[0, 2]).save()
+        assert client.file.download_to(FILE_ID, tmp_path / "b.bin", segments=4, min_segment_size=100_000).sha256 == SHA
+        assert sorted(_ranges(stub)) == sorted(f"bytes={a}-{b}" for a, b in (plan[1], plan[3]))
+
+
+def test_11_no_range_support_falls_back_to_plain_stream(tmp_path):
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/file/{FILE_ID}", _Ranged(ranges=False))
+        stub.route("HEAD", f"/ddm/file/{FILE_ID}", _Ranged(ranges=False))
+        client = DdmClient(base_url=stub.url)
+        out, _ = _partial(tmp_path, 500)
+        res = client.file.download_to(FILE_ID, out, segments=4, min_segment_size=1)
+    assert res.sha256 == SHA and out.read_bytes() == PAYLOAD
+    assert [r.method for r in stub.requests] == ["HEAD", "GET"]
+
+
+def test_11_async_segments_and_resume(tmp_path):
+    pytest.importorskip("aiohttp")
+    from ddm_sdk.async_client import AsyncDdmClient
+
+    async def run(url):
+        async with AsyncDdmClient(base_url=url) as client:
+            seg = await client.file.download_to(FILE_ID, tmp_path / "s.bin", segments=3, min_segment_size=100_000)
+            out, _ = _partial(tmp_path, 700_000)
+            res = await client.file.download_to(FILE_ID, out, expected_sha256=SHA)
+            return seg, res
+
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/file/{FILE_ID}", _Ranged())
+        stub.route("HEAD", f"/ddm/file/{FILE_ID}", _Ranged())
+        seg, res = asyncio.run(run(stub.url))
+
+    assert seg.sha256 == res.sha256 == SHA and (tmp_path / "s.bin").read_bytes() == PAYLOAD
+    assert _ranges(stub)[-1] == "bytes=700000-" and len(_ranges(stub)) == 4
+    assert res.bytes == len(PAYLOAD)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.storage.fs import FileStorage
+from ddm_sdk.transport.errors import Forbidden, NotFound
+from tests.stub_server import StubResponse, StubServer
+
+IDS = [f"f{i:03d}" for i in range(40)]
+BAD = {"f013", "f031"}   # the bulk endpoint rejects any batch containing these
+GONE = {"f020"}          # silently left out of the response
+
+
+def _bulk(req):
+    ids = req.json()["file_ids"]
+    if BAD & set(ids):
+        return StubResponse.json({"message": "invalid file id"}, status=400)
+    return StubResponse.json({"metadata": {f: {"rows": int(f[1:])} for f in ids if f not in GONE}})
+
+
+def _single(req):
+    fid = req.path.rsplit("/", 1)[1]
+    if fid in BAD:
+        return StubResponse.json({"message": "not found"}, status=404)
+    return StubResponse.json({"rows": int(fid[1:])})
+
+
+def _stub():
+    stub = StubServer()
+    stub.route("POST", "/ddm/file_metadata/", _bulk)
+    for f in IDS:
+        stub.route("GET", f"/ddm/file_metadata/{f}", _single)
+    return stub
+
+
+def test_05_batches_bisect_to_failing_ids():
+    with _stub() as stub:
+        client = DdmClient(base_url=stub.url)
+        found, errors = client.file_metadata.get_many_with_errors(IDS + ["f001", " "], batch_size=10, max_workers=3)
+
+    assert list(found) == [f for f in IDS if f not in BAD | GONE]
+    assert found["f007"] == {"rows": 7}
+    assert set(errors) == BAD | GONE
+    assert isinstance(errors["f013"], NotFound) and isinstance(errors["f020"], NotFound)
+
+    posts = [r for r in stub.requests if r.method == "POST"]
+    gets = [r.path for r in stub.requests if r.method == "GET"]
+    assert sorted(gets) == ["/ddm/file_metadata/f013", "/ddm/file_metadata/f031"]
+    # 4 batches, then bisection: 5+5, 2+3, 1+2, 1+1 isolates f013; 5+5, 2+3, 1+1 isolates f031
+    assert len(posts) == 4 + 8 + 6 and max(len(r.json()["file_ids"]) for r in posts) == 10
+
+    with _stub() as stub:
+        client = DdmClient(base_url=stub.url)
+        assert list(client.file_metadata.get_many(IDS, batch_size=10)) == list(found)
+        with pytest.raises(NotFound):
+            client.file_metadata.get_many(IDS, batch_size=10, raise_on_error=True)
+
+
+def test_05_cache_reused_until_version_changes(tmp_path):
+    ids = IDS[:5]
+    versions = {f: "2026-01-01T00:00:00" for f in ids}
+    with _stub() as stub:
+        client = DdmClient(base_url=stub.url, storage=FileStorage(tmp_path))
+        first = client.file_metadata.get_many(ids, versions=versions)
+        assert len(stub.requests) == 1
+
+        assert client.file_metadata.get_many(ids, versions=versions) == first
+        assert len(stub.requests) == 1
+
+        versions["f002"] = "2026-02-01T00:00:00"  # updated file
+        client.file_metadata.invalidate(["f004"])
+        client.file_metadata.get_many(ids, versions=versions)
+        assert stub.requests[-1].json() == {"file_ids": ["f002", "f004"]}
+
+        client.file_metadata.get_many(ids)  # no versions: nothing is trusted
+        assert stub.requests[-1].json() == {"file_ids": ids}
+
+
+def test_05_server_errors_are_not_bisected():
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/file_metadata/", lambda req: StubResponse.json({"message": "denied"}, status=403))
+        found, errors = DdmClient(base_url=stub.url).file_metadata.get_many_with_errors(IDS, batch_size=10)
+
+    assert found == {} and set(errors) == set(IDS)
+    assert all(isinstance(e, Forbidden) for e in errors.values())
+    assert [r.method for r in stub.requests] == ["POST"] * 4
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.transport.multipart import MultipartEncoder
+from tests.stub_server import StubResponse, StubServer
+
+
+@pytest.fixture()
+def stub():
+    with StubServer() as s:
+        s.route("POST", "/ddm/files/upload", lambda req: StubResponse.json({"message": "ok", "files": []}))
+        s.route(
+            "POST",
+            "/ddm/file/upload",
+            lambda req: StubResponse.json({"message": "ok", "file": {"id": "f1", "filename": "a.bin", "path": "p/a.bin"}}),
+        )
+        yield s
+
+
+def test_06_encoder_length_matches_body(tmp_path):
+    p = tmp_path / "blob.bin"
+    p.write_bytes(b"\x00\x01" * 70_000)
+
+    for use_mmap in (False, True):
+        enc = MultipartEncoder(boundary="b0undary", use_mmap=use_mmap, block_size=4096)
+        enc.add_field("project_id", "proj/x")
+        enc.add_file("files", str(p))
+        enc.add_file("files", b"inline", filename='we"ird.txt')
+        body = b"".join(enc)
+        assert len(body) == len(enc)
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_06_bulk_upload_streams_with_content_length(stub, tmp_path, use_mmap):
+    a = tmp_path / "a.csv"
+    b = tmp_path / "b.bin"
+    a.write_bytes(b"x,y\n1,2\n")
+    b.write_bytes(bytes(range(256)) * 2048)
+
+    client = DdmClient(base_url=stub.url)
+    client.files.upload(
+        project_id="proj",
+        files=[str(a), str(b)],
+        user_filenames=["A", "B"],
+        descriptions=["da", "db"],
+        use_case=[["crawling"]],
+        metadata_files=[b'{"k": 1}'],
+        metadata_filenames=["m.json"],
+        use_mmap=use_mmap,
+    )
+
+    req = stub.requests[-1]
+    assert "chunked" not in req.headers.get("Transfer-Encoding", "")
+    assert int(req.headers["Content-Length"]) == len(req.body)
+
+    parts = req.form()
+    assert [p[0] for p in parts] == [
+        "project_id",
+        "files", "user_filenames", "descriptions", "use_case",
+        "files", "user_filenames", "descriptions", "use_case",
+        "metadata-files",
+    ]
+    assert parts[1][1] == "a.csv" and parts[1][2] == a.read_bytes()
+    assert parts[5][1] == "b.bin" and parts[5][2] == b.read_bytes()
+    assert json.loads(parts[4][2]) == ["crawling"]
+    assert parts[-1][1] == "m.json"
+
+
+def test_06_single_upload_metadata_dict(stub, tmp_path):
+    f = tmp_path / "a.bin"
+    f.write_bytes(b"hello")
+
+    client = DdmClient(base_url=stub.url)
+    res = client.file.upload(project_id="proj", file=str(f), use_case=["u1", "u2"], metadata={"a": 1})
+    assert res.file.id == "f1"
+
+    parts = stub.requests[-1].form()
+    assert [p[0] for p in parts] == ["project_id", "use_case", "use_case", "file", "metadata-file"]
+    assert parts[3][2] == b"hello"
+    assert json.loads(parts[4][2]) == {"a": 1}
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import json
+import zipfile
+
+import pytest
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.scripts.files import download_project_zip
+from ddm_sdk.storage.fs import FileStorage
+from ddm_sdk.transport.archive import SPOOL_SUFFIX, UnsafeArchivePath
+from tests.stub_server import StubResponse, StubServer
+
+MEMBERS = {
+    "a.csv": b"x,y\n1,2\n",
+    "sub/dir/b.bin": bytes(range(256)) * 4096,  # 1 MiB
+    "sub/c.txt": b"hello " * 1000,
+}
+
+
+def _zip(members, *, compression=zipfile.ZIP_DEFLATED) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=compression) as zf:
+        zf.writestr("sub/empty/", b"")
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+def _corrupt(blob: bytes, member: bytes) -> bytes:
+    # flip one data byte of a stored member: sizes and headers stay valid, the CRC does not
+    i = blob.index(member) + 10
+    return blob[:i] + bytes([blob[i] ^ 0xFF]) + blob[i + 1:]
+
+
+def _no_spool(path):
+    return not any(p.name.endswith(SPOOL_SUFFIX) for p in path.rglob("*"))
+
+
+def test_07_download_zip_to_extracts_in_parallel(tmp_path):
+    blob = _zip(MEMBERS)
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/files/download", lambda req: StubResponse.bytes(blob))
+        client = DdmClient(base_url=stub.url)
+
+        kept = client.files.download_zip_to(["f1", "f2"], tmp_path / "keep" / "sel.zip")
+        res = client.files.download_zip_to(["f1", "f2"], tmp_path / "out", extract=True, workers=3, chunk_size=4096)
+
+    assert stub.requests[0].json() == {"file_ids": ["f1", "f2"]}
+    assert (tmp_path / "keep" / "sel.zip").read_bytes() == blob and kept.members == ()
+    assert kept.sha256 == res.sha256 == hashlib.sha256(blob).hexdigest() and res.bytes == len(blob)
+
+    assert list(res.members) == list(MEMBERS)
+    for name, data in MEMBERS.items():
+        assert (tmp_path / "out" / name).read_bytes() == data
+    assert (tmp_path / "out" / "sub" / "empty").is_dir()
+    assert _no_spool(tmp_path)
+
+
+def test_07_crc_mismatch_and_zip_slip_write_nothing(tmp_path):
+    bad_crc = _corrupt(_zip({"ok.txt": b"fine", "bad.bin": b"A" * 5000}, compression=zipfile.ZIP_STORED), b"A" * 5000)
+    slip = _zip({"ok.txt": b"fine", "../escape.txt": b"owned"})
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/files/download", lambda req: StubResponse.bytes(bad_crc))
+        stub.route("POST", "/ddm/files/download/project", lambda req: StubResponse.bytes(slip))
+        client = DdmClient(base_url=stub.url)
+
+        with pytest.raises(zipfile.BadZipFile, match="CRC"):
+            client.files.download_zip_to(["f1"], tmp_path / "crc", extract=True, workers=1)
+        with pytest.raises(UnsafeArchivePath):
+            client.files.download_project_zip_to("p", tmp_path / "slip", extract=True)
+
+    assert not (tmp_path / "crc" / "bad.bin").exists()
+    assert not (tmp_path / "escape.txt").exists() and not (tmp_path / "slip" / "ok.txt").exists()
+    assert _no_spool(tmp_path)
+
+
+def test_07_iter_members_and_async(tmp_path):
+    blob = _zip(MEMBERS)
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/files/download/project", lambda req: StubResponse.bytes(blob))
+        client = DdmClient(base_url=stub.url)
+
+        it = client.files.iter_project_zip_members("proj", spool_dir=tmp_path)
+        seen = {info.filename: f.read() for info, f in it}
+        assert seen == MEMBERS and _no_spool(tmp_path)
+
+        it = client.files.iter_project_zip_members("proj", spool_dir=tmp_path)
+        next(it)
+        assert not _no_spool(tmp_path)
+        it.close()
+        assert _no_spool(tmp_path)
+
+        async def run():
+            from ddm_sdk.async_client import AsyncDdmClient
+
+            async with AsyncDdmClient(base_url=stub.url) as aclient:
+                return await aclient.files.download_project_zip_to("proj", tmp_path / "async", extract=True)
+
+        pytest.importorskip("aiohttp")
+        res = asyncio.run(run())
+
+    assert len(res.members) == 3 and (tmp_path / "async" / "sub" / "c.txt").read_bytes() == MEMBERS["sub/c.txt"]
+
+
+def test_07_project_zip_script_extracts_into_storage(tmp_path, monkeypatch, capsys):
+    blob = _zip(MEMBERS)
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/files/download/project", lambda req: StubResponse.bytes(blob))
+        client = DdmClient(base_url=stub.url, storage=FileStorage(tmp_path))
+        monkeypatch.setattr(download_project_zip.DdmClient, "from_env", classmethod(lambda cls: client))
+        monkeypatch.setattr(download_project_zip, "ensure_authenticated", lambda c: None)
+        assert download_project_zip.main(["--project_id", "p1", "--extract", "--workers", "2"]) == 0
+
+    out = json.loads(capsys.readouterr().out)
+    root = tmp_path / "projects" / "p1" / "zips" / "project"
+    (extracted,) = [p for p in root.iterdir() if p.is_dir()]
+    assert out["saved_to"] == str(extracted) and out["members"] == 3
+    assert (extracted / "sub" / "dir" / "b.bin").read_bytes() == MEMBERS["sub/dir/b.bin"]
+    receipt = json.loads((root / f"{extracted.name}.json").read_text())
+    assert receipt["extracted"] is True and receipt["sha256"] == hashlib.sha256(blob).hexdigest()
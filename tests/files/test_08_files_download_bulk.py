@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import zipfile
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.scripts.files import download_bulk
+from ddm_sdk.scripts.files.download_bulk import BulkItem, choose_mode
+from ddm_sdk.storage.fs import FileStorage
+from tests.stub_server import StubResponse, StubServer
+
+IDS = [f"00000000-0000-4000-8000-{i:012d}" for i in range(4)]
+DATA = {fid: (f"file {i} ".encode() * (1000 * (i + 1))) for i, fid in enumerate(IDS)}
+
+
+def _item(i: int, **over) -> dict:
+    fid = IDS[i]
+    d = {
+        "id": fid, "filename": f"f{i}.csv", "path": f"p1/f{i}.csv", "user_id": "u", "project_id": "p1",
+        "file_size": len(DATA[fid]), "file_hash": hashlib.sha256(DATA[fid]).hexdigest(),
+    }
+    d.update(over)
+    return d
+
+
+def _catalog(items):
+    def handler(req):
+        return StubResponse.json({"data": items, "total": len(items), "filtered_total": len(items),
+                                  "page": 1, "perPage": 100})
+    return handler
+
+
+def _run(monkeypatch, capsys, client, argv):
+    monkeypatch.setattr(download_bulk.DdmClient, "from_env", classmethod(lambda cls: client))
+    monkeypatch.setattr(download_bulk, "ensure_authenticated", lambda c: None)
+    code = download_bulk.main(["--project_id", "p1", *argv])
+    return code, json.loads(capsys.readouterr().out)
+
+
+def test_08_choose_mode():
+    small = [BulkItem(file_id=str(i), size=1000) for i in range(300)]
+    assert choose_mode(small) == "zip"
+    assert choose_mode(small[:10]) == "parallel"
+    assert choose_mode(small + [BulkItem(file_id="x")]) == "parallel"  # unknown size
+    assert choose_mode([BulkItem(file_id=str(i), size=10 << 20) for i in range(300)]) == "parallel"
+
+
+def test_08_parallel_skips_matching_local_hash(tmp_path, monkeypatch, capsys):
+    items = [_item(0), _item(1), _item(2, file_hash="ab" * 32)]
+    store = FileStorage(tmp_path)
+    local = store.blob_path(f"projects/p1/files/{IDS[0]}/f0", ext=".csv")
+    local.write_bytes(DATA[IDS[0]])
+
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/catalog/list", _catalog(items))
+        for fid in IDS:
+            stub.route("GET", f"/ddm/file/{fid}", lambda req, fid=fid: StubResponse.bytes(DATA[fid]))
+        client = DdmClient(base_url=stub.url, storage=store)
+        code, out = _run(monkeypatch, capsys, client, ["--query", "--use_case", "crawl", "--mode", "auto", "--workers", "3"])
+
+    assert code == 1 and out["mode"] == "parallel"
+    assert (out["files"], out["downloaded"], out["skipped"], out["failed"]) == (3, 1, 1, 1)
+    assert out["bytes"] == len(DATA[IDS[1]]) and out["mib_per_s"] is not None
+    q = stub.requests[0].query
+    assert q["project_id"] == ["p1"] and q["use_case"] == ["crawl"]
+    assert sorted(r.path for r in stub.requests[1:]) == [f"/ddm/file/{IDS[1]}", f"/ddm/file/{IDS[2]}"]
+
+    assert (tmp_path / "projects/p1/files" / IDS[1] / "f1.csv").read_bytes() == DATA[IDS[1]]
+    assert not (tmp_path / "projects/p1/files" / IDS[2] / "f2.csv").exists()  # checksum mismatch
+    assert "ChecksumMismatch" in out["results"][2]["error"]
+    rec = store.read_json(f"projects/p1/files/{IDS[1]}/file")
+    assert rec["filename"] == "f1.csv" and rec["last_download"]["sha256"] == _item(1)["file_hash"]
+
+
+def test_08_zip_mode_moves_members_and_fetches_leftovers(tmp_path, monkeypatch, capsys):
+    items = [_item(i) for i in range(4)]
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for i in range(3):  # f3.csv missing from the archive
+            zf.writestr(f"p1/f{i}.csv", DATA[IDS[i]])
+    store = FileStorage(tmp_path)
+
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/files/download", lambda req: StubResponse.bytes(buf.getvalue()))
+        stub.route("GET", f"/ddm/file/{IDS[3]}", lambda req: StubResponse.bytes(DATA[IDS[3]]))
+        client = DdmClient(base_url=stub.url, storage=store)
+        for i in range(4):
+            store.write_json(f"projects/p1/files/{IDS[i]}/file", items[i])
+        code, out = _run(monkeypatch, capsys, client,
+                         [*(x for fid in IDS for x in ("--file-id", fid)), "--mode", "zip", "--out", str(tmp_path / "out")])
+
+    assert code == 0 and out["mode"] == "zip" and out["downloaded"] == 4
+    assert stub.requests[0].json() == {"file_ids": IDS}
+    assert [r.path for r in stub.requests[1:]] == [f"/ddm/file/{IDS[3]}"]
+    files = tmp_path / "out" / "projects/p1/files"
+    for i, fid in enumerate(IDS):
+        assert (files / fid / f"f{i}.csv").read_bytes() == DATA[fid]
+    assert sorted(p.name for p in files.iterdir()) == sorted(IDS)  # extraction dir removed
+
+
+def test_08_zip_mode_shared_filename_is_fetched_per_file(tmp_path, monkeypatch, capsys):
+    items = [_item(0), _item(1, filename="f0.csv")]
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("p1/f0.csv", DATA[IDS[0]])
+    store = FileStorage(tmp_path)
+
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/files/download", lambda req: StubResponse.bytes(buf.getvalue()))
+        for fid in IDS[:2]:
+            stub.route("GET", f"/ddm/file/{fid}", lambda req, fid=fid: StubResponse.bytes(DATA[fid]))
+        client = DdmClient(base_url=stub.url, storage=store)
+        for it in items:
+            store.write_json(f"projects/p1/files/{it['id']}/file", it)
+        code, out = _run(monkeypatch, capsys, client, ["--file-id", IDS[0], "--file-id", IDS[1], "--mode", "zip"])
+
+    assert code == 0 and out["downloaded"] == 2
+    assert sorted(r.path for r in stub.requests[1:]) == [f"/ddm/file/{IDS[0]}", f"/ddm/file/{IDS[1]}"]
+    for fid in IDS[:2]:
+        assert (tmp_path / "projects/p1/files" / fid / "f0.csv").read_bytes() == DATA[fid]
+
+
+def test_08_zip_failure_falls_back_to_parallel(tmp_path, monkeypatch, capsys):
+    store = FileStorage(tmp_path)
+    with StubServer() as stub:
+        stub.route("POST", "/ddm/files/download", lambda req: StubResponse.json({"message": "boom"}, status=500))
+        for fid in IDS[:2]:
+            stub.route("GET", f"/ddm/file/{fid}", lambda req, fid=fid: StubResponse.bytes(DATA[fid]))
+        client = DdmClient(base_url=stub.url, storage=store)
+        for i in range(2):
+            store.write_json(f"projects/p1/files/{IDS[i]}/file", _item(i))
+        code, out = _run(monkeypatch, capsys, client, ["--file-id", IDS[0], "--file-id", IDS[1], "--mode", "zip"])
+
+    assert code == 0 and out["downloaded"] == 2
+    assert all("ServerError" in r["zip_error"] for r in out["results"])
+    assert (tmp_path / "projects/p1/files" / IDS[1] / "f1.csv").read_bytes() == DATA[IDS[1]]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.transport.cache import HttpCache
+from tests.stub_server import StubResponse, StubServer
+
+TYPES = {"tabular": [".csv", ".parquet"]}
+
+
+def test_05_ttl_applies_without_server_headers(tmp_path):
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/parametrics/df-supported-file-types", lambda req: StubResponse.json(TYPES))
+        stub.route("GET", "/ddm/catalog/list", lambda req: StubResponse.json({"data": [], "total": 0}))
+        cache = HttpCache(directory=tmp_path / "http_cache")
+        client = DdmClient(base_url=stub.url, token="t1", http_cache=cache)
+
+        assert client.parametrics.df_supported_file_types() == TYPES
+        assert client.parametrics.df_supported_file_types() == TYPES
+        client._http.request("GET", "/ddm/catalog/list")  # no rule -> never cached
+        client._http.request("GET", "/ddm/catalog/list")
+
+        # a new process: memory is empty, the disk copy is used
+        again = DdmClient(base_url=stub.url, token="t1", http_cache=HttpCache(directory=tmp_path / "http_cache"))
+        assert again.parametrics.df_supported_file_types() == TYPES
+        # another user does not see it
+        other = DdmClient(base_url=stub.url, token="t2", http_cache=cache)
+        other.parametrics.df_supported_file_types()
+
+        paths = [r.path for r in stub.requests]
+        assert paths.count("/ddm/parametrics/df-supported-file-types") == 2
+        assert paths.count("/ddm/catalog/list") == 2
+        assert cache.stats.as_dict() == {"hits": 1, "revalidated": 0, "misses": 2, "stores": 2}
+
+
+def test_05_etag_revalidation_and_no_store():
+    etag = '"v1"'
+
+    def registry(req):
+        if req.headers.get("If-None-Match") == etag:
+            return StubResponse(status=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        return StubResponse.json({"data": [1, 2], "count": 2}, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+    with StubServer() as stub:
+        stub.route("GET", "/ddm/blockchain/contracts/registry", registry)
+        stub.route(
+            "GET",
+            "/ddm/expectations/suites/s1",
+            lambda req: StubResponse.json({"id": "s1"}, headers={"Cache-Control": "no-store"}),
+        )
+        cache = HttpCache()
+        client = DdmClient(base_url=stub.url, http_cache=cache)
+
+        results = [client.blockchain.registry() for _ in range(3)]
+        client._http.request("GET", "/ddm/expectations/suites/s1")
+        client._http.request("GET", "/ddm/expectations/suites/s1")
+
+        assert results == [{"data": [1, 2], "count": 2}] * 3
+        assert [r.headers.get("If-None-Match") for r in stub.requests[:3]] == [None, etag, etag]
+        assert cache.stats.revalidated == 2 and cache.stats.hits == 0
+        assert len(stub.requests) == 5
+
+
+def test_05_x_fields_is_part_of_the_key():
+    addr = "0xabc"
+
+    def contract(req):
+        body = {"address": addr, "name": "Reg"}
+        if req.headers.get("X-Fields"):
+            body = {"address": addr}
+        return StubResponse.json(body)
+
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/blockchain/contracts/{addr}", contract)
+        client = DdmClient(base_url=stub.url, http_cache=HttpCache())
+        full = client._http.request("GET", f"/ddm/blockchain/contracts/{addr}")
+        masked = client._http.request("GET", f"/ddm/blockchain/contracts/{addr}", headers={"X-Fields": "address"})
+        again = client._http.request("GET", f"/ddm/blockchain/contracts/{addr}", headers={"x-fields": "address"})
+
+    assert full == {"address": addr, "name": "Reg"} and masked == again == {"address": addr}
+    assert len(stub.requests) == 2
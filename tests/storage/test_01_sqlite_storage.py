@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.scripts.file import download_file
+from ddm_sdk.scripts.file.utils import file_dir_key
+from ddm_sdk.storage.factory import make_storage
+from ddm_sdk.storage.fs import FileStorage
+from ddm_sdk.storage import sqlite
+from ddm_sdk.storage.sqlite import BLOB_DIR, DB_FILENAME, SqliteStorage, migrate_fs_tree
+from tests.stub_server import StubResponse, StubServer
+
+
+def test_01_sqlite_backend_roundtrip(tmp_path):
+    st = make_storage("sqlite", str(tmp_path))
+    assert isinstance(st, SqliteStorage)
+
+    loc = st.write_json("projects/p1/files/abc/file", {"id": "abc", "n": 1})
+    assert loc.endswith("#projects/p1/files/abc/file.json")
+    assert st.read_json("projects/p1/files/abc/file") == {"id": "abc", "n": 1}
+    assert st.read_json("/projects/p1/files/abc/file/") == {"id": "abc", "n": 1}  # same key normalization
+    st.write_json("projects/p1/files/abc/file", [1, 2])
+    assert st.read_json("projects/p1/files/abc/file") == [1, 2]
+    st.delete("projects/p1/files/abc/file")
+    assert st.read_json("projects/p1/files/abc/file") is None
+
+    st.write_bytes("blobs/x", b"\x00\x01", ext="bin")
+    assert st.read_bytes("blobs/x", ext=".bin") == b"\x00\x01"
+    assert st.read_bytes("blobs/x", ext=".zip") is None
+
+    src = tmp_path / "report.html"
+    src.write_text("<h1>hi</h1>", encoding="utf-8")
+    st.copy_file("reports/r1", src)
+    assert st.read_bytes("reports/r1", ext=".html") == b"<h1>hi</h1>"
+
+    assert (tmp_path / DB_FILENAME).exists()
+    assert not (tmp_path / "projects").exists()  # nothing written as loose files
+
+
+def test_01_sqlite_concurrent_writers(tmp_path):
+    st = SqliteStorage(tmp_path)
+
+    def work(n):
+        for i in range(50):
+            st.write_json(f"logs/{n}/{i}", {"n": n, "i": i})
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    other = SqliteStorage(tmp_path)  # second connection sees committed rows
+    assert other.read_json("logs/7/49") == {"n": 7, "i": 49}
+
+
+def test_01_migrate_fs_tree(tmp_path):
+    fs = FileStorage(tmp_path)
+    fs.write_json("projects/p1/files/abc/file", {"id": "abc"})
+    fs.write_json("blockchain/contracts/sepolia/0x1.abi", [{"type": "event"}])
+    fs.write_bytes("projects/p1/files/abc/payload", b"raw", ext=".csv")
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    dst = SqliteStorage(tmp_path)
+    stats = migrate_fs_tree(tmp_path, dst, batch_size=2)
+
+    assert stats["json"] == 2 and stats["blobs"] == 2
+    assert dst.read_json("projects/p1/files/abc/file") == {"id": "abc"}
+    assert dst.read_json("blockchain/contracts/sepolia/0x1.abi") == [{"type": "event"}]
+    assert dst.read_bytes("projects/p1/files/abc/payload", ext=".csv") == b"raw"
+    assert dst.read_bytes("broken", ext=".json") == b"{not json"
+
+    # running again is idempotent and never copies the database into itself
+    assert migrate_fs_tree(tmp_path, dst) == stats
+
+
+def test_01_large_blobs_are_kept_as_files(tmp_path, monkeypatch):
+    st = SqliteStorage(tmp_path, max_inline_blob=1024)
+    big, small = b"x" * 4096, b"y" * 512
+
+    assert st.write_bytes("b/big", big) == str(tmp_path / BLOB_DIR / "b/big.bin")
+    assert st.read_bytes("b/big") == big
+
+    monkeypatch.setattr(sqlite, "_COPY_CHUNK", 100)
+    src = tmp_path / "src.csv"
+    src.write_bytes(small + b"z" * 250)  # streamed into the row 100 bytes at a time
+    assert st.copy_file("b/copy", src).startswith("sqlite:")
+    assert st.read_bytes("b/copy", ext=".csv") == small + b"z" * 250
+    src.write_bytes(big)
+    assert st.copy_file("b/copy", src) == str(tmp_path / BLOB_DIR / "b/copy.csv")
+    assert st.read_bytes("b/copy", ext=".csv") == big
+
+    # rewriting a key moves it between a row and a file without leaving the other behind
+    st.write_bytes("b/big", small)
+    assert st.read_bytes("b/big") == small and not (tmp_path / BLOB_DIR / "b/big.bin").exists()
+    st.write_bytes("b/big", big)
+    st.delete_bytes("b/big")
+    assert st.read_bytes("b/big") is None
+
+    # migration copies big files without loading them into the database
+    fs_root = tmp_path / "fs"
+    FileStorage(fs_root).write_bytes("projects/p1/files/f/data", big, ext=".csv")
+    dst = SqliteStorage(tmp_path / "db", max_inline_blob=1024)
+    assert migrate_fs_tree(fs_root, dst)["blobs"] == 1
+    assert (tmp_path / "db" / BLOB_DIR / "projects/p1/files/f/data.csv").read_bytes() == big
+
+
+def test_01_download_file_streams_into_sqlite_storage(tmp_path, monkeypatch, capsys):
+    file_id = "3f2b1c4e-8d7a-4e21-9c55-0a1b2c3d4e5f"
+    data = b"a,b\n" + b"1,2\n" * 10_000
+    st = SqliteStorage(tmp_path)
+    st.write_json(f"{file_dir_key('p1', file_id)}/file", {"filename": "data.csv"})
+
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/file/{file_id}", lambda req: StubResponse.bytes(data))
+        client = DdmClient(base_url=stub.url, storage=st)
+        monkeypatch.setattr(download_file.DdmClient, "from_env", classmethod(lambda cls: client))
+        monkeypatch.setattr(download_file, "ensure_authenticated", lambda c: None)
+        assert download_file.main(["--project_id", "p1", "--file_id", file_id]) == 0
+    out = json.loads(capsys.readouterr().out)
+
+    assert out["bytes"] == len(data) and out["sha256"] == hashlib.sha256(data).hexdigest()
+    assert out["saved_to"] == str(tmp_path / BLOB_DIR / file_dir_key("p1", file_id) / "data.csv")
+    assert st.read_bytes(f"{file_dir_key('p1', file_id)}/data", ext=".csv") == data
+    assert st.read_json(f"{file_dir_key('p1', file_id)}/file")["last_download"]["bytes"] == len(data)
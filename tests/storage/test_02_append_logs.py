@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ddm_sdk.scripts.blockchain.utils import append_blockchain_log
+from ddm_sdk.scripts.validations.utils import append_validation_log
+from ddm_sdk.storage.fs import FileStorage
+from ddm_sdk.storage.logs import append_entry, iter_entries
+from ddm_sdk.storage.sqlite import SqliteStorage, migrate_fs_tree
+
+
+@pytest.fixture(params=["fs", "sqlite"])
+def storage(request, tmp_path):
+    return FileStorage(tmp_path) if request.param == "fs" else SqliteStorage(tmp_path)
+
+
+def test_02_concurrent_appends_are_not_lost(storage):
+    def work(n):
+        for i in range(100):
+            append_entry(storage, "blockchain/logs", {"action": "a", "n": n, "i": i})
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    entries = list(iter_entries(storage, "blockchain/logs"))
+    assert len(entries) == 800
+    assert all("ts" in e for e in entries)
+    assert [e["i"] for e in entries if e["n"] == 3] == list(range(100))  # write order per writer
+
+
+def test_02_time_range_and_legacy_list(storage):
+    storage.write_json("p/logs", [{"ts": "2025-12-31T23:00:00+00:00", "action": "old"}])  # pre-JSONL format
+    for day in range(1, 6):
+        append_entry(storage, "p/logs", {"ts": f"2026-01-0{day}T12:00:00+00:00", "action": f"d{day}"})
+
+    all_actions = [e["action"] for e in iter_entries(storage, "p/logs")]
+    window = [e["action"] for e in iter_entries(storage, "p/logs", since="2026-01-02", until="2026-01-04T12:00:00Z")]
+
+    assert all_actions == ["old", "d1", "d2", "d3", "d4", "d5"]
+    assert window == ["d2", "d3"]
+
+
+def test_02_fs_log_is_jsonl_and_reader_is_lazy(tmp_path):
+    st = FileStorage(tmp_path)
+    client = SimpleNamespace(storage=st)
+    append_validation_log(client, project_id="proj", action="validate", ok=True, details={"x": 1})
+    append_blockchain_log(client, action="dump_contracts", ok=True)
+
+    p = tmp_path / "projects/proj/validations/logs.jsonl"
+    lines = p.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1 and json.loads(lines[0])["details"] == {"x": 1}
+
+    with p.open("ab") as f:
+        f.write(b'{"ts": "2026-01-01T00:00:00+00:00", "act')  # torn write from a crashed process
+    it = st.iter_log("projects/proj/validations/logs")
+    assert next(it)["action"] == "validate"
+    assert list(it) == []
+
+
+def test_02_migration_moves_jsonl_logs_to_rows(tmp_path):
+    fs = FileStorage(tmp_path)
+    for i in range(3):
+        fs.append("blockchain/logs", {"ts": f"2026-01-0{i + 1}T00:00:00+00:00", "i": i})
+
+    db = SqliteStorage(tmp_path)
+    assert migrate_fs_tree(tmp_path, db)["logs"] == 3
+    assert migrate_fs_tree(tmp_path, db)["logs"] == 3  # re-run replaces, no duplicates
+    assert [e["i"] for e in db.iter_log("blockchain/logs", since="2026-01-02")] == [1, 2]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ddm_sdk.scripts.expectations.utils import dataset_suites_key, link_suite_dataset, suite_datasets_key
+from ddm_sdk.storage import _files
+from ddm_sdk.storage.fs import FileStorage
+from ddm_sdk.storage.sqlite import SqliteStorage, migrate_fs_tree
+
+
+@pytest.fixture(params=["fs", "sqlite"])
+def storage(request, tmp_path):
+    return FileStorage(tmp_path) if request.param == "fs" else SqliteStorage(tmp_path)
+
+
+def _run(workers):
+    threads = [threading.Thread(target=w) for w in workers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def test_03_concurrent_update_json_loses_nothing(storage):
+    def work():
+        for _ in range(50):
+            storage.update_json("counters/c", lambda cur: {"n": (cur or {}).get("n", 0) + 1})
+
+    _run([work] * 8)
+    assert storage.read_json("counters/c") == {"n": 400}
+
+
+def test_03_update_json_refuses_corrupt_document(tmp_path):
+    st = FileStorage(tmp_path)
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "b.json").write_bytes(b'{"v": 1')
+    assert st.read_json("a/b") is None
+    with pytest.raises(ValueError):
+        st.update_json("a/b", lambda cur: {"v": 2})
+    assert (tmp_path / "a" / "b.json").read_bytes() == b'{"v": 1'
+
+    sq = SqliteStorage(tmp_path / "sq")
+    sq.write_json("a/b", {"v": 1})
+    sq._conn.execute("UPDATE json_docs SET data = '{\"v\": 1' WHERE key = 'a/b'")
+    with pytest.raises(ValueError):
+        sq.update_json("a/b", lambda cur: {"v": 2})
+
+
+def test_03_link_suite_dataset_from_many_workers(storage):
+    client = SimpleNamespace(storage=storage)
+
+    def work(n):
+        return lambda: [link_suite_dataset(client=client, suite_id="s1", dataset_id=f"d{n}-{i}") for i in range(20)]
+
+    _run([work(n) for n in range(6)])
+
+    datasets = storage.read_json(suite_datasets_key(suite_id="s1"))
+    assert len(datasets) == 120 and datasets == sorted(datasets)
+    assert storage.read_json(dataset_suites_key(dataset_id="d5-19")) == ["s1"]
+
+
+def test_03_failed_write_keeps_old_file(tmp_path, monkeypatch):
+    st = FileStorage(tmp_path)
+    st.write_json("a/b", {"v": 1})
+
+    def crash(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(_files.os, "replace", crash)
+    with pytest.raises(OSError):
+        st.write_json("a/b", {"v": 2, "big": "x" * 100_000})
+    monkeypatch.undo()
+
+    assert st.read_json("a/b") == {"v": 1}
+    assert [p.name for p in (tmp_path / "a").iterdir()] == ["b.json"]  # temp file removed
+
+
+def test_03_locking_storage_and_migration_skip_bookkeeping(tmp_path):
+    st = FileStorage(tmp_path / "fs", locking=True, fsync=True)
+    st.write_json("x", [1])
+    st.write_bytes("blob", b"abc", ext=".txt")
+    st.update_json("x", lambda cur: cur + [2])
+    (tmp_path / "fs" / ".x.json.123.tmp").write_bytes(b"{")  # left by a killed writer
+
+    assert (tmp_path / "fs" / ".locks" / "x.lock").exists()
+    stats = migrate_fs_tree(tmp_path / "fs", SqliteStorage(tmp_path / "db"))
+    assert (stats["json"], stats["blobs"]) == (1, 1)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from ddm_sdk.storage.encoding import COMPACT, JsonEncoding, have_zstd, parse_encoding, parse_encoding_rules
+from ddm_sdk.storage.factory import make_storage
+from ddm_sdk.storage.fs import FileStorage
+from ddm_sdk.storage.sqlite import SqliteStorage, migrate_fs_tree
+
+DOC = {"results": [{"column": f"c{i}", "success": i % 3 != 0, "unexpected": [i, i + 1]} for i in range(200)], "name": "é"}
+
+
+def test_04_default_stays_pretty(tmp_path):
+    st = FileStorage(tmp_path)
+    st.write_json("a/doc", DOC)
+    text = (tmp_path / "a/doc.json").read_text(encoding="utf-8")
+    assert text == json.dumps(DOC, indent=2, ensure_ascii=False)
+
+
+def test_04_compact_and_prefix_rules(tmp_path):
+    default, rules = parse_encoding_rules("compact;tasks/=compact+gzip;tasks/keep/=pretty")
+    st = FileStorage(tmp_path, encoding=default, encodings=rules)
+
+    st.write_json("projects/p/doc", DOC)
+    st.write_json("tasks/t1/result", DOC)
+    st.write_json("tasks/keep/x", DOC)
+
+    compact = (tmp_path / "projects/p/doc.json").read_bytes()
+    gz = (tmp_path / "tasks/t1/result.json.gz").read_bytes()
+    assert len(compact) < 0.8 * len(json.dumps(DOC, indent=2, ensure_ascii=False).encode())
+    assert json.loads(gzip.decompress(gz)) == DOC
+    assert (tmp_path / "tasks/keep/x.json").exists()
+    assert all(st.read_json(k) == DOC for k in ("projects/p/doc", "tasks/t1/result", "tasks/keep/x"))
+
+
+def test_04_switching_encoding_replaces_old_file(tmp_path):
+    FileStorage(tmp_path).write_json("k", {"v": 1})
+    st = FileStorage(tmp_path, encoding=parse_encoding("pretty+gzip"))
+
+    assert st.read_json("k") == {"v": 1}  # old .json still readable
+    st.update_json("k", lambda cur: {"v": cur["v"] + 1})
+
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.startswith(".")) == ["k.json.gz"]
+    assert FileStorage(tmp_path).read_json("k") == {"v": 2}  # any reader decodes it
+    st.delete("k")
+    assert st.read_json("k") is None
+
+
+@pytest.mark.skipif(not have_zstd(), reason="zstd not available")
+def test_04_zstd_roundtrip_and_migration(tmp_path):
+    st = make_storage("fs", str(tmp_path / "fs"), encoding="orjson+zstd")
+    st.write_json("tasks/t/result", DOC)
+    assert (tmp_path / "fs/tasks/t/result.json.zst").exists()
+
+    db = SqliteStorage(tmp_path / "db")
+    migrate_fs_tree(tmp_path / "fs", db)
+    assert db.read_json("tasks/t/result") == DOC
+
+
+def test_04_bad_specs_are_rejected():
+    with pytest.raises(ValueError):
+        parse_encoding("yaml")
+    with pytest.raises(ValueError):
+        JsonEncoding(compression="lz4")
+    assert COMPACT.suffix == ".json" and parse_encoding("compact+gz:9").level == 9
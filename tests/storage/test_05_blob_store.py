@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.scripts.file import download_file
+from ddm_sdk.scripts.file.utils import file_dir_key
+from ddm_sdk.storage.fs import FileStorage
+from tests.stub_server import StubResponse, StubServer
+
+DATA = b"a,b\n" + b"1,2\n" * 10_000
+SHA = hashlib.sha256(DATA).hexdigest()
+FILE_ID = "3f2b1c4e-8d7a-4e21-9c55-0a1b2c3d4e5f"
+
+
+def test_05_identical_blobs_are_stored_once(tmp_path):
+    st = FileStorage(tmp_path, dedupe=True)
+    a = st.write_bytes("projects/p1/zips/x/1", DATA, ext=".zip")
+    b = st.write_bytes("projects/p2/zips/x/2", DATA, ext=".zip")
+    src = tmp_path / "src.csv"
+    src.write_bytes(DATA)
+    c = st.copy_file("samples/s", src)
+
+    assert os.path.samefile(a, b) and os.path.samefile(a, c)
+    assert list(st.cas.iter_digests()) == [SHA]
+    assert st.read_bytes("projects/p2/zips/x/2", ext=".zip") == DATA
+
+    st.write_bytes("projects/p1/zips/x/1", b"other", ext=".zip")  # rewrite breaks only that link
+    assert st.read_bytes("projects/p2/zips/x/2", ext=".zip") == DATA
+    assert st.cas.prune() == 0  # both contents are still referenced
+
+
+def test_05_prune_drops_unreferenced(tmp_path):
+    st = FileStorage(tmp_path, dedupe=True)
+    p = st.write_bytes("k", DATA)
+    os.unlink(p)
+    assert st.cas.prune() == 1 and not st.cas.has(SHA)
+
+
+def _run_download(monkeypatch, client, capsys):
+    monkeypatch.setattr(download_file.DdmClient, "from_env", classmethod(lambda cls: client))
+    monkeypatch.setattr(download_file, "ensure_authenticated", lambda c: None)
+    assert download_file.main(["--project_id", "p1", "--file_id", FILE_ID]) == 0
+    return json.loads(capsys.readouterr().out)
+
+
+def test_05_download_skips_network_when_hash_is_stored(tmp_path, monkeypatch, capsys):
+    with StubServer() as stub:
+        stub.route("GET", f"/ddm/file/{FILE_ID}", lambda req: StubResponse.bytes(DATA))
+        st = FileStorage(tmp_path, dedupe=True)
+        client = DdmClient(base_url=stub.url, storage=st)
+        st.write_json(f"{file_dir_key('p1', FILE_ID)}/file", {"filename": "data.csv", "file_hash": "0x" + SHA})
+
+        first = _run_download(monkeypatch, client, capsys)
+        os.unlink(first["saved_to"])
+        second = _run_download(monkeypatch, client, capsys)
+
+        assert len(stub.requests) == 1
+        assert (first["cached"], second["cached"]) == (False, True)
+        assert second["sha256"] == SHA and second["bytes"] == len(DATA)
+        assert (tmp_path / file_dir_key("p1", FILE_ID) / "data.csv").read_bytes() == DATA
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# ----------------------------
+# Tiny local HTTP stub used by offline tests (no DDM backend needed)
+# ----------------------------
+
+
+@dataclass
+class StubRequest:
+    method: str
+    path: str
+    query: Dict[str, List[str]]
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8")) if self.body else None
+
+    def form(self) -> List[Tuple[Optional[str], Optional[str], bytes]]:
+        """multipart/form-data body as [(field name, filename, payload), ...] in wire order."""
+        raw = b"Content-Type: " + self.headers["Content-Type"].encode("latin-1") + b"\r\n\r\n" + self.body
+        msg = BytesParser(policy=HTTP).parsebytes(raw)
+        return [
+            (p.get_param("name", header="content-disposition"), p.get_filename(), p.get_payload(decode=True))
+            for p in msg.iter_parts()
+        ]
+
+    def fields(self) -> Dict[str, str]:
+        """Non-file form fields (last value wins)."""
+        return {n: v.decode("utf-8") for n, fn, v in self.form() if fn is None and n}
+
+
+@dataclass
+class StubResponse:
+    status: int = 200
+    body: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(cls, obj: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> "StubResponse":
+        h = {"Content-Type": "application/json"}
+        h.update(headers or {})
+        return cls(status=status, body=json.dumps(obj).encode("utf-8"), headers=h)
+
+    @classmethod
+    def bytes(cls, data: bytes, status: int = 200, headers: Optional[Dict[str, str]] = None) -> "StubResponse":
+        h = {"Content-Type": "application/octet-stream"}
+        h.update(headers or {})
+        return cls(status=status, body=data, headers=h)
+
+
+Handler = Callable[[StubRequest], StubResponse]
+
+
+class RpcFault(Exception):
+    """Raised by a json_rpc() method handler to answer with a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.error = {"code": code, "message": message, **({"data": data} if data is not None else {})}
+
+
+def json_rpc(methods: Dict[str, Callable[[List[Any]], Any]], *, batches: bool = True) -> Handler:
+    """
+    Handler for a JSON-RPC endpoint: {method: fn(params) -> result}. Array bodies
+    are answered as arrays (or rejected like a node without batch support when
+    batches=False).
+
+        stub.route("POST", "/rpc", json_rpc({"eth_chainId": lambda params: "0x1"}))
+    """
+
+    def one(call: Dict[str, Any]) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"jsonrpc": "2.0", "id": call.get("id")}
+        fn = methods.get(call.get("method"))
+        try:
+            if fn is None:
+                raise RpcFault(-32601, f"method not found: {call.get('method')}")
+            out["result"] = fn(call.get("params") or [])
+        except RpcFault as e:
+            out["error"] = e.error
+        return out
+
+    def handler(req: StubRequest) -> StubResponse:
+        body = req.json()
+        if isinstance(body, list):
+            if not batches:
+                return StubResponse.json({"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}})
+            return StubResponse.json([one(c) for c in body])
+        return StubResponse.json(one(body))
+
+    return handler
+
+
+class StubServer:
+    """
+    Route table keyed by (METHOD, path). Handlers get a StubRequest and return a StubResponse.
+    Every request is recorded in .requests (thread-safe).
+
+        with StubServer() as stub:
+            stub.route("GET", "/ddm/file/abc", lambda req: StubResponse.bytes(b"..."))
+            client = DdmClient(base_url=stub.url)
+    """
+
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], Handler] = {}
+        self.requests: List[StubRequest] = []
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def route(self, method: str, path: str, handler: Handler) -> None:
+        self.routes[(method.upper(), path)] = handler
+
+    def _dispatch(self, req: StubRequest) -> StubResponse:
+        with self._lock:
+            self.requests.append(req)
+        handler = self.routes.get((req.method, req.path))
+        if handler is None:
+            return StubResponse.json({"message": f"no stub for {req.method} {req.path}"}, status=404)
+        return handler(req)
+
+    def start(self) -> "StubServer":
+        stub = self
+
+        class _H(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:  # keep pytest output clean
+                pass
+
+            def _handle(self) -> None:
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    body = _read_chunked(self.rfile)
+                else:
+                    body = self.rfile.read(length) if length else b""
+                req = StubRequest(
+                    method=self.command,
+                    path=parts.path,
+                    query=parse_qs(parts.query),
+                    headers={k: v for k, v in self.headers.items()},
+                    body=body,
+                )
+                resp = stub._dispatch(req)
+                self.send_response(resp.status)
+                for k, v in resp.headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(resp.body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(resp.body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _H)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def _read_chunked(rfile: Any) -> bytes:
+    out = bytearray()
+    while True:
+        size_line = rfile.readline().strip()
+        size = int(size_line.split(b";")[0], 16)
+        if size == 0:
+            rfile.readline()
+            break
+        out += rfile.read(size)
+        rfile.readline()
+    return bytes(out)
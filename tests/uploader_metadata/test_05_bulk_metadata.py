@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+
+from ddm_sdk.client import DdmClient
+from ddm_sdk.scripts.uploader_metadata import bulk
+from ddm_sdk.scripts.uploader_metadata.bulk import apply_bulk, load_rows
+from ddm_sdk.storage.fs import FileStorage
+from ddm_sdk.transport.retry import RetryPolicy
+from tests.stub_server import StubResponse, StubServer
+
+IDS = [f"00000000-0000-4000-8000-{i:012d}" for i in range(5)]
+NO_WAIT = RetryPolicy(total=2, backoff_factor=0.0)
+
+
+class _Server:
+    """uploader_metadata endpoints with existing metadata (409 on POST) and flaky files (503 first)."""
+
+    def __init__(self, existing=(), flaky=None):
+        self.meta = {fid: {"old": True} for fid in existing}
+        self.flaky = dict(flaky or {})  # file_id -> number of 503s left
+
+    def __call__(self, req):
+        fid = req.path.rsplit("/", 1)[1]
+        if self.flaky.get(fid):
+            self.flaky[fid] -= 1
+            return StubResponse.json({"message": "busy"}, status=503)
+        if req.method == "GET":
+            return StubResponse.json({"uploader_metadata": self.meta.get(fid)})
+        if req.method == "POST" and fid in self.meta:
+            return StubResponse.json({"error": "uploader metadata already exists"}, status=409)
+        if req.method == "PUT" and fid not in self.meta:
+            return StubResponse.json({"error": "not found"}, status=404)
+        self.meta[fid] = req.json()["uploader_metadata"]
+        return StubResponse.json({"message": "ok", "file_id": fid}, status=201 if req.method == "POST" else 200)
+
+    def mount(self, stub):
+        for fid in IDS:
+            for method in ("GET", "POST", "PUT"):
+                stub.route(method, f"/ddm/uploader_metadata/{fid}", self)
+        return stub
+
+
+def _rows(mapping, tmp_path):
+    p = tmp_path / "rows.jsonl"
+    p.write_text("\n".join(json.dumps({"file_id": k, "uploader_metadata": v}) for k, v in mapping.items()), encoding="utf-8")
+    return load_rows(p)
+
+
+def test_05_load_rows_jsonl_and_csv(tmp_path):
+    jl = tmp_path / "m.jsonl"
+    jl.write_text("\n".join([
+        json.dumps({"file_id": IDS[0], "uploader_metadata": {"sensor": "A1"}}),
+        "",
+        json.dumps({"id": IDS[1], "sensor": "B2", "rate": 5}),
+        json.dumps({"file_id": IDS[0], "metadata": {"sensor": "A9"}}),
+    ]), encoding="utf-8")
+    rows = load_rows(jl)
+    assert [(r.file_id, r.metadata) for r in rows] == [(IDS[0], {"sensor": "A9"}), (IDS[1], {"sensor": "B2", "rate": 5})]
+
+    c = tmp_path / "m.csv"
+    c.write_text(f'file_id,uploader_metadata\n{IDS[2]},"{{""sensor"": ""C3""}}"\n', encoding="utf-8")
+    assert load_rows(c)[0].metadata == {"sensor": "C3"}
+    c.write_text(f"file_id,sensor,site\n{IDS[3]},D4,north\n", encoding="utf-8")
+    assert load_rows(c)[0].metadata == {"sensor": "D4", "site": "north"}
+
+
+def test_05_upsert_falls_back_to_update_and_retries(tmp_path):
+    server = _Server(existing=[IDS[1]], flaky={IDS[2]: 1})
+    rows = _rows({fid: {"n": i} for i, fid in enumerate(IDS[:3])}, tmp_path)
+    with server.mount(StubServer()) as stub:
+        client = DdmClient(base_url=stub.url)
+        results = apply_bulk(client, "p1", rows, workers=3, retry=NO_WAIT)
+
+    assert [r["ok"] for r in results] == [True, True, True]
+    assert results[2]["attempts"] == 2
+    assert server.meta == {IDS[0]: {"n": 0}, IDS[1]: {"n": 1}, IDS[2]: {"n": 2}}
+    calls = sorted((r.method, r.path.rsplit("/", 1)[1]) for r in stub.requests)
+    assert calls == sorted([("POST", IDS[0]), ("POST", IDS[1]), ("PUT", IDS[1]), ("POST", IDS[2]), ("POST", IDS[2])])
+
+    # attach only: the conflict is a failure, and 4xx are not retried
+    with _Server(existing=[IDS[0]]).mount(StubServer()) as stub:
+        res = apply_bulk(DdmClient(base_url=stub.url), "p1", rows[:1], mode="attach", retry=NO_WAIT)
+    assert not res[0]["ok"] and "Conflict" in res[0]["error"] and len(stub.requests) == 1
+
+
+def test_05_put_is_only_retried_by_the_transport(tmp_path):
+    rows = _rows({IDS[0]: {"n": 0}}, tmp_path)
+    server = _Server(existing=[IDS[0]], flaky={IDS[0]: 2})
+    with server.mount(StubServer()) as stub:
+        client = DdmClient(base_url=stub.url, retry=NO_WAIT)
+        res = apply_bulk(client, "p1", rows, mode="update", retry=NO_WAIT)
+    assert res[0]["ok"] and res[0]["attempts"] == 1
+    assert [r.method for r in stub.requests] == ["PUT"] * 3
+
+    # plain 500s are not retried
+    with StubServer() as stub:
+        stub.route("POST", f"/ddm/uploader_metadata/{IDS[0]}", lambda req: StubResponse.json({}, status=500))
+        res = apply_bulk(DdmClient(base_url=stub.url), "p1", rows, retry=NO_WAIT)
+    assert not res[0]["ok"] and len(stub.requests) == 1
+
+
+def test_05_script_resumes_from_checkpoint(tmp_path, monkeypatch, capsys):
+    store = FileStorage(tmp_path / "store")
+    src = tmp_path / "meta.jsonl"
+    src.write_text("\n".join(json.dumps({"file_id": fid, "uploader_metadata": {"n": i}}) for i, fid in enumerate(IDS)),
+                   encoding="utf-8")
+    server = _Server(flaky={IDS[3]: 10})  # keeps failing past the retries
+
+    def run(stub, *extra):
+        client = DdmClient(base_url=stub.url, storage=store)
+        monkeypatch.setattr(bulk.DdmClient, "from_env", classmethod(lambda cls: client))
+        monkeypatch.setattr(bulk, "ensure_authenticated", lambda c: None)
+        code = bulk.main(["--project_id", "p1", "--input", str(src), "--retries", "1", "--workers", "2", *extra])
+        return code, json.loads(capsys.readouterr().out)
+
+    monkeypatch.setattr(bulk.time, "sleep", lambda s: None)
+    with server.mount(StubServer()) as stub:
+        code, out = run(stub)
+        assert code == 1 and (out["applied"], out["failed"]) == (4, 1)
+        assert out["failures"][0]["file_id"] == IDS[3] and out["failures"][0]["attempts"] == 2
+        assert store.read_json(f"projects/p1/files/{IDS[0]}/uploader_metadata")["uploader_metadata"] == {"n": 0}
+
+        # second run: only the failed file is sent again
+        server.flaky.clear()
+        stub.requests.clear()
+        code, out = run(stub, "--no-store")
+        assert code == 0 and (out["applied"], out["skipped"]) == (1, 4)
+        assert [(r.method, r.path) for r in stub.requests] == [("POST", f"/ddm/uploader_metadata/{IDS[3]}")]
+
+        # changed metadata is sent again; --restart sends everything
+        src.write_text(src.read_text(encoding="utf-8").replace('{"n": 4}', '{"n": 40}'), encoding="utf-8")
+        stub.requests.clear()
+        code, out = run(stub, "--no-store")
+        assert (out["applied"], out["skipped"]) == (1, 4) and server.meta[IDS[4]] == {"n": 40}
+        assert [r.method for r in stub.requests] == ["POST", "PUT"]
+
+        code, out = run(stub, "--no-store", "--restart")
+        assert (out["applied"], out["skipped"]) == (5, 0)
+
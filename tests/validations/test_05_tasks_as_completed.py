@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from ddm_sdk.apis.tasks import PollSchedule, TaskFailedError
+from ddm_sdk.client import DdmClient
+from tests.stub_server import StubResponse, StubServer
+
+
+class _Tasks:
+    """/ddm/tasks/status/<id> stub: task i becomes SUCCESS after `ready_after[i]` seconds."""
+
+    def __init__(self, stub: StubServer, ready_after, *, fail=(), delay: float = 0.0):
+        self.t0 = time.monotonic()
+        self.ready_after = ready_after
+        self.fail = set(fail)
+        self.delay = delay
+        self.polls = {tid: 0 for tid in ready_after}
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        for tid in ready_after:
+            stub.route("GET", f"/ddm/tasks/status/{tid}", self.handler)
+
+    def handler(self, req):
+        tid = req.path.rsplit("/", 1)[-1]
+        with self._lock:
+            self.polls[tid] += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if time.monotonic() - self.t0 < self.ready_after[tid]:
+            return StubResponse.json({"state": "PENDING"})
+        if tid in self.fail:
+            return StubResponse.json({"state": "FAILURE", "error": "boom"})
+        return StubResponse.json({"state": "SUCCESS", "result": tid})
+
+
+def test_05_as_completed_yields_in_completion_order():
+    with StubServer() as stub:
+        tasks = _Tasks(stub, {"slow": 0.4, "fast": 0.0, "mid": 0.15})
+        client = DdmClient(base_url=stub.url)
+        order = [tid for tid, st in client.tasks.as_completed(["slow", "fast", "mid"], poll_interval_s=0.05)]
+
+    assert order == ["fast", "mid", "slow"]
+    assert tasks.polls["fast"] == 1
+
+
+def test_05_wait_many_polls_concurrently_with_bounded_workers():
+    ids = [f"t{i}" for i in range(24)]
+    with StubServer() as stub:
+        tasks = _Tasks(stub, {tid: 0.0 for tid in ids}, delay=0.05)
+        client = DdmClient(base_url=stub.url)
+        t0 = time.monotonic()
+        res = client.tasks.wait_many(ids, max_workers=6)
+        dt = time.monotonic() - t0
+
+    assert res.succeeded == set(ids) and not res.pending and not res.timed_out
+    assert 1 < tasks.peak <= 6
+    assert dt < 24 * 0.05  # faster than polling one by one
+
+
+def test_05_wait_many_timeout_and_failures():
+    with StubServer() as stub:
+        _Tasks(stub, {"ok": 0.0, "bad": 0.0, "never": 60.0}, fail={"bad"})
+        client = DdmClient(base_url=stub.url)
+
+        res = client.tasks.wait_many(["ok", "bad", "never"], timeout_s=0.3, poll_interval_s=0.05, raise_on_failure=False)
+        with pytest.raises(TaskFailedError) as e:
+            client.tasks.wait_many(["bad"], poll_interval_s=0.05)
+
+    assert res.succeeded == {"ok"}
+    assert res.failed == {"bad"}
+    assert res.pending == {"never"} and res.timed_out
+    assert res.statuses["never"].state == "PENDING"
+    assert e.value.task_id == "bad"
+
+
+def test_05_zero_timeout_still_polls_every_task_once():
+    ids = [f"t{i}" for i in range(5)]
+    with StubServer() as stub:
+        tasks = _Tasks(stub, {"t0": 0.0, **{tid: 60.0 for tid in ids[1:]}})
+        client = DdmClient(base_url=stub.url)
+        res = client.tasks.wait_many(ids, timeout_s=0, max_workers=2, raise_on_failure=False)
+
+    assert res.succeeded == {"t0"} and res.pending == set(ids[1:]) and res.timed_out
+    assert set(res.statuses) == set(ids) and set(tasks.polls.values()) == {1}
+
+
+def test_05_poll_schedule_backs_off_per_task():
+    s = PollSchedule(["a", "b"], interval=1.0, max_interval=4.0, factor=2.0, jitter=0.0, now=0.0)
+    assert s.pop_due(0.0) == "a" and s.pop_due(0.0) == "b" and s.pop_due(0.0) is None
+
+    delays = [s.again("a", 0.0) for _ in range(4)]
+    assert delays == [1.0, 2.0, 4.0, 4.0]
+    assert s.next_due() == 1.0